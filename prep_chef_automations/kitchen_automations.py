@@ -19,8 +19,15 @@ class KitchenDashboard:
     async def get_status(self) -> Dict[str, Any]:
         """Get complete kitchen status snapshot"""
         async with self.client:
+            # Fetch prep lists, inventory, staff and analytics concurrently
+            async with self.client.batch() as batch:
+                prep_lists_call = batch.call_tool("list_prep_lists")
+                inventory_call = batch.call_tool("check_inventory")
+                staff_call = batch.call_tool("list_staff")
+                stats_call = batch.call_tool("get_prep_stats", {"company_id": "corporate"})
+
             # Get all active prep lists
-            prep_lists_result = await self.client.call_tool("list_prep_lists")
+            prep_lists_result = prep_lists_call.result()
             prep_lists = prep_lists_result.data if hasattr(prep_lists_result, 'data') else []
 
             # Count active vs completed
@@ -28,18 +35,18 @@ class KitchenDashboard:
             completed_prep = len([p for p in prep_lists if isinstance(p, dict) and p.get('status') == 'completed'])
 
             # Get inventory levels
-            inventory_result = await self.client.call_tool("check_inventory")
+            inventory_result = inventory_call.result()
             inventory = inventory_result.data if hasattr(inventory_result, 'data') else []
 
             # Count low stock items
             low_stock = len([i for i in inventory if isinstance(i, dict) and i.get('quantity', 0) < 10])
 
             # Get staff info
-            staff_result = await self.client.call_tool("list_staff")
+            staff_result = staff_call.result()
             staff = staff_result.data if hasattr(staff_result, 'data') else []
 
             # Get analytics
-            stats_result = await self.client.call_tool("get_prep_stats", {"company_id": "corporate"})
+            stats_result = stats_call.result()
             stats = stats_result.data if hasattr(stats_result, 'data') else {}
 
             return {
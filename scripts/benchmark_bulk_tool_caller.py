@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Compare BulkToolCaller's default and in-process modes.
+
+Run from the repository root with
+`uv run python scripts/benchmark_bulk_tool_caller.py`. Each mode
+makes one bulk call of `--calls` calls to a trivial echo tool, through an
+in-memory client, and reports the best time of `--repeat` runs.
+"""
+
+import argparse
+import asyncio
+import time
+
+from fastmcp import Client, FastMCP
+from fastmcp.contrib.bulk_tool_caller import BulkToolCaller
+
+
+def create_server(in_process: bool) -> FastMCP:
+    mcp = FastMCP()
+
+    @mcp.tool
+    def echo_tool(text: str) -> str:
+        """Echo the input text"""
+        return text
+
+    BulkToolCaller(in_process=in_process).register_tools(mcp)
+    return mcp
+
+
+async def run(in_process: bool, calls: int, max_concurrency: int) -> float:
+    async with Client(create_server(in_process)) as client:
+        start = time.perf_counter()
+        result = await client.call_tool(
+            "call_tool_bulk",
+            {
+                "tool": "echo_tool",
+                "tool_arguments": [{"text": str(i)} for i in range(calls)],
+                "max_concurrency": max_concurrency,
+            },
+        )
+        elapsed = time.perf_counter() - start
+    assert not result.is_error
+    return elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--max-concurrency", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for in_process in (False, True):
+        best = min(
+            [
+                await run(in_process, args.calls, args.max_concurrency)
+                for _ in range(args.repeat)
+            ]
+        )
+        mode = "in-process" if in_process else "client session"
+        print(f"{mode:>14}: {args.calls} calls in {best:.2f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
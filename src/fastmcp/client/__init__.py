@@ -10,6 +10,7 @@ from .transports import (
     UvStdioTransport,
     NpxStdioTransport,
     FastMCPTransport,
+    DirectFastMCPTransport,
     StreamableHttpTransport,
 )
 from .auth import OAuth, BearerAuth
@@ -26,6 +27,7 @@ __all__ = [
     "UvStdioTransport",
     "NpxStdioTransport",
     "FastMCPTransport",
+    "DirectFastMCPTransport",
     "StreamableHttpTransport",
     "OAuth",
     "BearerAuth",
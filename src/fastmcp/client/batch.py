@@ -0,0 +1,249 @@
+"""Send several requests over a client's session concurrently."""
+
+from __future__ import annotations
+
+import datetime
+from collections.abc import Awaitable, Callable, Generator
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+import anyio
+import mcp.types
+from anyio.abc import TaskGroup
+from exceptiongroup import ExceptionGroup
+from pydantic import AnyUrl
+
+from fastmcp.client.progress import ProgressHandler
+from fastmcp.utilities.types import NotSet, NotSetT
+
+if TYPE_CHECKING:
+    from fastmcp.client.client import CallToolResult, Client
+
+T = TypeVar("T")
+
+Timeout = datetime.timedelta | float | int | None
+
+
+def _seconds(timeout: Timeout) -> float | None:
+    if isinstance(timeout, datetime.timedelta):
+        return timeout.total_seconds()
+    return timeout
+
+
+class BatchCall(Generic[T]):
+    """
+    A request made as part of a ClientBatch. Await it to wait for its result,
+    or call `result()` once the batch has finished.
+    """
+
+    def __init__(self, index: int):
+        self.index = index
+        self._done = anyio.Event()
+        self._result: T | None = None
+        self._exception: Exception | None = None
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def result(self) -> T:
+        """Return the result of the request, or raise the error it failed with."""
+        if not self.done():
+            raise RuntimeError("The request has not finished yet")
+        if self._exception is not None:
+            raise self._exception
+        return self._result  # type: ignore[return-value]
+
+    def exception(self) -> Exception | None:
+        """Return the error the request failed with, if any."""
+        if not self.done():
+            raise RuntimeError("The request has not finished yet")
+        return self._exception
+
+    async def wait(self) -> T:
+        await self._done.wait()
+        return self.result()
+
+    def __await__(self) -> Generator[Any, None, T]:
+        return self.wait().__await__()
+
+
+class ClientBatch:
+    """
+    Sends requests over a connected client's session concurrently, instead of
+    waiting for each response before sending the next request.
+
+    Requests are sent as soon as they are added, with at most `max_concurrency`
+    of them in flight. Leaving the `async with` block waits for all of them;
+    if any failed, an ExceptionGroup of their errors (in the order the
+    requests were added) is raised. Each request's result or error is also
+    available from the BatchCall returned when adding it, and all results,
+    in order, from `results()`.
+
+    Example:
+        ```python
+        async with client.batch(max_concurrency=4) as batch:
+            tools = batch.list_tools()
+            weather = batch.call_tool("get_weather", {"city": "London"})
+            readme = batch.read_resource("file:///README.md", timeout=2)
+
+        print(weather.result().data)
+        ```
+
+    Args:
+        client: The connected client to send the requests with.
+        max_concurrency: The most requests in flight at once. None is unlimited.
+        timeout: The default time, in seconds, to wait for each request; a
+            request that takes longer fails with a TimeoutError.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        max_concurrency: int | None = None,
+        timeout: Timeout = None,
+    ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.calls: list[BatchCall[Any]] = []
+        self._task_group: TaskGroup | None = None
+        self._limiter = (
+            anyio.Semaphore(max_concurrency) if max_concurrency is not None else None
+        )
+
+    async def __aenter__(self) -> ClientBatch:
+        if not self.client.is_connected():
+            raise RuntimeError(
+                "Client is not connected. Use the 'async with client:' context manager first."
+            )
+        self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        assert self._task_group is not None
+        if exc_type is not None:
+            self._task_group.cancel_scope.cancel()
+        try:
+            await self._task_group.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            self._task_group = None
+        if exc_type is None:
+            errors = [
+                call._exception for call in self.calls if call._exception is not None
+            ]
+            if errors:
+                raise ExceptionGroup(
+                    f"{len(errors)} of {len(self.calls)} batched requests failed",
+                    errors,
+                )
+
+    def results(self) -> list[Any]:
+        """Return the results of all requests, in the order they were added."""
+        return [call.result() for call in self.calls]
+
+    def add(
+        self,
+        request: Callable[[], Awaitable[T]],
+        timeout: Timeout | NotSetT = NotSet,
+    ) -> BatchCall[T]:
+        """Add a request, given as a function that makes it with the client."""
+        if self._task_group is None:
+            raise RuntimeError(
+                "Requests can only be added inside the batch's 'async with' block"
+            )
+        call: BatchCall[T] = BatchCall(len(self.calls))
+        self.calls.append(call)
+        seconds = _seconds(self.timeout if timeout is NotSet else timeout)
+        self._task_group.start_soon(self._run, call, request, seconds)
+        return call
+
+    async def _run(
+        self,
+        call: BatchCall[T],
+        request: Callable[[], Awaitable[T]],
+        timeout: float | None,
+    ) -> None:
+        try:
+            if self._limiter is not None:
+                async with self._limiter:
+                    with anyio.fail_after(timeout):
+                        call._result = await request()
+            else:
+                with anyio.fail_after(timeout):
+                    call._result = await request()
+        except Exception as e:
+            call._exception = e
+        finally:
+            call._done.set()
+
+    def call_tool(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None = None,
+        *,
+        timeout: Timeout | NotSetT = NotSet,
+        progress_handler: ProgressHandler | None = None,
+        raise_on_error: bool = True,
+    ) -> BatchCall[CallToolResult]:
+        """Add a tools/call request; see `Client.call_tool`."""
+        return self.add(
+            lambda: self.client.call_tool(
+                name,
+                arguments,
+                progress_handler=progress_handler,
+                raise_on_error=raise_on_error,
+            ),
+            timeout=timeout,
+        )
+
+    def read_resource(
+        self, uri: AnyUrl | str, *, timeout: Timeout | NotSetT = NotSet
+    ) -> BatchCall[
+        list[mcp.types.TextResourceContents | mcp.types.BlobResourceContents]
+    ]:
+        """Add a resources/read request; see `Client.read_resource`."""
+        return self.add(lambda: self.client.read_resource(uri), timeout=timeout)
+
+    def get_prompt(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None = None,
+        *,
+        timeout: Timeout | NotSetT = NotSet,
+    ) -> BatchCall[mcp.types.GetPromptResult]:
+        """Add a prompts/get request; see `Client.get_prompt`."""
+        return self.add(
+            lambda: self.client.get_prompt(name, arguments), timeout=timeout
+        )
+
+    def list_tools(
+        self, *, timeout: Timeout | NotSetT = NotSet
+    ) -> BatchCall[list[mcp.types.Tool]]:
+        """Add a tools/list request."""
+        return self.add(self.client.list_tools, timeout=timeout)
+
+    def list_resources(
+        self, *, timeout: Timeout | NotSetT = NotSet
+    ) -> BatchCall[list[mcp.types.Resource]]:
+        """Add a resources/list request."""
+        return self.add(self.client.list_resources, timeout=timeout)
+
+    def list_resource_templates(
+        self, *, timeout: Timeout | NotSetT = NotSet
+    ) -> BatchCall[list[mcp.types.ResourceTemplate]]:
+        """Add a resources/templates/list request."""
+        return self.add(self.client.list_resource_templates, timeout=timeout)
+
+    def list_prompts(
+        self, *, timeout: Timeout | NotSetT = NotSet
+    ) -> BatchCall[list[mcp.types.Prompt]]:
+        """Add a prompts/list request."""
+        return self.add(self.client.list_prompts, timeout=timeout)
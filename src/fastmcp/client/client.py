@@ -4,6 +4,7 @@ import asyncio
 import copy
 import datetime
 import secrets
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -11,6 +12,7 @@ from typing import Any, Generic, Literal, TypeVar, cast, overload
 
 import anyio
 import httpx
+import jsonschema
 import mcp.types
 import pydantic_core
 from exceptiongroup import catch
@@ -18,6 +20,7 @@ from mcp import ClientSession
 from pydantic import AnyUrl
 
 import fastmcp
+from fastmcp.client.batch import BatchCall, ClientBatch
 from fastmcp.client.elicitation import ElicitationHandler, create_elicitation_callback
 from fastmcp.client.logging import (
     LogHandler,
@@ -25,6 +28,7 @@ from fastmcp.client.logging import (
     default_log_handler,
 )
 from fastmcp.client.messages import MessageHandler, MessageHandlerT
+from fastmcp.client.output_types import OutputTypeCache
 from fastmcp.client.progress import ProgressHandler, default_progress_handler
 from fastmcp.client.roots import (
     RootsHandler,
@@ -40,9 +44,8 @@ from fastmcp.exceptions import ToolError
 from fastmcp.mcp_config import MCPConfig
 from fastmcp.server import FastMCP
 from fastmcp.utilities.exceptions import get_catch_handlers
-from fastmcp.utilities.json_schema_type import json_schema_to_type
 from fastmcp.utilities.logging import get_logger
-from fastmcp.utilities.types import get_cached_typeadapter
+from fastmcp.utilities.types import NotSet, NotSetT
 
 from .transports import (
     ClientTransport,
@@ -70,11 +73,33 @@ __all__ = [
     "SamplingHandler",
     "ElicitationHandler",
     "ProgressHandler",
+    "BatchCall",
+    "ClientBatch",
 ]
 
 logger = get_logger(__name__)
 
 T = TypeVar("T", bound="ClientTransport")
+PageT = TypeVar("PageT", bound=mcp.types.PaginatedResult)
+
+
+async def _iter_pages(
+    list_page: Callable[[str | None], Awaitable[PageT]],
+) -> AsyncIterator[PageT]:
+    """Fetch the pages of a paginated list one at a time, following their cursors."""
+    cursor: str | None = None
+    seen: set[str] = set()
+    while True:
+        page = await list_page(cursor)
+        yield page
+        cursor = page.nextCursor
+        if cursor is None:
+            return
+        if cursor in seen:
+            raise RuntimeError(
+                f"Server returned the same list cursor twice: {cursor!r}"
+            )
+        seen.add(cursor)
 
 
 @dataclass
@@ -92,6 +117,36 @@ class ClientSessionState:
     ready_event: anyio.Event = field(default_factory=anyio.Event)
     stop_event: anyio.Event = field(default_factory=anyio.Event)
     initialize_result: mcp.types.InitializeResult | None = None
+    output_types: OutputTypeCache = field(default_factory=OutputTypeCache)
+
+
+class _SessionMessageHandler:
+    """
+    Clears a session's cached output types and tool output schemas when its
+    tool list changes, so that the next structured result lists the tools
+    again, then calls the configured message handler.
+
+    This doesn't hold the Client, so that the session and transport, which keep
+    their message handler, don't keep the Client alive.
+    """
+
+    def __init__(
+        self,
+        session_state: ClientSessionState,
+        message_handler: MessageHandlerT | MessageHandler | None,
+    ):
+        self._session_state = session_state
+        self._message_handler = message_handler
+
+    async def __call__(self, message: Any) -> None:
+        if isinstance(message, mcp.types.ServerNotification) and isinstance(
+            message.root, mcp.types.ToolListChangedNotification
+        ):
+            self._session_state.output_types.clear()
+            if self._session_state.session is not None:
+                self._session_state.session._tool_output_schemas.clear()
+        if self._message_handler is not None:
+            await self._message_handler(message)
 
 
 class Client(Generic[ClientTransportT]):
@@ -351,8 +406,11 @@ class Client(Generic[ClientTransportT]):
     @asynccontextmanager
     async def _context_manager(self):
         with catch(get_catch_handlers()):
+            message_handler = _SessionMessageHandler(
+                self._session_state, self._session_kwargs.get("message_handler")
+            )
             async with self.transport.connect_session(
-                **self._session_kwargs
+                **{**self._session_kwargs, "message_handler": message_handler}
             ) as session:
                 self._session_state.session = session
                 # Initialize the session
@@ -369,6 +427,7 @@ class Client(Generic[ClientTransportT]):
                 finally:
                     self._session_state.session = None
                     self._session_state.initialize_result = None
+                    self._session_state.output_types.clear()
 
     async def __aenter__(self):
         return await self._connect()
@@ -491,6 +550,37 @@ class Client(Generic[ClientTransportT]):
         await self._disconnect(force=True)
         await self.transport.close()
 
+    # --- Batching ---
+
+    def batch(
+        self,
+        max_concurrency: int | None = None,
+        timeout: datetime.timedelta | float | int | None = None,
+    ) -> ClientBatch:
+        """Send several requests over this client's session concurrently.
+
+        Requests added to the batch are sent right away, without waiting for
+        earlier responses; leaving the `async with` block waits for all of
+        them. Results are returned in the order the requests were added.
+
+        Args:
+            max_concurrency (int | None, optional): The most requests in flight at once. Defaults to unlimited.
+            timeout (datetime.timedelta | float | int | None, optional): The default timeout for each request. Defaults to None.
+
+        Returns:
+            ClientBatch: An async context manager to add requests to.
+
+        Example:
+            ```python
+            async with client.batch(max_concurrency=4) as batch:
+                forecast = batch.call_tool("forecast", {"city": "London"})
+                alerts = batch.call_tool("alerts", {"city": "London"}, timeout=2)
+
+            print(forecast.result().data, alerts.result().data)
+            ```
+        """
+        return ClientBatch(self, max_concurrency=max_concurrency, timeout=timeout)
+
     # --- MCP Client Methods ---
 
     async def ping(self) -> bool:
@@ -537,23 +627,47 @@ class Client(Generic[ClientTransportT]):
 
     # --- Resources ---
 
-    async def list_resources_mcp(self) -> mcp.types.ListResourcesResult:
+    async def list_resources_mcp(
+        self, cursor: str | None = None
+    ) -> mcp.types.ListResourcesResult:
         """Send a resources/list request and return the complete MCP protocol result.
 
+        Servers may split the list into pages; this returns a single page.
+
+        Args:
+            cursor (str | None, optional): The cursor of the page to fetch, from the
+                `nextCursor` of the previous page. Defaults to the first page.
+
         Returns:
             mcp.types.ListResourcesResult: The complete response object from the protocol,
-                containing the list of resources and any additional metadata.
+                containing the resources on this page, the cursor of the next page
+                (if any) and any additional metadata.
 
         Raises:
             RuntimeError: If called while the client is not connected.
         """
         logger.debug(f"[{self.name}] called list_resources")
 
-        result = await self.session.list_resources()
+        result = await self.session.list_resources(cursor=cursor)
         return result
 
+    async def iter_resources(self) -> AsyncIterator[mcp.types.Resource]:
+        """Iterate over the resources available on the server, fetching each page
+        of the list from the server as it is needed.
+
+        Yields:
+            mcp.types.Resource: The resources on the server, in order.
+
+        Raises:
+            RuntimeError: If called while the client is not connected.
+        """
+        async for page in _iter_pages(self.list_resources_mcp):
+            for resource in page.resources:
+                yield resource
+
     async def list_resources(self) -> list[mcp.types.Resource]:
-        """Retrieve a list of resources available on the server.
+        """Retrieve a list of all resources available on the server, fetching
+        every page if the server splits the list into pages.
 
         Returns:
             list[mcp.types.Resource]: A list of Resource objects.
@@ -561,30 +675,51 @@ class Client(Generic[ClientTransportT]):
         Raises:
             RuntimeError: If called while the client is not connected.
         """
-        result = await self.list_resources_mcp()
-        return result.resources
+        return [resource async for resource in self.iter_resources()]
 
     async def list_resource_templates_mcp(
-        self,
+        self, cursor: str | None = None
     ) -> mcp.types.ListResourceTemplatesResult:
         """Send a resources/listResourceTemplates request and return the complete MCP protocol result.
 
+        Servers may split the list into pages; this returns a single page.
+
+        Args:
+            cursor (str | None, optional): The cursor of the page to fetch, from the
+                `nextCursor` of the previous page. Defaults to the first page.
+
         Returns:
             mcp.types.ListResourceTemplatesResult: The complete response object from the protocol,
-                containing the list of resource templates and any additional metadata.
+                containing the resource templates on this page, the cursor of the next page
+                (if any) and any additional metadata.
 
         Raises:
             RuntimeError: If called while the client is not connected.
         """
         logger.debug(f"[{self.name}] called list_resource_templates")
 
-        result = await self.session.list_resource_templates()
+        result = await self.session.list_resource_templates(cursor=cursor)
         return result
 
-    async def list_resource_templates(
+    async def iter_resource_templates(
         self,
-    ) -> list[mcp.types.ResourceTemplate]:
-        """Retrieve a list of resource templates available on the server.
+    ) -> AsyncIterator[mcp.types.ResourceTemplate]:
+        """Iterate over the resource templates available on the server, fetching each page
+        of the list from the server as it is needed.
+
+        Yields:
+            mcp.types.ResourceTemplate: The resource templates on the server, in order.
+
+        Raises:
+            RuntimeError: If called while the client is not connected.
+        """
+        async for page in _iter_pages(self.list_resource_templates_mcp):
+            for template in page.resourceTemplates:
+                yield template
+
+    async def list_resource_templates(self) -> list[mcp.types.ResourceTemplate]:
+        """Retrieve a list of all resource templates available on the server, fetching
+        every page if the server splits the list into pages.
 
         Returns:
             list[mcp.types.ResourceTemplate]: A list of ResourceTemplate objects.
@@ -592,8 +727,7 @@ class Client(Generic[ClientTransportT]):
         Raises:
             RuntimeError: If called while the client is not connected.
         """
-        result = await self.list_resource_templates_mcp()
-        return result.resourceTemplates
+        return [template async for template in self.iter_resource_templates()]
 
     async def read_resource_mcp(
         self, uri: AnyUrl | str
@@ -656,23 +790,47 @@ class Client(Generic[ClientTransportT]):
 
     # --- Prompts ---
 
-    async def list_prompts_mcp(self) -> mcp.types.ListPromptsResult:
+    async def list_prompts_mcp(
+        self, cursor: str | None = None
+    ) -> mcp.types.ListPromptsResult:
         """Send a prompts/list request and return the complete MCP protocol result.
 
+        Servers may split the list into pages; this returns a single page.
+
+        Args:
+            cursor (str | None, optional): The cursor of the page to fetch, from the
+                `nextCursor` of the previous page. Defaults to the first page.
+
         Returns:
             mcp.types.ListPromptsResult: The complete response object from the protocol,
-                containing the list of prompts and any additional metadata.
+                containing the prompts on this page, the cursor of the next page
+                (if any) and any additional metadata.
 
         Raises:
             RuntimeError: If called while the client is not connected.
         """
         logger.debug(f"[{self.name}] called list_prompts")
 
-        result = await self.session.list_prompts()
+        result = await self.session.list_prompts(cursor=cursor)
         return result
 
+    async def iter_prompts(self) -> AsyncIterator[mcp.types.Prompt]:
+        """Iterate over the prompts available on the server, fetching each page
+        of the list from the server as it is needed.
+
+        Yields:
+            mcp.types.Prompt: The prompts on the server, in order.
+
+        Raises:
+            RuntimeError: If called while the client is not connected.
+        """
+        async for page in _iter_pages(self.list_prompts_mcp):
+            for prompt in page.prompts:
+                yield prompt
+
     async def list_prompts(self) -> list[mcp.types.Prompt]:
-        """Retrieve a list of prompts available on the server.
+        """Retrieve a list of all prompts available on the server, fetching
+        every page if the server splits the list into pages.
 
         Returns:
             list[mcp.types.Prompt]: A list of Prompt objects.
@@ -680,8 +838,7 @@ class Client(Generic[ClientTransportT]):
         Raises:
             RuntimeError: If called while the client is not connected.
         """
-        result = await self.list_prompts_mcp()
-        return result.prompts
+        return [prompt async for prompt in self.iter_prompts()]
 
     # --- Prompt ---
     async def get_prompt_mcp(
@@ -786,23 +943,50 @@ class Client(Generic[ClientTransportT]):
 
     # --- Tools ---
 
-    async def list_tools_mcp(self) -> mcp.types.ListToolsResult:
+    async def list_tools_mcp(
+        self, cursor: str | None = None
+    ) -> mcp.types.ListToolsResult:
         """Send a tools/list request and return the complete MCP protocol result.
 
+        Servers may split the list into pages; this returns a single page.
+
+        Args:
+            cursor (str | None, optional): The cursor of the page to fetch, from the
+                `nextCursor` of the previous page. Defaults to the first page.
+
         Returns:
             mcp.types.ListToolsResult: The complete response object from the protocol,
-                containing the list of tools and any additional metadata.
+                containing the tools on this page, the cursor of the next page
+                (if any) and any additional metadata.
 
         Raises:
             RuntimeError: If called while the client is not connected.
         """
         logger.debug(f"[{self.name}] called list_tools")
 
-        result = await self.session.list_tools()
+        result = await self.session.list_tools(cursor=cursor)
+        self._session_state.output_types.update(
+            result.tools, complete=cursor is None and result.nextCursor is None
+        )
         return result
 
+    async def iter_tools(self) -> AsyncIterator[mcp.types.Tool]:
+        """Iterate over the tools available on the server, fetching each page
+        of the list from the server as it is needed.
+
+        Yields:
+            mcp.types.Tool: The tools on the server, in order.
+
+        Raises:
+            RuntimeError: If called while the client is not connected.
+        """
+        async for page in _iter_pages(self.list_tools_mcp):
+            for tool in page.tools:
+                yield tool
+
     async def list_tools(self) -> list[mcp.types.Tool]:
-        """Retrieve a list of tools available on the server.
+        """Retrieve a list of all tools available on the server, fetching
+        every page if the server splits the list into pages.
 
         Returns:
             list[mcp.types.Tool]: A list of Tool objects.
@@ -810,8 +994,7 @@ class Client(Generic[ClientTransportT]):
         Raises:
             RuntimeError: If called while the client is not connected.
         """
-        result = await self.list_tools_mcp()
-        return result.tools
+        return [tool async for tool in self.iter_tools()]
 
     # --- Call Tool ---
 
@@ -821,6 +1004,8 @@ class Client(Generic[ClientTransportT]):
         arguments: dict[str, Any],
         progress_handler: ProgressHandler | None = None,
         timeout: datetime.timedelta | float | int | None = None,
+        *,
+        output_schema: dict[str, Any] | None | NotSetT = NotSet,
     ) -> mcp.types.CallToolResult:
         """Send a tools/call request and return the complete MCP protocol result.
 
@@ -832,6 +1017,11 @@ class Client(Generic[ClientTransportT]):
             arguments (dict[str, Any]): Arguments to pass to the tool.
             timeout (datetime.timedelta | float | int | None, optional): The timeout for the tool call. Defaults to None.
             progress_handler (ProgressHandler | None, optional): The progress handler to use for the tool call. Defaults to None.
+            output_schema (dict[str, Any] | None, optional): The tool's output schema, if
+                the caller already knows it. The structured content of the result is
+                validated against it, instead of against the schema the session looks
+                up by listing the server's tools. Without a schema, the session's own
+                validation is used.
 
         Returns:
             mcp.types.CallToolResult: The complete response object from the protocol,
@@ -844,12 +1034,29 @@ class Client(Generic[ClientTransportT]):
 
         if isinstance(timeout, int | float):
             timeout = datetime.timedelta(seconds=float(timeout))
-        result = await self.session.call_tool(
-            name=name,
-            arguments=arguments,
-            read_timeout_seconds=timeout,
+        if not isinstance(output_schema, dict):
+            return await self.session.call_tool(
+                name=name,
+                arguments=arguments,
+                read_timeout_seconds=timeout,
+                progress_callback=progress_handler or self._progress_handler,
+            )
+
+        result = await self.session.send_request(
+            mcp.types.ClientRequest(
+                mcp.types.CallToolRequest(
+                    method="tools/call",
+                    params=mcp.types.CallToolRequestParams(
+                        name=name, arguments=arguments
+                    ),
+                )
+            ),
+            mcp.types.CallToolResult,
+            request_read_timeout_seconds=timeout,
             progress_callback=progress_handler or self._progress_handler,
         )
+        if not result.isError:
+            _validate_structured_content(name, result, output_schema)
         return result
 
     async def call_tool(
@@ -896,22 +1103,12 @@ class Client(Generic[ClientTransportT]):
         elif result.structuredContent:
             try:
                 if name not in self.session._tool_output_schemas:
-                    await self.session.list_tools()
+                    await self.list_tools()
                 if name in self.session._tool_output_schemas:
-                    output_schema = self.session._tool_output_schemas.get(name)
-                    if output_schema:
-                        if output_schema.get("x-fastmcp-wrap-result"):
-                            output_schema = output_schema.get("properties", {}).get(
-                                "result"
-                            )
-                            structured_content = result.structuredContent.get("result")
-                        else:
-                            structured_content = result.structuredContent
-                        output_type = json_schema_to_type(output_schema)
-                        type_adapter = get_cached_typeadapter(output_type)
-                        data = type_adapter.validate_python(structured_content)
-                    else:
-                        data = result.structuredContent
+                    output_type = self._session_state.output_types.get(
+                        name, self.session._tool_output_schemas[name]
+                    )
+                    data = output_type.validate(result.structuredContent)
             except Exception as e:
                 logger.error(f"[{self.name}] Error parsing structured content: {e}")
 
@@ -931,6 +1128,24 @@ class Client(Generic[ClientTransportT]):
             return f"{class_name}-{name}-{secrets.token_hex(2)}"
 
 
+def _validate_structured_content(
+    name: str, result: mcp.types.CallToolResult, output_schema: dict[str, Any]
+) -> None:
+    """Validate a tool result like ClientSession.call_tool does, against a known schema."""
+    if result.structuredContent is None:
+        raise RuntimeError(
+            f"Tool {name} has an output schema but did not return structured content"
+        )
+    try:
+        jsonschema.validate(result.structuredContent, output_schema)
+    except jsonschema.ValidationError as e:
+        raise RuntimeError(
+            f"Invalid structured content returned by tool {name}: {e}"
+        ) from e
+    except jsonschema.SchemaError as e:
+        raise RuntimeError(f"Invalid schema for tool {name}: {e}") from e
+
+
 @dataclass
 class CallToolResult:
     content: list[mcp.types.ContentBlock]
@@ -0,0 +1,94 @@
+"""Compiled validators for the structured output of a client's tools."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any
+
+import mcp.types
+from pydantic import TypeAdapter
+
+from fastmcp.utilities.json_schema_type import json_schema_to_type
+
+
+def _schema_key(schema: dict[str, Any] | None) -> str:
+    if schema is None:
+        return ""
+    return hashlib.sha256(
+        json.dumps(schema, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+@dataclass
+class OutputType:
+    """The compiled output schema of a tool."""
+
+    schema: dict[str, Any] | None
+    key: str
+    adapter: TypeAdapter[Any] | None
+    wrap_result: bool
+
+    @classmethod
+    def compile(cls, schema: dict[str, Any] | None, key: str) -> OutputType:
+        if not schema:
+            return cls(schema=schema, key=key, adapter=None, wrap_result=False)
+        wrap_result = bool(schema.get("x-fastmcp-wrap-result"))
+        if wrap_result:
+            output_schema = schema.get("properties", {}).get("result")
+        else:
+            output_schema = schema
+        # A new adapter per schema: json_schema_to_type creates a new type on
+        # every call, so the shared TypeAdapter cache wouldn't help
+        adapter = TypeAdapter(json_schema_to_type(output_schema))  # type: ignore[arg-type]
+        return cls(schema=schema, key=key, adapter=adapter, wrap_result=wrap_result)
+
+    def validate(self, structured_content: dict[str, Any]) -> Any:
+        if self.adapter is None:
+            return structured_content
+        if self.wrap_result:
+            return self.adapter.validate_python(structured_content.get("result"))
+        return self.adapter.validate_python(structured_content)
+
+
+class OutputTypeCache:
+    """
+    Compiled output types for a client's tools, by tool name and schema.
+
+    Compiling an output schema into a type is expensive, so each schema is
+    compiled once, on the first call that returns structured content. A
+    tool's entry is reused while its schema object is unchanged, or when a new
+    listing returns an identical schema (compared by hash).
+    """
+
+    def __init__(self) -> None:
+        self._types: dict[str, OutputType] = {}
+
+    def get(self, name: str, schema: dict[str, Any] | None) -> OutputType:
+        output_type = self._types.get(name)
+        if output_type is not None and output_type.schema is schema:
+            return output_type
+        key = _schema_key(schema)
+        if output_type is not None and output_type.key == key:
+            output_type.schema = schema
+            return output_type
+        output_type = OutputType.compile(schema, key)
+        self._types[name] = output_type
+        return output_type
+
+    def update(self, tools: list[mcp.types.Tool], complete: bool = True) -> None:
+        """
+        Refresh cached types from a tool listing. Tools missing from a complete
+        listing are dropped; a single page of a paginated listing is not complete.
+        """
+        schemas = {tool.name: tool.outputSchema for tool in tools}
+        for name, output_type in list(self._types.items()):
+            if name in schemas:
+                if output_type.schema is not schemas[name]:
+                    self.get(name, schemas[name])
+            elif complete:
+                del self._types[name]
+
+    def clear(self) -> None:
+        self._types.clear()
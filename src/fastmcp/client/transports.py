@@ -2,18 +2,23 @@ import abc
 import asyncio
 import contextlib
 import datetime
+import functools
+import importlib.metadata
+import math
 import os
 import shutil
 import sys
 import warnings
 from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal, TypeVar, cast, overload
 
 import anyio
 import httpx
 import mcp.types
-from mcp import ClientSession, StdioServerParameters
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from mcp import ClientSession, McpError, StdioServerParameters
 from mcp.client.session import (
     ElicitationFnT,
     ListRootsFnT,
@@ -25,9 +30,17 @@ from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client
 from mcp.client.streamable_http import streamablehttp_client
 from mcp.server.fastmcp import FastMCP as FastMCP1Server
+from mcp.server.lowlevel.server import Server as MCPServer
+from mcp.server.lowlevel.server import request_ctx
+from mcp.server.session import ServerSession
 from mcp.shared._httpx_utils import McpHttpClientFactory
+from mcp.shared.context import RequestContext
 from mcp.shared.memory import create_client_server_memory_streams
+from mcp.shared.message import MessageMetadata, SessionMessage
+from mcp.shared.session import ProgressFnT, ReceiveResultT
+from mcp.types import JSONRPCError, JSONRPCResponse
 from pydantic import AnyUrl
+from pydantic_core import to_jsonable_python
 from typing_extensions import TypedDict, Unpack
 
 import fastmcp
@@ -56,6 +69,7 @@ __all__ = [
     "UvStdioTransport",
     "NpxStdioTransport",
     "FastMCPTransport",
+    "DirectFastMCPTransport",
     "infer_transport",
 ]
 
@@ -834,6 +848,306 @@ class FastMCPTransport(ClientTransport):
         return f"<FastMCPTransport(server='{self.server.name}')>"
 
 
+@dataclass
+class _DirectRequest:
+    """A request handed from a DirectClientSession to the server task."""
+
+    request: mcp.types.ClientRequest
+    request_id: int
+    scope: anyio.CancelScope = field(default_factory=anyio.CancelScope)
+    response: mcp.types.ServerResult | mcp.types.ErrorData | None = None
+    exception: Exception | None = None
+
+
+class DirectClientSession(ClientSession):
+    """
+    A ClientSession that hands requests to an in-process server as typed
+    objects, skipping JSON-RPC envelopes and re-validation.
+
+    The session still runs over memory streams for the initialize handshake,
+    notifications and requests from the server (e.g. sampling), and for
+    requests the server has no handler for.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        server: MCPServer[Any, Any],
+        direct_requests: MemoryObjectSendStream[_DirectRequest],
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self._server = server
+        self._direct_requests = direct_requests
+
+    async def send_request(
+        self,
+        request: mcp.types.ClientRequest,
+        result_type: type[ReceiveResultT],
+        request_read_timeout_seconds: datetime.timedelta | None = None,
+        metadata: MessageMetadata = None,
+        progress_callback: ProgressFnT | None = None,
+    ) -> ReceiveResultT:
+        root = request.root
+        if type(root) not in self._server.request_handlers or (
+            progress_callback is not None and root.params is None
+        ):
+            return await super().send_request(
+                request,
+                result_type,
+                request_read_timeout_seconds=request_read_timeout_seconds,
+                metadata=metadata,
+                progress_callback=progress_callback,
+            )
+
+        request_id = self._request_id
+        self._request_id = request_id + 1
+        params = root.params
+        update: dict[str, Any] = {}
+        if (arguments := getattr(params, "arguments", None)) is not None:
+            # Arguments may hold any Python values; give the server the
+            # JSON-compatible copy it would have received over the streams
+            update["arguments"] = to_jsonable_python(arguments)
+        if progress_callback is not None and params is not None:
+            # Use the request id as the progress token, like the stream path
+            update["meta"] = (
+                params.meta.model_copy(update={"progressToken": request_id})
+                if params.meta is not None
+                else mcp.types.RequestParams.Meta(progressToken=request_id)
+            )
+            self._progress_callbacks[request_id] = progress_callback
+        if update and params is not None:
+            params = params.model_copy(update=update)
+            request = mcp.types.ClientRequest(
+                root.model_copy(update={"params": params})  # type: ignore[arg-type]
+            )
+
+        timeout = None
+        if request_read_timeout_seconds is not None:
+            timeout = request_read_timeout_seconds.total_seconds()
+        elif self._session_read_timeout_seconds is not None:
+            timeout = self._session_read_timeout_seconds.total_seconds()
+
+        # The server reports completion with an empty response over the
+        # streams, so that the result is delivered after any notifications
+        # (e.g. progress) the handler sent before it returned
+        response_stream, response_stream_reader = anyio.create_memory_object_stream[
+            JSONRPCResponse | JSONRPCError
+        ](1)
+        self._response_streams[request_id] = response_stream
+        direct_request = _DirectRequest(request=request, request_id=request_id)
+        completed = False
+        try:
+            await self._direct_requests.send(direct_request)
+            try:
+                with anyio.fail_after(timeout):
+                    await response_stream_reader.receive()
+                completed = True
+            except TimeoutError:
+                raise McpError(
+                    mcp.types.ErrorData(
+                        code=httpx.codes.REQUEST_TIMEOUT,
+                        message=(
+                            f"Timed out while waiting for response to "
+                            f"{request.__class__.__name__}. Waited "
+                            f"{timeout} seconds."
+                        ),
+                    )
+                )
+        finally:
+            # Like a cancelled request over streams, stop the handler if the
+            # caller stops waiting
+            if not completed:
+                direct_request.scope.cancel()
+            self._response_streams.pop(request_id, None)
+            self._progress_callbacks.pop(request_id, None)
+            await response_stream.aclose()
+            await response_stream_reader.aclose()
+
+        if direct_request.exception is not None:
+            raise direct_request.exception
+        response = direct_request.response
+        if isinstance(response, mcp.types.ErrorData):
+            raise McpError(response)
+        assert response is not None
+        if isinstance(response.root, result_type):
+            return response.root
+        return result_type.model_validate(
+            response.root.model_dump(by_alias=True, mode="json", exclude_none=True)
+        )
+
+
+class DirectFastMCPTransport(FastMCPTransport):
+    """In-memory transport that dispatches requests to the server's handlers directly.
+
+    Like FastMCPTransport, but requests are passed to the server's request
+    handlers as typed objects instead of being serialized to JSON-RPC and
+    validated again on the other side, and results are returned the same way.
+    Request and result objects are therefore shared between client and server
+    rather than copied.
+
+    Handlers run in the server's task, with the same request context as over
+    FastMCPTransport, so middleware, logging, progress, sampling and
+    elicitation behave identically. With `raise_exceptions=True`, a handler's
+    exception is raised to the caller of the request.
+
+    It relies on internals of the MCP SDK's client and server sessions, which
+    may change between SDK releases. FastMCP uses it for MCPConfig composites
+    and in-process proxies only when `is_supported()` confirms the installed
+    SDK is a release it was tested against, and falls back to
+    FastMCPTransport otherwise.
+    """
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Whether the installed MCP SDK is one this transport was tested against."""
+        return _mcp_version() in _DIRECT_DISPATCH_MCP_VERSIONS and all(
+            hasattr(cls, name)
+            for cls, name in [
+                (MCPServer, "_handle_message"),
+                (ServerSession, "_send_response"),
+            ]
+        )
+
+    @contextlib.asynccontextmanager
+    async def connect_session(
+        self, **session_kwargs: Unpack[SessionKwargs]
+    ) -> AsyncIterator[ClientSession]:
+        direct_send, direct_receive = anyio.create_memory_object_stream[_DirectRequest](
+            math.inf
+        )
+        async with create_client_server_memory_streams() as (
+            client_streams,
+            server_streams,
+        ):
+            client_read, client_write = client_streams
+            server_read, server_write = server_streams
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(
+                    self._run_server, server_read, server_write, direct_receive
+                )
+
+                try:
+                    async with DirectClientSession(
+                        read_stream=client_read,
+                        write_stream=client_write,
+                        server=self.server._mcp_server,
+                        direct_requests=direct_send,
+                        **session_kwargs,
+                    ) as client_session:
+                        yield client_session
+                finally:
+                    tg.cancel_scope.cancel()
+
+    async def _run_server(
+        self,
+        read_stream: MemoryObjectReceiveStream[SessionMessage | Exception],
+        write_stream: MemoryObjectSendStream[SessionMessage],
+        direct_requests: MemoryObjectReceiveStream[_DirectRequest],
+    ) -> None:
+        """Mirrors the low-level server's `run`, also serving direct requests."""
+        server = self.server._mcp_server
+        async with contextlib.AsyncExitStack() as stack:
+            lifespan_context = await stack.enter_async_context(server.lifespan(server))
+            session = await stack.enter_async_context(
+                ServerSession(
+                    read_stream,
+                    write_stream,
+                    server.create_initialization_options(),
+                )
+            )
+
+            async def serve_direct_requests() -> None:
+                async for direct_request in direct_requests:
+                    tg.start_soon(
+                        self._handle_direct_request,
+                        direct_request,
+                        session,
+                        lifespan_context,
+                    )
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(serve_direct_requests)
+                async for message in session.incoming_messages:
+                    tg.start_soon(
+                        server._handle_message,
+                        message,
+                        session,
+                        lifespan_context,
+                        self.raise_exceptions,
+                    )
+
+    async def _handle_direct_request(
+        self,
+        direct_request: _DirectRequest,
+        session: ServerSession,
+        lifespan_context: Any,
+    ) -> None:
+        """Call the request's handler as the low-level server would."""
+        request = direct_request.request.root
+        handler = self.server._mcp_server.request_handlers[type(request)]
+        params = getattr(request, "params", None)
+        token = request_ctx.set(
+            RequestContext(
+                direct_request.request_id,
+                params.meta if params is not None else None,
+                session,
+                lifespan_context,
+            )
+        )
+        try:
+            with direct_request.scope:
+                direct_request.response = await handler(request)
+            if direct_request.scope.cancelled_caught:
+                return
+        except McpError as err:
+            direct_request.response = err.error
+        except Exception as err:
+            if self.raise_exceptions:
+                direct_request.exception = err
+            else:
+                direct_request.response = mcp.types.ErrorData(
+                    code=0, message=str(err), data=None
+                )
+        finally:
+            request_ctx.reset(token)
+
+        with contextlib.suppress(anyio.ClosedResourceError, anyio.BrokenResourceError):
+            await session._send_response(
+                direct_request.request_id,
+                mcp.types.ServerResult(mcp.types.EmptyResult()),
+            )
+
+    def __repr__(self) -> str:
+        return f"<DirectFastMCPTransport(server='{self.server.name}')>"
+
+
+# The MCP SDK releases (major, minor) whose session internals
+# DirectClientSession was tested against
+_DIRECT_DISPATCH_MCP_VERSIONS = {(1, 12)}
+
+
+@functools.cache
+def _mcp_version() -> tuple[int, int] | None:
+    try:
+        major, minor = importlib.metadata.version("mcp").split(".")[:2]
+        return int(major), int(minor)
+    except (importlib.metadata.PackageNotFoundError, ValueError):
+        return None
+
+
+def in_process_transport(mcp: FastMCP[Any] | FastMCP1Server) -> FastMCPTransport:
+    """
+    Return the transport FastMCP uses to connect to an in-process server:
+    DirectFastMCPTransport if the installed MCP SDK supports it, otherwise
+    FastMCPTransport.
+    """
+    if DirectFastMCPTransport.is_supported():
+        return DirectFastMCPTransport(mcp)
+    return FastMCPTransport(mcp)
+
+
 class MCPConfigTransport(ClientTransport):
     """Transport for connecting to one or more MCP servers defined in an MCPConfig.
 
@@ -913,7 +1227,7 @@ class MCPConfigTransport(ClientTransport):
                     server, prefix=name if name_as_prefix else None
                 )
 
-            self.transport = FastMCPTransport(mcp=self._composite_server)
+            self.transport = in_process_transport(self._composite_server)
 
     @contextlib.asynccontextmanager
     async def connect_session(
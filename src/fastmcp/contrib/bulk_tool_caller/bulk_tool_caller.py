@@ -1,6 +1,8 @@
-from typing import Any
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import Annotated, Any, cast
 
-from mcp.types import CallToolResult
+import anyio
+from mcp.types import CallToolResult, TextContent
 from pydantic import BaseModel, Field
 
 from fastmcp import FastMCP
@@ -11,6 +13,8 @@ from fastmcp.contrib.mcp_mixin.mcp_mixin import (
     MCPMixin,
     mcp_tool,
 )
+from fastmcp.exceptions import DisabledError, NotFoundError
+from fastmcp.server.context import Context
 
 
 class CallToolRequest(BaseModel):
@@ -51,8 +55,17 @@ class CallToolRequestResult(CallToolResult):
 class BulkToolCaller(MCPMixin):
     """
     A class to provide a "bulk tool call" tool for a FastMCP server
+
+    Args:
+        in_process: Call tools directly on the server instead of through an MCP
+            client session. The server's middleware and component filtering
+            still apply, but each call skips JSON-RPC framing and
+            (de)serialization, which makes large batches much faster.
     """
 
+    def __init__(self, in_process: bool = False):
+        self.in_process = in_process
+
     def register_tools(
         self,
         mcp_server: "FastMCP",
@@ -62,30 +75,34 @@ class BulkToolCaller(MCPMixin):
         """
         Register the tools provided by this class with the given MCP server.
         """
+        self.server = mcp_server
         self.connection = FastMCPTransport(mcp_server)
 
         super().register_tools(mcp_server=mcp_server)
 
     @mcp_tool()
     async def call_tools_bulk(
-        self, tool_calls: list[CallToolRequest], continue_on_error: bool = True
+        self,
+        tool_calls: list[CallToolRequest],
+        continue_on_error: bool = True,
+        max_concurrency: Annotated[int, Field(ge=1)] = 1,
     ) -> list[CallToolRequestResult]:
         """
         Call multiple tools registered on this MCP server in a single request. Each call can
          be for a different tool and can include different arguments. Useful for speeding up
          what would otherwise take several individual tool calls.
-        """
-        results = []
-
-        for tool_call in tool_calls:
-            result = await self._call_tool(tool_call.tool, tool_call.arguments)
-
-            results.append(result)
-
-            if result.isError and not continue_on_error:
-                return results
 
-        return results
+        Args:
+            tool_calls: The tool calls to make.
+            continue_on_error: Whether to keep going after a call fails.
+            max_concurrency: How many calls may run at the same time. Only raise this for
+             calls that don't depend on each other.
+        """
+        return await self._call_tools(
+            [(tool_call.tool, tool_call.arguments) for tool_call in tool_calls],
+            continue_on_error=continue_on_error,
+            max_concurrency=max_concurrency,
+        )
 
     @mcp_tool()
     async def call_tool_bulk(
@@ -93,6 +110,7 @@ class BulkToolCaller(MCPMixin):
         tool: str,
         tool_arguments: list[dict[str, str | int | float | bool | None]],
         continue_on_error: bool = True,
+        max_concurrency: Annotated[int, Field(ge=1)] = 1,
     ) -> list[CallToolRequestResult]:
         """
         Call a single tool registered on this MCP server multiple times with a single request.
@@ -102,32 +120,149 @@ class BulkToolCaller(MCPMixin):
         Args:
             tool: The name of the tool to call.
             tool_arguments: A list of dictionaries, where each dictionary contains the arguments for an individual run of the tool.
+            continue_on_error: Whether to keep going after a call fails.
+            max_concurrency: How many calls may run at the same time. Only raise this for
+             calls that don't depend on each other.
         """
-        results = []
+        return await self._call_tools(
+            [(tool, dict(arguments)) for arguments in tool_arguments],
+            continue_on_error=continue_on_error,
+            max_concurrency=max_concurrency,
+        )
 
-        for tool_call_arguments in tool_arguments:
-            result = await self._call_tool(tool, tool_call_arguments)
+    async def _call_tools(
+        self,
+        calls: list[tuple[str, dict[str, Any]]],
+        continue_on_error: bool,
+        max_concurrency: int,
+    ) -> list[CallToolRequestResult]:
+        """
+        Make the calls over a single session, up to `max_concurrency` at a time,
+        and return their results in order.
 
-            results.append(result)
+        Unless `continue_on_error` is set, a failed call cancels the calls after
+        it, while the calls before it still complete. The results are therefore
+        the same as if the calls were made one at a time.
+        """
+        async with self._session() as client:
+            if max_concurrency == 1 or len(calls) <= 1:
+                return await self._call_tools_sequentially(
+                    client, calls, continue_on_error
+                )
+            return await self._call_tools_concurrently(
+                client, calls, continue_on_error, max_concurrency
+            )
 
+    async def _call_tools_sequentially(
+        self,
+        client: Client | None,
+        calls: list[tuple[str, dict[str, Any]]],
+        continue_on_error: bool,
+    ) -> list[CallToolRequestResult]:
+        results: list[CallToolRequestResult] = []
+        for tool, arguments in calls:
+            result = await self._call_tool(client, tool, arguments)
+            results.append(result)
             if result.isError and not continue_on_error:
-                return results
-
+                break
         return results
 
+    async def _call_tools_concurrently(
+        self,
+        client: Client | None,
+        calls: list[tuple[str, dict[str, Any]]],
+        continue_on_error: bool,
+        max_concurrency: int,
+    ) -> list[CallToolRequestResult]:
+        """
+        Make the calls from `max_concurrency` workers that take the next call
+        from a shared queue as they become free.
+        """
+        results: list[CallToolRequestResult | None] = [None] * len(calls)
+        # The index of the first failed call, if continue_on_error is not set
+        stop_after = len(calls)
+        running: dict[int, anyio.CancelScope] = {}
+        pending = iter(enumerate(calls))
+
+        async def worker() -> None:
+            nonlocal stop_after
+            for index, (tool, arguments) in pending:
+                if index > stop_after:
+                    return
+                with anyio.CancelScope() as scope:
+                    running[index] = scope
+                    try:
+                        result = await self._call_tool(client, tool, arguments)
+                    finally:
+                        del running[index]
+                if scope.cancelled_caught:
+                    continue
+                results[index] = result
+                if result.isError and not continue_on_error and index < stop_after:
+                    stop_after = index
+                    for other, other_scope in running.items():
+                        if other > index:
+                            other_scope.cancel()
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(min(max_concurrency, len(calls))):
+                tg.start_soon(worker)
+
+        return cast(list[CallToolRequestResult], results[: stop_after + 1])
+
+    def _session(self) -> AbstractAsyncContextManager[Client | None]:
+        """A client session for a bulk request, or None when calling in process."""
+        if self.in_process:
+            return nullcontext()
+        return Client(self.connection)
+
     async def _call_tool(
-        self, tool: str, arguments: dict[str, Any]
+        self, client: Client | None, tool: str, arguments: dict[str, Any]
     ) -> CallToolRequestResult:
         """
         Helper method to call a tool with the provided arguments.
         """
+        if client is None:
+            return await self._call_tool_in_process(tool, arguments)
 
-        async with Client(self.connection) as client:
-            result = await client.call_tool_mcp(name=tool, arguments=arguments)
+        result = await client.call_tool_mcp(name=tool, arguments=arguments)
 
-            return CallToolRequestResult(
-                tool=tool,
-                arguments=arguments,
-                isError=result.isError,
-                content=result.content,
-            )
+        return CallToolRequestResult(
+            tool=tool,
+            arguments=arguments,
+            isError=result.isError,
+            content=result.content,
+        )
+
+    async def _call_tool_in_process(
+        self, tool: str, arguments: dict[str, Any]
+    ) -> CallToolRequestResult:
+        """
+        Call a tool through the server's middleware and filters, reporting
+        errors as error results like the MCP server would.
+        """
+        try:
+            async with Context(fastmcp=self.server):
+                result = await self.server._call_tool(tool, arguments)
+        except (DisabledError, NotFoundError):
+            return self._error_result(tool, arguments, f"Unknown tool: {tool}")
+        except Exception as e:
+            return self._error_result(tool, arguments, str(e))
+
+        return CallToolRequestResult(
+            tool=tool,
+            arguments=arguments,
+            isError=False,
+            content=result.content,
+        )
+
+    @staticmethod
+    def _error_result(
+        tool: str, arguments: dict[str, Any], message: str
+    ) -> CallToolRequestResult:
+        return CallToolRequestResult(
+            tool=tool,
+            arguments=arguments,
+            isError=True,
+            content=[TextContent(type="text", text=message)],
+        )
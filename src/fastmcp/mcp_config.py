@@ -118,9 +118,9 @@ class _TransformingMCPServerMixin(FastMCPBaseModel):
 
     def to_transport(self) -> ClientTransport:
         """Get the transport for the transforming MCP server."""
-        from fastmcp.client.transports import FastMCPTransport
+        from fastmcp.client.transports import in_process_transport
 
-        return FastMCPTransport(mcp=self._to_server_and_underlying_transport()[0])
+        return in_process_transport(self._to_server_and_underlying_transport()[0])
 
 
 class StdioMCPServer(BaseModel):
@@ -6,6 +6,7 @@ import inspect
 import json
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable, Sequence
+from functools import partial
 from typing import Any
 
 import pydantic_core
@@ -19,9 +20,11 @@ from fastmcp.server.dependencies import get_context
 from fastmcp.utilities.components import FastMCPComponent
 from fastmcp.utilities.json_schema import compress_schema
 from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.sync_executor import get_sync_executor
 from fastmcp.utilities.types import (
     FastMCPBaseModel,
     find_kwarg_by_type,
+    get_cached_signature,
     get_cached_typeadapter,
 )
 
@@ -262,7 +265,7 @@ class FunctionPrompt(Prompt):
         """Convert string arguments to expected types based on function signature."""
         from fastmcp.server.context import Context
 
-        sig = inspect.signature(self.fn)
+        sig = get_cached_signature(self.fn)
         converted_kwargs = {}
 
         # Find context parameter name if any
@@ -338,7 +341,7 @@ class FunctionPrompt(Prompt):
             kwargs = self._convert_string_arguments(kwargs)
 
             # Call function and check if result is a coroutine
-            result = self.fn(**kwargs)
+            result = await get_sync_executor().call(partial(self.fn, **kwargs))
             if inspect.isawaitable(result):
                 result = await result
 
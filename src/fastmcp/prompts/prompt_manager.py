@@ -11,6 +11,7 @@ from fastmcp.exceptions import NotFoundError, PromptError
 from fastmcp.prompts.prompt import FunctionPrompt, Prompt, PromptResult
 from fastmcp.settings import DuplicateBehavior
 from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.mounts import MountedServerLoader, NegativeCache
 
 if TYPE_CHECKING:
     from fastmcp.server.server import MountedServer
@@ -28,6 +29,9 @@ class PromptManager:
     ):
         self._prompts: dict[str, Prompt] = {}
         self._mounted_servers: list[MountedServer] = []
+        self._mounted_loader: MountedServerLoader[Any] = MountedServerLoader("prompts")
+        # Names that mounted servers recently reported as not found
+        self._not_found = NegativeCache()
         self.mask_error_details = mask_error_details or settings.mask_error_details
 
         # Default to "warn" if None is provided
@@ -56,34 +60,39 @@ class PromptManager:
         """
         all_prompts: dict[str, Prompt] = {}
 
-        for mounted in self._mounted_servers:
-            try:
-                if via_server:
-                    # Use the server-to-server filtered path
-                    child_results = await mounted.server._list_prompts()
-                else:
-                    # Use the manager-to-manager unfiltered path
-                    child_results = await mounted.server._prompt_manager.list_prompts()
-
-                # The combination logic is the same for both paths
-                child_dict = {p.key: p for p in child_results}
-                if mounted.prefix:
-                    for prompt in child_dict.values():
-                        prefixed_prompt = prompt.model_copy(
-                            key=f"{mounted.prefix}_{prompt.key}"
-                        )
-                        all_prompts[prefixed_prompt.key] = prefixed_prompt
-                else:
-                    all_prompts.update(child_dict)
-            except Exception as e:
+        async def load(mounted: MountedServer) -> list[Prompt]:
+            if via_server:
+                # Use the server-to-server filtered path
+                return await mounted.server._list_prompts()
+            # Use the manager-to-manager unfiltered path
+            return await mounted.server._prompt_manager.list_prompts()
+
+        # Mounted servers are queried concurrently, and their results combined
+        # in mount order so later mounts still take precedence
+        loaded = await self._mounted_loader.load(
+            self._mounted_servers, load, key=via_server
+        )
+        for mounted, child_results in loaded:
+            if isinstance(child_results, Exception):
                 # Skip failed mounts silently, matches existing behavior
                 logger.warning(
-                    f"Failed to get prompts from server: {mounted.server.name!r}, mounted at: {mounted.prefix!r}: {e}"
+                    f"Failed to get prompts from server: {mounted.server.name!r}, mounted at: {mounted.prefix!r}: {child_results}"
                 )
                 if settings.mounted_components_raise_on_load_error:
-                    raise
+                    raise child_results
                 continue
 
+            # The combination logic is the same for both paths
+            child_dict = {p.key: p for p in child_results}
+            if mounted.prefix:
+                for prompt in child_dict.values():
+                    prefixed_prompt = prompt.model_copy(
+                        key=f"{mounted.prefix}_{prompt.key}"
+                    )
+                    all_prompts[prefixed_prompt.key] = prefixed_prompt
+            else:
+                all_prompts.update(child_dict)
+
         # Finally, add local prompts, which always take precedence
         all_prompts.update(self._prompts)
         return all_prompts
@@ -195,9 +204,12 @@ class PromptManager:
                     prompt_key = name.removeprefix(f"{mounted.prefix}_")
                 else:
                     continue
+            if mounted.health.is_open or (mounted, prompt_key) in self._not_found:
+                continue
             try:
                 return await mounted.server._get_prompt(prompt_key, arguments)
             except NotFoundError:
+                self._not_found.add(mounted, prompt_key)
                 continue
 
         raise NotFoundError(f"Unknown prompt: {name}")
@@ -5,6 +5,7 @@ from __future__ import annotations
 import abc
 import inspect
 from collections.abc import Callable
+from functools import partial
 from typing import TYPE_CHECKING, Annotated, Any
 
 import pydantic_core
@@ -22,6 +23,7 @@ from typing_extensions import Self
 
 from fastmcp.server.dependencies import get_context
 from fastmcp.utilities.components import FastMCPComponent
+from fastmcp.utilities.sync_executor import get_sync_executor
 from fastmcp.utilities.types import (
     find_kwarg_by_type,
 )
@@ -201,15 +203,20 @@ class FunctionResource(Resource):
         if context_kwarg is not None:
             kwargs[context_kwarg] = get_context()
 
-        result = self.fn(**kwargs)
+        result = await get_sync_executor().call(partial(self.fn, **kwargs))
         if inspect.isawaitable(result):
             result = await result
 
-        if isinstance(result, Resource):
-            return await result.read()
-        elif isinstance(result, bytes):
-            return result
-        elif isinstance(result, str):
-            return result
-        else:
-            return pydantic_core.to_json(result, fallback=str).decode()
+        return await _convert_to_contents(result)
+
+
+async def _convert_to_contents(result: Any) -> str | bytes:
+    """Convert the return value of a resource function to resource contents."""
+    if isinstance(result, Resource):
+        return await result.read()
+    elif isinstance(result, bytes):
+        return result
+    elif isinstance(result, str):
+        return result
+    else:
+        return pydantic_core.to_json(result, fallback=str).decode()
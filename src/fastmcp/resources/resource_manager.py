@@ -5,7 +5,8 @@ from __future__ import annotations
 import inspect
 import warnings
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
 
 from pydantic import AnyUrl
 
@@ -14,10 +15,12 @@ from fastmcp.exceptions import NotFoundError, ResourceError
 from fastmcp.resources.resource import Resource
 from fastmcp.resources.template import (
     ResourceTemplate,
-    match_uri_template,
+    ResourceTemplateIndex,
 )
 from fastmcp.settings import DuplicateBehavior
+from fastmcp.utilities.components import VersionedDict
 from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.mounts import MountedServerLoader, NegativeCache
 
 if TYPE_CHECKING:
     from fastmcp.server.server import MountedServer
@@ -25,6 +28,21 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+@dataclass
+class ResolvedResource:
+    """The component that serves a URI, as found by ResourceManager.resolve_resource."""
+
+    uri: str
+    # The resource to filter on and take the MIME type from. For templates that
+    # use the default create_resource(), this is the template itself.
+    component: Resource | ResourceTemplate
+    # The matching template and its parameters, if the URI matched a template
+    template: ResourceTemplate | None = None
+    params: dict[str, str] | None = None
+    # Whether the component is registered on this manager (not a mounted server)
+    local: bool = False
+
+
 class ResourceManager:
     """Manages FastMCP resources."""
 
@@ -41,11 +59,34 @@ class ResourceManager:
             mask_error_details: Whether to mask error details from exceptions
                 other than ResourceError
         """
-        self._resources: dict[str, Resource] = {}
-        self._templates: dict[str, ResourceTemplate] = {}
+        self._resources: VersionedDict[Resource] = VersionedDict()
+        self._templates: VersionedDict[ResourceTemplate] = VersionedDict()
         self._mounted_servers: list[MountedServer] = []
+        self._mounted_resource_loader: MountedServerLoader[Any] = MountedServerLoader(
+            "resources"
+        )
+        self._mounted_template_loader: MountedServerLoader[Any] = MountedServerLoader(
+            "templates"
+        )
+        # URIs that mounted servers recently reported as not found
+        self._not_found = NegativeCache(
+            get_version=lambda mounted: mounted.server._resource_manager._get_version()
+        )
         self.mask_error_details = mask_error_details or settings.mask_error_details
 
+        # Cached unfiltered inventories, valid while the composite version
+        # (this manager, all mounted managers, and component enabled state)
+        # matches. `_generation` is bumped on mounts; the registries track
+        # their own edits.
+        self._generation: int = 0
+        self._resource_inventory: dict[str, Resource] | None = None
+        self._resource_inventory_version: tuple[Any, ...] | None = None
+        self._template_inventory: dict[str, ResourceTemplate] | None = None
+        self._template_index: ResourceTemplateIndex | None = None
+        self._template_inventory_version: tuple[Any, ...] | None = None
+        self._local_template_index: ResourceTemplateIndex | None = None
+        self._local_template_index_version: int | None = None
+
         # Default to "warn" if None is provided
         if duplicate_behavior is None:
             duplicate_behavior = "warn"
@@ -60,14 +101,97 @@ class ResourceManager:
     def mount(self, server: MountedServer) -> None:
         """Adds a mounted server as a source for resources and templates."""
         self._mounted_servers.append(server)
+        self._generation += 1
+
+    def _get_version(self) -> tuple[Any, ...] | None:
+        """
+        Return a version that changes whenever the unfiltered inventories may
+        have changed, or None if they can't be cached (e.g. a remote source).
+
+        Versions of mounted managers are included, so changes in child servers
+        propagate up to every parent.
+        """
+        parts: list[Any] = [
+            self._generation,
+            self._resources.version,
+            self._templates.version,
+        ]
+        for mounted in self._mounted_servers:
+            try:
+                child_version = mounted.server._resource_manager._get_version()
+            except Exception:
+                return None
+            if child_version is None:
+                return None
+            parts.append((id(mounted.server), child_version))
+        return tuple(parts)
+
+    async def _get_resource_inventory(self) -> dict[str, Resource]:
+        """
+        Return the unfiltered resource inventory, rebuilding it only if
+        something changed. The returned dict is shared and must not be mutated.
+        """
+        version = self._get_version()
+        if (
+            version is not None
+            and self._resource_inventory is not None
+            and version == self._resource_inventory_version
+        ):
+            return self._resource_inventory
+
+        inventory = await self._load_resources(via_server=False)
+        if version is not None:
+            self._resource_inventory = inventory
+            self._resource_inventory_version = version
+        return inventory
+
+    async def _get_template_inventory(self) -> dict[str, ResourceTemplate]:
+        """
+        Return the unfiltered template inventory, rebuilding it only if
+        something changed. The returned dict is shared and must not be mutated.
+        """
+        version = self._get_version()
+        if (
+            version is not None
+            and self._template_inventory is not None
+            and version == self._template_inventory_version
+        ):
+            return self._template_inventory
+
+        inventory = await self._load_resource_templates(via_server=False)
+        if version is not None:
+            self._template_inventory = inventory
+            self._template_index = None
+            self._template_inventory_version = version
+        return inventory
+
+    async def _get_template_index(self) -> ResourceTemplateIndex:
+        """Return a matching index over the unfiltered template inventory."""
+        templates = await self._get_template_inventory()
+        if templates is not self._template_inventory:
+            # Not cacheable, so index this inventory just for this lookup
+            return ResourceTemplateIndex(templates)
+        if self._template_index is None:
+            self._template_index = ResourceTemplateIndex(templates)
+        return self._template_index
+
+    def _get_local_template_index(self) -> ResourceTemplateIndex:
+        """Return a matching index over the local templates only."""
+        if (
+            self._local_template_index is None
+            or self._local_template_index_version != self._templates.version
+        ):
+            self._local_template_index = ResourceTemplateIndex(self._templates)
+            self._local_template_index_version = self._templates.version
+        return self._local_template_index
 
     async def get_resources(self) -> dict[str, Resource]:
         """Get all registered resources, keyed by URI."""
-        return await self._load_resources(via_server=False)
+        return dict(await self._get_resource_inventory())
 
     async def get_resource_templates(self) -> dict[str, ResourceTemplate]:
         """Get all registered templates, keyed by URI template."""
-        return await self._load_resource_templates(via_server=False)
+        return dict(await self._get_template_inventory())
 
     async def _load_resources(self, *, via_server: bool = False) -> dict[str, Resource]:
         """
@@ -79,49 +203,68 @@ class ResourceManager:
         """
         all_resources: dict[str, Resource] = {}
 
-        for mounted in self._mounted_servers:
-            try:
-                if via_server:
-                    # Use the server-to-server filtered path
-                    child_resources_list = await mounted.server._list_resources()
-                    child_resources = {
-                        resource.key: resource for resource in child_resources_list
-                    }
-                else:
-                    # Use the manager-to-manager unfiltered path
-                    child_resources = (
-                        await mounted.server._resource_manager.get_resources()
-                    )
-
-                # Apply prefix if needed
-                if mounted.prefix:
-                    from fastmcp.server.server import add_resource_prefix
-
-                    for uri, resource in child_resources.items():
-                        prefixed_uri = add_resource_prefix(
-                            uri, mounted.prefix, mounted.resource_prefix_format
-                        )
-                        # Create a copy of the resource with the prefixed key and name
-                        prefixed_resource = resource.model_copy(
-                            update={"name": f"{mounted.prefix}_{resource.name}"},
-                            key=prefixed_uri,
-                        )
-                        all_resources[prefixed_uri] = prefixed_resource
-                else:
-                    all_resources.update(child_resources)
-            except Exception as e:
+        async def load(mounted: MountedServer) -> dict[str, Resource]:
+            if via_server:
+                # Use the server-to-server filtered path
+                child_resources_list = await mounted.server._list_resources()
+                return {resource.key: resource for resource in child_resources_list}
+            # Use the manager-to-manager unfiltered path
+            return await mounted.server._resource_manager._get_resource_inventory()
+
+        # Mounted servers are queried concurrently, and their results combined
+        # in mount order so later mounts still take precedence
+        loaded = await self._mounted_resource_loader.load(
+            self._mounted_servers, load, key=via_server
+        )
+        for mounted, child_resources in loaded:
+            if isinstance(child_resources, Exception):
                 # Skip failed mounts silently, matches existing behavior
                 logger.warning(
-                    f"Failed to get resources from server: {mounted.server.name!r}, mounted at: {mounted.prefix!r}: {e}"
+                    f"Failed to get resources from server: {mounted.server.name!r}, mounted at: {mounted.prefix!r}: {child_resources}"
                 )
                 if settings.mounted_components_raise_on_load_error:
-                    raise
+                    raise child_resources
                 continue
 
+            # Apply prefix if needed
+            if mounted.prefix:
+                from fastmcp.server.server import add_resource_prefix
+
+                for uri, resource in child_resources.items():
+                    prefixed_uri = add_resource_prefix(
+                        uri, mounted.prefix, mounted.resource_prefix_format
+                    )
+                    # Create a copy of the resource with the prefixed key and name
+                    prefixed_resource = resource.model_copy(
+                        update={"name": f"{mounted.prefix}_{resource.name}"},
+                        key=prefixed_uri,
+                    )
+                    all_resources[prefixed_uri] = prefixed_resource
+            else:
+                all_resources.update(child_resources)
+
         # Finally, add local resources, which always take precedence
         all_resources.update(self._resources)
         return all_resources
 
+    async def _get_mounted_templates(
+        self, mounted: MountedServer
+    ) -> list[ResourceTemplate]:
+        """
+        The templates a mounted server contributes to the unfiltered
+        inventory: its own inventory, limited to the templates it exposes (its
+        include and exclude tags and enabled state), like its filtered listing
+        but without running its middleware.
+        """
+        child_templates = (
+            await mounted.server._resource_manager._get_template_inventory()
+        )
+        return [
+            template
+            for template in child_templates.values()
+            if mounted.server._should_enable_component(template)
+        ]
+
     async def _load_resource_templates(
         self, *, via_server: bool = False
     ) -> dict[str, ResourceTemplate]:
@@ -134,43 +277,47 @@ class ResourceManager:
         """
         all_templates: dict[str, ResourceTemplate] = {}
 
-        for mounted in self._mounted_servers:
-            try:
-                if via_server:
-                    # Use the server-to-server filtered path
-                    child_templates = await mounted.server._list_resource_templates()
-                else:
-                    # Use the manager-to-manager unfiltered path
-                    child_templates = (
-                        await mounted.server._resource_manager.list_resource_templates()
-                    )
-                child_dict = {template.key: template for template in child_templates}
-
-                # Apply prefix if needed
-                if mounted.prefix:
-                    from fastmcp.server.server import add_resource_prefix
-
-                    for uri_template, template in child_dict.items():
-                        prefixed_uri_template = add_resource_prefix(
-                            uri_template, mounted.prefix, mounted.resource_prefix_format
-                        )
-                        # Create a copy of the template with the prefixed key and name
-                        prefixed_template = template.model_copy(
-                            update={"name": f"{mounted.prefix}_{template.name}"},
-                            key=prefixed_uri_template,
-                        )
-                        all_templates[prefixed_uri_template] = prefixed_template
-                else:
-                    all_templates.update(child_dict)
-            except Exception as e:
+        async def load(mounted: MountedServer) -> list[ResourceTemplate]:
+            if via_server:
+                # Use the server-to-server filtered path
+                return await mounted.server._list_resource_templates()
+            # Use the manager-to-manager unfiltered path
+            return await self._get_mounted_templates(mounted)
+
+        # Mounted servers are queried concurrently, and their results combined
+        # in mount order so later mounts still take precedence
+        loaded = await self._mounted_template_loader.load(
+            self._mounted_servers, load, key=via_server
+        )
+        for mounted, child_templates in loaded:
+            if isinstance(child_templates, Exception):
                 # Skip failed mounts silently, matches existing behavior
                 logger.warning(
-                    f"Failed to get templates from server: {mounted.server.name!r}, mounted at: {mounted.prefix!r}: {e}"
+                    f"Failed to get templates from server: {mounted.server.name!r}, mounted at: {mounted.prefix!r}: {child_templates}"
                 )
                 if settings.mounted_components_raise_on_load_error:
-                    raise
+                    raise child_templates
                 continue
 
+            child_dict = {template.key: template for template in child_templates}
+
+            # Apply prefix if needed
+            if mounted.prefix:
+                from fastmcp.server.server import add_resource_prefix
+
+                for uri_template, template in child_dict.items():
+                    prefixed_uri_template = add_resource_prefix(
+                        uri_template, mounted.prefix, mounted.resource_prefix_format
+                    )
+                    # Create a copy of the template with the prefixed key and name
+                    prefixed_template = template.model_copy(
+                        update={"name": f"{mounted.prefix}_{template.name}"},
+                        key=prefixed_uri_template,
+                    )
+                    all_templates[prefixed_uri_template] = prefixed_template
+            else:
+                all_templates.update(child_dict)
+
         # Finally, add local templates, which always take precedence
         all_templates.update(self._templates)
         return all_templates
@@ -179,6 +326,10 @@ class ResourceManager:
         """
         Lists all resources, applying protocol filtering.
         """
+        if not self._mounted_servers:
+            # Without mounted servers there is nothing to filter, so the
+            # prebuilt inventory can be served directly.
+            return list((await self._get_resource_inventory()).values())
         resources_dict = await self._load_resources(via_server=True)
         return list(resources_dict.values())
 
@@ -186,6 +337,8 @@ class ResourceManager:
         """
         Lists all templates, applying protocol filtering.
         """
+        if not self._mounted_servers:
+            return list((await self._get_template_inventory()).values())
         templates_dict = await self._load_resource_templates(via_server=True)
         return list(templates_dict.values())
 
@@ -357,17 +510,13 @@ class ResourceManager:
         uri_str = str(uri)
 
         # First check concrete resources (local and mounted)
-        resources = await self.get_resources()
+        resources = await self._get_resource_inventory()
         if uri_str in resources:
             return True
 
         # Then check templates (local and mounted) only if not found in concrete resources
-        templates = await self.get_resource_templates()
-        for template_key in templates.keys():
-            if match_uri_template(uri_str, template_key):
-                return True
-
-        return False
+        template_index = await self._get_template_index()
+        return template_index.match(uri_str) is not None
 
     async def get_resource(self, uri: AnyUrl | str) -> Resource:
         """Get resource by URI, checking concrete resources first, then templates.
@@ -382,94 +531,115 @@ class ResourceManager:
         logger.debug("Getting resource", extra={"uri": uri_str})
 
         # First check concrete resources (local and mounted)
-        resources = await self.get_resources()
+        resources = await self._get_resource_inventory()
         if resource := resources.get(uri_str):
             return resource
 
-        # Then check templates (local and mounted) - use the utility function to match against storage keys
-        templates = await self.get_resource_templates()
-        for storage_key, template in templates.items():
-            # Try to match against the storage key (which might be a custom key)
-            if params := match_uri_template(uri_str, storage_key):
-                try:
-                    return await template.create_resource(
-                        uri_str,
-                        params=params,
-                    )
-                # Pass through ResourceErrors as-is
-                except ResourceError as e:
-                    logger.error(f"Error creating resource from template: {e}")
-                    raise e
-                # Handle other exceptions
-                except Exception as e:
-                    logger.error(f"Error creating resource from template: {e}")
-                    if self.mask_error_details:
-                        # Mask internal details
-                        raise ValueError("Error creating resource from template") from e
-                    else:
-                        # Include original error details
-                        raise ValueError(
-                            f"Error creating resource from template: {e}"
-                        ) from e
+        # Then check templates (local and mounted), matching against storage keys
+        # (which might be custom keys)
+        template_index = await self._get_template_index()
+        if match := template_index.match(uri_str):
+            _, template, params = match
+            return await self._create_resource(uri_str, template, params)
+
+        raise NotFoundError(f"Unknown resource: {uri_str}")
+
+    async def resolve_resource(self, uri: AnyUrl | str) -> ResolvedResource:
+        """Find the component that serves a URI, checking concrete resources first.
+
+        Unlike get_resource(), templates are only instantiated if they override
+        create_resource(); otherwise the template and its matched parameters are
+        returned so the URI can be read without building a Resource. Pass the
+        result to read_resource() to read it without matching the URI again.
+
+        Raises:
+            NotFoundError: If no resource or template matching the URI is found.
+        """
+        uri_str = str(uri)
+
+        resources = await self._get_resource_inventory()
+        if resource := resources.get(uri_str):
+            return ResolvedResource(
+                uri=uri_str,
+                component=resource,
+                local=self._resources.get(uri_str) is resource,
+            )
+
+        template_index = await self._get_template_index()
+        if match := template_index.match(uri_str):
+            key, template, params = match
+            component: Resource | ResourceTemplate = template
+            if template.creates_custom_resources:
+                component = await self._create_resource(uri_str, template, params)
+            return ResolvedResource(
+                uri=uri_str,
+                component=component,
+                template=template,
+                params=params,
+                local=self._templates.get(key) is template,
+            )
 
         raise NotFoundError(f"Unknown resource: {uri_str}")
 
-    async def read_resource(self, uri: AnyUrl | str) -> str | bytes:
+    async def _create_resource(
+        self, uri_str: str, template: ResourceTemplate, params: dict[str, Any]
+    ) -> Resource:
+        """Create a resource from a template, standardizing errors."""
+        try:
+            return await template.create_resource(
+                uri_str,
+                params=params,
+            )
+        # Pass through ResourceErrors as-is
+        except ResourceError as e:
+            logger.error(f"Error creating resource from template: {e}")
+            raise e
+        # Handle other exceptions
+        except Exception as e:
+            logger.error(f"Error creating resource from template: {e}")
+            if self.mask_error_details:
+                # Mask internal details
+                raise ValueError("Error creating resource from template") from e
+            else:
+                # Include original error details
+                raise ValueError(f"Error creating resource from template: {e}") from e
+
+    async def read_resource(
+        self, uri: AnyUrl | str, resolved: ResolvedResource | None = None
+    ) -> str | bytes:
         """
         Internal API for servers: Finds and reads a resource, respecting the
         filtered protocol path.
+
+        If `resolved` comes from resolve_resource() for the same URI and refers
+        to a component registered on this manager, it is read directly.
         """
         uri_str = str(uri)
 
-        # 1. Check local resources first. The server will have already applied its filter.
-        if uri_str in self._resources:
-            resource = await self.get_resource(uri_str)
-            if not resource:
-                raise NotFoundError(f"Resource {uri_str!r} not found")
-
-            try:
-                return await resource.read()
+        if resolved is not None and resolved.local and resolved.uri == uri_str:
+            if resolved.template is not None:
+                return await self._read_from_template(
+                    uri_str,
+                    resolved.template,
+                    resolved.params or {},
+                    resource=(
+                        resolved.component
+                        if isinstance(resolved.component, Resource)
+                        else None
+                    ),
+                )
+            return await self._read_local_resource(
+                uri_str, cast(Resource, resolved.component)
+            )
 
-            # raise ResourceErrors as-is
-            except ResourceError as e:
-                logger.exception(f"Error reading resource {uri_str!r}")
-                raise e
-
-            # Handle other exceptions
-            except Exception as e:
-                logger.exception(f"Error reading resource {uri_str!r}")
-                if self.mask_error_details:
-                    # Mask internal details
-                    raise ResourceError(f"Error reading resource {uri_str!r}") from e
-                else:
-                    # Include original error details
-                    raise ResourceError(
-                        f"Error reading resource {uri_str!r}: {e}"
-                    ) from e
+        # 1. Check local resources first. The server will have already applied its filter.
+        if resource := self._resources.get(uri_str):
+            return await self._read_local_resource(uri_str, resource)
 
         # 1b. Check local templates if not found in concrete resources
-        for key, template in self._templates.items():
-            if params := match_uri_template(uri_str, key):
-                try:
-                    resource = await template.create_resource(uri_str, params=params)
-                    return await resource.read()
-                except ResourceError as e:
-                    logger.exception(
-                        f"Error reading resource from template {uri_str!r}"
-                    )
-                    raise e
-                except Exception as e:
-                    logger.exception(
-                        f"Error reading resource from template {uri_str!r}"
-                    )
-                    if self.mask_error_details:
-                        raise ResourceError(
-                            f"Error reading resource from template {uri_str!r}"
-                        ) from e
-                    else:
-                        raise ResourceError(
-                            f"Error reading resource from template {uri_str!r}: {e}"
-                        ) from e
+        if match := self._get_local_template_index().match(uri_str):
+            _, template, params = match
+            return await self._read_from_template(uri_str, template, params)
 
         # 2. Check mounted servers using the filtered protocol path.
         from fastmcp.server.server import has_resource_prefix, remove_resource_prefix
@@ -491,12 +661,62 @@ class ResourceManager:
                     else:
                         continue
 
+                if mounted.health.is_open or (mounted, key) in self._not_found:
+                    continue
                 try:
                     result = await mounted.server._read_resource(key)
                     return result[0].content
                 except NotFoundError:
+                    self._not_found.add(mounted, key)
                     continue
             except NotFoundError:
                 continue
 
         raise NotFoundError(f"Resource {uri_str!r} not found.")
+
+    async def _read_local_resource(
+        self, uri_str: str, resource: Resource
+    ) -> str | bytes:
+        """Read a local resource, standardizing errors."""
+        try:
+            return await resource.read()
+        # raise ResourceErrors as-is
+        except ResourceError as e:
+            logger.exception(f"Error reading resource {uri_str!r}")
+            raise e
+
+        # Handle other exceptions
+        except Exception as e:
+            logger.exception(f"Error reading resource {uri_str!r}")
+            if self.mask_error_details:
+                # Mask internal details
+                raise ResourceError(f"Error reading resource {uri_str!r}") from e
+            else:
+                # Include original error details
+                raise ResourceError(f"Error reading resource {uri_str!r}: {e}") from e
+
+    async def _read_from_template(
+        self,
+        uri_str: str,
+        template: ResourceTemplate,
+        params: dict[str, Any],
+        resource: Resource | None = None,
+    ) -> str | bytes:
+        """Read a URI matched by a local template, standardizing errors."""
+        try:
+            if resource is not None:
+                return await resource.read()
+            return await template.read_uri(uri_str, params=params)
+        except ResourceError as e:
+            logger.exception(f"Error reading resource from template {uri_str!r}")
+            raise e
+        except Exception as e:
+            logger.exception(f"Error reading resource from template {uri_str!r}")
+            if self.mask_error_details:
+                raise ResourceError(
+                    f"Error reading resource from template {uri_str!r}"
+                ) from e
+            else:
+                raise ResourceError(
+                    f"Error reading resource from template {uri_str!r}: {e}"
+                ) from e
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import inspect
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from functools import lru_cache, partial
 from typing import Any
 from urllib.parse import unquote
 
@@ -16,16 +17,18 @@ from pydantic import (
     validate_call,
 )
 
-from fastmcp.resources.resource import Resource
+from fastmcp.resources.resource import Resource, _convert_to_contents
 from fastmcp.server.dependencies import get_context
 from fastmcp.utilities.components import FastMCPComponent
 from fastmcp.utilities.json_schema import compress_schema
+from fastmcp.utilities.sync_executor import get_sync_executor
 from fastmcp.utilities.types import (
     find_kwarg_by_type,
     get_cached_typeadapter,
 )
 
 
+@lru_cache(maxsize=5000)
 def build_regex(template: str) -> re.Pattern:
     parts = re.split(r"(\{[^}]+\})", template)
     pattern = ""
@@ -50,6 +53,57 @@ def match_uri_template(uri: str, uri_template: str) -> dict[str, str] | None:
     return None
 
 
+class _TemplateTrieNode:
+    __slots__ = ("children", "entries")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TemplateTrieNode] = {}
+        self.entries: list[tuple[int, str, re.Pattern, ResourceTemplate]] = []
+
+
+class ResourceTemplateIndex:
+    """
+    Precompiled index for matching URIs against many resource templates.
+
+    Templates are placed in a trie keyed on the literal text before their
+    first parameter (e.g. the scheme and any fixed path), so a lookup only
+    tries the regexes of templates whose literal prefix matches the URI.
+    Candidates are tried in the order the templates were given, so the first
+    matching template wins exactly as with a linear scan.
+    """
+
+    def __init__(self, templates: Mapping[str, ResourceTemplate]):
+        self._root = _TemplateTrieNode()
+        for order, (key, template) in enumerate(templates.items()):
+            node = self._root
+            for char in key.split("{", 1)[0]:
+                node = node.children.setdefault(char, _TemplateTrieNode())
+            node.entries.append((order, key, build_regex(key), template))
+
+    def match(self, uri: str) -> tuple[str, ResourceTemplate, dict[str, str]] | None:
+        """
+        Find the first template matching `uri`, returning its key, the
+        template, and the extracted parameters.
+        """
+        node = self._root
+        candidates = list(node.entries)
+        for char in uri:
+            node = node.children.get(char)
+            if node is None:
+                break
+            candidates.extend(node.entries)
+
+        if len(candidates) > 1:
+            candidates.sort(key=lambda entry: entry[0])
+
+        for _, key, regex, template in candidates:
+            if match := regex.match(uri):
+                params = {k: unquote(v) for k, v in match.groupdict().items()}
+                if params:
+                    return key, template, params
+        return None
+
+
 class ResourceTemplate(FastMCPComponent):
     """A template for dynamically creating resources."""
 
@@ -147,6 +201,22 @@ class ResourceTemplate(FastMCPComponent):
             enabled=self.enabled,
         )
 
+    @property
+    def creates_custom_resources(self) -> bool:
+        """Whether this template overrides create_resource() with its own resources."""
+        return type(self).create_resource is not ResourceTemplate.create_resource
+
+    async def read_uri(self, uri: str, params: dict[str, Any]) -> str | bytes:
+        """Read the resource at a URI matched by this template.
+
+        Templates using the default create_resource() are read directly,
+        without building an intermediate Resource for every read.
+        """
+        if self.creates_custom_resources:
+            resource = await self.create_resource(uri, params=params)
+            return await resource.read()
+        return await _convert_to_contents(await self.read(arguments=params))
+
     def to_mcp_template(
         self,
         *,
@@ -204,7 +274,7 @@ class FunctionResourceTemplate(ResourceTemplate):
         if context_kwarg and context_kwarg not in kwargs:
             kwargs[context_kwarg] = get_context()
 
-        result = self.fn(**kwargs)
+        result = await get_sync_executor().call(partial(self.fn, **kwargs))
         if inspect.isawaitable(result):
             result = await result
         return result
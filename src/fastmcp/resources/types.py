@@ -7,12 +7,12 @@ from pathlib import Path
 
 import anyio
 import anyio.to_thread
-import httpx
 import pydantic.json
 from pydantic import Field, ValidationInfo
 
 from fastmcp.exceptions import ResourceError
 from fastmcp.resources.resource import Resource
+from fastmcp.utilities.http import get_http_client
 from fastmcp.utilities.logging import get_logger
 
 logger = get_logger(__name__)
@@ -91,10 +91,9 @@ class HttpResource(Resource):
 
     async def read(self) -> str | bytes:
         """Read the HTTP content."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.url)
-            response.raise_for_status()
-            return response.text
+        response = await get_http_client().get(self.url)
+        response.raise_for_status()
+        return response.text
 
 
 class DirectoryResource(Resource):
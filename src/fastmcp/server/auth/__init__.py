@@ -7,6 +7,7 @@ from .auth import (
 )
 from .providers.jwt import JWTVerifier, StaticTokenVerifier
 from .oauth_proxy import OAuthProxy
+from .storage import MemoryOAuthStorage, OAuthStorage, SQLiteOAuthStorage
 
 
 __all__ = [
@@ -18,6 +19,9 @@ __all__ = [
     "RemoteAuthProvider",
     "AccessToken",
     "OAuthProxy",
+    "OAuthStorage",
+    "MemoryOAuthStorage",
+    "SQLiteOAuthStorage",
 ]
 
 
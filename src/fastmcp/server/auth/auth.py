@@ -176,6 +176,12 @@ class TokenVerifier(AuthProvider):
         """Verify a bearer token and return access info if valid."""
         raise NotImplementedError("Subclasses must implement verify_token")
 
+    def invalidate_token(self, token: str) -> None:
+        """
+        Forget any cached verification of a token, e.g. because it was
+        revoked. Verifiers that cache verified tokens override this.
+        """
+
 
 class RemoteAuthProvider(AuthProvider):
     """Authentication provider for resource servers that verify tokens from known authorization servers.
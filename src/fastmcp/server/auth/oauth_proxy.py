@@ -25,7 +25,6 @@ from base64 import urlsafe_b64encode
 from typing import TYPE_CHECKING, Any, Final
 from urllib.parse import urlencode
 
-import httpx
 from authlib.common.security import generate_token
 from authlib.integrations.httpx_client import AsyncOAuth2Client
 from mcp.server.auth.provider import (
@@ -47,6 +46,12 @@ from starlette.routing import Route
 
 from fastmcp.server.auth.auth import OAuthProvider, TokenVerifier
 from fastmcp.server.auth.redirect_validation import validate_redirect_uri
+from fastmcp.server.auth.storage import (
+    MemoryOAuthStorage,
+    OAuthStorage,
+    OAuthStorageCollection,
+)
+from fastmcp.utilities.http import get_http_client
 from fastmcp.utilities.logging import get_logger
 
 if TYPE_CHECKING:
@@ -115,6 +120,7 @@ class ProxyDCRClient(OAuthClientInformationFull):
 # Default token expiration times
 DEFAULT_ACCESS_TOKEN_EXPIRY_SECONDS: Final[int] = 60 * 60  # 1 hour
 DEFAULT_AUTH_CODE_EXPIRY_SECONDS: Final[int] = 5 * 60  # 5 minutes
+DEFAULT_TRANSACTION_EXPIRY_SECONDS: Final[int] = 15 * 60  # 15 minutes
 
 # HTTP client timeout
 HTTP_TIMEOUT_SECONDS: Final[int] = 30
@@ -250,6 +256,8 @@ class OAuthProxy(OAuthProvider):
         forward_pkce: bool = True,
         # Token endpoint authentication
         token_endpoint_auth_method: str | None = None,
+        # State storage
+        storage: OAuthStorage | None = None,
     ):
         """Initialize the OAuth proxy provider.
 
@@ -278,6 +286,10 @@ class OAuthProxy(OAuthProvider):
             token_endpoint_auth_method: Token endpoint authentication method for upstream server.
                 Common values: "client_secret_basic", "client_secret_post", "none".
                 If None, authlib will use its default (typically "client_secret_basic").
+            storage: Where to keep registered clients, issued tokens and authorization
+                flows in progress (defaults to `MemoryOAuthStorage`). Use persistent storage
+                such as `SQLiteOAuthStorage` to keep state across restarts or to share it
+                between server workers.
         """
         # Always enable DCR since we implement it locally for MCP clients
         client_registration_options = ClientRegistrationOptions(
@@ -320,19 +332,32 @@ class OAuthProxy(OAuthProvider):
         self._token_endpoint_auth_method = token_endpoint_auth_method
 
         # Local state for DCR and token bookkeeping
-        self._clients: dict[str, OAuthClientInformationFull] = {}
-        self._access_tokens: dict[str, AccessToken] = {}
-        self._refresh_tokens: dict[str, RefreshToken] = {}
+        self._storage = storage or MemoryOAuthStorage()
+        self._clients = OAuthStorageCollection(
+            self._storage, "clients", OAuthClientInformationFull
+        )
+        self._access_tokens = OAuthStorageCollection(
+            self._storage, "access_tokens", AccessToken
+        )
+        self._refresh_tokens = OAuthStorageCollection(
+            self._storage, "refresh_tokens", RefreshToken
+        )
 
         # Token relation mappings for cleanup
-        self._access_to_refresh: dict[str, str] = {}
-        self._refresh_to_access: dict[str, str] = {}
+        self._access_to_refresh = OAuthStorageCollection(
+            self._storage, "access_to_refresh", str
+        )
+        self._refresh_to_access = OAuthStorageCollection(
+            self._storage, "refresh_to_access", str
+        )
 
         # OAuth transaction storage for IdP callback forwarding
-        self._oauth_transactions: dict[
-            str, dict[str, Any]
-        ] = {}  # txn_id -> transaction_data
-        self._client_codes: dict[str, dict[str, Any]] = {}  # client_code -> code_data
+        self._oauth_transactions = OAuthStorageCollection(
+            self._storage, "oauth_transactions", dict[str, Any]
+        )  # txn_id -> transaction_data
+        self._client_codes = OAuthStorageCollection(
+            self._storage, "client_codes", dict[str, Any]
+        )  # client_code -> code_data
 
         # Use the provided token validator
         self._token_validator = token_verifier
@@ -371,9 +396,15 @@ class OAuthProxy(OAuthProvider):
 
         For unregistered clients, returns None (which will raise an error in the SDK).
         """
-        client = self._clients.get(client_id)
+        client = await self._clients.get(client_id)
+        if client is None:
+            return None
 
-        return client
+        # Redirect URI patterns are configuration, so they aren't stored
+        return ProxyDCRClient(
+            **client.model_dump(),
+            allowed_redirect_uri_patterns=self._allowed_client_redirect_uris,
+        )
 
     async def register_client(self, client_info: OAuthClientInformationFull) -> None:
         """Register a client locally
@@ -397,7 +428,7 @@ class OAuthProxy(OAuthProvider):
         )
 
         # Store the ProxyDCRClient
-        self._clients[client_info.client_id] = proxy_client
+        await self._clients.set(client_info.client_id, proxy_client)
 
         # Log redirect URIs to help users discover what patterns they might need
         if client_info.redirect_uris:
@@ -459,7 +490,9 @@ class OAuthProxy(OAuthProvider):
         if proxy_code_verifier:
             transaction_data["proxy_code_verifier"] = proxy_code_verifier
 
-        self._oauth_transactions[txn_id] = transaction_data
+        await self._oauth_transactions.set(
+            txn_id, transaction_data, ttl_seconds=DEFAULT_TRANSACTION_EXPIRY_SECONDS
+        )
 
         # Build query parameters for upstream IdP authorization request
         # Use our fixed IdP callback and transaction ID as state
@@ -512,7 +545,7 @@ class OAuthProxy(OAuthProvider):
         with PKCE challenge for validation.
         """
         # Look up client code data
-        code_data = self._client_codes.get(authorization_code)
+        code_data = await self._client_codes.get(authorization_code)
         if not code_data:
             logger.debug("Authorization code not found: %s", authorization_code)
             return None
@@ -520,7 +553,7 @@ class OAuthProxy(OAuthProvider):
         # Check if code expired
         if time.time() > code_data["expires_at"]:
             logger.debug("Authorization code expired: %s", authorization_code)
-            self._client_codes.pop(authorization_code, None)
+            await self._client_codes.delete(authorization_code)
             return None
 
         # Verify client ID matches
@@ -553,8 +586,9 @@ class OAuthProxy(OAuthProvider):
         For the DCR-compliant proxy flow, we return the IdP tokens that were obtained
         during the IdP callback exchange. PKCE validation is handled by the MCP framework.
         """
-        # Look up stored code data
-        code_data = self._client_codes.get(authorization_code.code)
+        # Take the stored code data, so the code can only be used once even
+        # when several workers share the storage
+        code_data = await self._client_codes.pop(authorization_code.code)
         if not code_data:
             logger.error(
                 "Authorization code not found in client codes: %s",
@@ -565,9 +599,6 @@ class OAuthProxy(OAuthProvider):
         # Get stored IdP tokens
         idp_tokens = code_data["idp_tokens"]
 
-        # Clean up client code (one-time use)
-        self._client_codes.pop(authorization_code.code, None)
-
         # Extract token information for local tracking
         access_token_value = idp_tokens["access_token"]
         refresh_token_value = idp_tokens.get("refresh_token")
@@ -583,7 +614,9 @@ class OAuthProxy(OAuthProvider):
             scopes=authorization_code.scopes,
             expires_at=expires_at,
         )
-        self._access_tokens[access_token_value] = access_token
+        await self._access_tokens.set(
+            access_token_value, access_token, ttl_seconds=expires_in
+        )
 
         # Store refresh token if provided
         if refresh_token_value:
@@ -593,11 +626,13 @@ class OAuthProxy(OAuthProvider):
                 scopes=authorization_code.scopes,
                 expires_at=None,  # Refresh tokens typically don't expire
             )
-            self._refresh_tokens[refresh_token_value] = refresh_token
+            await self._refresh_tokens.set(refresh_token_value, refresh_token)
 
             # Maintain token relationships for cleanup
-            self._access_to_refresh[access_token_value] = refresh_token_value
-            self._refresh_to_access[refresh_token_value] = access_token_value
+            await self._access_to_refresh.set(
+                access_token_value, refresh_token_value, ttl_seconds=expires_in
+            )
+            await self._refresh_to_access.set(refresh_token_value, access_token_value)
 
         logger.debug(
             "Successfully exchanged client code for stored IdP tokens (client: %s)",
@@ -616,7 +651,7 @@ class OAuthProxy(OAuthProvider):
         refresh_token: str,
     ) -> RefreshToken | None:
         """Load refresh token from local storage."""
-        return self._refresh_tokens.get(refresh_token)
+        return await self._refresh_tokens.get(refresh_token)
 
     async def exchange_refresh_token(
         self,
@@ -661,11 +696,15 @@ class OAuthProxy(OAuthProvider):
             token_response.get("expires_in", DEFAULT_ACCESS_TOKEN_EXPIRY_SECONDS)
         )
 
-        self._access_tokens[new_access_token] = AccessToken(
-            token=new_access_token,
-            client_id=client.client_id,
-            scopes=scopes,
-            expires_at=int(time.time() + expires_in),
+        await self._access_tokens.set(
+            new_access_token,
+            AccessToken(
+                token=new_access_token,
+                client_id=client.client_id,
+                scopes=scopes,
+                expires_at=int(time.time() + expires_in),
+            ),
+            ttl_seconds=expires_in,
         )
 
         # Handle refresh token rotation if new one provided
@@ -673,20 +712,25 @@ class OAuthProxy(OAuthProvider):
             new_refresh_token = token_response["refresh_token"]
             if new_refresh_token != refresh_token.token:
                 # Remove old refresh token
-                self._refresh_tokens.pop(refresh_token.token, None)
-                old_access = self._refresh_to_access.pop(refresh_token.token, None)
+                await self._refresh_tokens.delete(refresh_token.token)
+                old_access = await self._refresh_to_access.pop(refresh_token.token)
                 if old_access:
-                    self._access_to_refresh.pop(old_access, None)
+                    await self._access_to_refresh.delete(old_access)
 
                 # Store new refresh token
-                self._refresh_tokens[new_refresh_token] = RefreshToken(
-                    token=new_refresh_token,
-                    client_id=client.client_id,
-                    scopes=scopes,
-                    expires_at=None,
+                await self._refresh_tokens.set(
+                    new_refresh_token,
+                    RefreshToken(
+                        token=new_refresh_token,
+                        client_id=client.client_id,
+                        scopes=scopes,
+                        expires_at=None,
+                    ),
+                )
+                await self._access_to_refresh.set(
+                    new_access_token, new_refresh_token, ttl_seconds=expires_in
                 )
-                self._access_to_refresh[new_access_token] = new_refresh_token
-                self._refresh_to_access[new_refresh_token] = new_access_token
+                await self._refresh_to_access.set(new_refresh_token, new_access_token)
 
         return OAuthToken(**token_response)  # type: ignore[arg-type]
 
@@ -719,35 +763,35 @@ class OAuthProxy(OAuthProvider):
         """
         # Clean up local token storage
         if isinstance(token, AccessToken):
-            self._access_tokens.pop(token.token, None)
+            await self._access_tokens.delete(token.token)
+            self._token_validator.invalidate_token(token.token)
             # Also remove associated refresh token
-            paired_refresh = self._access_to_refresh.pop(token.token, None)
+            paired_refresh = await self._access_to_refresh.pop(token.token)
             if paired_refresh:
-                self._refresh_tokens.pop(paired_refresh, None)
-                self._refresh_to_access.pop(paired_refresh, None)
+                await self._refresh_tokens.delete(paired_refresh)
+                await self._refresh_to_access.delete(paired_refresh)
         else:  # RefreshToken
-            self._refresh_tokens.pop(token.token, None)
+            await self._refresh_tokens.delete(token.token)
             # Also remove associated access token
-            paired_access = self._refresh_to_access.pop(token.token, None)
+            paired_access = await self._refresh_to_access.pop(token.token)
             if paired_access:
-                self._access_tokens.pop(paired_access, None)
-                self._access_to_refresh.pop(paired_access, None)
+                await self._access_tokens.delete(paired_access)
+                self._token_validator.invalidate_token(paired_access)
+                await self._access_to_refresh.delete(paired_access)
 
         # Attempt upstream revocation if endpoint is configured
         if self._upstream_revocation_endpoint:
             try:
-                async with httpx.AsyncClient(
-                    timeout=HTTP_TIMEOUT_SECONDS
-                ) as http_client:
-                    await http_client.post(
-                        self._upstream_revocation_endpoint,
-                        data={"token": token.token},
-                        auth=(
-                            self._upstream_client_id,
-                            self._upstream_client_secret.get_secret_value(),
-                        ),
-                    )
-                    logger.debug("Successfully revoked token with upstream server")
+                await get_http_client().post(
+                    self._upstream_revocation_endpoint,
+                    data={"token": token.token},
+                    auth=(
+                        self._upstream_client_id,
+                        self._upstream_client_secret.get_secret_value(),
+                    ),
+                    timeout=HTTP_TIMEOUT_SECONDS,
+                )
+                logger.debug("Successfully revoked token with upstream server")
             except Exception as e:
                 logger.warning("Failed to revoke token with upstream server: %s", e)
         else:
@@ -845,8 +889,9 @@ class OAuthProxy(OAuthProvider):
                     status_code=302,
                 )
 
-            # Look up transaction data
-            transaction = self._oauth_transactions.get(txn_id)
+            # Take the transaction, so each one completes at most once even
+            # when several workers share the storage
+            transaction = await self._oauth_transactions.pop(txn_id)
             if not transaction:
                 logger.error("IdP callback with invalid transaction ID: %s", txn_id)
                 return RedirectResponse(
@@ -907,19 +952,20 @@ class OAuthProxy(OAuthProvider):
             code_expires_at = int(time.time() + DEFAULT_AUTH_CODE_EXPIRY_SECONDS)
 
             # Store client code with PKCE challenge and IdP tokens
-            self._client_codes[client_code] = {
-                "client_id": transaction["client_id"],
-                "redirect_uri": transaction["client_redirect_uri"],
-                "code_challenge": transaction["code_challenge"],
-                "code_challenge_method": transaction["code_challenge_method"],
-                "scopes": transaction["scopes"],
-                "idp_tokens": idp_tokens,
-                "expires_at": code_expires_at,
-                "created_at": time.time(),
-            }
-
-            # Clean up transaction
-            self._oauth_transactions.pop(txn_id, None)
+            await self._client_codes.set(
+                client_code,
+                {
+                    "client_id": transaction["client_id"],
+                    "redirect_uri": transaction["client_redirect_uri"],
+                    "code_challenge": transaction["code_challenge"],
+                    "code_challenge_method": transaction["code_challenge_method"],
+                    "scopes": transaction["scopes"],
+                    "idp_tokens": idp_tokens,
+                    "expires_at": code_expires_at,
+                    "created_at": time.time(),
+                },
+                ttl_seconds=DEFAULT_AUTH_CODE_EXPIRY_SECONDS,
+            )
 
             # Build client callback URL with our code and original state
             client_redirect_uri = transaction["client_redirect_uri"]
@@ -12,7 +12,9 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from fastmcp.server.auth import AccessToken, TokenVerifier
 from fastmcp.server.auth.oauth_proxy import OAuthProxy
+from fastmcp.server.auth.storage import OAuthStorage
 from fastmcp.utilities.auth import parse_scopes
+from fastmcp.utilities.http import get_http_client
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.types import NotSet, NotSetT
 
@@ -68,43 +70,44 @@ class AzureTokenVerifier(TokenVerifier):
     async def verify_token(self, token: str) -> AccessToken | None:
         """Verify Azure OAuth token by calling Microsoft Graph API."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-                # Use Microsoft Graph API to validate token and get user info
-                response = await client.get(
-                    "https://graph.microsoft.com/v1.0/me",
-                    headers={
-                        "Authorization": f"Bearer {token}",
-                        "User-Agent": "FastMCP-Azure-OAuth",
-                    },
-                )
+            client = get_http_client()
+            # Use Microsoft Graph API to validate token and get user info
+            response = await client.get(
+                "https://graph.microsoft.com/v1.0/me",
+                headers={
+                    "Authorization": f"Bearer {token}",
+                    "User-Agent": "FastMCP-Azure-OAuth",
+                },
+                timeout=self.timeout_seconds,
+            )
 
-                if response.status_code != 200:
-                    logger.debug(
-                        "Azure token verification failed: %d - %s",
-                        response.status_code,
-                        response.text[:200],
-                    )
-                    return None
-
-                user_data = response.json()
-
-                # Create AccessToken with Azure user info
-                return AccessToken(
-                    token=token,
-                    client_id=str(user_data.get("id", "unknown")),
-                    scopes=self.required_scopes or [],
-                    expires_at=None,
-                    claims={
-                        "sub": user_data.get("id"),
-                        "email": user_data.get("mail")
-                        or user_data.get("userPrincipalName"),
-                        "name": user_data.get("displayName"),
-                        "given_name": user_data.get("givenName"),
-                        "family_name": user_data.get("surname"),
-                        "job_title": user_data.get("jobTitle"),
-                        "office_location": user_data.get("officeLocation"),
-                    },
+            if response.status_code != 200:
+                logger.debug(
+                    "Azure token verification failed: %d - %s",
+                    response.status_code,
+                    response.text[:200],
                 )
+                return None
+
+            user_data = response.json()
+
+            # Create AccessToken with Azure user info
+            return AccessToken(
+                token=token,
+                client_id=str(user_data.get("id", "unknown")),
+                scopes=self.required_scopes or [],
+                expires_at=None,
+                claims={
+                    "sub": user_data.get("id"),
+                    "email": user_data.get("mail")
+                    or user_data.get("userPrincipalName"),
+                    "name": user_data.get("displayName"),
+                    "given_name": user_data.get("givenName"),
+                    "family_name": user_data.get("surname"),
+                    "job_title": user_data.get("jobTitle"),
+                    "office_location": user_data.get("officeLocation"),
+                },
+            )
 
         except httpx.RequestError as e:
             logger.debug("Failed to verify Azure token: %s", e)
@@ -160,6 +163,7 @@ class AzureProvider(OAuthProxy):
         required_scopes: list[str] | None | NotSetT = NotSet,
         timeout_seconds: int | NotSetT = NotSet,
         allowed_client_redirect_uris: list[str] | NotSetT = NotSet,
+        storage: OAuthStorage | None = None,
     ):
         """Initialize Azure OAuth provider.
 
@@ -173,6 +177,7 @@ class AzureProvider(OAuthProxy):
             timeout_seconds: HTTP request timeout for Azure API calls
             allowed_client_redirect_uris: List of allowed redirect URI patterns for MCP clients.
                 If None (default), all URIs are allowed. If empty list, no URIs are allowed.
+            storage: Where to keep OAuth state (defaults to in-memory storage)
         """
         settings = AzureProviderSettings.model_validate(
             {
@@ -252,6 +257,7 @@ class AzureProvider(OAuthProxy):
             redirect_path=redirect_path_final,
             issuer_url=settings.base_url,
             allowed_client_redirect_uris=allowed_client_redirect_uris_final,
+            storage=storage,
         )
 
         logger.info(
@@ -28,7 +28,13 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from fastmcp.server.auth import TokenVerifier
 from fastmcp.server.auth.auth import AccessToken
 from fastmcp.server.auth.oauth_proxy import OAuthProxy
+from fastmcp.server.auth.storage import OAuthStorage
+from fastmcp.server.auth.token_cache import (
+    VerifiedTokenCache,
+    raise_for_transient_error,
+)
 from fastmcp.utilities.auth import parse_scopes
+from fastmcp.utilities.http import get_http_client
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.types import NotSet, NotSetT
 
@@ -50,6 +56,7 @@ class GitHubProviderSettings(BaseSettings):
     redirect_path: str | None = None
     required_scopes: list[str] | None = None
     timeout_seconds: int | None = None
+    cache_ttl_seconds: int | None = None
     allowed_client_redirect_uris: list[str] | None = None
 
     @field_validator("required_scopes", mode="before")
@@ -70,91 +77,24 @@ class GitHubTokenVerifier(TokenVerifier):
         *,
         required_scopes: list[str] | None = None,
         timeout_seconds: int = 10,
+        cache_ttl_seconds: int = 300,
     ):
         """Initialize the GitHub token verifier.
 
         Args:
             required_scopes: Required OAuth scopes (e.g., ['user:email'])
             timeout_seconds: HTTP request timeout
+            cache_ttl_seconds: How long to remember a verified token before
+                checking it with GitHub again; 0 checks every request
         """
         super().__init__(required_scopes=required_scopes)
         self.timeout_seconds = timeout_seconds
+        self._token_cache = VerifiedTokenCache(ttl_seconds=cache_ttl_seconds)
 
     async def verify_token(self, token: str) -> AccessToken | None:
         """Verify GitHub OAuth token by calling GitHub API."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-                # Get token info from GitHub API
-                response = await client.get(
-                    "https://api.github.com/user",
-                    headers={
-                        "Authorization": f"Bearer {token}",
-                        "Accept": "application/vnd.github.v3+json",
-                        "User-Agent": "FastMCP-GitHub-OAuth",
-                    },
-                )
-
-                if response.status_code != 200:
-                    logger.debug(
-                        "GitHub token verification failed: %d - %s",
-                        response.status_code,
-                        response.text[:200],
-                    )
-                    return None
-
-                user_data = response.json()
-
-                # Get token scopes from GitHub API
-                # GitHub includes scopes in the X-OAuth-Scopes header
-                scopes_response = await client.get(
-                    "https://api.github.com/user/repos",  # Any authenticated endpoint
-                    headers={
-                        "Authorization": f"Bearer {token}",
-                        "Accept": "application/vnd.github.v3+json",
-                        "User-Agent": "FastMCP-GitHub-OAuth",
-                    },
-                )
-
-                # Extract scopes from X-OAuth-Scopes header if available
-                oauth_scopes_header = scopes_response.headers.get("x-oauth-scopes", "")
-                token_scopes = [
-                    scope.strip()
-                    for scope in oauth_scopes_header.split(",")
-                    if scope.strip()
-                ]
-
-                # If no scopes in header, assume basic scopes based on successful user API call
-                if not token_scopes:
-                    token_scopes = ["user"]  # Basic scope if we can access user info
-
-                # Check required scopes
-                if self.required_scopes:
-                    token_scopes_set = set(token_scopes)
-                    required_scopes_set = set(self.required_scopes)
-                    if not required_scopes_set.issubset(token_scopes_set):
-                        logger.debug(
-                            "GitHub token missing required scopes. Has %d, needs %d",
-                            len(token_scopes_set),
-                            len(required_scopes_set),
-                        )
-                        return None
-
-                # Create AccessToken with GitHub user info
-                return AccessToken(
-                    token=token,
-                    client_id=str(user_data.get("id", "unknown")),  # Use GitHub user ID
-                    scopes=token_scopes,
-                    expires_at=None,  # GitHub tokens don't typically expire
-                    claims={
-                        "sub": str(user_data["id"]),
-                        "login": user_data.get("login"),
-                        "name": user_data.get("name"),
-                        "email": user_data.get("email"),
-                        "avatar_url": user_data.get("avatar_url"),
-                        "github_user_data": user_data,
-                    },
-                )
-
+            return await self._token_cache.verify(token, self._verify_token)
         except httpx.RequestError as e:
             logger.debug("Failed to verify GitHub token: %s", e)
             return None
@@ -162,6 +102,84 @@ class GitHubTokenVerifier(TokenVerifier):
             logger.debug("GitHub token verification error: %s", e)
             return None
 
+    def invalidate_token(self, token: str) -> None:
+        self._token_cache.invalidate(token)
+
+    async def _verify_token(self, token: str) -> AccessToken | None:
+        client = get_http_client()
+        # Get token info from GitHub API
+        response = await client.get(
+            "https://api.github.com/user",
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github.v3+json",
+                "User-Agent": "FastMCP-GitHub-OAuth",
+            },
+            timeout=self.timeout_seconds,
+        )
+
+        raise_for_transient_error(response)
+
+        if response.status_code != 200:
+            logger.debug(
+                "GitHub token verification failed: %d - %s",
+                response.status_code,
+                response.text[:200],
+            )
+            return None
+
+        user_data = response.json()
+
+        # Get token scopes from GitHub API
+        # GitHub includes scopes in the X-OAuth-Scopes header
+        scopes_response = await client.get(
+            "https://api.github.com/user/repos",  # Any authenticated endpoint
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github.v3+json",
+                "User-Agent": "FastMCP-GitHub-OAuth",
+            },
+            timeout=self.timeout_seconds,
+        )
+
+        # Extract scopes from X-OAuth-Scopes header if available
+        oauth_scopes_header = scopes_response.headers.get("x-oauth-scopes", "")
+        token_scopes = [
+            scope.strip() for scope in oauth_scopes_header.split(",") if scope.strip()
+        ]
+
+        # If no scopes in header, assume basic scopes based on successful user API call
+        if not token_scopes:
+            token_scopes = ["user"]  # Basic scope if we can access user info
+
+        # Check required scopes
+        if self.required_scopes:
+            token_scopes_set = set(token_scopes)
+            required_scopes_set = set(self.required_scopes)
+            if not required_scopes_set.issubset(token_scopes_set):
+                logger.debug(
+                    "GitHub token missing required scopes. Has %d, needs %d",
+                    len(token_scopes_set),
+                    len(required_scopes_set),
+                )
+                return None
+
+        # Create AccessToken with GitHub user info
+        return AccessToken(
+            token=token,
+            client_id=str(user_data.get("id", "unknown")),  # Use GitHub user ID
+            scopes=token_scopes,
+            expires_at=None,  # GitHub tokens don't typically expire
+            claims={
+                "sub": str(user_data["id"]),
+                "login": user_data.get("login"),
+                "name": user_data.get("name"),
+                "email": user_data.get("email"),
+                "avatar_url": user_data.get("avatar_url"),
+                "github_user_data": user_data,
+            },
+        )
+
 
 class GitHubProvider(OAuthProxy):
     """Complete GitHub OAuth provider for FastMCP.
@@ -200,7 +218,9 @@ class GitHubProvider(OAuthProxy):
         redirect_path: str | NotSetT = NotSet,
         required_scopes: list[str] | NotSetT = NotSet,
         timeout_seconds: int | NotSetT = NotSet,
+        cache_ttl_seconds: int | NotSetT = NotSet,
         allowed_client_redirect_uris: list[str] | NotSetT = NotSet,
+        storage: OAuthStorage | None = None,
     ):
         """Initialize GitHub OAuth provider.
 
@@ -211,8 +231,10 @@ class GitHubProvider(OAuthProxy):
             redirect_path: Redirect path configured in GitHub OAuth app (defaults to "/auth/callback")
             required_scopes: Required GitHub scopes (defaults to ["user"])
             timeout_seconds: HTTP request timeout for GitHub API calls
+            cache_ttl_seconds: How long to remember a verified token (defaults to 300 seconds)
             allowed_client_redirect_uris: List of allowed redirect URI patterns for MCP clients.
                 If None (default), all URIs are allowed. If empty list, no URIs are allowed.
+            storage: Where to keep OAuth state (defaults to in-memory storage)
         """
 
         settings = GitHubProviderSettings.model_validate(
@@ -225,6 +247,7 @@ class GitHubProvider(OAuthProxy):
                     "redirect_path": redirect_path,
                     "required_scopes": required_scopes,
                     "timeout_seconds": timeout_seconds,
+                    "cache_ttl_seconds": cache_ttl_seconds,
                     "allowed_client_redirect_uris": allowed_client_redirect_uris,
                 }.items()
                 if v is not NotSet
@@ -245,6 +268,11 @@ class GitHubProvider(OAuthProxy):
 
         redirect_path_final = settings.redirect_path or "/auth/callback"
         timeout_seconds_final = settings.timeout_seconds or 10
+        cache_ttl_seconds_final = (
+            settings.cache_ttl_seconds
+            if settings.cache_ttl_seconds is not None
+            else 300
+        )
         required_scopes_final = settings.required_scopes or ["user"]
         allowed_client_redirect_uris_final = settings.allowed_client_redirect_uris
 
@@ -252,6 +280,7 @@ class GitHubProvider(OAuthProxy):
         token_verifier = GitHubTokenVerifier(
             required_scopes=required_scopes_final,
             timeout_seconds=timeout_seconds_final,
+            cache_ttl_seconds=cache_ttl_seconds_final,
         )
 
         # Extract secret string from SecretStr
@@ -270,6 +299,7 @@ class GitHubProvider(OAuthProxy):
             redirect_path=redirect_path_final,
             issuer_url=settings.base_url,  # We act as the issuer for client registration
             allowed_client_redirect_uris=allowed_client_redirect_uris_final,
+            storage=storage,
         )
 
         logger.info(
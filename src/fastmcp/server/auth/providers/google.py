@@ -30,7 +30,13 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from fastmcp.server.auth import TokenVerifier
 from fastmcp.server.auth.auth import AccessToken
 from fastmcp.server.auth.oauth_proxy import OAuthProxy
+from fastmcp.server.auth.storage import OAuthStorage
+from fastmcp.server.auth.token_cache import (
+    VerifiedTokenCache,
+    raise_for_transient_error,
+)
 from fastmcp.utilities.auth import parse_scopes
+from fastmcp.utilities.http import get_http_client
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.types import NotSet, NotSetT
 
@@ -52,6 +58,7 @@ class GoogleProviderSettings(BaseSettings):
     redirect_path: str | None = None
     required_scopes: list[str] | None = None
     timeout_seconds: int | None = None
+    cache_ttl_seconds: int | None = None
     allowed_client_redirect_uris: list[str] | None = None
 
     @field_validator("required_scopes", mode="before")
@@ -72,105 +79,24 @@ class GoogleTokenVerifier(TokenVerifier):
         *,
         required_scopes: list[str] | None = None,
         timeout_seconds: int = 10,
+        cache_ttl_seconds: int = 300,
     ):
         """Initialize the Google token verifier.
 
         Args:
             required_scopes: Required OAuth scopes (e.g., ['openid', 'email'])
             timeout_seconds: HTTP request timeout
+            cache_ttl_seconds: How long to remember a verified token before
+                checking it with Google again; 0 checks every request
         """
         super().__init__(required_scopes=required_scopes)
         self.timeout_seconds = timeout_seconds
+        self._token_cache = VerifiedTokenCache(ttl_seconds=cache_ttl_seconds)
 
     async def verify_token(self, token: str) -> AccessToken | None:
         """Verify Google OAuth token by calling Google's tokeninfo API."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-                # Use Google's tokeninfo endpoint to validate the token
-                response = await client.get(
-                    "https://www.googleapis.com/oauth2/v1/tokeninfo",
-                    params={"access_token": token},
-                    headers={"User-Agent": "FastMCP-Google-OAuth"},
-                )
-
-                if response.status_code != 200:
-                    logger.debug(
-                        "Google token verification failed: %d",
-                        response.status_code,
-                    )
-                    return None
-
-                token_info = response.json()
-
-                # Check if token is expired
-                expires_in = token_info.get("expires_in")
-                if expires_in and int(expires_in) <= 0:
-                    logger.debug("Google token has expired")
-                    return None
-
-                # Extract scopes from token info
-                scope_string = token_info.get("scope", "")
-                token_scopes = [
-                    scope.strip() for scope in scope_string.split(" ") if scope.strip()
-                ]
-
-                # Check required scopes
-                if self.required_scopes:
-                    token_scopes_set = set(token_scopes)
-                    required_scopes_set = set(self.required_scopes)
-                    if not required_scopes_set.issubset(token_scopes_set):
-                        logger.debug(
-                            "Google token missing required scopes. Has %d, needs %d",
-                            len(token_scopes_set),
-                            len(required_scopes_set),
-                        )
-                        return None
-
-                # Get additional user info if we have the right scopes
-                user_data = {}
-                if "openid" in token_scopes or "profile" in token_scopes:
-                    try:
-                        userinfo_response = await client.get(
-                            "https://www.googleapis.com/oauth2/v2/userinfo",
-                            headers={
-                                "Authorization": f"Bearer {token}",
-                                "User-Agent": "FastMCP-Google-OAuth",
-                            },
-                        )
-                        if userinfo_response.status_code == 200:
-                            user_data = userinfo_response.json()
-                    except Exception as e:
-                        logger.debug("Failed to fetch Google user info: %s", e)
-
-                # Calculate expiration time
-                expires_at = None
-                if expires_in:
-                    expires_at = int(time.time() + int(expires_in))
-
-                # Create AccessToken with Google user info
-                access_token = AccessToken(
-                    token=token,
-                    client_id=token_info.get(
-                        "audience", "unknown"
-                    ),  # Use audience as client_id
-                    scopes=token_scopes,
-                    expires_at=expires_at,
-                    claims={
-                        "sub": user_data.get("id")
-                        or token_info.get("user_id", "unknown"),
-                        "email": user_data.get("email"),
-                        "name": user_data.get("name"),
-                        "picture": user_data.get("picture"),
-                        "given_name": user_data.get("given_name"),
-                        "family_name": user_data.get("family_name"),
-                        "locale": user_data.get("locale"),
-                        "google_user_data": user_data,
-                        "google_token_info": token_info,
-                    },
-                )
-                logger.debug("Google token verified successfully")
-                return access_token
-
+            return await self._token_cache.verify(token, self._verify_token)
         except httpx.RequestError as e:
             logger.debug("Failed to verify Google token: %s", e)
             return None
@@ -178,6 +104,99 @@ class GoogleTokenVerifier(TokenVerifier):
             logger.debug("Google token verification error: %s", e)
             return None
 
+    def invalidate_token(self, token: str) -> None:
+        self._token_cache.invalidate(token)
+
+    async def _verify_token(self, token: str) -> AccessToken | None:
+        client = get_http_client()
+        # Use Google's tokeninfo endpoint to validate the token
+        response = await client.get(
+            "https://www.googleapis.com/oauth2/v1/tokeninfo",
+            params={"access_token": token},
+            headers={"User-Agent": "FastMCP-Google-OAuth"},
+            timeout=self.timeout_seconds,
+        )
+
+        raise_for_transient_error(response)
+
+        if response.status_code != 200:
+            logger.debug(
+                "Google token verification failed: %d",
+                response.status_code,
+            )
+            return None
+
+        token_info = response.json()
+
+        # Check if token is expired
+        expires_in = token_info.get("expires_in")
+        if expires_in and int(expires_in) <= 0:
+            logger.debug("Google token has expired")
+            return None
+
+        # Extract scopes from token info
+        scope_string = token_info.get("scope", "")
+        token_scopes = [
+            scope.strip() for scope in scope_string.split(" ") if scope.strip()
+        ]
+
+        # Check required scopes
+        if self.required_scopes:
+            token_scopes_set = set(token_scopes)
+            required_scopes_set = set(self.required_scopes)
+            if not required_scopes_set.issubset(token_scopes_set):
+                logger.debug(
+                    "Google token missing required scopes. Has %d, needs %d",
+                    len(token_scopes_set),
+                    len(required_scopes_set),
+                )
+                return None
+
+        # Get additional user info if we have the right scopes
+        user_data = {}
+        if "openid" in token_scopes or "profile" in token_scopes:
+            try:
+                userinfo_response = await client.get(
+                    "https://www.googleapis.com/oauth2/v2/userinfo",
+                    headers={
+                        "Authorization": f"Bearer {token}",
+                        "User-Agent": "FastMCP-Google-OAuth",
+                    },
+                    timeout=self.timeout_seconds,
+                )
+                if userinfo_response.status_code == 200:
+                    user_data = userinfo_response.json()
+            except Exception as e:
+                logger.debug("Failed to fetch Google user info: %s", e)
+
+        # Calculate expiration time
+        expires_at = None
+        if expires_in:
+            expires_at = int(time.time() + int(expires_in))
+
+        # Create AccessToken with Google user info
+        access_token = AccessToken(
+            token=token,
+            client_id=token_info.get(
+                "audience", "unknown"
+            ),  # Use audience as client_id
+            scopes=token_scopes,
+            expires_at=expires_at,
+            claims={
+                "sub": user_data.get("id") or token_info.get("user_id", "unknown"),
+                "email": user_data.get("email"),
+                "name": user_data.get("name"),
+                "picture": user_data.get("picture"),
+                "given_name": user_data.get("given_name"),
+                "family_name": user_data.get("family_name"),
+                "locale": user_data.get("locale"),
+                "google_user_data": user_data,
+                "google_token_info": token_info,
+            },
+        )
+        logger.debug("Google token verified successfully")
+        return access_token
+
 
 class GoogleProvider(OAuthProxy):
     """Complete Google OAuth provider for FastMCP.
@@ -216,7 +235,9 @@ class GoogleProvider(OAuthProxy):
         redirect_path: str | NotSetT = NotSet,
         required_scopes: list[str] | NotSetT = NotSet,
         timeout_seconds: int | NotSetT = NotSet,
+        cache_ttl_seconds: int | NotSetT = NotSet,
         allowed_client_redirect_uris: list[str] | NotSetT = NotSet,
+        storage: OAuthStorage | None = None,
     ):
         """Initialize Google OAuth provider.
 
@@ -230,8 +251,10 @@ class GoogleProvider(OAuthProxy):
                 - "https://www.googleapis.com/auth/userinfo.email" for email access
                 - "https://www.googleapis.com/auth/userinfo.profile" for profile info
             timeout_seconds: HTTP request timeout for Google API calls
+            cache_ttl_seconds: How long to remember a verified token (defaults to 300 seconds)
             allowed_client_redirect_uris: List of allowed redirect URI patterns for MCP clients.
                 If None (default), all URIs are allowed. If empty list, no URIs are allowed.
+            storage: Where to keep OAuth state (defaults to in-memory storage)
         """
 
         settings = GoogleProviderSettings.model_validate(
@@ -244,6 +267,7 @@ class GoogleProvider(OAuthProxy):
                     "redirect_path": redirect_path,
                     "required_scopes": required_scopes,
                     "timeout_seconds": timeout_seconds,
+                    "cache_ttl_seconds": cache_ttl_seconds,
                     "allowed_client_redirect_uris": allowed_client_redirect_uris,
                 }.items()
                 if v is not NotSet
@@ -263,6 +287,11 @@ class GoogleProvider(OAuthProxy):
         # Apply defaults
         redirect_path_final = settings.redirect_path or "/auth/callback"
         timeout_seconds_final = settings.timeout_seconds or 10
+        cache_ttl_seconds_final = (
+            settings.cache_ttl_seconds
+            if settings.cache_ttl_seconds is not None
+            else 300
+        )
         # Google requires at least one scope - openid is the minimal OIDC scope
         required_scopes_final = settings.required_scopes or ["openid"]
         allowed_client_redirect_uris_final = settings.allowed_client_redirect_uris
@@ -271,6 +300,7 @@ class GoogleProvider(OAuthProxy):
         token_verifier = GoogleTokenVerifier(
             required_scopes=required_scopes_final,
             timeout_seconds=timeout_seconds_final,
+            cache_ttl_seconds=cache_ttl_seconds_final,
         )
 
         # Extract secret string from SecretStr
@@ -289,6 +319,7 @@ class GoogleProvider(OAuthProxy):
             redirect_path=redirect_path_final,
             issuer_url=settings.base_url,  # We act as the issuer for client registration
             allowed_client_redirect_uris=allowed_client_redirect_uris_final,
+            storage=storage,
         )
 
         logger.info(
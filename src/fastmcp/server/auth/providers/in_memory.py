@@ -21,6 +21,11 @@ from fastmcp.server.auth.auth import (
     OAuthProvider,
     RevocationOptions,
 )
+from fastmcp.server.auth.storage import (
+    MemoryOAuthStorage,
+    OAuthStorage,
+    OAuthStorageCollection,
+)
 
 # Default expiration times (in seconds)
 DEFAULT_AUTH_CODE_EXPIRY_SECONDS = 5 * 60  # 5 minutes
@@ -32,6 +37,9 @@ class InMemoryOAuthProvider(OAuthProvider):
     """
     An in-memory OAuth provider for testing purposes.
     It simulates the OAuth 2.1 flow locally without external calls.
+
+    Clients, codes and tokens are kept in memory unless another `storage`,
+    such as `SQLiteOAuthStorage`, is given.
     """
 
     def __init__(
@@ -41,6 +49,7 @@ class InMemoryOAuthProvider(OAuthProvider):
         client_registration_options: ClientRegistrationOptions | None = None,
         revocation_options: RevocationOptions | None = None,
         required_scopes: list[str] | None = None,
+        storage: OAuthStorage | None = None,
     ):
         super().__init__(
             base_url=base_url or "http://fastmcp.example.com",
@@ -49,29 +58,38 @@ class InMemoryOAuthProvider(OAuthProvider):
             revocation_options=revocation_options,
             required_scopes=required_scopes,
         )
-        self.clients: dict[str, OAuthClientInformationFull] = {}
-        self.auth_codes: dict[str, AuthorizationCode] = {}
-        self.access_tokens: dict[str, AccessToken] = {}
-        self.refresh_tokens: dict[str, RefreshToken] = {}
+        self.storage = storage or MemoryOAuthStorage()
+        self.clients = OAuthStorageCollection(
+            self.storage, "clients", OAuthClientInformationFull
+        )
+        self.auth_codes = OAuthStorageCollection(
+            self.storage, "auth_codes", AuthorizationCode
+        )
+        self.access_tokens = OAuthStorageCollection(
+            self.storage, "access_tokens", AccessToken
+        )
+        self.refresh_tokens = OAuthStorageCollection(
+            self.storage, "refresh_tokens", RefreshToken
+        )
 
         # For revoking associated tokens
-        self._access_to_refresh_map: dict[
-            str, str
-        ] = {}  # access_token_str -> refresh_token_str
-        self._refresh_to_access_map: dict[
-            str, str
-        ] = {}  # refresh_token_str -> access_token_str
+        self._access_to_refresh_map = OAuthStorageCollection(
+            self.storage, "access_to_refresh", str
+        )  # access_token_str -> refresh_token_str
+        self._refresh_to_access_map = OAuthStorageCollection(
+            self.storage, "refresh_to_access", str
+        )  # refresh_token_str -> access_token_str
 
     async def get_client(self, client_id: str) -> OAuthClientInformationFull | None:
-        return self.clients.get(client_id)
+        return await self.clients.get(client_id)
 
     async def register_client(self, client_info: OAuthClientInformationFull) -> None:
-        if client_info.client_id in self.clients:
+        if await self.clients.contains(client_info.client_id):
             # As per RFC 7591, if client_id is already known, it's an update.
             # For this simple provider, we'll treat it as re-registration.
             # A real provider might handle updates or raise errors for conflicts.
             pass
-        self.clients[client_info.client_id] = client_info
+        await self.clients.set(client_info.client_id, client_info)
 
     async def authorize(
         self, client: OAuthClientInformationFull, params: AuthorizationParams
@@ -80,7 +98,7 @@ class InMemoryOAuthProvider(OAuthProvider):
         Simulates user authorization and generates an authorization code.
         Returns a redirect URI with the code and state.
         """
-        if client.client_id not in self.clients:
+        if not await self.clients.contains(client.client_id):
             raise AuthorizeError(
                 error="unauthorized_client",
                 error_description=f"Client '{client.client_id}' not registered.",
@@ -120,7 +138,9 @@ class InMemoryOAuthProvider(OAuthProvider):
             code_challenge=params.code_challenge,
             # code_challenge_method is assumed S256 by the framework
         )
-        self.auth_codes[auth_code_value] = auth_code
+        await self.auth_codes.set(
+            auth_code_value, auth_code, ttl_seconds=DEFAULT_AUTH_CODE_EXPIRY_SECONDS
+        )
 
         return construct_redirect_uri(
             str(params.redirect_uri), code=auth_code_value, state=params.state
@@ -129,12 +149,12 @@ class InMemoryOAuthProvider(OAuthProvider):
     async def load_authorization_code(
         self, client: OAuthClientInformationFull, authorization_code: str
     ) -> AuthorizationCode | None:
-        auth_code_obj = self.auth_codes.get(authorization_code)
+        auth_code_obj = await self.auth_codes.get(authorization_code)
         if auth_code_obj:
             if auth_code_obj.client_id != client.client_id:
                 return None  # Belongs to a different client
             if auth_code_obj.expires_at < time.time():
-                del self.auth_codes[authorization_code]  # Expired
+                await self.auth_codes.delete(authorization_code)  # Expired
                 return None
             return auth_code_obj
         return None
@@ -146,14 +166,12 @@ class InMemoryOAuthProvider(OAuthProvider):
         # by the TokenHandler calling load_authorization_code before this.
         # We might want to re-verify or simply trust it's valid.
 
-        if authorization_code.code not in self.auth_codes:
+        # Consume the auth code, atomically so it can only be used once
+        if await self.auth_codes.pop(authorization_code.code) is None:
             raise TokenError(
                 "invalid_grant", "Authorization code not found or already used."
             )
 
-        # Consume the auth code
-        del self.auth_codes[authorization_code.code]
-
         access_token_value = f"test_access_token_{secrets.token_hex(32)}"
         refresh_token_value = f"test_refresh_token_{secrets.token_hex(32)}"
 
@@ -166,21 +184,33 @@ class InMemoryOAuthProvider(OAuthProvider):
                 time.time() + DEFAULT_REFRESH_TOKEN_EXPIRY_SECONDS
             )
 
-        self.access_tokens[access_token_value] = AccessToken(
-            token=access_token_value,
-            client_id=client.client_id,
-            scopes=authorization_code.scopes,
-            expires_at=access_token_expires_at,
+        await self.access_tokens.set(
+            access_token_value,
+            AccessToken(
+                token=access_token_value,
+                client_id=client.client_id,
+                scopes=authorization_code.scopes,
+                expires_at=access_token_expires_at,
+            ),
+            ttl_seconds=DEFAULT_ACCESS_TOKEN_EXPIRY_SECONDS,
         )
-        self.refresh_tokens[refresh_token_value] = RefreshToken(
-            token=refresh_token_value,
-            client_id=client.client_id,
-            scopes=authorization_code.scopes,  # Refresh token inherits scopes
-            expires_at=refresh_token_expires_at,
+        await self.refresh_tokens.set(
+            refresh_token_value,
+            RefreshToken(
+                token=refresh_token_value,
+                client_id=client.client_id,
+                scopes=authorization_code.scopes,  # Refresh token inherits scopes
+                expires_at=refresh_token_expires_at,
+            ),
+            ttl_seconds=DEFAULT_REFRESH_TOKEN_EXPIRY_SECONDS,
         )
 
-        self._access_to_refresh_map[access_token_value] = refresh_token_value
-        self._refresh_to_access_map[refresh_token_value] = access_token_value
+        await self._access_to_refresh_map.set(
+            access_token_value,
+            refresh_token_value,
+            ttl_seconds=DEFAULT_ACCESS_TOKEN_EXPIRY_SECONDS,
+        )
+        await self._refresh_to_access_map.set(refresh_token_value, access_token_value)
 
         return OAuthToken(
             access_token=access_token_value,
@@ -193,12 +223,12 @@ class InMemoryOAuthProvider(OAuthProvider):
     async def load_refresh_token(
         self, client: OAuthClientInformationFull, refresh_token: str
     ) -> RefreshToken | None:
-        token_obj = self.refresh_tokens.get(refresh_token)
+        token_obj = await self.refresh_tokens.get(refresh_token)
         if token_obj:
             if token_obj.client_id != client.client_id:
                 return None  # Belongs to different client
             if token_obj.expires_at is not None and token_obj.expires_at < time.time():
-                self._revoke_internal(
+                await self._revoke_internal(
                     refresh_token_str=token_obj.token
                 )  # Clean up expired
                 return None
@@ -221,7 +251,7 @@ class InMemoryOAuthProvider(OAuthProvider):
             )
 
         # Invalidate old refresh token and its associated access token (rotation)
-        self._revoke_internal(refresh_token_str=refresh_token.token)
+        await self._revoke_internal(refresh_token_str=refresh_token.token)
 
         # Issue new tokens
         new_access_token_value = f"test_access_token_{secrets.token_hex(32)}"
@@ -236,21 +266,35 @@ class InMemoryOAuthProvider(OAuthProvider):
                 time.time() + DEFAULT_REFRESH_TOKEN_EXPIRY_SECONDS
             )
 
-        self.access_tokens[new_access_token_value] = AccessToken(
-            token=new_access_token_value,
-            client_id=client.client_id,
-            scopes=scopes,  # Use newly requested (and validated) scopes
-            expires_at=access_token_expires_at,
+        await self.access_tokens.set(
+            new_access_token_value,
+            AccessToken(
+                token=new_access_token_value,
+                client_id=client.client_id,
+                scopes=scopes,  # Use newly requested (and validated) scopes
+                expires_at=access_token_expires_at,
+            ),
+            ttl_seconds=DEFAULT_ACCESS_TOKEN_EXPIRY_SECONDS,
         )
-        self.refresh_tokens[new_refresh_token_value] = RefreshToken(
-            token=new_refresh_token_value,
-            client_id=client.client_id,
-            scopes=scopes,  # New refresh token also gets these scopes
-            expires_at=refresh_token_expires_at,
+        await self.refresh_tokens.set(
+            new_refresh_token_value,
+            RefreshToken(
+                token=new_refresh_token_value,
+                client_id=client.client_id,
+                scopes=scopes,  # New refresh token also gets these scopes
+                expires_at=refresh_token_expires_at,
+            ),
+            ttl_seconds=DEFAULT_REFRESH_TOKEN_EXPIRY_SECONDS,
         )
 
-        self._access_to_refresh_map[new_access_token_value] = new_refresh_token_value
-        self._refresh_to_access_map[new_refresh_token_value] = new_access_token_value
+        await self._access_to_refresh_map.set(
+            new_access_token_value,
+            new_refresh_token_value,
+            ttl_seconds=DEFAULT_ACCESS_TOKEN_EXPIRY_SECONDS,
+        )
+        await self._refresh_to_access_map.set(
+            new_refresh_token_value, new_access_token_value
+        )
 
         return OAuthToken(
             access_token=new_access_token_value,
@@ -261,10 +305,10 @@ class InMemoryOAuthProvider(OAuthProvider):
         )
 
     async def load_access_token(self, token: str) -> AccessToken | None:
-        token_obj = self.access_tokens.get(token)
+        token_obj = await self.access_tokens.get(token)
         if token_obj:
             if token_obj.expires_at is not None and token_obj.expires_at < time.time():
-                self._revoke_internal(
+                await self._revoke_internal(
                     access_token_str=token_obj.token
                 )  # Clean up expired
                 return None
@@ -286,47 +330,27 @@ class InMemoryOAuthProvider(OAuthProvider):
         """
         return await self.load_access_token(token)
 
-    def _revoke_internal(
+    async def _revoke_internal(
         self, access_token_str: str | None = None, refresh_token_str: str | None = None
     ):
         """Internal helper to remove tokens and their associations."""
-        removed_access_token = None
-        removed_refresh_token = None
-
         if access_token_str:
-            if access_token_str in self.access_tokens:
-                del self.access_tokens[access_token_str]
-                removed_access_token = access_token_str
+            await self.access_tokens.delete(access_token_str)
 
-            # Get associated refresh token
-            associated_refresh = self._access_to_refresh_map.pop(access_token_str, None)
+            # Remove the associated refresh token
+            associated_refresh = await self._access_to_refresh_map.pop(access_token_str)
             if associated_refresh:
-                if associated_refresh in self.refresh_tokens:
-                    del self.refresh_tokens[associated_refresh]
-                    removed_refresh_token = associated_refresh
-                self._refresh_to_access_map.pop(associated_refresh, None)
+                await self.refresh_tokens.delete(associated_refresh)
+                await self._refresh_to_access_map.delete(associated_refresh)
 
         if refresh_token_str:
-            if refresh_token_str in self.refresh_tokens:
-                del self.refresh_tokens[refresh_token_str]
-                removed_refresh_token = refresh_token_str
+            await self.refresh_tokens.delete(refresh_token_str)
 
-            # Get associated access token
-            associated_access = self._refresh_to_access_map.pop(refresh_token_str, None)
+            # Remove the associated access token
+            associated_access = await self._refresh_to_access_map.pop(refresh_token_str)
             if associated_access:
-                if associated_access in self.access_tokens:
-                    del self.access_tokens[associated_access]
-                    removed_access_token = associated_access
-                self._access_to_refresh_map.pop(associated_access, None)
-
-        # Clean up any dangling references if one part of the pair was already gone
-        if removed_access_token and removed_access_token in self._access_to_refresh_map:
-            del self._access_to_refresh_map[removed_access_token]
-        if (
-            removed_refresh_token
-            and removed_refresh_token in self._refresh_to_access_map
-        ):
-            del self._refresh_to_access_map[removed_refresh_token]
+                await self.access_tokens.delete(associated_access)
+                await self._access_to_refresh_map.delete(associated_access)
 
     async def revoke_token(
         self,
@@ -334,7 +358,7 @@ class InMemoryOAuthProvider(OAuthProvider):
     ) -> None:
         """Revokes an access or refresh token and its counterpart."""
         if isinstance(token, AccessToken):
-            self._revoke_internal(access_token_str=token.token)
+            await self._revoke_internal(access_token_str=token.token)
         elif isinstance(token, RefreshToken):
-            self._revoke_internal(refresh_token_str=token.token)
+            await self._revoke_internal(refresh_token_str=token.token)
         # If token is not found or already revoked, _revoke_internal does nothing, which is correct.
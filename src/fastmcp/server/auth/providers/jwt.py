@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from dataclasses import dataclass
 from typing import Any, cast
 
-import httpx
-from authlib.jose import JsonWebKey, JsonWebToken
+from authlib.jose import JsonWebKey, JsonWebToken, Key
 from authlib.jose.errors import JoseError
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
@@ -16,7 +16,9 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing_extensions import TypedDict
 
 from fastmcp.server.auth import AccessToken, TokenVerifier
+from fastmcp.server.auth.token_cache import VerifiedTokenCache
 from fastmcp.utilities.auth import parse_scopes
+from fastmcp.utilities.http import get_http_client
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.types import NotSet, NotSetT
 
@@ -154,6 +156,8 @@ class JWTVerifierSettings(BaseSettings):
     audience: str | list[str] | None = None
     required_scopes: list[str] | None = None
     base_url: AnyHttpUrl | str | None = None
+    cache_ttl_seconds: int | None = None
+    cache_max_size: int | None = None
 
     @field_validator("required_scopes", mode="before")
     @classmethod
@@ -190,6 +194,8 @@ class JWTVerifier(TokenVerifier):
         algorithm: str | None | NotSetT = NotSet,
         required_scopes: list[str] | None | NotSetT = NotSet,
         base_url: AnyHttpUrl | str | None | NotSetT = NotSet,
+        cache_ttl_seconds: int | None | NotSetT = NotSet,
+        cache_max_size: int | None | NotSetT = NotSet,
     ):
         """
         Initialize the JWT token verifier.
@@ -205,6 +211,10 @@ class JWTVerifier(TokenVerifier):
                       - Symmetric: HS256, HS384, HS512
             required_scopes: Required scopes for all tokens
             base_url: Base URL for TokenVerifier protocol
+            cache_ttl_seconds: How long to remember a verified token, so that a
+                client reusing it skips signature verification (default: 0,
+                disabled). Tokens are never remembered past their expiry.
+            cache_max_size: The most verified tokens to remember (default: 10,000)
         """
         settings = JWTVerifierSettings.model_validate(
             {
@@ -217,6 +227,8 @@ class JWTVerifier(TokenVerifier):
                     "algorithm": algorithm,
                     "required_scopes": required_scopes,
                     "base_url": base_url,
+                    "cache_ttl_seconds": cache_ttl_seconds,
+                    "cache_max_size": cache_max_size,
                 }.items()
                 if v is not NotSet
             }
@@ -259,15 +271,35 @@ class JWTVerifier(TokenVerifier):
         self.jwt = JsonWebToken([self.algorithm])
         self.logger = get_logger(__name__)
 
-        # Simple JWKS cache
-        self._jwks_cache: dict[str, str] = {}
+        # Verified tokens by hash; `token_cache.hit_rate` reports its use.
+        # Rejections aren't cached, as they may be due to a JWKS fetch error.
+        self.token_cache = VerifiedTokenCache(
+            ttl_seconds=settings.cache_ttl_seconds or 0,
+            negative_ttl_seconds=0,
+            max_size=settings.cache_max_size or 10_000,
+        )
+        self._token_cache_config = self._get_token_cache_config()
+
+        # Parsed static key, remembered with the key it was parsed from
+        self._public_key_cache: tuple[str, Key] | None = None
+
+        # JWKS cache of parsed keys by kid. Keys are refreshed in the background
+        # shortly before they expire, and concurrent fetches share one request.
+        self._jwks_cache: dict[str, Key] = {}
         self._jwks_cache_time: float = 0
         self._cache_ttl = 3600  # 1 hour
-
-    async def _get_verification_key(self, token: str) -> str:
+        self._jwks_refresh_margin = 300  # refresh in the background 5 minutes early
+        self._jwks_fetch: asyncio.Task[None] | None = None
+        self._jwks_fetch_started: float = 0
+        # Unknown kids, expired keys and failed refreshes trigger at most one
+        # refetch per interval, so that tokens with bogus kids or a flaky
+        # endpoint can't make us hammer it
+        self._jwks_min_refetch_interval = 30
+
+    async def _get_verification_key(self, token: str) -> Key:
         """Get the verification key for the token."""
         if self.public_key:
-            return self.public_key
+            return self._get_public_key()
 
         # Extract kid from token header for JWKS lookup
         try:
@@ -284,68 +316,114 @@ class JWTVerifier(TokenVerifier):
         except Exception as e:
             raise ValueError(f"Failed to extract key ID from token: {e}")
 
-    async def _get_jwks_key(self, kid: str | None) -> str:
-        """Fetch key from JWKS with simple caching."""
+    def _get_public_key(self) -> Key:
+        """Parse the static key once rather than on every token."""
+        assert self.public_key
+        if self._public_key_cache and self._public_key_cache[0] == self.public_key:
+            return self._public_key_cache[1]
+
+        kty = {"HS": "oct", "RS": "RSA", "PS": "RSA", "ES": "EC"}[self.algorithm[:2]]
+        key = JsonWebKey.import_key(self.public_key, {"kty": kty})
+        self._public_key_cache = (self.public_key, key)
+        return key
+
+    async def _get_jwks_key(self, kid: str | None) -> Key:
+        """Get a key from the cached JWKS, fetching it if needed."""
         if not self.jwks_uri:
             raise ValueError("JWKS URI not configured")
 
         current_time = time.time()
+        age = current_time - self._jwks_cache_time
+        if age >= self._cache_ttl:
+            # Expired keys are refetched at most once per interval. If the
+            # fetch fails, the stale keys are used until a later one succeeds.
+            if self._may_refetch_jwks(current_time):
+                try:
+                    await self._refresh_jwks()
+                except ValueError:
+                    if not self._jwks_cache:
+                        raise
+                    self.logger.warning("JWKS refresh failed, using cached keys")
+        elif (
+            age >= self._cache_ttl - self._jwks_refresh_margin
+            and self._may_refetch_jwks(current_time)
+        ):
+            self._start_jwks_fetch()
+
+        key = self._select_jwks_key(kid)
+        if key is None and kid and self._may_refetch_jwks(current_time):
+            # The issuer may have rotated its keys since we last fetched them
+            await self._refresh_jwks()
+            key = self._select_jwks_key(kid)
+
+        if key is None:
+            if kid:
+                self.logger.debug("JWKS key lookup failed: key ID '%s' not found", kid)
+                raise ValueError(f"Key ID '{kid}' not found in JWKS")
+            raise ValueError("No keys found in JWKS")
+        return key
 
-        # Check cache first
-        if current_time - self._jwks_cache_time < self._cache_ttl:
-            if kid and kid in self._jwks_cache:
-                return self._jwks_cache[kid]
-            elif not kid and len(self._jwks_cache) == 1:
-                # If no kid but only one key cached, use it
-                return next(iter(self._jwks_cache.values()))
+    def _select_jwks_key(self, kid: str | None) -> Key | None:
+        """Select the cached key for a kid, or None if there isn't one."""
+        if kid:
+            return self._jwks_cache.get(kid)
+        # No kid in token - only allow if there's exactly one key
+        if len(self._jwks_cache) > 1:
+            raise ValueError("Multiple keys in JWKS but no key ID (kid) in token")
+        return next(iter(self._jwks_cache.values()), None)
+
+    def _may_refetch_jwks(self, current_time: float) -> bool:
+        """Whether the JWKS may be fetched before the cached keys expire."""
+        if self._jwks_fetch is not None and not self._jwks_fetch.done():
+            return True
+        return (
+            current_time - self._jwks_fetch_started >= self._jwks_min_refetch_interval
+        )
 
-        # Fetch JWKS
+    async def _refresh_jwks(self) -> None:
+        """Fetch the JWKS, joining a fetch that is already in progress."""
+        # Shielded so that a cancelled request doesn't cancel the fetch for
+        # the other requests waiting on it
+        await asyncio.shield(self._start_jwks_fetch())
+
+    def _start_jwks_fetch(self) -> asyncio.Task[None]:
+        """Start fetching the JWKS unless a fetch is already in progress."""
+        task = self._jwks_fetch
+        if (
+            task is None
+            or task.done()
+            or task.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._jwks_fetch_started = time.time()
+            task = self._jwks_fetch = asyncio.create_task(self._fetch_jwks())
+            # Background refreshes aren't awaited; failures are logged instead
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return task
+
+    async def _fetch_jwks(self) -> None:
+        """Fetch the JWKS and replace the cached keys."""
+        assert self.jwks_uri
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.jwks_uri)
-                response.raise_for_status()
-                jwks_data = response.json()
+            response = await get_http_client().get(self.jwks_uri)
+            response.raise_for_status()
+            jwks_data = response.json()
 
-            # Cache all keys
-            self._jwks_cache = {}
+            keys: dict[str, Key] = {}
             for key_data in jwks_data.get("keys", []):
-                key_kid = key_data.get("kid")
-                jwk = JsonWebKey.import_key(key_data)
-                public_key = jwk.get_public_key()  # type: ignore
-
-                if key_kid:
-                    self._jwks_cache[key_kid] = public_key
-                else:
-                    # Key without kid - use a default identifier
-                    self._jwks_cache["_default"] = public_key
-
-            self._jwks_cache_time = current_time
-
-            # Select the appropriate key
-            if kid:
-                if kid not in self._jwks_cache:
-                    self.logger.debug(
-                        "JWKS key lookup failed: key ID '%s' not found", kid
-                    )
-                    raise ValueError(f"Key ID '{kid}' not found in JWKS")
-                return self._jwks_cache[kid]
-            else:
-                # No kid in token - only allow if there's exactly one key
-                if len(self._jwks_cache) == 1:
-                    return next(iter(self._jwks_cache.values()))
-                elif len(self._jwks_cache) > 1:
-                    raise ValueError(
-                        "Multiple keys in JWKS but no key ID (kid) in token"
-                    )
-                else:
-                    raise ValueError("No keys found in JWKS")
-
-        except httpx.HTTPError as e:
-            raise ValueError(f"Failed to fetch JWKS: {e}")
+                # Key without kid - use a default identifier
+                keys[key_data.get("kid") or "_default"] = JsonWebKey.import_key(
+                    key_data
+                )
         except Exception as e:
             self.logger.debug(f"JWKS fetch failed: {e}")
             raise ValueError(f"Failed to fetch JWKS: {e}")
 
+        if self._jwks_cache.keys() - keys.keys():
+            # Tokens signed with a removed key must be verified again
+            self.token_cache.clear()
+        self._jwks_cache = keys
+        self._jwks_cache_time = time.time()
+
     def _extract_scopes(self, claims: dict[str, Any]) -> list[str]:
         """
         Extract scopes from JWT claims. Supports both 'scope' and 'scp'
@@ -363,6 +441,20 @@ class JWTVerifier(TokenVerifier):
 
         return []
 
+    def _get_token_cache_config(self) -> tuple[Any, ...]:
+        """The settings that verified tokens were checked against."""
+        return (
+            self.algorithm,
+            self.public_key,
+            self.jwks_uri,
+            self.issuer,
+            str(self.audience),
+            str(self.required_scopes),
+        )
+
+    def invalidate_token(self, token: str) -> None:
+        self.token_cache.invalidate(token)
+
     async def load_access_token(self, token: str) -> AccessToken | None:
         """
         Validates the provided JWT bearer token.
@@ -373,6 +465,17 @@ class JWTVerifier(TokenVerifier):
         Returns:
             AccessToken object if valid, None if invalid or expired
         """
+        if not self.token_cache.ttl_seconds:
+            return await self._load_access_token(token)
+
+        config = self._get_token_cache_config()
+        if config != self._token_cache_config:
+            # Cached tokens may not pass the changed checks
+            self.token_cache.clear()
+            self._token_cache_config = config
+        return await self.token_cache.verify(token, self._load_access_token)
+
+    async def _load_access_token(self, token: str) -> AccessToken | None:
         try:
             # Get verification key (static or from JWKS)
             verification_key = await self._get_verification_key(token)
@@ -21,7 +21,13 @@ from starlette.routing import Route
 from fastmcp.server.auth import AccessToken, RemoteAuthProvider, TokenVerifier
 from fastmcp.server.auth.oauth_proxy import OAuthProxy
 from fastmcp.server.auth.providers.jwt import JWTVerifier
+from fastmcp.server.auth.storage import OAuthStorage
+from fastmcp.server.auth.token_cache import (
+    VerifiedTokenCache,
+    raise_for_transient_error,
+)
 from fastmcp.utilities.auth import parse_scopes
+from fastmcp.utilities.http import get_http_client
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.types import NotSet, NotSetT
 
@@ -44,6 +50,7 @@ class WorkOSProviderSettings(BaseSettings):
     redirect_path: str | None = None
     required_scopes: list[str] | None = None
     timeout_seconds: int | None = None
+    cache_ttl_seconds: int | None = None
     allowed_client_redirect_uris: list[str] | None = None
 
     @field_validator("required_scopes", mode="before")
@@ -65,6 +72,7 @@ class WorkOSTokenVerifier(TokenVerifier):
         authkit_domain: str,
         required_scopes: list[str] | None = None,
         timeout_seconds: int = 10,
+        cache_ttl_seconds: int = 300,
     ):
         """Initialize the WorkOS token verifier.
 
@@ -72,50 +80,18 @@ class WorkOSTokenVerifier(TokenVerifier):
             authkit_domain: WorkOS AuthKit domain (e.g., "https://your-app.authkit.app")
             required_scopes: Required OAuth scopes
             timeout_seconds: HTTP request timeout
+            cache_ttl_seconds: How long to remember a verified token before
+                checking it with WorkOS again; 0 checks every request
         """
         super().__init__(required_scopes=required_scopes)
         self.authkit_domain = authkit_domain.rstrip("/")
         self.timeout_seconds = timeout_seconds
+        self._token_cache = VerifiedTokenCache(ttl_seconds=cache_ttl_seconds)
 
     async def verify_token(self, token: str) -> AccessToken | None:
         """Verify WorkOS OAuth token by calling userinfo endpoint."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-                # Use WorkOS AuthKit userinfo endpoint to validate token
-                response = await client.get(
-                    f"{self.authkit_domain}/oauth2/userinfo",
-                    headers={
-                        "Authorization": f"Bearer {token}",
-                        "User-Agent": "FastMCP-WorkOS-OAuth",
-                    },
-                )
-
-                if response.status_code != 200:
-                    logger.debug(
-                        "WorkOS token verification failed: %d - %s",
-                        response.status_code,
-                        response.text[:200],
-                    )
-                    return None
-
-                user_data = response.json()
-
-                # Create AccessToken with WorkOS user info
-                return AccessToken(
-                    token=token,
-                    client_id=str(user_data.get("sub", "unknown")),
-                    scopes=self.required_scopes or [],
-                    expires_at=None,  # Will be set from token introspection if needed
-                    claims={
-                        "sub": user_data.get("sub"),
-                        "email": user_data.get("email"),
-                        "email_verified": user_data.get("email_verified"),
-                        "name": user_data.get("name"),
-                        "given_name": user_data.get("given_name"),
-                        "family_name": user_data.get("family_name"),
-                    },
-                )
-
+            return await self._token_cache.verify(token, self._verify_token)
         except httpx.RequestError as e:
             logger.debug("Failed to verify WorkOS token: %s", e)
             return None
@@ -123,6 +99,49 @@ class WorkOSTokenVerifier(TokenVerifier):
             logger.debug("WorkOS token verification error: %s", e)
             return None
 
+    def invalidate_token(self, token: str) -> None:
+        self._token_cache.invalidate(token)
+
+    async def _verify_token(self, token: str) -> AccessToken | None:
+        client = get_http_client()
+        # Use WorkOS AuthKit userinfo endpoint to validate token
+        response = await client.get(
+            f"{self.authkit_domain}/oauth2/userinfo",
+            headers={
+                "Authorization": f"Bearer {token}",
+                "User-Agent": "FastMCP-WorkOS-OAuth",
+            },
+            timeout=self.timeout_seconds,
+        )
+
+        raise_for_transient_error(response)
+
+        if response.status_code != 200:
+            logger.debug(
+                "WorkOS token verification failed: %d - %s",
+                response.status_code,
+                response.text[:200],
+            )
+            return None
+
+        user_data = response.json()
+
+        # Create AccessToken with WorkOS user info
+        return AccessToken(
+            token=token,
+            client_id=str(user_data.get("sub", "unknown")),
+            scopes=self.required_scopes or [],
+            expires_at=None,  # Will be set from token introspection if needed
+            claims={
+                "sub": user_data.get("sub"),
+                "email": user_data.get("email"),
+                "email_verified": user_data.get("email_verified"),
+                "name": user_data.get("name"),
+                "given_name": user_data.get("given_name"),
+                "family_name": user_data.get("family_name"),
+            },
+        )
+
 
 class WorkOSProvider(OAuthProxy):
     """Complete WorkOS OAuth provider for FastMCP.
@@ -168,7 +187,9 @@ class WorkOSProvider(OAuthProxy):
         redirect_path: str | NotSetT = NotSet,
         required_scopes: list[str] | None | NotSetT = NotSet,
         timeout_seconds: int | NotSetT = NotSet,
+        cache_ttl_seconds: int | NotSetT = NotSet,
         allowed_client_redirect_uris: list[str] | NotSetT = NotSet,
+        storage: OAuthStorage | None = None,
     ):
         """Initialize WorkOS OAuth provider.
 
@@ -180,8 +201,10 @@ class WorkOSProvider(OAuthProxy):
             redirect_path: Redirect path configured in WorkOS (defaults to "/auth/callback")
             required_scopes: Required OAuth scopes (no default)
             timeout_seconds: HTTP request timeout for WorkOS API calls
+            cache_ttl_seconds: How long to remember a verified token (defaults to 300 seconds)
             allowed_client_redirect_uris: List of allowed redirect URI patterns for MCP clients.
                 If None (default), all URIs are allowed. If empty list, no URIs are allowed.
+            storage: Where to keep OAuth state (defaults to in-memory storage)
         """
 
         settings = WorkOSProviderSettings.model_validate(
@@ -195,6 +218,7 @@ class WorkOSProvider(OAuthProxy):
                     "redirect_path": redirect_path,
                     "required_scopes": required_scopes,
                     "timeout_seconds": timeout_seconds,
+                    "cache_ttl_seconds": cache_ttl_seconds,
                     "allowed_client_redirect_uris": allowed_client_redirect_uris,
                 }.items()
                 if v is not NotSet
@@ -222,6 +246,11 @@ class WorkOSProvider(OAuthProxy):
         authkit_domain_final = authkit_domain_str.rstrip("/")
         redirect_path_final = settings.redirect_path or "/auth/callback"
         timeout_seconds_final = settings.timeout_seconds or 10
+        cache_ttl_seconds_final = (
+            settings.cache_ttl_seconds
+            if settings.cache_ttl_seconds is not None
+            else 300
+        )
         scopes_final = settings.required_scopes or []
         allowed_client_redirect_uris_final = settings.allowed_client_redirect_uris
 
@@ -235,6 +264,7 @@ class WorkOSProvider(OAuthProxy):
             authkit_domain=authkit_domain_final,
             required_scopes=scopes_final,
             timeout_seconds=timeout_seconds_final,
+            cache_ttl_seconds=cache_ttl_seconds_final,
         )
 
         # Initialize OAuth proxy with WorkOS AuthKit endpoints
@@ -248,6 +278,7 @@ class WorkOSProvider(OAuthProxy):
             redirect_path=redirect_path_final,
             issuer_url=settings.base_url,
             allowed_client_redirect_uris=allowed_client_redirect_uris_final,
+            storage=storage,
         )
 
         logger.info(
@@ -377,13 +408,12 @@ class AuthKitProvider(RemoteAuthProvider):
         async def oauth_authorization_server_metadata(request):
             """Forward AuthKit OAuth authorization server metadata with FastMCP customizations."""
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(
-                        f"{self.authkit_domain}/.well-known/oauth-authorization-server"
-                    )
-                    response.raise_for_status()
-                    metadata = response.json()
-                    return JSONResponse(metadata)
+                response = await get_http_client().get(
+                    f"{self.authkit_domain}/.well-known/oauth-authorization-server"
+                )
+                response.raise_for_status()
+                metadata = response.json()
+                return JSONResponse(metadata)
             except Exception as e:
                 return JSONResponse(
                     {
@@ -0,0 +1,304 @@
+"""Storage for the state of OAuth providers, such as registered clients, issued
+tokens and authorization flows in progress."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Generic, Protocol, TypeVar
+
+import anyio.to_thread
+from pydantic import TypeAdapter
+
+T = TypeVar("T")
+
+
+class OAuthStorage(Protocol):
+    """
+    A key-value store for the state of an OAuth provider.
+
+    Values are JSON-compatible and grouped in named collections. Entries
+    stored with a TTL are not returned once it has passed. Implementations
+    must be safe to share between the providers of one process; to share
+    state between processes, such as the workers of a server, use storage
+    they can all reach, like `SQLiteOAuthStorage`.
+
+    Methods are async so that implementations can do I/O without blocking
+    the event loop.
+    """
+
+    async def get(self, collection: str, key: str) -> Any | None:
+        """Return the value stored under `key`, or None if there isn't one."""
+        ...
+
+    async def set(
+        self,
+        collection: str,
+        key: str,
+        value: Any,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Store `value` under `key`, expiring after `ttl_seconds` if given."""
+        ...
+
+    async def delete(self, collection: str, key: str) -> None:
+        """Delete the value stored under `key`, if there is one."""
+        ...
+
+    async def pop(self, collection: str, key: str) -> Any | None:
+        """
+        Delete the value stored under `key` and return it, or None if there
+        isn't one. This is atomic: when several callers pop the same key, at
+        most one of them gets the value, which keeps codes single-use.
+        """
+        ...
+
+
+def _expires_at(ttl_seconds: float | None) -> float | None:
+    return time.time() + ttl_seconds if ttl_seconds is not None else None
+
+
+class MemoryOAuthStorage:
+    """
+    Stores OAuth state in memory, where it is lost on restart and not shared
+    with other processes.
+
+    Expired entries are swept at most every `sweep_interval_seconds`, when an
+    entry is stored. If `max_size` is set, the least recently used entries of
+    a collection are dropped once it holds more than that many.
+
+    Args:
+        max_size: The most entries to keep per collection (default: unbounded)
+        sweep_interval_seconds: How often to remove expired entries
+    """
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        sweep_interval_seconds: float = 60,
+    ):
+        self.max_size = max_size
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self._collections: dict[str, OrderedDict[str, tuple[Any, float | None]]] = {}
+        self._last_sweep = time.time()
+
+    async def get(self, collection: str, key: str) -> Any | None:
+        entries = self._collections.get(collection)
+        entry = entries.get(key) if entries is not None else None
+        if entry is None:
+            return None
+        assert entries is not None
+        value, expires_at = entry
+        if expires_at is not None and time.time() >= expires_at:
+            del entries[key]
+            return None
+        entries.move_to_end(key)
+        return value
+
+    async def set(
+        self,
+        collection: str,
+        key: str,
+        value: Any,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        self._sweep_if_due()
+        entries = self._collections.setdefault(collection, OrderedDict())
+        entries[key] = (value, _expires_at(ttl_seconds))
+        entries.move_to_end(key)
+        if self.max_size is not None:
+            while len(entries) > self.max_size:
+                entries.popitem(last=False)
+
+    async def delete(self, collection: str, key: str) -> None:
+        entries = self._collections.get(collection)
+        if entries is not None:
+            entries.pop(key, None)
+
+    async def pop(self, collection: str, key: str) -> Any | None:
+        entries = self._collections.get(collection)
+        entry = entries.pop(key, None) if entries is not None else None
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and time.time() >= expires_at:
+            return None
+        return value
+
+    def _sweep_if_due(self) -> None:
+        now = time.time()
+        if now - self._last_sweep < self.sweep_interval_seconds:
+            return
+        self._last_sweep = now
+        for entries in self._collections.values():
+            expired = [
+                key
+                for key, (_, expires_at) in entries.items()
+                if expires_at is not None and now >= expires_at
+            ]
+            for key in expired:
+                del entries[key]
+
+
+class SQLiteOAuthStorage:
+    """
+    Stores OAuth state in a local SQLite database, so that it survives
+    restarts and can be shared by the worker processes of a server.
+
+    Values are stored as JSON. Expired entries are swept at most every
+    `sweep_interval_seconds`, when an entry is stored. Queries run in a
+    worker thread, so a worker waiting for another one's write lock doesn't
+    block the event loop.
+
+    Args:
+        path: The database file, created if it doesn't exist
+        sweep_interval_seconds: How often to remove expired entries
+    """
+
+    def __init__(self, path: str | Path, sweep_interval_seconds: float = 60):
+        self.path = Path(path)
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        with self._lock:
+            # WAL lets workers read while another one writes
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS oauth_storage (
+                    collection TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    expires_at REAL,
+                    PRIMARY KEY (collection, key)
+                )
+                """
+            )
+        self._last_sweep = 0.0
+
+    async def get(self, collection: str, key: str) -> Any | None:
+        return await anyio.to_thread.run_sync(self._get, collection, key)
+
+    async def set(
+        self,
+        collection: str,
+        key: str,
+        value: Any,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        await anyio.to_thread.run_sync(self._set, collection, key, value, ttl_seconds)
+
+    async def delete(self, collection: str, key: str) -> None:
+        await anyio.to_thread.run_sync(self._delete, collection, key)
+
+    async def pop(self, collection: str, key: str) -> Any | None:
+        return await anyio.to_thread.run_sync(self._pop, collection, key)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _get(self, collection: str, key: str) -> Any | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM oauth_storage "
+                "WHERE collection = ? AND key = ?",
+                (collection, key),
+            ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is not None and time.time() >= expires_at:
+            return None
+        return json.loads(value)
+
+    def _set(
+        self,
+        collection: str,
+        key: str,
+        value: Any,
+        ttl_seconds: float | None,
+    ) -> None:
+        self._sweep_if_due()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO oauth_storage "
+                "(collection, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (collection, key, json.dumps(value), _expires_at(ttl_seconds)),
+            )
+
+    def _delete(self, collection: str, key: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM oauth_storage WHERE collection = ? AND key = ?",
+                (collection, key),
+            )
+
+    def _pop(self, collection: str, key: str) -> Any | None:
+        # A single statement runs in its own transaction, so only one
+        # connection can delete, and so receive, the row. All rows are
+        # fetched so the statement, and with it the transaction, completes.
+        with self._lock:
+            rows = self._connection.execute(
+                "DELETE FROM oauth_storage WHERE collection = ? AND key = ? "
+                "RETURNING value, expires_at",
+                (collection, key),
+            ).fetchall()
+        if not rows:
+            return None
+        value, expires_at = rows[0]
+        if expires_at is not None and time.time() >= expires_at:
+            return None
+        return json.loads(value)
+
+    def _sweep_if_due(self) -> None:
+        now = time.time()
+        if now - self._last_sweep < self.sweep_interval_seconds:
+            return
+        self._last_sweep = now
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM oauth_storage WHERE expires_at <= ?", (now,)
+            )
+
+
+class OAuthStorageCollection(Generic[T]):
+    """
+    A collection of an `OAuthStorage` holding values of one type. Values are
+    converted to and from JSON-compatible data with pydantic, so reading a
+    value returns a new object.
+    """
+
+    def __init__(self, storage: OAuthStorage, name: str, value_type: type[T]):
+        self.storage = storage
+        self.name = name
+        self._adapter: TypeAdapter[T] = TypeAdapter(value_type)
+
+    async def get(self, key: str, default: T | None = None) -> T | None:
+        data = await self.storage.get(self.name, key)
+        if data is None:
+            return default
+        return self._adapter.validate_python(data)
+
+    async def set(self, key: str, value: T, ttl_seconds: float | None = None) -> None:
+        data = self._adapter.dump_python(value, mode="json")
+        await self.storage.set(self.name, key, data, ttl_seconds=ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        await self.storage.delete(self.name, key)
+
+    async def pop(self, key: str, default: T | None = None) -> T | None:
+        """Delete the value stored under `key` and return it, atomically."""
+        data = await self.storage.pop(self.name, key)
+        if data is None:
+            return default
+        return self._adapter.validate_python(data)
+
+    async def contains(self, key: str) -> bool:
+        return await self.storage.get(self.name, key) is not None
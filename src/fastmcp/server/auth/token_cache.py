@@ -0,0 +1,161 @@
+"""Cache the results of verifying opaque tokens with a remote API."""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+import anyio
+import httpx
+
+from fastmcp.server.auth.auth import AccessToken
+
+
+def raise_for_transient_error(response: httpx.Response) -> None:
+    """
+    Raise an error for a response that says nothing about whether the token is
+    valid, such as a server error or rate limit, so that it isn't cached as a
+    rejection.
+    """
+    if response.status_code == 429 or response.status_code >= 500:
+        response.raise_for_status()
+
+
+class _Verification:
+    """A verification in progress, which concurrent requests wait for."""
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.finished = False
+        self.result: AccessToken | None = None
+        self.error: Exception | None = None
+
+
+class VerifiedTokenCache:
+    """
+    Remembers the outcome of verifying tokens, so that a client reusing the
+    same bearer token doesn't cost a round trip to the identity provider on
+    every request.
+
+    Verified tokens are remembered for `ttl_seconds`, or until the token
+    expires if that is sooner. Rejected tokens are remembered for
+    `negative_ttl_seconds` (at most `ttl_seconds`). Errors, such as the
+    provider being unreachable, are not cached. Tokens are stored by their
+    SHA-256 hash, and the least recently used entries are dropped once there
+    are more than `max_size`.
+
+    Concurrent verifications of the same token are coalesced: the first
+    request checks with the provider, and the others wait for its outcome.
+    `hits` and `misses` count requests answered without and with a call to
+    the provider.
+
+    Args:
+        ttl_seconds: How long to remember verified tokens. 0 disables caching,
+            though concurrent verifications are still coalesced.
+        negative_ttl_seconds: How long to remember rejected tokens.
+        max_size: The most tokens to remember.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300,
+        negative_ttl_seconds: float = 30,
+        max_size: int = 10_000,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = min(negative_ttl_seconds, ttl_seconds)
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[AccessToken | None, float]] = (
+            OrderedDict()
+        )
+        self._verifications: dict[str, _Verification] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of requests answered without calling the provider."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _get(self, key: str) -> tuple[bool, AccessToken | None]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        access_token, expires_at = entry
+        if time.time() >= expires_at:
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, access_token
+
+    def _set(self, key: str, access_token: AccessToken | None) -> None:
+        now = time.time()
+        if access_token is None:
+            expires_at = now + self.negative_ttl_seconds
+        else:
+            expires_at = now + self.ttl_seconds
+            if access_token.expires_at is not None:
+                expires_at = min(expires_at, access_token.expires_at)
+        if expires_at <= now:
+            return
+        self._entries[key] = (access_token, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def verify(
+        self,
+        token: str,
+        verify: Callable[[str], Awaitable[AccessToken | None]],
+    ) -> AccessToken | None:
+        """
+        Return the cached outcome of verifying `token`, or verify it with
+        `verify` and remember the outcome. Errors raised by `verify` are
+        raised to every request waiting for it.
+        """
+        key = self._key(token)
+        while True:
+            found, access_token = self._get(key)
+            if found:
+                self.hits += 1
+                return access_token
+
+            verification = self._verifications.get(key)
+            if verification is None:
+                break
+            await verification.done.wait()
+            if verification.error is not None:
+                raise verification.error
+            if verification.finished:
+                self.hits += 1
+                return verification.result
+            # The verification was cancelled; try again
+
+        self.misses += 1
+        verification = _Verification()
+        self._verifications[key] = verification
+        try:
+            verification.result = await verify(token)
+            verification.finished = True
+            self._set(key, verification.result)
+            return verification.result
+        except Exception as e:
+            verification.error = e
+            raise
+        finally:
+            del self._verifications[key]
+            verification.done.set()
+
+    def invalidate(self, token: str) -> None:
+        """Forget the outcome of verifying `token`, e.g. after it was revoked."""
+        self._entries.pop(self._key(token), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
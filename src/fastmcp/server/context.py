@@ -5,6 +5,7 @@ import copy
 import inspect
 import warnings
 import weakref
+from collections import ChainMap
 from collections.abc import Generator, Mapping
 from contextlib import contextmanager
 from contextvars import ContextVar, Token
@@ -112,8 +113,9 @@ class Context:
     State Management:
     Context objects maintain a state dictionary that can be used to store and share
     data across middleware and tool calls within a request. When a new context
-    is created (nested contexts), it inherits a copy of its parent's state, ensuring
-    that modifications in child contexts don't affect parent contexts.
+    is created (nested contexts), it inherits its parent's state, ensuring
+    that modifications in child contexts don't affect parent contexts. Inherited
+    values are copied when the child first reads them.
 
     The context parameter name can be anything as long as it's annotated with Context.
     The context is optional - tools that don't need it can omit the parameter.
@@ -124,7 +126,7 @@ class Context:
         self._fastmcp: weakref.ref[FastMCP] = weakref.ref(fastmcp)
         self._tokens: list[Token] = []
         self._notification_queue: set[str] = set()  # Dedupe notifications
-        self._state: dict[str, Any] = {}
+        self._state: ChainMap[str, Any] = ChainMap()
 
     @property
     def fastmcp(self) -> FastMCP:
@@ -138,8 +140,11 @@ class Context:
         """Enter the context manager and set this context as the current context."""
         parent_context = _current_context.get(None)
         if parent_context is not None:
-            # Inherit state from parent context
-            self._state = copy.deepcopy(parent_context._state)
+            # Inherit a snapshot of the parent's state, so that later changes
+            # to the parent aren't seen here. Only the keys are copied now;
+            # values are deep-copied lazily by get_state(), so nesting
+            # contexts is cheap.
+            self._state = ChainMap({}, dict(parent_context._state))
 
         # Always set this context and save the token
         token = _current_context.set(self)
@@ -586,7 +591,15 @@ class Context:
 
     def get_state(self, key: str) -> Any:
         """Get a value from the context state. Returns None if the key is not found."""
-        return self._state.get(key)
+        local_state = self._state.maps[0]
+        if key in local_state:
+            return local_state[key]
+        if key not in self._state:
+            return None
+        # Copy inherited values on first access, so that changing them in place
+        # doesn't affect the parent context
+        value = local_state[key] = copy.deepcopy(self._state[key])
+        return value
 
     def _queue_tool_list_changed(self) -> None:
         """Queue a tool list changed notification."""
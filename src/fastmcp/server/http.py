@@ -303,7 +303,7 @@ def create_streamable_http_app(
     # Create a lifespan manager to start and stop the session manager
     @asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncGenerator[None, None]:
-        async with session_manager.run():
+        async with session_manager.run(), server._resources_lifespan():
             yield
 
     # Create and return the app with lifespan
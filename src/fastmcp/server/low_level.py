@@ -1,5 +1,7 @@
+from collections.abc import Awaitable, Callable
 from typing import Any
 
+import mcp.types
 from mcp.server.lowlevel.server import (
     LifespanResultT,
     NotificationOptions,
@@ -35,3 +37,80 @@ class LowLevelServer(_Server[LifespanResultT, RequestT]):
             experimental_capabilities=experimental_capabilities,
             **kwargs,
         )
+
+    # The list handlers below differ from the base server's in that the
+    # decorated function is passed the request's cursor and returns a complete
+    # (possibly paginated) result, rather than a list of all components.
+
+    def list_tools(self):
+        def decorator(
+            func: Callable[[str | None], Awaitable[mcp.types.ListToolsResult]],
+        ):
+            async def handler(req: mcp.types.ListToolsRequest | None):
+                if req is None:
+                    # The base server refreshes its tool cache, used to
+                    # validate tool calls, by calling this handler without a
+                    # request; that needs every page
+                    self._tool_cache.clear()
+                    cursor = None
+                    while True:
+                        result = await func(cursor)
+                        for tool in result.tools:
+                            self._tool_cache[tool.name] = tool
+                        cursor = result.nextCursor
+                        if cursor is None:
+                            return mcp.types.ServerResult(result)
+
+                cursor = req.params.cursor if req.params else None
+                result = await func(cursor)
+                if cursor is None:
+                    self._tool_cache.clear()
+                for tool in result.tools:
+                    self._tool_cache[tool.name] = tool
+                return mcp.types.ServerResult(result)
+
+            self.request_handlers[mcp.types.ListToolsRequest] = handler
+            return func
+
+        return decorator
+
+    def list_resources(self):
+        def decorator(
+            func: Callable[[str | None], Awaitable[mcp.types.ListResourcesResult]],
+        ):
+            async def handler(req: mcp.types.ListResourcesRequest):
+                cursor = req.params.cursor if req.params else None
+                return mcp.types.ServerResult(await func(cursor))
+
+            self.request_handlers[mcp.types.ListResourcesRequest] = handler
+            return func
+
+        return decorator
+
+    def list_resource_templates(self):
+        def decorator(
+            func: Callable[
+                [str | None], Awaitable[mcp.types.ListResourceTemplatesResult]
+            ],
+        ):
+            async def handler(req: mcp.types.ListResourceTemplatesRequest):
+                cursor = req.params.cursor if req.params else None
+                return mcp.types.ServerResult(await func(cursor))
+
+            self.request_handlers[mcp.types.ListResourceTemplatesRequest] = handler
+            return func
+
+        return decorator
+
+    def list_prompts(self):
+        def decorator(
+            func: Callable[[str | None], Awaitable[mcp.types.ListPromptsResult]],
+        ):
+            async def handler(req: mcp.types.ListPromptsRequest):
+                cursor = req.params.cursor if req.params else None
+                return mcp.types.ServerResult(await func(cursor))
+
+            self.request_handlers[mcp.types.ListPromptsRequest] = handler
+            return func
+
+        return decorator
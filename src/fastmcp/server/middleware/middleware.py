@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Sequence
+from contextvars import ContextVar
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from functools import partial
@@ -76,6 +77,24 @@ def make_middleware_wrapper(
     return wrapper
 
 
+# The hook that handles each MCP method, in addition to on_message and
+# on_request / on_notification
+_METHOD_HOOKS: dict[str | None, str] = {
+    "tools/call": "on_call_tool",
+    "resources/read": "on_read_resource",
+    "prompts/get": "on_get_prompt",
+    "tools/list": "on_list_tools",
+    "resources/list": "on_list_resources",
+    "resources/templates/list": "on_list_resource_templates",
+    "prompts/list": "on_list_prompts",
+}
+
+_TYPE_HOOKS: dict[str, str] = {
+    "request": "on_request",
+    "notification": "on_notification",
+}
+
+
 class Middleware:
     """Base class for FastMCP middleware with dispatching hooks."""
 
@@ -96,33 +115,20 @@ class Middleware:
     ) -> CallNext[Any, Any]:
         """Builds a chain of handlers for a given message."""
         handler = call_next
-
-        match context.method:
-            case "tools/call":
-                handler = partial(self.on_call_tool, call_next=handler)
-            case "resources/read":
-                handler = partial(self.on_read_resource, call_next=handler)
-            case "prompts/get":
-                handler = partial(self.on_get_prompt, call_next=handler)
-            case "tools/list":
-                handler = partial(self.on_list_tools, call_next=handler)
-            case "resources/list":
-                handler = partial(self.on_list_resources, call_next=handler)
-            case "resources/templates/list":
-                handler = partial(self.on_list_resource_templates, call_next=handler)
-            case "prompts/list":
-                handler = partial(self.on_list_prompts, call_next=handler)
-
-        match context.type:
-            case "request":
-                handler = partial(self.on_request, call_next=handler)
-            case "notification":
-                handler = partial(self.on_notification, call_next=handler)
-
-        handler = partial(self.on_message, call_next=handler)
-
+        for hook in reversed(self._hook_names(context.method, context.type)):
+            handler = partial(getattr(self, hook), call_next=handler)
         return handler
 
+    @staticmethod
+    def _hook_names(method: str | None, message_type: str) -> list[str]:
+        """The hooks that handle a message, outermost first."""
+        hooks = ["on_message"]
+        if type_hook := _TYPE_HOOKS.get(message_type):
+            hooks.append(type_hook)
+        if method_hook := _METHOD_HOOKS.get(method):
+            hooks.append(method_hook)
+        return hooks
+
     async def on_message(
         self,
         context: MiddlewareContext[Any],
@@ -192,3 +198,70 @@ class Middleware:
         call_next: CallNext[mt.ListPromptsRequest, list[Prompt]],
     ) -> list[Prompt]:
         return await call_next(context)
+
+
+_terminal_handler: ContextVar[CallNext[Any, Any]] = ContextVar(
+    "middleware_terminal_handler"
+)
+
+
+async def _call_terminal_handler(context: MiddlewareContext[Any]) -> Any:
+    return await _terminal_handler.get()(context)
+
+
+class MiddlewareChain:
+    """
+    The middleware hooks that handle one kind of message, linked once.
+
+    Servers keep one chain per (method, type) instead of rebuilding partials
+    for every request. Hooks that a middleware doesn't override are skipped.
+    Middleware that customizes `__call__` or `_dispatch_handler`, or that isn't
+    a `Middleware` at all, is called as a whole.
+
+    The final handler differs per request, so it is passed to `__call__` and
+    looked up from a context variable at the end of the chain.
+    """
+
+    def __init__(
+        self,
+        middleware: Sequence[Middleware],
+        method: str | None,
+        message_type: str,
+    ):
+        chain: CallNext[Any, Any] = _call_terminal_handler
+        for mw in reversed(middleware):
+            if _uses_default_dispatch(mw):
+                for hook in reversed(Middleware._hook_names(method, message_type)):
+                    if _overrides_hook(mw, hook):
+                        chain = partial(getattr(mw, hook), call_next=chain)
+            else:
+                chain = partial(mw, call_next=chain)
+        self._chain = chain
+
+    async def __call__(
+        self, context: MiddlewareContext[T], call_next: CallNext[T, Any]
+    ) -> Any:
+        token = _terminal_handler.set(call_next)
+        try:
+            return await self._chain(context)
+        finally:
+            _terminal_handler.reset(token)
+
+
+def _uses_default_dispatch(middleware: Any) -> bool:
+    cls = type(middleware)
+    return (
+        isinstance(middleware, Middleware)
+        and cls.__call__ is Middleware.__call__
+        and cls._dispatch_handler is Middleware._dispatch_handler
+    )
+
+
+def _overrides_hook(middleware: Middleware, hook: str) -> bool:
+    cls = type(middleware)
+    return (
+        getattr(cls, hook) is not getattr(Middleware, hook)
+        or hook in getattr(middleware, "__dict__", {})
+        # Hooks may be provided dynamically
+        or cls.__getattribute__ is not object.__getattribute__
+    )
@@ -1,15 +1,26 @@
 from __future__ import annotations
 
 import inspect
+import time
 import warnings
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import (
+    AbstractAsyncContextManager,
+    AsyncExitStack,
+    asynccontextmanager,
+    contextmanager,
+)
+from contextvars import ContextVar
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import quote
 
+import anyio
 import mcp.types
 from mcp import ServerSession
 from mcp.client.session import ClientSession
+from mcp.server.lowlevel.server import request_ctx
 from mcp.shared.context import LifespanContextT, RequestContext
 from mcp.shared.exceptions import McpError
 from mcp.types import (
@@ -24,16 +35,23 @@ import fastmcp
 from fastmcp.client.client import Client, FastMCP1Server
 from fastmcp.client.elicitation import ElicitResult
 from fastmcp.client.logging import LogMessage
+from fastmcp.client.messages import Message
 from fastmcp.client.roots import RootsList
 from fastmcp.client.transports import ClientTransportT
-from fastmcp.exceptions import NotFoundError, ResourceError, ToolError
+from fastmcp.exceptions import (
+    ClientError,
+    FastMCPError,
+    NotFoundError,
+    ResourceError,
+    ToolError,
+)
 from fastmcp.mcp_config import MCPConfig
 from fastmcp.prompts import Prompt, PromptMessage
 from fastmcp.prompts.prompt import PromptArgument
 from fastmcp.prompts.prompt_manager import PromptManager
 from fastmcp.resources import Resource, ResourceTemplate
-from fastmcp.resources.resource_manager import ResourceManager
-from fastmcp.server.context import Context
+from fastmcp.resources.resource_manager import ResolvedResource, ResourceManager
+from fastmcp.server.context import Context, set_context
 from fastmcp.server.dependencies import get_context
 from fastmcp.server.server import FastMCP
 from fastmcp.tools.tool import Tool, ToolResult
@@ -53,10 +71,317 @@ logger = get_logger(__name__)
 ClientFactoryT = Callable[[], Client] | Callable[[], Awaitable[Client]]
 
 
+@dataclass(eq=False)
+class _PooledSession:
+    client: Client
+    last_used: float
+    last_checked: float
+    # The request that has currently checked out the session
+    context: Context | None = None
+    request_context: RequestContext | None = None
+
+
+# Set in the session task of a pooled client, so forwarding handlers can find
+# the request that is currently using the session
+_pooled_session: ContextVar[_PooledSession | None] = ContextVar(
+    "pooled_session", default=None
+)
+
+
+@contextmanager
+def _forwarding_context() -> Iterator[Context]:
+    """
+    Yields the context that remote requests and notifications should be
+    forwarded to: the request that has checked out the pooled session they
+    arrived on, or otherwise the current request.
+    """
+    pooled_session = _pooled_session.get()
+    if pooled_session is None:
+        yield get_context()
+        return
+    if pooled_session.context is None or pooled_session.request_context is None:
+        raise RuntimeError("Pooled proxy session is not in use by any request")
+    # The session task still carries the request that opened the session, and
+    # Context reads the MCP request from the running task
+    token = request_ctx.set(pooled_session.request_context)
+    try:
+        with set_context(pooled_session.context) as context:
+            yield context
+    finally:
+        request_ctx.reset(token)
+
+
+class ProxyClientPool:
+    """
+    A pool of connected backend sessions for a proxy server.
+
+    By default a proxy opens a fresh backend session (including the MCP
+    initialize handshake) for every request it forwards. A pool keeps sessions
+    open and hands each one to a single request at a time, so requests never
+    share a session while it is in use; sampling, elicitation, logging and
+    progress from the backend are forwarded to the request that has the
+    session checked out.
+
+    Sessions that have been idle for longer than `idle_timeout` seconds are
+    closed, except for `min_size` of them. Before a session that hasn't been
+    used for `ping_interval` seconds is handed out, it is checked with a ping
+    and replaced if the backend doesn't answer. Sessions that fail with an
+    error other than an MCP or FastMCP error are discarded.
+
+    A `FastMCPProxy` using the pool enters its `lifespan()` while it runs,
+    which sweeps idle sessions in the background and closes the pool when the
+    server shuts down.
+
+    Args:
+        client_factory: Creates the (disconnected) clients for new sessions.
+        min_size: The number of idle sessions to keep open.
+        max_size: The maximum number of open sessions. Requests wait for a
+            free session when all of them are in use.
+        idle_timeout: Seconds after which an idle session is closed.
+        ping_interval: Seconds of inactivity after which a session is pinged
+            before it is used.
+    """
+
+    def __init__(
+        self,
+        client_factory: ClientFactoryT,
+        *,
+        min_size: int = 0,
+        max_size: int = 10,
+        idle_timeout: float = 300.0,
+        ping_interval: float = 30.0,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if not 0 <= min_size <= max_size:
+            raise ValueError("min_size must be between 0 and max_size")
+        self.client_factory = client_factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.ping_interval = ping_interval
+        self._idle: list[_PooledSession] = []
+        self._in_use: set[_PooledSession] = set()
+        self._slots: anyio.Semaphore | None = None
+        self._users = 0
+        self._sweeper: anyio.CancelScope | None = None
+
+    @property
+    def size(self) -> int:
+        """The number of open sessions."""
+        return len(self._idle) + len(self._in_use)
+
+    @property
+    def idle(self) -> int:
+        """The number of open sessions that are not in use."""
+        return len(self._idle)
+
+    def _get_slots(self) -> anyio.Semaphore:
+        # Created lazily so the pool can be built outside of an event loop
+        if self._slots is None:
+            self._slots = anyio.Semaphore(self.max_size)
+        return self._slots
+
+    @asynccontextmanager
+    async def lifespan(self) -> AsyncIterator[None]:
+        """
+        Keep the pool open, sweeping idle sessions in the background.
+
+        Lifespans can be nested or run concurrently; the pool is closed when
+        the last of them ends.
+        """
+        self._users += 1
+        try:
+            async with anyio.create_task_group() as tg:
+                # One sweeper is enough; it runs in the lifespan that started
+                # it, and the next lifespan to start takes over when that ends
+                if self._sweeper is None:
+                    self._sweeper = tg.cancel_scope
+                    tg.start_soon(self._sweep)
+                try:
+                    yield
+                finally:
+                    if self._sweeper is tg.cancel_scope:
+                        self._sweeper = None
+                    tg.cancel_scope.cancel()
+        finally:
+            self._users -= 1
+            if self._users == 0:
+                with anyio.CancelScope(shield=True):
+                    await self.close()
+
+    async def _sweep(self) -> None:
+        while True:
+            await anyio.sleep(self.idle_timeout / 2)
+            await self._evict_idle()
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[Client]:
+        """Check out a connected client for exclusive use by the current request."""
+        async with self._get_slots():
+            pooled_session = await self._checkout()
+            try:
+                pooled_session.context = get_context()
+                pooled_session.request_context = request_ctx.get()
+            except (RuntimeError, LookupError):
+                pooled_session.context = None
+                pooled_session.request_context = None
+            self._in_use.add(pooled_session)
+            try:
+                yield pooled_session.client
+            except BaseException as e:
+                self._in_use.discard(pooled_session)
+                pooled_session.context = pooled_session.request_context = None
+                if isinstance(e, McpError | FastMCPError | ClientError):
+                    self._release(pooled_session)
+                else:
+                    # Close the session even if the request was cancelled
+                    with anyio.CancelScope(shield=True):
+                        await self._close(pooled_session)
+                raise
+            self._in_use.discard(pooled_session)
+            pooled_session.context = pooled_session.request_context = None
+            self._release(pooled_session)
+        await self._evict_idle()
+
+    async def _checkout(self) -> _PooledSession:
+        while self._idle:
+            pooled_session = self._idle.pop()
+            now = time.monotonic()
+            if now - pooled_session.last_checked < self.ping_interval:
+                return pooled_session
+            try:
+                if pooled_session.client.is_connected() and (
+                    await pooled_session.client.ping()
+                ):
+                    pooled_session.last_checked = now
+                    return pooled_session
+            except Exception as e:
+                logger.debug(f"Pooled proxy session failed its health check: {e}")
+            except BaseException:
+                # Don't lose track of the session if the request is cancelled
+                with anyio.CancelScope(shield=True):
+                    await self._close(pooled_session)
+                raise
+            await self._close(pooled_session)
+        return await self._connect()
+
+    async def _connect(self) -> _PooledSession:
+        client = self.client_factory()
+        if inspect.isawaitable(client):
+            client = await client
+        now = time.monotonic()
+        pooled_session = _PooledSession(client=client, last_used=now, last_checked=now)
+        # The session task created while connecting inherits this variable
+        token = _pooled_session.set(pooled_session)
+        try:
+            await client._connect()
+        finally:
+            _pooled_session.reset(token)
+        return pooled_session
+
+    def _release(self, pooled_session: _PooledSession) -> None:
+        if not pooled_session.client.is_connected():
+            return
+        pooled_session.last_used = pooled_session.last_checked = time.monotonic()
+        self._idle.append(pooled_session)
+
+    async def _close(self, pooled_session: _PooledSession) -> None:
+        try:
+            await pooled_session.client._disconnect(force=True)
+        except Exception as e:
+            logger.debug(f"Error closing pooled proxy session: {e}")
+
+    async def _evict_idle(self) -> None:
+        cutoff = time.monotonic() - self.idle_timeout
+        # The least recently used sessions are at the start of the list
+        expired: list[_PooledSession] = []
+        while (
+            self._idle
+            and self.size > self.min_size
+            and self._idle[0].last_used < cutoff
+        ):
+            expired.append(self._idle.pop(0))
+        for pooled_session in expired:
+            await self._close(pooled_session)
+
+    async def close(self) -> None:
+        """Close all sessions that are not currently in use."""
+        idle, self._idle = self._idle, []
+        for pooled_session in idle:
+            await self._close(pooled_session)
+
+
+class ProxyInventoryCache:
+    """
+    Caches the tools, resources, templates and prompts listed by a proxy's
+    remote server, so that looking up a remote component doesn't require a
+    round-trip to the remote server.
+
+    Entries expire after `ttl` seconds, and are invalidated early when the
+    remote server sends a `notifications/*/list_changed` notification on a
+    session opened by the proxy.
+
+    Args:
+        ttl: Seconds to keep each list. 0 disables caching and `math.inf`
+            caches until the remote server reports a change. Defaults to
+            `fastmcp.settings.proxy_cache_ttl`.
+    """
+
+    def __init__(self, ttl: float | None = None):
+        if ttl is not None and ttl < 0:
+            raise ValueError("ttl must not be negative")
+        self._ttl = ttl
+        self._entries: dict[str, tuple[float, Any]] = {}
+        # Bumped on invalidation, so lists fetched before a change are dropped
+        self.generation: int = 0
+
+    @property
+    def ttl(self) -> float:
+        if self._ttl is None:
+            return fastmcp.settings.proxy_cache_ttl
+        return self._ttl
+
+    def get(self, kind: str) -> Any | None:
+        """Return the cached list of `kind`, or None if it is missing or expired."""
+        entry = self._entries.get(kind)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            self._entries.pop(kind, None)
+            return None
+        return value
+
+    def set(self, kind: str, value: Any, generation: int) -> None:
+        """Cache `value`, unless the cache was invalidated since `generation`."""
+        if self.ttl > 0 and generation == self.generation:
+            self._entries[kind] = (time.monotonic(), value)
+
+    def invalidate(self, *kinds: str) -> None:
+        """Drop the given lists, or all of them if no kinds are given."""
+        self.generation += 1
+        if not kinds:
+            self._entries.clear()
+        for kind in kinds:
+            self._entries.pop(kind, None)
+
+
+# Set while a proxy manager connects to its remote server, so the session task
+# (and with it the list_changed handler) knows which cache to invalidate
+_inventory_cache: ContextVar[ProxyInventoryCache | None] = ContextVar(
+    "proxy_inventory_cache", default=None
+)
+
+ClientSessionFactoryT = Callable[[], AbstractAsyncContextManager[Client]]
+
+
 class ProxyManagerMixin:
     """A mixin for proxy managers to provide a unified client retrieval method."""
 
     client_factory: ClientFactoryT
+    client_pool: ProxyClientPool | None = None
+    inventory_cache: ProxyInventoryCache | None = None
 
     async def _get_client(self) -> Client:
         """Gets a client instance by calling the sync or async factory."""
@@ -65,36 +390,101 @@ class ProxyManagerMixin:
             client = await client
         return client
 
+    @asynccontextmanager
+    async def _client_session(self) -> AsyncIterator[Client]:
+        """Connects a client from the pool, if there is one, or the factory."""
+        token = _inventory_cache.set(self.inventory_cache)
+        try:
+            if self.client_pool is not None:
+                async with self.client_pool.session() as client:
+                    yield client
+            else:
+                client = await self._get_client()
+                async with client:
+                    yield client
+        finally:
+            _inventory_cache.reset(token)
+
+    async def _get_remote_components(
+        self, kind: str, fetch: Callable[[Client], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """
+        Returns the remote components of `kind`, from the inventory cache if
+        possible. Remote servers that don't support listing `kind` have none.
+        """
+        cache = self.inventory_cache
+        generation = 0
+        if cache is not None:
+            cached = cache.get(kind)
+            if cached is not None:
+                return cached
+            generation = cache.generation
+        try:
+            async with self._client_session() as client:
+                components = await fetch(client)
+        except McpError as e:
+            if e.error.code == METHOD_NOT_FOUND:
+                components = {}  # No components of this kind available from proxy
+            else:
+                raise e
+        if cache is not None:
+            cache.set(kind, components, generation)
+        return components
+
+
+def _connect(
+    client: Client, client_session: ClientSessionFactoryT | None
+) -> AbstractAsyncContextManager[Client]:
+    """Connects a component's client, or a session from its manager if it has one."""
+    if client_session is not None:
+        return client_session()
+    return client
+
 
 class ProxyToolManager(ToolManager, ProxyManagerMixin):
     """A ToolManager that sources its tools from a remote client in addition to local and mounted tools."""
 
-    def __init__(self, client_factory: ClientFactoryT, **kwargs):
+    def __init__(
+        self,
+        client_factory: ClientFactoryT,
+        client_pool: ProxyClientPool | None = None,
+        inventory_cache: ProxyInventoryCache | None = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.client_factory = client_factory
+        self.client_pool = client_pool
+        self.inventory_cache = inventory_cache
+
+    def _get_version(self) -> None:
+        """Remote tools can change at any time, so the inventory is never cached."""
+        return None
 
-    async def get_tools(self) -> dict[str, Tool]:
+    async def _fetch_remote_tools(self, client: Client) -> dict[str, Tool]:
+        return {
+            tool.name: ProxyTool.from_mcp_tool(
+                client, tool, client_session=self._client_session
+            )
+            for tool in await client.list_tools()
+        }
+
+    async def _get_inventory(self) -> dict[str, Tool]:
         """Gets the unfiltered tool inventory including local, mounted, and proxy tools."""
         # First get local and mounted tools from parent
-        all_tools = await super().get_tools()
+        all_tools = dict(await super()._get_inventory())
 
         # Then add proxy tools, but don't overwrite existing ones
-        try:
-            client = await self._get_client()
-            async with client:
-                client_tools = await client.list_tools()
-                for tool in client_tools:
-                    if tool.name not in all_tools:
-                        all_tools[tool.name] = ProxyTool.from_mcp_tool(client, tool)
-        except McpError as e:
-            if e.error.code == METHOD_NOT_FOUND:
-                pass  # No tools available from proxy
-            else:
-                raise e
+        remote_tools = await self._get_remote_components(
+            "tools", self._fetch_remote_tools
+        )
+        for name, tool in remote_tools.items():
+            if name not in all_tools:
+                all_tools[name] = tool
 
         transformed_tools = apply_transformations_to_tools(
             tools=all_tools,
             transformations=self.transformations,
+            cache=self.transform_cache,
         )
 
         return transformed_tools
@@ -110,66 +500,90 @@ class ProxyToolManager(ToolManager, ProxyManagerMixin):
             # First try local and mounted tools
             return await super().call_tool(key, arguments)
         except NotFoundError:
-            # If not found locally, try proxy
-            client = await self._get_client()
-            async with client:
-                result = await client.call_tool(key, arguments)
-                return ToolResult(
-                    content=result.content,
-                    structured_content=result.structured_content,
+            # If not found locally, try proxy. With caching enabled, the listed
+            # tool gives its output schema, which saves the client from
+            # listing remote tools to validate the result. Without caching,
+            # listing first would double the round-trips, so the tool is
+            # called directly, as are tools the remote server doesn't list.
+            cache = self.inventory_cache
+            if cache is not None and cache.ttl > 0:
+                remote_tools = await self._get_remote_components(
+                    "tools", self._fetch_remote_tools
                 )
+                if key in remote_tools:
+                    return await remote_tools[key].run(arguments)
+            async with self._client_session() as client:
+                result = await client.call_tool(key, arguments)
+            return ToolResult(
+                content=result.content,
+                structured_content=result.structured_content,
+            )
 
 
 class ProxyResourceManager(ResourceManager, ProxyManagerMixin):
     """A ResourceManager that sources its resources from a remote client in addition to local and mounted resources."""
 
-    def __init__(self, client_factory: ClientFactoryT, **kwargs):
+    def __init__(
+        self,
+        client_factory: ClientFactoryT,
+        client_pool: ProxyClientPool | None = None,
+        inventory_cache: ProxyInventoryCache | None = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.client_factory = client_factory
+        self.client_pool = client_pool
+        self.inventory_cache = inventory_cache
 
-    async def get_resources(self) -> dict[str, Resource]:
+    def _get_version(self) -> None:
+        """Remote resources can change at any time, so inventories are never cached."""
+        return None
+
+    async def _fetch_remote_resources(self, client: Client) -> dict[str, Resource]:
+        return {
+            str(resource.uri): ProxyResource.from_mcp_resource(
+                client, resource, client_session=self._client_session
+            )
+            for resource in await client.list_resources()
+        }
+
+    async def _fetch_remote_templates(
+        self, client: Client
+    ) -> dict[str, ResourceTemplate]:
+        return {
+            template.uriTemplate: ProxyTemplate.from_mcp_template(
+                client, template, client_session=self._client_session
+            )
+            for template in await client.list_resource_templates()
+        }
+
+    async def _get_resource_inventory(self) -> dict[str, Resource]:
         """Gets the unfiltered resource inventory including local, mounted, and proxy resources."""
         # First get local and mounted resources from parent
-        all_resources = await super().get_resources()
+        all_resources = dict(await super()._get_resource_inventory())
 
         # Then add proxy resources, but don't overwrite existing ones
-        try:
-            client = await self._get_client()
-            async with client:
-                client_resources = await client.list_resources()
-                for resource in client_resources:
-                    if str(resource.uri) not in all_resources:
-                        all_resources[str(resource.uri)] = (
-                            ProxyResource.from_mcp_resource(client, resource)
-                        )
-        except McpError as e:
-            if e.error.code == METHOD_NOT_FOUND:
-                pass  # No resources available from proxy
-            else:
-                raise e
+        remote_resources = await self._get_remote_components(
+            "resources", self._fetch_remote_resources
+        )
+        for uri, resource in remote_resources.items():
+            if uri not in all_resources:
+                all_resources[uri] = resource
 
         return all_resources
 
-    async def get_resource_templates(self) -> dict[str, ResourceTemplate]:
+    async def _get_template_inventory(self) -> dict[str, ResourceTemplate]:
         """Gets the unfiltered template inventory including local, mounted, and proxy templates."""
         # First get local and mounted templates from parent
-        all_templates = await super().get_resource_templates()
+        all_templates = dict(await super()._get_template_inventory())
 
         # Then add proxy templates, but don't overwrite existing ones
-        try:
-            client = await self._get_client()
-            async with client:
-                client_templates = await client.list_resource_templates()
-                for template in client_templates:
-                    if template.uriTemplate not in all_templates:
-                        all_templates[template.uriTemplate] = (
-                            ProxyTemplate.from_mcp_template(client, template)
-                        )
-        except McpError as e:
-            if e.error.code == METHOD_NOT_FOUND:
-                pass  # No templates available from proxy
-            else:
-                raise e
+        remote_templates = await self._get_remote_components(
+            "templates", self._fetch_remote_templates
+        )
+        for uri_template, template in remote_templates.items():
+            if uri_template not in all_templates:
+                all_templates[uri_template] = template
 
         return all_templates
 
@@ -183,15 +597,24 @@ class ProxyResourceManager(ResourceManager, ProxyManagerMixin):
         templates_dict = await self.get_resource_templates()
         return list(templates_dict.values())
 
-    async def read_resource(self, uri: AnyUrl | str) -> str | bytes:
+    async def read_resource(
+        self, uri: AnyUrl | str, resolved: ResolvedResource | None = None
+    ) -> str | bytes:
         """Reads a resource, trying local/mounted first, then proxy if not found."""
+        # A remote resource that was already resolved (and possibly already read
+        # by its template) doesn't need to be looked up again
+        if (
+            resolved is not None
+            and resolved.uri == str(uri)
+            and isinstance(resolved.component, ProxyResource)
+        ):
+            return await resolved.component.read()
         try:
             # First try local and mounted resources
-            return await super().read_resource(uri)
+            return await super().read_resource(uri, resolved=resolved)
         except NotFoundError:
             # If not found locally, try proxy
-            client = await self._get_client()
-            async with client:
+            async with self._client_session() as client:
                 result = await client.read_resource(uri)
                 if isinstance(result[0], TextResourceContents):
                     return result[0].text
@@ -204,9 +627,25 @@ class ProxyResourceManager(ResourceManager, ProxyManagerMixin):
 class ProxyPromptManager(PromptManager, ProxyManagerMixin):
     """A PromptManager that sources its prompts from a remote client in addition to local and mounted prompts."""
 
-    def __init__(self, client_factory: ClientFactoryT, **kwargs):
+    def __init__(
+        self,
+        client_factory: ClientFactoryT,
+        client_pool: ProxyClientPool | None = None,
+        inventory_cache: ProxyInventoryCache | None = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.client_factory = client_factory
+        self.client_pool = client_pool
+        self.inventory_cache = inventory_cache
+
+    async def _fetch_remote_prompts(self, client: Client) -> dict[str, Prompt]:
+        return {
+            prompt.name: ProxyPrompt.from_mcp_prompt(
+                client, prompt, client_session=self._client_session
+            )
+            for prompt in await client.list_prompts()
+        }
 
     async def get_prompts(self) -> dict[str, Prompt]:
         """Gets the unfiltered prompt inventory including local, mounted, and proxy prompts."""
@@ -214,20 +653,12 @@ class ProxyPromptManager(PromptManager, ProxyManagerMixin):
         all_prompts = await super().get_prompts()
 
         # Then add proxy prompts, but don't overwrite existing ones
-        try:
-            client = await self._get_client()
-            async with client:
-                client_prompts = await client.list_prompts()
-                for prompt in client_prompts:
-                    if prompt.name not in all_prompts:
-                        all_prompts[prompt.name] = ProxyPrompt.from_mcp_prompt(
-                            client, prompt
-                        )
-        except McpError as e:
-            if e.error.code == METHOD_NOT_FOUND:
-                pass  # No prompts available from proxy
-            else:
-                raise e
+        remote_prompts = await self._get_remote_components(
+            "prompts", self._fetch_remote_prompts
+        )
+        for name, prompt in remote_prompts.items():
+            if name not in all_prompts:
+                all_prompts[name] = prompt
 
         return all_prompts
 
@@ -247,8 +678,7 @@ class ProxyPromptManager(PromptManager, ProxyManagerMixin):
             return await super().render_prompt(name, arguments)
         except NotFoundError:
             # If not found locally, try proxy
-            client = await self._get_client()
-            async with client:
+            async with self._client_session() as client:
                 result = await client.get_prompt(name, arguments)
                 return result
 
@@ -258,15 +688,28 @@ class ProxyTool(Tool, MirroredComponent):
     A Tool that represents and executes a tool on a remote server.
     """
 
-    def __init__(self, client: Client, **kwargs):
+    def __init__(
+        self,
+        client: Client,
+        *,
+        client_session: ClientSessionFactoryT | None = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self._client = client
+        self._client_session = client_session
 
     @classmethod
-    def from_mcp_tool(cls, client: Client, mcp_tool: mcp.types.Tool) -> ProxyTool:
+    def from_mcp_tool(
+        cls,
+        client: Client,
+        mcp_tool: mcp.types.Tool,
+        client_session: ClientSessionFactoryT | None = None,
+    ) -> ProxyTool:
         """Factory method to create a ProxyTool from a raw MCP tool schema."""
         return cls(
             client=client,
+            client_session=client_session,
             name=mcp_tool.name,
             description=mcp_tool.description,
             parameters=mcp_tool.inputSchema,
@@ -283,10 +726,13 @@ class ProxyTool(Tool, MirroredComponent):
         context: Context | None = None,
     ) -> ToolResult:
         """Executes the tool by making a call through the client."""
-        async with self._client:
-            result = await self._client.call_tool_mcp(
+        async with _connect(self._client, self._client_session) as client:
+            # Passing the listed output schema saves the session from listing
+            # all remote tools to validate the result
+            result = await client.call_tool_mcp(
                 name=self.name,
                 arguments=arguments,
+                output_schema=self.output_schema,
             )
         if result.isError:
             raise ToolError(cast(mcp.types.TextContent, result.content[0]).text)
@@ -302,17 +748,20 @@ class ProxyResource(Resource, MirroredComponent):
     """
 
     _client: Client
+    _client_session: ClientSessionFactoryT | None = None
     _value: str | bytes | None = None
 
     def __init__(
         self,
         client: Client,
         *,
+        client_session: ClientSessionFactoryT | None = None,
         _value: str | bytes | None = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self._client = client
+        self._client_session = client_session
         self._value = _value
 
     @classmethod
@@ -320,11 +769,13 @@ class ProxyResource(Resource, MirroredComponent):
         cls,
         client: Client,
         mcp_resource: mcp.types.Resource,
+        client_session: ClientSessionFactoryT | None = None,
     ) -> ProxyResource:
         """Factory method to create a ProxyResource from a raw MCP resource schema."""
 
         return cls(
             client=client,
+            client_session=client_session,
             uri=mcp_resource.uri,
             name=mcp_resource.name,
             description=mcp_resource.description,
@@ -339,8 +790,8 @@ class ProxyResource(Resource, MirroredComponent):
         if self._value is not None:
             return self._value
 
-        async with self._client:
-            result = await self._client.read_resource(self.uri)
+        async with _connect(self._client, self._client_session) as client:
+            result = await client.read_resource(self.uri)
         if isinstance(result[0], TextResourceContents):
             return result[0].text
         elif isinstance(result[0], BlobResourceContents):
@@ -354,17 +805,28 @@ class ProxyTemplate(ResourceTemplate, MirroredComponent):
     A ResourceTemplate that represents and creates resources from a remote server template.
     """
 
-    def __init__(self, client: Client, **kwargs):
+    def __init__(
+        self,
+        client: Client,
+        *,
+        client_session: ClientSessionFactoryT | None = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self._client = client
+        self._client_session = client_session
 
     @classmethod
     def from_mcp_template(
-        cls, client: Client, mcp_template: mcp.types.ResourceTemplate
+        cls,
+        client: Client,
+        mcp_template: mcp.types.ResourceTemplate,
+        client_session: ClientSessionFactoryT | None = None,
     ) -> ProxyTemplate:
         """Factory method to create a ProxyTemplate from a raw MCP template schema."""
         return cls(
             client=client,
+            client_session=client_session,
             uri_template=mcp_template.uriTemplate,
             name=mcp_template.name,
             description=mcp_template.description,
@@ -388,8 +850,8 @@ class ProxyTemplate(ResourceTemplate, MirroredComponent):
         parameterized_uri = self.uri_template.format(
             **{k: quote(v, safe="") for k, v in params.items()}
         )
-        async with self._client:
-            result = await self._client.read_resource(parameterized_uri)
+        async with _connect(self._client, self._client_session) as client:
+            result = await client.read_resource(parameterized_uri)
 
         if isinstance(result[0], TextResourceContents):
             value = result[0].text
@@ -400,6 +862,7 @@ class ProxyTemplate(ResourceTemplate, MirroredComponent):
 
         return ProxyResource(
             client=self._client,
+            client_session=self._client_session,
             uri=parameterized_uri,
             name=self.name,
             description=self.description,
@@ -416,14 +879,25 @@ class ProxyPrompt(Prompt, MirroredComponent):
     """
 
     _client: Client
+    _client_session: ClientSessionFactoryT | None = None
 
-    def __init__(self, client: Client, **kwargs):
+    def __init__(
+        self,
+        client: Client,
+        *,
+        client_session: ClientSessionFactoryT | None = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self._client = client
+        self._client_session = client_session
 
     @classmethod
     def from_mcp_prompt(
-        cls, client: Client, mcp_prompt: mcp.types.Prompt
+        cls,
+        client: Client,
+        mcp_prompt: mcp.types.Prompt,
+        client_session: ClientSessionFactoryT | None = None,
     ) -> ProxyPrompt:
         """Factory method to create a ProxyPrompt from a raw MCP prompt schema."""
         arguments = [
@@ -436,6 +910,7 @@ class ProxyPrompt(Prompt, MirroredComponent):
         ]
         return cls(
             client=client,
+            client_session=client_session,
             name=mcp_prompt.name,
             description=mcp_prompt.description,
             arguments=arguments,
@@ -446,8 +921,8 @@ class ProxyPrompt(Prompt, MirroredComponent):
 
     async def render(self, arguments: dict[str, Any]) -> list[PromptMessage]:
         """Render the prompt by making a call through the client."""
-        async with self._client:
-            result = await self._client.get_prompt(self.name, arguments)
+        async with _connect(self._client, self._client_session) as client:
+            result = await client.get_prompt(self.name, arguments)
         return result.messages
 
 
@@ -462,6 +937,8 @@ class FastMCPProxy(FastMCP):
         client: Client | None = None,
         *,
         client_factory: ClientFactoryT | None = None,
+        client_pool: ProxyClientPool | None = None,
+        cache_ttl: float | None = None,
         **kwargs,
     ):
         """
@@ -477,14 +954,28 @@ class FastMCPProxy(FastMCP):
             client_factory: A callable that returns a Client instance when called.
                            This gives you full control over session creation and reuse.
                            Can be either a synchronous or asynchronous function.
+            client_pool: A ProxyClientPool that keeps backend sessions open across
+                         requests instead of creating one per request. Takes the
+                         place of client_factory.
+            cache_ttl: Seconds to cache the tools, resources and prompts listed by
+                       the remote server, which are also invalidated when it sends a
+                       list_changed notification. 0 disables caching. Defaults to
+                       `fastmcp.settings.proxy_cache_ttl`.
             **kwargs: Additional settings for the FastMCP server.
         """
 
         super().__init__(**kwargs)
 
-        # Handle client and client_factory parameters
+        # Handle client, client_factory and client_pool parameters
         if client is not None and client_factory is not None:
             raise ValueError("Cannot specify both 'client' and 'client_factory'")
+        if client_pool is not None and (
+            client is not None or client_factory is not None
+        ):
+            raise ValueError(
+                "Cannot specify 'client_pool' together with 'client' or 'client_factory'"
+            )
+        self.client_pool = client_pool
 
         if client is not None:
             # Deprecated in 2.10.3
@@ -503,19 +994,41 @@ class FastMCPProxy(FastMCP):
             self.client_factory = deprecated_client_factory
         elif client_factory is not None:
             self.client_factory = client_factory
+        elif client_pool is not None:
+            self.client_factory = client_pool.client_factory
         else:
             raise ValueError("Must specify 'client_factory'")
 
+        # Remote lists are shared by the managers, so a list_changed
+        # notification received by any of them invalidates them all
+        self.inventory_cache = ProxyInventoryCache(ttl=cache_ttl)
+
         # Replace the default managers with our specialized proxy managers.
         self._tool_manager = ProxyToolManager(
             client_factory=self.client_factory,
+            client_pool=self.client_pool,
+            inventory_cache=self.inventory_cache,
             # Propagate the transformations from the base class tool manager
             transformations=self._tool_manager.transformations,
         )
         self._resource_manager = ProxyResourceManager(
-            client_factory=self.client_factory
+            client_factory=self.client_factory,
+            client_pool=self.client_pool,
+            inventory_cache=self.inventory_cache,
+        )
+        self._prompt_manager = ProxyPromptManager(
+            client_factory=self.client_factory,
+            client_pool=self.client_pool,
+            inventory_cache=self.inventory_cache,
         )
-        self._prompt_manager = ProxyPromptManager(client_factory=self.client_factory)
+
+    @asynccontextmanager
+    async def _resources_lifespan(self) -> AsyncIterator[None]:
+        async with AsyncExitStack() as stack:
+            await stack.enter_async_context(super()._resources_lifespan())
+            if self.client_pool is not None:
+                await stack.enter_async_context(self.client_pool.lifespan())
+            yield
 
 
 async def default_proxy_roots_handler(
@@ -524,8 +1037,8 @@ async def default_proxy_roots_handler(
     """
     A handler that forwards the list roots request from the remote server to the proxy's connected clients and relays the response back to the remote server.
     """
-    ctx = get_context()
-    return await ctx.list_roots()
+    with _forwarding_context() as ctx:
+        return await ctx.list_roots()
 
 
 class ProxyClient(Client[ClientTransportT]):
@@ -558,6 +1071,8 @@ class ProxyClient(Client[ClientTransportT]):
             kwargs["log_handler"] = ProxyClient.default_log_handler
         if "progress_handler" not in kwargs:
             kwargs["progress_handler"] = ProxyClient.default_progress_handler
+        if "message_handler" not in kwargs:
+            kwargs["message_handler"] = ProxyClient.default_message_handler
         super().__init__(**kwargs | dict(transport=transport))
 
     @classmethod
@@ -570,14 +1085,14 @@ class ProxyClient(Client[ClientTransportT]):
         """
         A handler that forwards the sampling request from the remote server to the proxy's connected clients and relays the response back to the remote server.
         """
-        ctx = get_context()
-        content = await ctx.sample(
-            [msg for msg in messages],
-            system_prompt=params.systemPrompt,
-            temperature=params.temperature,
-            max_tokens=params.maxTokens,
-            model_preferences=params.modelPreferences,
-        )
+        with _forwarding_context() as ctx:
+            content = await ctx.sample(
+                [msg for msg in messages],
+                system_prompt=params.systemPrompt,
+                temperature=params.temperature,
+                max_tokens=params.maxTokens,
+                model_preferences=params.modelPreferences,
+            )
         if isinstance(content, mcp.types.ResourceLink | mcp.types.EmbeddedResource):
             raise RuntimeError("Content is not supported")
         return mcp.types.CreateMessageResult(
@@ -597,12 +1112,12 @@ class ProxyClient(Client[ClientTransportT]):
         """
         A handler that forwards the elicitation request from the remote server to the proxy's connected clients and relays the response back to the remote server.
         """
-        ctx = get_context()
-        result = await ctx.session.elicit(
-            message=message,
-            requestedSchema=params.requestedSchema,
-            related_request_id=ctx.request_id,
-        )
+        with _forwarding_context() as ctx:
+            result = await ctx.session.elicit(
+                message=message,
+                requestedSchema=params.requestedSchema,
+                related_request_id=ctx.request_id,
+            )
         return ElicitResult(action=result.action, content=result.content)
 
     @classmethod
@@ -610,10 +1125,12 @@ class ProxyClient(Client[ClientTransportT]):
         """
         A handler that forwards the log notification from the remote server to the proxy's connected clients.
         """
-        ctx = get_context()
         msg = message.data.get("msg")
         extra = message.data.get("extra")
-        await ctx.log(msg, level=message.level, logger_name=message.logger, extra=extra)
+        with _forwarding_context() as ctx:
+            await ctx.log(
+                msg, level=message.level, logger_name=message.logger, extra=extra
+            )
 
     @classmethod
     async def default_progress_handler(
@@ -625,8 +1142,24 @@ class ProxyClient(Client[ClientTransportT]):
         """
         A handler that forwards the progress notification from the remote server to the proxy's connected clients.
         """
-        ctx = get_context()
-        await ctx.report_progress(progress, total, message)
+        with _forwarding_context() as ctx:
+            await ctx.report_progress(progress, total, message)
+
+    @classmethod
+    async def default_message_handler(cls, message: Message) -> None:
+        """
+        A handler that invalidates the proxy's cached tools, resources or prompts when the remote server reports that they changed.
+        """
+        cache = _inventory_cache.get()
+        if cache is None or not isinstance(message, mcp.types.ServerNotification):
+            return
+        match message.root:
+            case mcp.types.ToolListChangedNotification():
+                cache.invalidate("tools")
+            case mcp.types.ResourceListChangedNotification():
+                cache.invalidate("resources", "templates")
+            case mcp.types.PromptListChangedNotification():
+                cache.invalidate("prompts")
 
 
 class StatefulProxyClient(ProxyClient[ClientTransportT]):
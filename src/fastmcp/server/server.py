@@ -13,7 +13,7 @@ from contextlib import (
     AsyncExitStack,
     asynccontextmanager,
 )
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generic, Literal, cast, overload
@@ -33,10 +33,6 @@ from mcp.types import (
     GetPromptResult,
     ToolAnnotations,
 )
-from mcp.types import Prompt as MCPPrompt
-from mcp.types import Resource as MCPResource
-from mcp.types import ResourceTemplate as MCPResourceTemplate
-from mcp.types import Tool as MCPTool
 from pydantic import AnyUrl
 from starlette.middleware import Middleware as ASGIMiddleware
 from starlette.requests import Request
@@ -59,13 +55,19 @@ from fastmcp.server.http import (
 )
 from fastmcp.server.low_level import LowLevelServer
 from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.server.middleware.middleware import MiddlewareChain
 from fastmcp.settings import Settings
 from fastmcp.tools import ToolManager
 from fastmcp.tools.tool import FunctionTool, Tool, ToolResult
 from fastmcp.tools.tool_transform import ToolTransformConfig
 from fastmcp.utilities.cli import log_server_banner
 from fastmcp.utilities.components import FastMCPComponent
+from fastmcp.utilities.http import http_client_lifespan
 from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.mounts import CircuitBreaker
+from fastmcp.utilities.pagination import paginate
+from fastmcp.utilities.process_pool import process_pool_lifespan
+from fastmcp.utilities.sync_executor import SyncExecutor, use_sync_executor
 from fastmcp.utilities.types import NotSet, NotSetT
 
 if TYPE_CHECKING:
@@ -120,6 +122,7 @@ def _lifespan_wrapper(
         s: LowLevelServer[LifespanResultT],
     ) -> AsyncIterator[LifespanResultT]:
         async with AsyncExitStack() as stack:
+            await stack.enter_async_context(app._resources_lifespan())
             context = await stack.enter_async_context(lifespan(app))
             yield context
 
@@ -151,9 +154,12 @@ class FastMCP(Generic[LifespanResultT]):
         include_tags: set[str] | None = None,
         exclude_tags: set[str] | None = None,
         include_fastmcp_meta: bool | None = None,
+        list_page_size: int | None = None,
         on_duplicate_tools: DuplicateBehavior | None = None,
         on_duplicate_resources: DuplicateBehavior | None = None,
         on_duplicate_prompts: DuplicateBehavior | None = None,
+        run_sync_in_thread: bool | None = None,
+        sync_worker_threads: int | None = None,
         # ---
         # ---
         # --- The following arguments are DEPRECATED ---
@@ -192,6 +198,15 @@ class FastMCP(Generic[LifespanResultT]):
         )
         self._tool_serializer = tool_serializer
 
+        # Servers that don't configure sync execution use the executor of the
+        # server they are mounted on, or the default from settings
+        self._sync_executor: SyncExecutor | None = None
+        if run_sync_in_thread is not None or sync_worker_threads is not None:
+            self._sync_executor = SyncExecutor(
+                run_sync_in_thread=run_sync_in_thread,
+                max_workers=sync_worker_threads,
+            )
+
         if lifespan is None:
             self._has_lifespan = False
             lifespan = default_lifespan
@@ -224,6 +239,8 @@ class FastMCP(Generic[LifespanResultT]):
         self.exclude_tags = exclude_tags
 
         self.middleware = middleware or []
+        self._middleware_chains: dict[tuple[str | None, str], MiddlewareChain] = {}
+        self._middleware_chains_source: list[Middleware] = []
 
         # Set up MCP protocol handlers
         self._setup_handlers()
@@ -255,6 +272,14 @@ class FastMCP(Generic[LifespanResultT]):
             else fastmcp.settings.include_fastmcp_meta
         )
 
+        if list_page_size is not None and list_page_size < 1:
+            raise ValueError("list_page_size must be at least 1")
+        self.list_page_size = (
+            list_page_size
+            if list_page_size is not None
+            else fastmcp.settings.list_page_size
+        )
+
         # handle deprecated settings
         self._handle_deprecated_settings(
             log_level=log_level,
@@ -399,24 +424,37 @@ class FastMCP(Generic[LifespanResultT]):
         context: MiddlewareContext[Any],
         call_next: Callable[[MiddlewareContext[Any]], Awaitable[Any]],
     ) -> Any:
-        """Builds and executes the middleware chain."""
-        chain = call_next
-        for mw in reversed(self.middleware):
-            chain = partial(mw, call_next=chain)
-        return await chain(context)
+        """Executes the middleware chain for the context's method and type."""
+        if not self.middleware:
+            return await call_next(context)
+
+        # The middleware list is public, so compare it to the one the chains
+        # were built from rather than relying on add_middleware() alone
+        if self._middleware_chains_source != self.middleware:
+            self._middleware_chains.clear()
+            self._middleware_chains_source = list(self.middleware)
+
+        key = (context.method, context.type)
+        chain = self._middleware_chains.get(key)
+        if chain is None:
+            chain = self._middleware_chains[key] = MiddlewareChain(
+                self.middleware, context.method, context.type
+            )
+        return await chain(context, call_next)
 
     def add_middleware(self, middleware: Middleware) -> None:
         self.middleware.append(middleware)
+        self._middleware_chains.clear()
 
     async def get_tools(self) -> dict[str, Tool]:
         """Get all registered tools, indexed by registered key."""
         return await self._tool_manager.get_tools()
 
     async def get_tool(self, key: str) -> Tool:
-        tools = await self.get_tools()
-        if key not in tools:
-            raise NotFoundError(f"Unknown tool: {key}")
-        return tools[key]
+        try:
+            return await self._tool_manager.get_tool(key)
+        except NotFoundError:
+            raise NotFoundError(f"Unknown tool: {key}") from None
 
     async def get_resources(self) -> dict[str, Resource]:
         """Get all registered resources, indexed by registered key."""
@@ -501,6 +539,24 @@ class FastMCP(Generic[LifespanResultT]):
 
         return decorator
 
+    @asynccontextmanager
+    async def _resources_lifespan(self) -> AsyncIterator[None]:
+        """Keep the resources shared by this server's sessions open.
+
+        Entered by every session's lifespan and by the lifespan of HTTP apps,
+        so resources like pooled connections outlive short-lived sessions and
+        are released when the server shuts down. Also enters the resources
+        lifespans of mounted servers.
+        """
+        async with AsyncExitStack() as stack:
+            await stack.enter_async_context(http_client_lifespan())
+            await stack.enter_async_context(process_pool_lifespan())
+            for mounted_server in self._mounted_servers:
+                await stack.enter_async_context(
+                    mounted_server.server._resources_lifespan()
+                )
+            yield
+
     def _get_additional_http_routes(self) -> list[BaseRoute]:
         """Get all additional HTTP routes including from mounted servers.
 
@@ -519,18 +575,25 @@ class FastMCP(Generic[LifespanResultT]):
 
         return routes
 
-    async def _mcp_list_tools(self) -> list[MCPTool]:
+    async def _mcp_list_tools(
+        self, cursor: str | None = None
+    ) -> mcp.types.ListToolsResult:
         logger.debug(f"[{self.name}] Handler called: list_tools")
 
         async with fastmcp.server.context.Context(fastmcp=self):
-            tools = await self._list_tools()
-            return [
-                tool.to_mcp_tool(
-                    name=tool.key,
-                    include_fastmcp_meta=self.include_fastmcp_meta,
-                )
-                for tool in tools
-            ]
+            tools, next_cursor = paginate(
+                await self._list_tools(), cursor, self.list_page_size
+            )
+            return mcp.types.ListToolsResult(
+                tools=[
+                    tool.to_mcp_tool(
+                        name=tool.key,
+                        include_fastmcp_meta=self.include_fastmcp_meta,
+                    )
+                    for tool in tools
+                ],
+                nextCursor=next_cursor,
+            )
 
     async def _list_tools(self) -> list[Tool]:
         """
@@ -563,18 +626,25 @@ class FastMCP(Generic[LifespanResultT]):
             # Apply the middleware chain.
             return await self._apply_middleware(mw_context, _handler)
 
-    async def _mcp_list_resources(self) -> list[MCPResource]:
+    async def _mcp_list_resources(
+        self, cursor: str | None = None
+    ) -> mcp.types.ListResourcesResult:
         logger.debug(f"[{self.name}] Handler called: list_resources")
 
         async with fastmcp.server.context.Context(fastmcp=self):
-            resources = await self._list_resources()
-            return [
-                resource.to_mcp_resource(
-                    uri=resource.key,
-                    include_fastmcp_meta=self.include_fastmcp_meta,
-                )
-                for resource in resources
-            ]
+            resources, next_cursor = paginate(
+                await self._list_resources(), cursor, self.list_page_size
+            )
+            return mcp.types.ListResourcesResult(
+                resources=[
+                    resource.to_mcp_resource(
+                        uri=resource.key,
+                        include_fastmcp_meta=self.include_fastmcp_meta,
+                    )
+                    for resource in resources
+                ],
+                nextCursor=next_cursor,
+            )
 
     async def _list_resources(self) -> list[Resource]:
         """
@@ -608,18 +678,25 @@ class FastMCP(Generic[LifespanResultT]):
             # Apply the middleware chain.
             return await self._apply_middleware(mw_context, _handler)
 
-    async def _mcp_list_resource_templates(self) -> list[MCPResourceTemplate]:
+    async def _mcp_list_resource_templates(
+        self, cursor: str | None = None
+    ) -> mcp.types.ListResourceTemplatesResult:
         logger.debug(f"[{self.name}] Handler called: list_resource_templates")
 
         async with fastmcp.server.context.Context(fastmcp=self):
-            templates = await self._list_resource_templates()
-            return [
-                template.to_mcp_template(
-                    uriTemplate=template.key,
-                    include_fastmcp_meta=self.include_fastmcp_meta,
-                )
-                for template in templates
-            ]
+            templates, next_cursor = paginate(
+                await self._list_resource_templates(), cursor, self.list_page_size
+            )
+            return mcp.types.ListResourceTemplatesResult(
+                resourceTemplates=[
+                    template.to_mcp_template(
+                        uriTemplate=template.key,
+                        include_fastmcp_meta=self.include_fastmcp_meta,
+                    )
+                    for template in templates
+                ],
+                nextCursor=next_cursor,
+            )
 
     async def _list_resource_templates(self) -> list[ResourceTemplate]:
         """
@@ -653,18 +730,25 @@ class FastMCP(Generic[LifespanResultT]):
             # Apply the middleware chain.
             return await self._apply_middleware(mw_context, _handler)
 
-    async def _mcp_list_prompts(self) -> list[MCPPrompt]:
+    async def _mcp_list_prompts(
+        self, cursor: str | None = None
+    ) -> mcp.types.ListPromptsResult:
         logger.debug(f"[{self.name}] Handler called: list_prompts")
 
         async with fastmcp.server.context.Context(fastmcp=self):
-            prompts = await self._list_prompts()
-            return [
-                prompt.to_mcp_prompt(
-                    name=prompt.key,
-                    include_fastmcp_meta=self.include_fastmcp_meta,
-                )
-                for prompt in prompts
-            ]
+            prompts, next_cursor = paginate(
+                await self._list_prompts(), cursor, self.list_page_size
+            )
+            return mcp.types.ListPromptsResult(
+                prompts=[
+                    prompt.to_mcp_prompt(
+                        name=prompt.key,
+                        include_fastmcp_meta=self.include_fastmcp_meta,
+                    )
+                    for prompt in prompts
+                ],
+                nextCursor=next_cursor,
+            )
 
     async def _list_prompts(self) -> list[Prompt]:
         """
@@ -738,9 +822,10 @@ class FastMCP(Generic[LifespanResultT]):
             if not self._should_enable_component(tool):
                 raise NotFoundError(f"Unknown tool: {context.message.name!r}")
 
-            return await self._tool_manager.call_tool(
-                key=context.message.name, arguments=context.message.arguments or {}
-            )
+            with use_sync_executor(self._sync_executor):
+                return await self._tool_manager.call_tool(
+                    key=context.message.name, arguments=context.message.arguments or {}
+                )
 
         mw_context = MiddlewareContext[CallToolRequestParams](
             message=mcp.types.CallToolRequestParams(name=key, arguments=arguments),
@@ -777,15 +862,20 @@ class FastMCP(Generic[LifespanResultT]):
         async def _handler(
             context: MiddlewareContext[mcp.types.ReadResourceRequestParams],
         ) -> list[ReadResourceContents]:
-            resource = await self._resource_manager.get_resource(context.message.uri)
-            if not self._should_enable_component(resource):
+            resolved = await self._resource_manager.resolve_resource(
+                context.message.uri
+            )
+            if not self._should_enable_component(resolved.component):
                 raise NotFoundError(f"Unknown resource: {str(context.message.uri)!r}")
 
-            content = await self._resource_manager.read_resource(context.message.uri)
+            with use_sync_executor(self._sync_executor):
+                content = await self._resource_manager.read_resource(
+                    context.message.uri, resolved=resolved
+                )
             return [
                 ReadResourceContents(
                     content=content,
-                    mime_type=resource.mime_type,
+                    mime_type=resolved.component.mime_type,
                 )
             ]
 
@@ -840,9 +930,10 @@ class FastMCP(Generic[LifespanResultT]):
             if not self._should_enable_component(prompt):
                 raise NotFoundError(f"Unknown prompt: {context.message.name!r}")
 
-            return await self._prompt_manager.render_prompt(
-                name=context.message.name, arguments=context.message.arguments
-            )
+            with use_sync_executor(self._sync_executor):
+                return await self._prompt_manager.render_prompt(
+                    name=context.message.name, arguments=context.message.arguments
+                )
 
         mw_context = MiddlewareContext(
             message=mcp.types.GetPromptRequestParams(name=name, arguments=arguments),
@@ -922,6 +1013,10 @@ class FastMCP(Generic[LifespanResultT]):
         exclude_args: list[str] | None = None,
         meta: dict[str, Any] | None = None,
         enabled: bool | None = None,
+        run_in_thread: bool | None = None,
+        run_in_process: bool | None = None,
+        process_timeout: float | None = None,
+        max_concurrency: int | None = None,
     ) -> FunctionTool: ...
 
     @overload
@@ -938,6 +1033,10 @@ class FastMCP(Generic[LifespanResultT]):
         exclude_args: list[str] | None = None,
         meta: dict[str, Any] | None = None,
         enabled: bool | None = None,
+        run_in_thread: bool | None = None,
+        run_in_process: bool | None = None,
+        process_timeout: float | None = None,
+        max_concurrency: int | None = None,
     ) -> Callable[[AnyFunction], FunctionTool]: ...
 
     def tool(
@@ -953,6 +1052,10 @@ class FastMCP(Generic[LifespanResultT]):
         exclude_args: list[str] | None = None,
         meta: dict[str, Any] | None = None,
         enabled: bool | None = None,
+        run_in_thread: bool | None = None,
+        run_in_process: bool | None = None,
+        process_timeout: float | None = None,
+        max_concurrency: int | None = None,
     ) -> Callable[[AnyFunction], FunctionTool] | FunctionTool:
         """Decorator to register a tool.
 
@@ -977,6 +1080,15 @@ class FastMCP(Generic[LifespanResultT]):
             exclude_args: Optional list of argument names to exclude from the tool schema
             meta: Optional meta information about the tool
             enabled: Optional boolean to enable or disable the tool
+            run_in_thread: Optional boolean to run a sync tool in a worker thread
+                instead of on the event loop. Defaults to the server's setting.
+            run_in_process: Optional boolean to run a CPU-bound sync tool in a
+                worker process. The function must be defined at module level and
+                its arguments and results must be picklable.
+            process_timeout: Optional timeout in seconds for tools run in a process.
+                The call fails when it expires, but a function that is already
+                running keeps its worker process busy until it returns.
+            max_concurrency: Optional maximum number of concurrent calls of the tool
 
         Examples:
             Register a tool with a custom name:
@@ -1037,6 +1149,10 @@ class FastMCP(Generic[LifespanResultT]):
                 meta=meta,
                 serializer=self._tool_serializer,
                 enabled=enabled,
+                run_in_thread=run_in_thread,
+                run_in_process=run_in_process,
+                process_timeout=process_timeout,
+                max_concurrency=max_concurrency,
             )
             self.add_tool(tool)
             return tool
@@ -1069,6 +1185,10 @@ class FastMCP(Generic[LifespanResultT]):
             exclude_args=exclude_args,
             meta=meta,
             enabled=enabled,
+            run_in_thread=run_in_thread,
+            run_in_process=run_in_process,
+            process_timeout=process_timeout,
+            max_concurrency=max_concurrency,
         )
 
     def add_resource(self, resource: Resource) -> Resource:
@@ -1736,6 +1856,7 @@ class FastMCP(Generic[LifespanResultT]):
         tool_separator: str | None = None,
         resource_separator: str | None = None,
         prompt_separator: str | None = None,
+        timeout: float | None = None,
     ) -> None:
         """Mount another FastMCP server on this server with an optional prefix.
 
@@ -1783,6 +1904,8 @@ class FastMCP(Generic[LifespanResultT]):
             tool_separator: Deprecated. Separator character for tool names.
             resource_separator: Deprecated. Separator character for resource URIs.
             prompt_separator: Deprecated. Separator character for prompt names.
+            timeout: Seconds to wait for the mounted server when listing its tools,
+                resources and prompts. Defaults to `fastmcp.settings.mounted_server_timeout`.
         """
         from fastmcp.server.proxy import FastMCPProxy
 
@@ -1843,6 +1966,7 @@ class FastMCP(Generic[LifespanResultT]):
             prefix=prefix,
             server=server,
             resource_prefix_format=self.resource_prefix_format,
+            timeout=timeout,
         )
         self._mounted_servers.append(mounted_server)
         self._tool_manager.mount(mounted_server)
@@ -2102,6 +2226,7 @@ class FastMCP(Generic[LifespanResultT]):
             | dict[str, Any]
             | str
         ),
+        max_pooled_sessions: int | None = None,
         **settings: Any,
     ) -> FastMCPProxy:
         """Create a FastMCP proxy server for the given backend.
@@ -2110,9 +2235,14 @@ class FastMCP(Generic[LifespanResultT]):
         instance or any value accepted as the `transport` argument of
         `fastmcp.client.Client`. This mirrors the convenience of the
         `fastmcp.client.Client` constructor.
+
+        By default, each request is forwarded over a fresh backend session. Set
+        `max_pooled_sessions` to keep up to that many sessions open and reuse
+        them across requests instead (see `ProxyClientPool`). This has no
+        effect for connected clients, whose session is always reused.
         """
         from fastmcp.client.client import Client
-        from fastmcp.server.proxy import FastMCPProxy, ProxyClient
+        from fastmcp.server.proxy import FastMCPProxy, ProxyClient, ProxyClientPool
 
         if isinstance(backend, Client):
             client = backend
@@ -2133,6 +2263,7 @@ class FastMCP(Generic[LifespanResultT]):
                     return client
 
                 client_factory = reuse_client_factory
+                max_pooled_sessions = None
             else:
                 # Fresh sessions per request
                 def fresh_client_factory():
@@ -2140,6 +2271,11 @@ class FastMCP(Generic[LifespanResultT]):
 
                 client_factory = fresh_client_factory
         else:
+            if isinstance(backend, FastMCP):
+                # Requests to an in-process backend don't need to be serialized
+                from fastmcp.client.transports import in_process_transport
+
+                backend = in_process_transport(backend)
             base_client = ProxyClient(backend)
 
             # Fresh client created from transport - use fresh sessions per request
@@ -2148,6 +2284,13 @@ class FastMCP(Generic[LifespanResultT]):
 
             client_factory = proxy_client_factory
 
+        if max_pooled_sessions is not None:
+            return FastMCPProxy(
+                client_pool=ProxyClientPool(
+                    client_factory, max_size=max_pooled_sessions
+                ),
+                **settings,
+            )
         return FastMCPProxy(client_factory=client_factory, **settings)
 
     @classmethod
@@ -2217,6 +2360,10 @@ class MountedServer:
     prefix: str | None
     server: FastMCP[Any]
     resource_prefix_format: Literal["protocol", "path"] | None = None
+    timeout: float | None = None
+    health: CircuitBreaker = field(
+        default_factory=CircuitBreaker, compare=False, repr=False
+    )
 
 
 def add_resource_prefix(
@@ -220,6 +220,112 @@ class Settings(BaseSettings):
         ),
     ] = None
 
+    run_sync_in_thread: Annotated[
+        bool,
+        Field(
+            default=False,
+            description=inspect.cleandoc(
+                """
+                If True, synchronous tool, resource and prompt functions run in a
+                bounded pool of worker threads instead of on the event loop, so
+                blocking I/O in one call doesn't stall other requests. Servers and
+                individual tools can override this.
+                """
+            ),
+        ),
+    ] = False
+
+    sync_worker_threads: Annotated[
+        int,
+        Field(
+            default=40,
+            ge=1,
+            description="The maximum number of worker threads used to run synchronous functions when `run_sync_in_thread` is enabled.",
+        ),
+    ] = 40
+
+    process_pool_workers: Annotated[
+        int | None,
+        Field(
+            default=None,
+            ge=1,
+            description="The number of worker processes for tools that run in a process pool. Defaults to the number of CPUs.",
+        ),
+    ] = None
+
+    proxy_cache_ttl: Annotated[
+        float,
+        Field(
+            default=0.0,
+            ge=0,
+            description=inspect.cleandoc(
+                """
+                How long, in seconds, proxy servers cache the tools, resources
+                and prompts listed by their remote servers. Cached lists are
+                also invalidated when the remote server sends a list_changed
+                notification. 0 disables caching; `inf` caches until a
+                notification arrives.
+                """
+            ),
+        ),
+    ] = 0.0
+
+    # Outgoing HTTP requests
+    http_timeout: Annotated[
+        float,
+        Field(
+            default=30.0,
+            gt=0,
+            description=inspect.cleandoc(
+                """
+                The default timeout, in seconds, for HTTP requests made by the
+                client shared by FastMCP components such as auth providers and
+                HTTP resources.
+                """
+            ),
+        ),
+    ] = 30.0
+
+    http_max_connections: Annotated[
+        int,
+        Field(
+            default=100,
+            ge=1,
+            description="The most connections the shared HTTP client opens at once.",
+        ),
+    ] = 100
+
+    http_max_keepalive_connections: Annotated[
+        int,
+        Field(
+            default=20,
+            ge=0,
+            description="The most idle connections the shared HTTP client keeps open for reuse.",
+        ),
+    ] = 20
+
+    http_keepalive_expiry: Annotated[
+        float,
+        Field(
+            default=5.0,
+            ge=0,
+            description="How long, in seconds, the shared HTTP client keeps idle connections open.",
+        ),
+    ] = 5.0
+
+    http2: Annotated[
+        bool,
+        Field(
+            default=True,
+            description=inspect.cleandoc(
+                """
+                Whether the shared HTTP client uses HTTP/2 with servers that
+                support it. Only takes effect when the `h2` package is installed.
+                """
+            ),
+        ),
+    ] = True
+
     # HTTP settings
     host: str = "127.0.0.1"
     port: int = 8000
@@ -329,6 +435,22 @@ class Settings(BaseSettings):
         ),
     ] = True
 
+    list_page_size: Annotated[
+        int | None,
+        Field(
+            default=None,
+            ge=1,
+            description=inspect.cleandoc(
+                """
+                The most tools, resources, resource templates or prompts a server
+                returns in response to a single list request. Clients fetch the
+                rest page by page, using the cursor returned with each page. None
+                returns all components at once.
+                """
+            ),
+        ),
+    ] = None
+
     mounted_components_raise_on_load_error: Annotated[
         bool,
         Field(
@@ -343,6 +465,96 @@ class Settings(BaseSettings):
         ),
     ] = False
 
+    mounted_server_timeout: Annotated[
+        float | None,
+        Field(
+            default=None,
+            gt=0,
+            description=inspect.cleandoc(
+                """
+                How long, in seconds, to wait for each mounted server when listing
+                its tools, resources or prompts. Mounts that time out are treated
+                like mounts that failed to load. Individual mounts can override
+                this. None waits indefinitely.
+                """
+            ),
+        ),
+    ] = None
+
+    mounted_server_serve_stale: Annotated[
+        bool,
+        Field(
+            default=False,
+            description=inspect.cleandoc(
+                """
+                If True, a mounted server that times out while listing its
+                components is represented by the components it returned last,
+                instead of being left out.
+                """
+            ),
+        ),
+    ] = False
+
+    mounted_server_failure_threshold: Annotated[
+        int | None,
+        Field(
+            default=None,
+            ge=1,
+            description=inspect.cleandoc(
+                """
+                The number of consecutive failures (errors or timeouts) while
+                listing a mounted server's components after which the server is
+                skipped until `mounted_server_backoff` seconds have passed. A
+                single request is then let through to probe it; each failed
+                probe doubles the wait. None never skips failing servers.
+                """
+            ),
+        ),
+    ] = None
+
+    mounted_server_backoff: Annotated[
+        float,
+        Field(
+            default=1.0,
+            gt=0,
+            description=inspect.cleandoc(
+                """
+                How long, in seconds, to skip a mounted server after it reaches
+                `mounted_server_failure_threshold` before probing it again.
+                """
+            ),
+        ),
+    ] = 1.0
+
+    mounted_server_max_backoff: Annotated[
+        float,
+        Field(
+            default=60.0,
+            gt=0,
+            description=inspect.cleandoc(
+                """
+                The longest time, in seconds, a failing mounted server is skipped
+                between probes.
+                """
+            ),
+        ),
+    ] = 60.0
+
+    mounted_server_negative_cache_ttl: Annotated[
+        float,
+        Field(
+            default=0,
+            ge=0,
+            description=inspect.cleandoc(
+                """
+                How long, in seconds, to remember that a mounted server doesn't
+                have a tool, resource or prompt, so calls with unknown names
+                don't ask it again. 0 disables the cache.
+                """
+            ),
+        ),
+    ] = 0
+
 
 def __getattr__(name: str):
     """
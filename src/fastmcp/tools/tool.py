@@ -3,7 +3,9 @@ from __future__ import annotations
 import inspect
 import warnings
 from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
 from dataclasses import dataclass
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Annotated,
@@ -13,11 +15,12 @@ from typing import (
     get_type_hints,
 )
 
+import anyio
 import mcp.types
 import pydantic_core
 from mcp.types import ContentBlock, TextContent, ToolAnnotations
 from mcp.types import Tool as MCPTool
-from pydantic import Field, PydanticSchemaGenerationError
+from pydantic import Field, PrivateAttr, PydanticSchemaGenerationError
 from typing_extensions import TypeVar
 
 import fastmcp
@@ -25,6 +28,8 @@ from fastmcp.server.dependencies import get_context
 from fastmcp.utilities.components import FastMCPComponent
 from fastmcp.utilities.json_schema import compress_schema
 from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.process_pool import FunctionRef, get_process_pool
+from fastmcp.utilities.sync_executor import get_sync_executor, is_coroutine_callable
 from fastmcp.utilities.types import (
     Audio,
     File,
@@ -169,6 +174,10 @@ class Tool(FastMCPComponent):
         serializer: Callable[[Any], str] | None = None,
         meta: dict[str, Any] | None = None,
         enabled: bool | None = None,
+        run_in_thread: bool | None = None,
+        run_in_process: bool | None = None,
+        process_timeout: float | None = None,
+        max_concurrency: int | None = None,
     ) -> FunctionTool:
         """Create a Tool from a function."""
         return FunctionTool.from_function(
@@ -183,6 +192,10 @@ class Tool(FastMCPComponent):
             serializer=serializer,
             meta=meta,
             enabled=enabled,
+            run_in_thread=run_in_thread,
+            run_in_process=run_in_process,
+            process_timeout=process_timeout,
+            max_concurrency=max_concurrency,
         )
 
     async def run(self, arguments: dict[str, Any]) -> ToolResult:
@@ -234,6 +247,33 @@ class Tool(FastMCPComponent):
 
 class FunctionTool(Tool):
     fn: Callable[..., Any]
+    run_in_thread: Annotated[
+        bool | None,
+        Field(
+            description="Whether to run a sync function in a worker thread. If None, the server's default is used."
+        ),
+    ] = None
+    run_in_process: Annotated[
+        bool | None,
+        Field(
+            description="Whether to run the function in a worker process, for CPU-bound tools. Arguments and results must be picklable."
+        ),
+    ] = None
+    process_timeout: Annotated[
+        float | None,
+        Field(
+            description="The maximum number of seconds to wait for a call that runs in a worker process. A function that is already running isn't stopped when the call times out."
+        ),
+    ] = None
+    max_concurrency: Annotated[
+        int | None,
+        Field(
+            description="The maximum number of concurrent calls of this tool. Further calls wait their turn.",
+            ge=1,
+        ),
+    ] = None
+
+    _concurrency_limiter: anyio.CapacityLimiter | None = PrivateAttr(default=None)
 
     @classmethod
     def from_function(
@@ -249,6 +289,10 @@ class FunctionTool(Tool):
         serializer: Callable[[Any], str] | None = None,
         meta: dict[str, Any] | None = None,
         enabled: bool | None = None,
+        run_in_thread: bool | None = None,
+        run_in_process: bool | None = None,
+        process_timeout: float | None = None,
+        max_concurrency: int | None = None,
     ) -> FunctionTool:
         """Create a Tool from a function."""
 
@@ -257,6 +301,16 @@ class FunctionTool(Tool):
         if name is None and parsed_fn.name == "<lambda>":
             raise ValueError("You must provide a name for lambda functions")
 
+        if run_in_process:
+            from fastmcp.server.context import Context
+
+            if is_coroutine_callable(parsed_fn.fn):
+                raise ValueError("Only sync functions can run in a worker process")
+            if find_kwarg_by_type(parsed_fn.fn, kwarg_type=Context):
+                raise ValueError("Tools that run in a worker process can't use Context")
+            # Fail at registration rather than on the first call
+            FunctionRef.from_function(parsed_fn.fn)
+
         if isinstance(output_schema, NotSetT):
             final_output_schema = parsed_fn.output_schema
         elif output_schema is False:
@@ -292,8 +346,19 @@ class FunctionTool(Tool):
             serializer=serializer,
             meta=meta,
             enabled=enabled if enabled is not None else True,
+            run_in_thread=run_in_thread,
+            run_in_process=run_in_process,
+            process_timeout=process_timeout,
+            max_concurrency=max_concurrency,
         )
 
+    def _get_concurrency_limiter(self) -> AbstractAsyncContextManager[Any]:
+        if self.max_concurrency is None:
+            return nullcontext()
+        if self._concurrency_limiter is None:
+            self._concurrency_limiter = anyio.CapacityLimiter(self.max_concurrency)
+        return self._concurrency_limiter
+
     async def run(self, arguments: dict[str, Any]) -> ToolResult:
         """Run the tool with arguments."""
         from fastmcp.server.context import Context
@@ -305,10 +370,22 @@ class FunctionTool(Tool):
             arguments[context_kwarg] = get_context()
 
         type_adapter = get_cached_typeadapter(self.fn)
-        result = type_adapter.validate_python(arguments)
+        # Only sync functions do their work during validation; async ones just
+        # return a coroutine
+        run_in_thread = False if is_coroutine_callable(self.fn) else self.run_in_thread
+        async with self._get_concurrency_limiter():
+            if self.run_in_process:
+                result = await get_process_pool().call(
+                    self.fn, arguments, timeout=self.process_timeout
+                )
+            else:
+                result = await get_sync_executor().call(
+                    partial(type_adapter.validate_python, arguments),
+                    run_in_thread=run_in_thread,
+                )
 
-        if inspect.isawaitable(result):
-            result = await result
+            if inspect.isawaitable(result):
+                result = await result
 
         if isinstance(result, ToolResult):
             return result
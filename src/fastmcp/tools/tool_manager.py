@@ -12,9 +12,12 @@ from fastmcp.settings import DuplicateBehavior
 from fastmcp.tools.tool import Tool, ToolResult
 from fastmcp.tools.tool_transform import (
     ToolTransformConfig,
+    TransformedToolCache,
     apply_transformations_to_tools,
 )
+from fastmcp.utilities.components import VersionedDict
 from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.mounts import MountedServerLoader, NegativeCache
 
 if TYPE_CHECKING:
     from fastmcp.server.server import MountedServer
@@ -31,10 +34,27 @@ class ToolManager:
         mask_error_details: bool | None = None,
         transformations: dict[str, ToolTransformConfig] | None = None,
     ):
-        self._tools: dict[str, Tool] = {}
+        self._tools: VersionedDict[Tool] = VersionedDict()
         self._mounted_servers: list[MountedServer] = []
         self.mask_error_details = mask_error_details or settings.mask_error_details
         self.transformations = transformations or {}
+        self.transform_cache = TransformedToolCache()
+
+        # Cached unfiltered inventory. `_generation` is bumped on mounts and
+        # transformation changes, and `_tools` tracks its own edits; the cache
+        # is valid while the composite version (this manager, all mounted
+        # managers, and component enabled state) matches.
+        self._generation: int = 0
+        self._inventory: dict[str, Tool] | None = None
+        self._inventory_version: tuple[Any, ...] | None = None
+        # Maps keys of mounted tools to the mounted server that owns them and
+        # the key within that server. Only valid alongside the cached inventory.
+        self._routes: dict[str, tuple[MountedServer, str]] = {}
+        self._mounted_loader: MountedServerLoader[Any] = MountedServerLoader("tools")
+        # Keys that mounted servers recently reported as not found
+        self._not_found = NegativeCache(
+            get_version=lambda mounted: mounted.server._tool_manager._get_version()
+        )
 
         # Default to "warn" if None is provided
         if duplicate_behavior is None:
@@ -51,63 +71,151 @@ class ToolManager:
     def mount(self, server: MountedServer) -> None:
         """Adds a mounted server as a source for tools."""
         self._mounted_servers.append(server)
+        self._bump_generation()
+
+    def _bump_generation(self) -> None:
+        """Mark the cached inventory of this manager (and its parents) as stale."""
+        self._generation += 1
+
+    def _get_version(self) -> tuple[Any, ...] | None:
+        """
+        Return a version that changes whenever the unfiltered inventory may have
+        changed, or None if the inventory can't be cached (e.g. a remote source).
+
+        Versions of mounted managers are included, so changes in child servers
+        propagate up to every parent.
+        """
+        parts: list[Any] = [
+            self._generation,
+            self._tools.version,
+        ]
+        for mounted in self._mounted_servers:
+            try:
+                child_version = mounted.server._tool_manager._get_version()
+            except Exception:
+                return None
+            if child_version is None:
+                return None
+            parts.append((id(mounted.server), child_version))
+        return tuple(parts)
+
+    async def _get_inventory(self) -> dict[str, Tool]:
+        """
+        Return the unfiltered inventory, rebuilding it only if something changed.
+
+        The returned dict is shared and must not be mutated.
+        """
+        version = self._get_version()
+        if (
+            version is not None
+            and self._inventory is not None
+            and version == self._inventory_version
+        ):
+            return self._inventory
+
+        inventory = await self._load_tools(via_server=False)
+        if version is not None:
+            self._routes = await self._build_routes()
+            self._inventory = inventory
+            self._inventory_version = version
+        return inventory
+
+    async def _build_routes(self) -> dict[str, tuple[MountedServer, str]]:
+        """
+        Map every mounted tool key to the mounted server that owns it. Later
+        mounts take precedence, matching the order used by call_tool.
+        """
+        routes: dict[str, tuple[MountedServer, str]] = {}
+        for mounted in self._mounted_servers:
+            for child_key in await self._get_mounted_tools(mounted):
+                if mounted.prefix:
+                    routes[f"{mounted.prefix}_{child_key}"] = (mounted, child_key)
+                else:
+                    routes[child_key] = (mounted, child_key)
+        return routes
+
+    async def _get_routes(self) -> dict[str, tuple[MountedServer, str]] | None:
+        """Return the routing table, or None if the inventory can't be cached."""
+        if self._get_version() is None:
+            return None
+        await self._get_inventory()
+        return self._routes
+
+    async def _get_mounted_tools(self, mounted: MountedServer) -> dict[str, Tool]:
+        """
+        The tools a mounted server contributes to the unfiltered inventory:
+        its own inventory, limited to the tools it exposes (its include and
+        exclude tags and enabled state), like its filtered listing but without
+        running its middleware.
+        """
+        child_tools = await mounted.server._tool_manager._get_inventory()
+        return {
+            key: tool
+            for key, tool in child_tools.items()
+            if mounted.server._should_enable_component(tool)
+        }
 
     async def _load_tools(self, *, via_server: bool = False) -> dict[str, Tool]:
         """
         The single, consolidated recursive method for fetching tools. The 'via_server'
         parameter determines the communication path.
 
-        - via_server=False: Manager-to-manager path for complete, unfiltered inventory
+        - via_server=False: Manager-to-manager path for the inventory, unfiltered
+          by this server but limited to the tools each mounted server exposes
         - via_server=True: Server-to-server path for filtered MCP requests
         """
         all_tools: dict[str, Tool] = {}
 
-        for mounted in self._mounted_servers:
-            try:
-                if via_server:
-                    # Use the server-to-server filtered path
-                    child_results = await mounted.server._list_tools()
-                else:
-                    # Use the manager-to-manager unfiltered path
-                    child_results = await mounted.server._tool_manager.list_tools()
-
-                # The combination logic is the same for both paths
-                child_dict = {t.key: t for t in child_results}
-                if mounted.prefix:
-                    for tool in child_dict.values():
-                        prefixed_tool = tool.model_copy(
-                            key=f"{mounted.prefix}_{tool.key}"
-                        )
-                        all_tools[prefixed_tool.key] = prefixed_tool
-                else:
-                    all_tools.update(child_dict)
-            except Exception as e:
+        async def load(mounted: MountedServer) -> list[Tool]:
+            if via_server:
+                # Use the server-to-server filtered path
+                return await mounted.server._list_tools()
+            # Use the manager-to-manager path, which caches each inventory
+            return list((await self._get_mounted_tools(mounted)).values())
+
+        # Mounted servers are queried concurrently, and their results combined
+        # in mount order so later mounts still take precedence
+        loaded = await self._mounted_loader.load(
+            self._mounted_servers, load, key=via_server
+        )
+        for mounted, child_results in loaded:
+            if isinstance(child_results, Exception):
                 # Skip failed mounts silently, matches existing behavior
                 logger.warning(
-                    f"Failed to get tools from server: {mounted.server.name!r}, mounted at: {mounted.prefix!r}: {e}"
+                    f"Failed to get tools from server: {mounted.server.name!r}, mounted at: {mounted.prefix!r}: {child_results}"
                 )
                 if settings.mounted_components_raise_on_load_error:
-                    raise
+                    raise child_results
                 continue
 
+            # The combination logic is the same for both paths
+            child_dict = {t.key: t for t in child_results}
+            if mounted.prefix:
+                for tool in child_dict.values():
+                    prefixed_tool = tool.model_copy(key=f"{mounted.prefix}_{tool.key}")
+                    all_tools[prefixed_tool.key] = prefixed_tool
+            else:
+                all_tools.update(child_dict)
+
         # Finally, add local tools, which always take precedence
         all_tools.update(self._tools)
 
         transformed_tools = apply_transformations_to_tools(
             tools=all_tools,
             transformations=self.transformations,
+            cache=self.transform_cache,
         )
 
         return transformed_tools
 
     async def has_tool(self, key: str) -> bool:
         """Check if a tool exists."""
-        tools = await self.get_tools()
+        tools = await self._get_inventory()
         return key in tools
 
     async def get_tool(self, key: str) -> Tool:
         """Get tool by key."""
-        tools = await self.get_tools()
+        tools = await self._get_inventory()
         if key in tools:
             return tools[key]
         raise NotFoundError(f"Tool {key!r} not found")
@@ -116,12 +224,16 @@ class ToolManager:
         """
         Gets the complete, unfiltered inventory of all tools.
         """
-        return await self._load_tools(via_server=False)
+        return dict(await self._get_inventory())
 
     async def list_tools(self) -> list[Tool]:
         """
         Lists all tools, applying protocol filtering.
         """
+        if not self._mounted_servers:
+            # Without mounted servers there is nothing to filter, so the
+            # prebuilt inventory can be served directly.
+            return list((await self._get_inventory()).values())
         tools_dict = await self._load_tools(via_server=True)
         return list(tools_dict.values())
 
@@ -185,6 +297,7 @@ class ToolManager:
     ) -> None:
         """Add a tool transformation."""
         self.transformations[tool_name] = transformation
+        self._bump_generation()
 
     def get_tool_transformation(self, tool_name: str) -> ToolTransformConfig | None:
         """Get a tool transformation."""
@@ -194,6 +307,7 @@ class ToolManager:
         """Remove a tool transformation."""
         if tool_name in self.transformations:
             del self.transformations[tool_name]
+            self._bump_generation()
 
     def remove_tool(self, key: str) -> None:
         """Remove a tool from the server.
@@ -238,17 +352,36 @@ class ToolManager:
                     # Include original error details
                     raise ToolError(f"Error calling tool {key!r}: {e}") from e
 
-        # 2. Check mounted servers using the filtered protocol path.
+        # 2. Route directly to the mounted server that owns the tool. Without a
+        # route in a cacheable inventory, no mounted server has the tool.
+        routes = await self._get_routes()
+        route = routes.get(key) if routes is not None else None
+        if route is not None:
+            routed_server, tool_key = route
+            try:
+                return await routed_server.server._call_tool(tool_key, arguments)
+            except NotFoundError:
+                # e.g. disabled in the owning server; fall back to the others
+                pass
+        elif routes is not None:
+            raise NotFoundError(f"Tool {key!r} not found.")
+
+        # 3. Check mounted servers using the filtered protocol path.
         for mounted in reversed(self._mounted_servers):
+            if route is not None and mounted is route[0]:
+                continue
             tool_key = key
             if mounted.prefix:
                 if key.startswith(f"{mounted.prefix}_"):
                     tool_key = key.removeprefix(f"{mounted.prefix}_")
                 else:
                     continue
+            if mounted.health.is_open or (mounted, tool_key) in self._not_found:
+                continue
             try:
                 return await mounted.server._call_tool(tool_key, arguments)
             except NotFoundError:
+                self._not_found.add(mounted, tool_key)
                 continue
 
         raise NotFoundError(f"Tool {key!r} not found.")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 import warnings
+from collections import OrderedDict
 from collections.abc import Callable
 from contextvars import ContextVar
 from dataclasses import dataclass
@@ -9,7 +10,7 @@ from typing import Annotated, Any, Literal, cast
 
 import pydantic_core
 from mcp.types import ToolAnnotations
-from pydantic import ConfigDict
+from pydantic import ConfigDict, PrivateAttr
 from pydantic.fields import Field
 from pydantic.functional_validators import BeforeValidator
 
@@ -916,6 +917,34 @@ class ToolTransformConfig(FastMCPBaseModel):
         description="A dictionary of argument transforms to apply to the tool.",
     )
 
+    _fingerprint: str | None = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._fingerprint = None
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> ToolTransformConfig:
+        copy = super().model_copy(update=update, deep=deep)
+        copy._fingerprint = None
+        return copy
+
+    def fingerprint(self) -> str:
+        """
+        A string that changes whenever the result of `apply()` would change.
+
+        It is computed once and recomputed after a field is assigned. Changes
+        made in place to a field's value, such as adding an entry to
+        `arguments`, aren't detected; assign the field a new value instead.
+        """
+        if self._fingerprint is None:
+            # `apply()` distinguishes unset fields from explicit defaults
+            fields_set = ",".join(sorted(self.model_fields_set))
+            self._fingerprint = f"{fields_set}:{self.model_dump_json(fallback=repr)}"
+        return self._fingerprint
+
     def apply(self, tool: Tool) -> TransformedTool:
         """Create a TransformedTool from a provided tool and this transformation configuration."""
 
@@ -930,21 +959,77 @@ class ToolTransformConfig(FastMCPBaseModel):
         )
 
 
+class TransformedToolCache:
+    """Memoizes `ToolTransformConfig.apply()` per (tool key, config) pair.
+
+    Entries are keyed on the key of the parent tool and a fingerprint of the
+    config, so copies of a tool, like the prefixed copies made for mounted
+    servers, find the entry built for an earlier copy. An entry is reused
+    while the parent's field values are the same objects as when it was
+    built; a parent with different fields (e.g. a changed enabled state) or
+    a modified config produce a freshly built TransformedTool.
+    """
+
+    def __init__(self, maxsize: int = 5000):
+        self.maxsize = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[
+            tuple[str, str], tuple[tuple[Any, ...], TransformedTool]
+        ] = OrderedDict()
+
+    def apply(self, transformation: ToolTransformConfig, tool: Tool) -> TransformedTool:
+        """Return the TransformedTool for `tool`, building it only on a miss."""
+        cache_key = (tool.key, transformation.fingerprint())
+        # Copies share their field values, so comparing them by identity is
+        # cheap and doesn't depend on the values being comparable
+        fields = (type(tool), *tool.__dict__.values())
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            cached_fields, transformed = entry
+            if len(cached_fields) == len(fields) and all(
+                a is b for a, b in zip(cached_fields, fields)
+            ):
+                self.hits += 1
+                self._entries.move_to_end(cache_key)
+                return transformed
+
+        self.misses += 1
+        transformed = transformation.apply(tool)
+        self._entries[cache_key] = (fields, transformed)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return transformed
+
+    def clear(self) -> None:
+        """Drop all cached transformed tools."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 def apply_transformations_to_tools(
     tools: dict[str, Tool],
     transformations: dict[str, ToolTransformConfig],
+    cache: TransformedToolCache | None = None,
 ) -> dict[str, Tool]:
     """Apply a list of transformations to a list of tools. Tools that do not have any transforamtions
     are left unchanged.
+
+    If a `cache` is provided, previously built transformed tools are reused.
     """
 
     transformed_tools: dict[str, Tool] = {}
 
     for tool_name, tool in tools.items():
         if transformation := transformations.get(tool_name):
-            transformed_tools[transformation.name or tool_name] = transformation.apply(
-                tool
-            )
+            if cache is not None:
+                transformed_tool = cache.apply(transformation, tool)
+            else:
+                transformed_tool = transformation.apply(tool)
+            transformed_tools[transformation.name or tool_name] = transformed_tool
             continue
 
         transformed_tools[tool_name] = tool
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import weakref
 from collections.abc import Sequence
 from typing import Annotated, Any, TypedDict
 
@@ -16,6 +17,54 @@ class FastMCPMeta(TypedDict, total=False):
     tags: list[str]
 
 
+class VersionedDict(dict[str, T]):
+    """
+    A dict that counts its mutations in `version`. Managers use it for their
+    component registries so that cached inventories notice direct edits too.
+    Components stored in it also bump its version when they are enabled or
+    disabled, so each manager only sees changes to its own components.
+    """
+
+    version: int = 0
+
+    def _track(self, value: Any) -> None:
+        if isinstance(value, FastMCPComponent):
+            value._registries[id(self)] = self
+
+    def __setitem__(self, key: str, value: T) -> None:
+        super().__setitem__(key, value)
+        self._track(value)
+        self.version += 1
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def pop(self, *args: Any) -> Any:
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[str, T]:
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self.version += 1
+        value = super().setdefault(key, default)
+        self._track(value)
+        return value
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        for value in self.values():
+            self._track(value)
+        self.version += 1
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+
 def _convert_set_default_none(maybe_set: set[T] | Sequence[T] | None) -> set[T]:
     """Convert a sequence to a set, defaulting to an empty set if None."""
     if maybe_set is None:
@@ -52,6 +101,10 @@ class FastMCPComponent(FastMCPBaseModel):
     )
 
     _key: str | None = PrivateAttr()
+    # The registries holding this component, told when it's enabled or disabled
+    _registries: weakref.WeakValueDictionary[int, VersionedDict[Any]] = PrivateAttr(
+        default_factory=weakref.WeakValueDictionary
+    )
 
     def __init__(self, *, key: str | None = None, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -110,6 +163,8 @@ class FastMCPComponent(FastMCPBaseModel):
         # https://github.com/pydantic/pydantic/issues/12116
         # So we manually set the private attribute here instead, such as _key
         copy = super().model_copy(update=update, deep=deep)
+        # The copy isn't stored in the original's registries
+        copy._registries = weakref.WeakValueDictionary()
         if key is not None:
             copy._key = key
         return copy
@@ -124,13 +179,18 @@ class FastMCPComponent(FastMCPBaseModel):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name={self.name!r}, title={self.title!r}, description={self.description!r}, tags={self.tags}, enabled={self.enabled})"
 
+    def _set_enabled(self, enabled: bool) -> None:
+        self.enabled = enabled
+        for registry in self._registries.values():
+            registry.version += 1
+
     def enable(self) -> None:
         """Enable the component."""
-        self.enabled = True
+        self._set_enabled(True)
 
     def disable(self) -> None:
         """Disable the component."""
-        self.enabled = False
+        self._set_enabled(False)
 
     def copy(self) -> Self:
         """Create a copy of the component."""
@@ -1,4 +1,14 @@
+import asyncio
+import importlib.util
 import socket
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import httpx
+
+import fastmcp
 
 
 def find_available_port() -> int:
@@ -6,3 +16,78 @@ def find_available_port() -> int:
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
         s.bind(("127.0.0.1", 0))
         return s.getsockname()[1]
+
+
+# Shared clients are bound to the event loop their connections were opened on
+_http_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+_http_client_users: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, int] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class _RejectCookiesPolicy(DefaultCookiePolicy):
+    """Cookie policy that never stores cookies set by responses."""
+
+    def set_ok(self, cookie, request) -> bool:
+        return False
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create an HTTP client configured by the `http_*` settings. HTTP/2 is used
+    when enabled and the `h2` package is installed.
+
+    The client doesn't persist cookies: it is shared by unrelated components
+    and requests, so a `Set-Cookie` from one response must not be sent with
+    the others.
+    """
+    settings = fastmcp.settings
+    return httpx.AsyncClient(
+        cookies=CookieJar(policy=_RejectCookiesPolicy()),
+        timeout=settings.http_timeout,
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        ),
+        http2=settings.http2 and importlib.util.find_spec("h2") is not None,
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the HTTP client shared by FastMCP components that make outgoing
+    requests, such as auth providers and HTTP resources, so that they reuse
+    pooled connections instead of opening new ones for every request.
+
+    There is one client per event loop, created on first use. It is closed
+    when the last server lifespan using it (see `http_client_lifespan`) ends.
+    Callers must not close it; pass per-request options such as `timeout` to
+    the request instead.
+    """
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _http_clients[loop] = create_http_client()
+    return client
+
+
+@asynccontextmanager
+async def http_client_lifespan() -> AsyncIterator[None]:
+    """
+    Keep the shared HTTP client of the running event loop open, closing it
+    once the last of the (possibly nested) lifespans using it ends.
+    """
+    loop = asyncio.get_running_loop()
+    _http_client_users[loop] = _http_client_users.get(loop, 0) + 1
+    try:
+        yield
+    finally:
+        _http_client_users[loop] -= 1
+        if not _http_client_users[loop]:
+            del _http_client_users[loop]
+            client = _http_clients.pop(loop, None)
+            if client is not None:
+                await client.aclose()
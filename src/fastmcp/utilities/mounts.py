@@ -0,0 +1,288 @@
+"""Load components from mounted servers concurrently, and track their health."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Generic, Literal, TypeVar
+
+import anyio
+
+import fastmcp
+from fastmcp.utilities.logging import get_logger
+
+if TYPE_CHECKING:
+    from fastmcp.server.server import MountedServer
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# The most keys a NegativeCache remembers; unknown keys come from clients
+_NEGATIVE_CACHE_MAX_SIZE = 1024
+
+
+class CircuitBreaker:
+    """
+    Tracks consecutive failures of a mounted server so that a server which is
+    down isn't retried (and waited for) on every request.
+
+    After `fastmcp.settings.mounted_server_failure_threshold` consecutive
+    failures the circuit opens and the server is skipped. Once
+    `fastmcp.settings.mounted_server_backoff` seconds have passed the circuit is
+    half-open: the next request is let through as a probe. If the probe
+    succeeds the circuit closes; if it fails the circuit opens again and the
+    backoff doubles, up to `fastmcp.settings.mounted_server_max_backoff`.
+    """
+
+    def __init__(self) -> None:
+        self.failures: int = 0
+        self._backoff: float = 0
+        self._retry_at: float | None = None
+
+    @property
+    def state(self) -> Literal["closed", "open", "half-open"]:
+        if self._retry_at is None:
+            return "closed"
+        if time.monotonic() < self._retry_at:
+            return "open"
+        return "half-open"
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests to the server should be skipped."""
+        return self.state == "open"
+
+    def allow_request(self) -> bool:
+        """
+        Whether a request may be sent to the server. In the half-open state this
+        lets a single probe through: the circuit stays open for concurrent
+        requests until the probe reports back, or the backoff passes again.
+        """
+        state = self.state
+        if state == "half-open":
+            self._retry_at = time.monotonic() + self._backoff
+            return True
+        return state == "closed"
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._backoff = 0
+        self._retry_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        threshold = fastmcp.settings.mounted_server_failure_threshold
+        if threshold is None or self.failures < threshold:
+            return
+        if self._retry_at is None:
+            self._backoff = fastmcp.settings.mounted_server_backoff
+        else:
+            self._backoff = min(
+                self._backoff * 2, fastmcp.settings.mounted_server_max_backoff
+            )
+        self._retry_at = time.monotonic() + self._backoff
+
+
+class NegativeCache:
+    """
+    Remembers keys that a mounted server reported as not found, for
+    `fastmcp.settings.mounted_server_negative_cache_ttl` seconds, so that
+    looking up an unknown key doesn't ask every (remote) mount again.
+
+    Entries are kept per mount. If `get_version` is given, a mount's entries
+    are also dropped as soon as the version it returns for the mount changes,
+    e.g. when a component is added to the mounted server.
+
+    Args:
+        get_version: Returns the inventory version of a mounted server, or
+            None if it has none (e.g. a proxy), in which case only the TTL
+            applies.
+    """
+
+    def __init__(
+        self, get_version: Callable[[MountedServer], Hashable | None] | None = None
+    ) -> None:
+        self.get_version = get_version
+        self._size = 0
+        # Keyed by the identity of the mount; the entry holds the mount itself,
+        # so its id can't be reused while it has entries
+        self._mounts: dict[int, _NegativeCacheEntries] = {}
+
+    def _entries(self, mounted: MountedServer) -> _NegativeCacheEntries | None:
+        entries = self._mounts.get(id(mounted))
+        if entries is None:
+            return None
+        assert entries.mounted is mounted
+        if self.get_version is not None:
+            if self.get_version(mounted) != entries.version:
+                self._drop(mounted)
+                return None
+        return entries
+
+    def _drop(self, mounted: MountedServer) -> None:
+        entries = self._mounts.pop(id(mounted), None)
+        if entries is not None:
+            self._size -= len(entries.expires_at)
+
+    def __contains__(self, item: tuple[MountedServer, str]) -> bool:
+        mounted, key = item
+        entries = self._entries(mounted)
+        if entries is None:
+            return False
+        expires_at = entries.expires_at.get(key)
+        if expires_at is None:
+            return False
+        if time.monotonic() < expires_at:
+            return True
+        del entries.expires_at[key]
+        self._size -= 1
+        return False
+
+    def add(self, mounted: MountedServer, key: str) -> None:
+        ttl = fastmcp.settings.mounted_server_negative_cache_ttl
+        if not ttl:
+            return
+        now = time.monotonic()
+        if self._size >= _NEGATIVE_CACHE_MAX_SIZE:
+            self._evict(now)
+        entries = self._entries(mounted)
+        if entries is None:
+            version = self.get_version(mounted) if self.get_version else None
+            entries = self._mounts[id(mounted)] = _NegativeCacheEntries(
+                mounted=mounted, version=version
+            )
+        if key not in entries.expires_at:
+            self._size += 1
+        entries.expires_at[key] = now + ttl
+
+    def _evict(self, now: float) -> None:
+        for entries in list(self._mounts.values()):
+            expired = [k for k, t in entries.expires_at.items() if t <= now]
+            for key in expired:
+                del entries.expires_at[key]
+            self._size -= len(expired)
+            if not entries.expires_at:
+                self._drop(entries.mounted)
+        if self._size >= _NEGATIVE_CACHE_MAX_SIZE:
+            # Forget the oldest entry of the first mount
+            entries = next(iter(self._mounts.values()))
+            del entries.expires_at[next(iter(entries.expires_at))]
+            self._size -= 1
+
+    def clear(self) -> None:
+        self._mounts.clear()
+        self._size = 0
+
+
+@dataclass
+class _NegativeCacheEntries:
+    mounted: MountedServer
+    version: Hashable | None
+    expires_at: dict[str, float] = field(default_factory=dict)
+
+
+class MountedServerLoader(Generic[T]):
+    """
+    Loads one kind of component from a list of mounted servers concurrently,
+    so a list over many (remote) mounts takes as long as the slowest mount
+    rather than the sum of all of them.
+
+    Each mount is given `MountedServer.timeout` seconds, or
+    `fastmcp.settings.mounted_server_timeout` if it has none. When
+    `fastmcp.settings.mounted_server_serve_stale` is enabled, a mount that
+    times out is represented by the last components it returned while the
+    setting was enabled, if any. Results aren't kept otherwise.
+
+    Every load is reported to the mount's `CircuitBreaker`. While a mount's
+    circuit is open it isn't called at all; it is represented by its last
+    components if serving stale results is enabled, or reported as failed.
+
+    Args:
+        components: The kind of component, used in log messages.
+    """
+
+    def __init__(self, components: str):
+        self.components = components
+        # The last successful result for each (mount, key)
+        self._last_results: dict[tuple[int, Hashable], T] = {}
+
+    async def load(
+        self,
+        mounted_servers: Sequence[MountedServer],
+        load: Callable[[MountedServer], Awaitable[T]],
+        key: Hashable = None,
+    ) -> list[tuple[MountedServer, T | Exception]]:
+        """
+        Call `load` for every mounted server concurrently and return the
+        results in mount order. Failed loads are returned as their exception
+        so callers can report them in order.
+
+        Args:
+            mounted_servers: The mounted servers to load from.
+            load: Loads the components of a single mounted server.
+            key: Distinguishes different `load` functions for the same mounts
+                when remembering results to serve stale.
+        """
+        results: dict[int, T | Exception] = {}
+
+        async def load_one(index: int, mounted: MountedServer) -> None:
+            results[index] = await self._load_one(mounted, load, key)
+
+        if len(mounted_servers) == 1:
+            await load_one(0, mounted_servers[0])
+        else:
+            async with anyio.create_task_group() as tg:
+                for index, mounted in enumerate(mounted_servers):
+                    tg.start_soon(load_one, index, mounted)
+
+        return [(mounted, results[i]) for i, mounted in enumerate(mounted_servers)]
+
+    async def _load_one(
+        self,
+        mounted: MountedServer,
+        load: Callable[[MountedServer], Awaitable[T]],
+        key: Hashable,
+    ) -> T | Exception:
+        timeout = getattr(mounted, "timeout", None)
+        if timeout is None:
+            timeout = fastmcp.settings.mounted_server_timeout
+        cache_key = (id(mounted), key)
+        breaker: CircuitBreaker | None = getattr(mounted, "health", None)
+        if breaker is not None and not breaker.allow_request():
+            if (
+                fastmcp.settings.mounted_server_serve_stale
+                and cache_key in self._last_results
+            ):
+                return self._last_results[cache_key]
+            return RuntimeError(
+                f"Skipped after {breaker.failures} consecutive failures"
+            )
+        try:
+            with anyio.fail_after(timeout):
+                result = await load(mounted)
+        except TimeoutError:
+            if breaker is not None:
+                breaker.record_failure()
+            if (
+                fastmcp.settings.mounted_server_serve_stale
+                and cache_key in self._last_results
+            ):
+                logger.warning(
+                    f"Timed out getting {self.components} from server: {mounted.server.name!r}, "
+                    f"mounted at: {mounted.prefix!r}; serving the last known {self.components}"
+                )
+                return self._last_results[cache_key]
+            return TimeoutError(f"Timed out after {timeout} seconds")
+        except Exception as e:
+            if breaker is not None:
+                breaker.record_failure()
+            return e
+        if breaker is not None:
+            breaker.record_success()
+        if fastmcp.settings.mounted_server_serve_stale:
+            self._last_results[cache_key] = result
+        else:
+            self._last_results.pop(cache_key, None)
+        return result
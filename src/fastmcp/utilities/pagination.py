@@ -0,0 +1,52 @@
+"""Cursor-based pagination of MCP list results."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from collections.abc import Sequence
+from typing import TypeVar
+
+from mcp import McpError
+from mcp.types import INVALID_PARAMS, ErrorData
+
+T = TypeVar("T")
+
+
+def encode_cursor(offset: int) -> str:
+    """Encode the offset of the next page as an opaque cursor."""
+    return base64.urlsafe_b64encode(str(offset).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode a cursor created by `encode_cursor` back into an offset."""
+    try:
+        offset = int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        offset = -1
+    if offset < 0:
+        raise McpError(ErrorData(code=INVALID_PARAMS, message="Invalid cursor"))
+    return offset
+
+
+def paginate(
+    items: Sequence[T], cursor: str | None, page_size: int | None
+) -> tuple[list[T], str | None]:
+    """
+    Return the page of `items` that starts at `cursor`, and the cursor of the
+    next page, or None if this is the last page. Without a page size, all items
+    are returned at once.
+
+    Cursors are offsets into the list, so a list that changes between requests
+    may skip or repeat items; clients are notified of such changes by
+    list_changed notifications.
+
+    Raises:
+        McpError: If the cursor is invalid.
+    """
+    offset = decode_cursor(cursor) if cursor is not None else 0
+    if page_size is None:
+        return list(items[offset:]), None
+    end = offset + page_size
+    next_cursor = encode_cursor(end) if end < len(items) else None
+    return list(items[offset:end]), next_cursor
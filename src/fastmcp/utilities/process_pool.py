@@ -0,0 +1,215 @@
+"""Run CPU-bound tool functions in a pool of worker processes."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import importlib
+import inspect
+import sys
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import anyio
+
+import fastmcp
+from fastmcp.exceptions import ToolError
+from fastmcp.utilities.logging import get_logger
+from fastmcp.utilities.types import get_cached_typeadapter
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class FunctionRef:
+    """
+    A picklable reference to a module-level function.
+
+    Functions are sent to worker processes by name rather than pickled
+    directly: decorating a function with `@mcp.tool` rebinds its module-level
+    name to the FunctionTool, which pickle refuses. The worker imports the
+    function's module by name, so functions in a script run directly
+    (`__main__`) or in a file loaded under another module name, as
+    `fastmcp run server.py` does, are rejected.
+    """
+
+    module: str
+    qualname: str
+
+    @classmethod
+    def from_function(cls, fn: Callable[..., Any]) -> FunctionRef:
+        module = getattr(fn, "__module__", None)
+        qualname = getattr(fn, "__qualname__", None)
+        if (
+            not inspect.isfunction(fn)
+            or module is None
+            or qualname is None
+            or "<" in qualname
+        ):
+            raise ValueError(
+                f"{fn!r} can't run in a worker process: only functions defined "
+                "at the top level of a module or class are supported"
+            )
+        if not _is_importable(module):
+            raise ValueError(
+                f"{fn!r} can't run in a worker process: worker processes import "
+                f"functions by module name, and module {module!r} can't be "
+                "imported by name. Define the function in an importable module."
+            )
+        return cls(module=module, qualname=qualname)
+
+    def resolve(self) -> Callable[..., Any]:
+        obj: Any = importlib.import_module(self.module)
+        for part in self.qualname.split("."):
+            obj = getattr(obj, part)
+        # Unwrap components (e.g. a FunctionTool created by a decorator)
+        return getattr(obj, "fn", obj)
+
+
+@functools.cache
+def _is_importable(module: str) -> bool:
+    """
+    Whether a new process could import `module` by name. Scripts run directly
+    are `__main__` there, and files loaded under another name can't be found.
+    """
+    if module == "__main__":
+        return False
+    top_level = module.partition(".")[0]
+    if top_level in sys.builtin_module_names:
+        return True
+    # Ask the finders directly, as sys.modules isn't shared with new processes
+    for finder in sys.meta_path:
+        find_spec = getattr(finder, "find_spec", None)
+        if find_spec is not None and find_spec(top_level, None) is not None:
+            return True
+    return False
+
+
+def _run_function(ref: FunctionRef, arguments: dict[str, Any]) -> Any:
+    """Entry point in the worker process."""
+    fn = ref.resolve()
+    return get_cached_typeadapter(fn).validate_python(arguments)
+
+
+class ProcessPool:
+    """
+    A lazily started ProcessPoolExecutor for CPU-bound tool functions.
+
+    Arguments and results are pickled. If a worker process dies, the pool is
+    replaced and the calls that were running on it fail with a ToolError.
+
+    A call that times out stops waiting for its result, but a function that is
+    already running can't be interrupted: it keeps its worker process busy
+    until it returns, and its result is discarded. Calls that haven't started
+    yet are cancelled.
+
+    Args:
+        max_workers: The number of worker processes. Defaults to
+            `fastmcp.settings.process_pool_workers`, or the number of CPUs.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers or fastmcp.settings.process_pool_workers
+            )
+        return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        # Concurrent failures may all try to replace the same broken executor
+        if self._executor is executor:
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def call(
+        self,
+        fn: Callable[..., Any],
+        arguments: dict[str, Any],
+        timeout: float | None = None,
+    ) -> Any:
+        """
+        Validate `arguments` against `fn`'s signature and call it in a worker
+        process, returning its result.
+
+        Raises:
+            ToolError: If the call times out or its worker process crashes.
+        """
+        ref = FunctionRef.from_function(fn)
+        executor = self._get_executor()
+        try:
+            future: Future[Any] = executor.submit(_run_function, ref, arguments)
+        except BrokenProcessPool:
+            # The pool broke after a previous call; start a new one
+            self._discard_executor(executor)
+            executor = self._get_executor()
+            future = executor.submit(_run_function, ref, arguments)
+
+        try:
+            with anyio.fail_after(timeout):
+                # Wait on the event loop rather than blocking a thread per call
+                return await asyncio.wrap_future(future)
+        except TimeoutError:
+            future.cancel()
+            raise ToolError(
+                f"Call to {ref.qualname!r} timed out after {timeout} seconds"
+            ) from None
+        except anyio.get_cancelled_exc_class():
+            future.cancel()
+            raise
+        except CancelledError:
+            # The pool was shut down before the call started
+            raise ToolError(f"Call to {ref.qualname!r} was cancelled") from None
+        except BrokenProcessPool as e:
+            logger.error(f"Worker process crashed while calling {ref.qualname!r}")
+            self._discard_executor(executor)
+            raise ToolError(
+                f"Worker process crashed while calling {ref.qualname!r}"
+            ) from e
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes. The pool restarts on the next call."""
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_default_process_pool = ProcessPool()
+_process_pool_users = 0
+
+
+def get_process_pool() -> ProcessPool:
+    """
+    Return the process pool shared by all tools that run in processes.
+
+    Its worker processes are stopped when the last server lifespan using it
+    (see `process_pool_lifespan`) ends.
+    """
+    return _default_process_pool
+
+
+@asynccontextmanager
+async def process_pool_lifespan() -> AsyncIterator[None]:
+    """
+    Keep the shared process pool running, stopping its worker processes once
+    the last of the (possibly nested) lifespans using it ends.
+    """
+    global _process_pool_users
+    _process_pool_users += 1
+    try:
+        yield
+    finally:
+        _process_pool_users -= 1
+        if not _process_pool_users:
+            # Running calls finish in the background instead of blocking
+            # the event loop
+            _default_process_pool.shutdown(wait=False)
@@ -0,0 +1,131 @@
+"""Run synchronous component functions in a bounded pool of worker threads."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+import anyio
+import anyio.to_thread
+
+import fastmcp
+
+T = TypeVar("T")
+
+_current_sync_executor: ContextVar[SyncExecutor | None] = ContextVar(
+    "sync_executor", default=None
+)
+
+
+class SyncExecutor:
+    """
+    Decides whether synchronous tool, resource and prompt functions run on the
+    event loop or in worker threads, and bounds the number of worker threads.
+
+    Blocking functions called on the event loop stall every other request the
+    server is handling. When enabled, calls are handed to anyio's thread pool
+    instead, with at most `max_workers` of them running at once; further calls
+    wait for a free worker.
+
+    Args:
+        run_sync_in_thread: Whether to run sync functions in threads by default.
+            Components can override this individually. Defaults to
+            `fastmcp.settings.run_sync_in_thread`.
+        max_workers: The maximum number of concurrently running worker threads.
+            Defaults to `fastmcp.settings.sync_worker_threads`.
+    """
+
+    def __init__(
+        self,
+        run_sync_in_thread: bool | None = None,
+        max_workers: int | None = None,
+    ):
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._run_sync_in_thread = run_sync_in_thread
+        self._max_workers = max_workers
+        self._limiter: anyio.CapacityLimiter | None = None
+
+    @property
+    def run_sync_in_thread(self) -> bool:
+        if self._run_sync_in_thread is None:
+            return fastmcp.settings.run_sync_in_thread
+        return self._run_sync_in_thread
+
+    @property
+    def max_workers(self) -> int:
+        if self._max_workers is None:
+            return fastmcp.settings.sync_worker_threads
+        return self._max_workers
+
+    @property
+    def limiter(self) -> anyio.CapacityLimiter:
+        if self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(self.max_workers)
+        return self._limiter
+
+    @property
+    def active(self) -> int:
+        """The number of calls currently running in worker threads."""
+        if self._limiter is None:
+            return 0
+        return int(self._limiter.borrowed_tokens)
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of calls waiting for a free worker thread."""
+        if self._limiter is None:
+            return 0
+        return self._limiter.statistics().tasks_waiting
+
+    async def call(self, fn: Callable[[], T], run_in_thread: bool | None = None) -> T:
+        """
+        Call `fn`, in a worker thread if `run_in_thread` (or, if it is None,
+        this executor's default) says so. Coroutine functions are always called
+        on the event loop.
+
+        `fn` may return an awaitable, e.g. when it validates arguments for an
+        async function; the caller is responsible for awaiting it.
+        """
+        if run_in_thread is None:
+            run_in_thread = self.run_sync_in_thread
+        if not run_in_thread or is_coroutine_callable(fn):
+            return fn()
+        return await anyio.to_thread.run_sync(fn, limiter=self.limiter)
+
+
+_default_sync_executor = SyncExecutor()
+
+
+def get_sync_executor() -> SyncExecutor:
+    """
+    Return the executor for the server handling the current request, or the
+    default executor configured by fastmcp.settings.
+    """
+    return _current_sync_executor.get() or _default_sync_executor
+
+
+@contextmanager
+def use_sync_executor(executor: SyncExecutor | None) -> Iterator[None]:
+    """Make `executor` the current executor. None keeps the current one."""
+    if executor is None:
+        yield
+        return
+    token = _current_sync_executor.set(executor)
+    try:
+        yield
+    finally:
+        _current_sync_executor.reset(token)
+
+
+def is_coroutine_callable(fn: Any) -> bool:
+    """Whether calling `fn` returns a coroutine rather than doing the work."""
+    while isinstance(fn, functools.partial):
+        fn = fn.func
+    return inspect.iscoroutinefunction(fn) or inspect.iscoroutinefunction(
+        getattr(fn, "__call__", None)
+    )
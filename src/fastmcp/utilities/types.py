@@ -18,6 +18,7 @@ from typing import (
     get_origin,
     get_type_hints,
 )
+from weakref import WeakKeyDictionary
 
 import mcp.types
 from mcp.types import Annotations, ContentBlock, ModelPreferences, SamplingMessage
@@ -150,10 +151,58 @@ def find_kwarg_by_type(fn: Callable, kwarg_type: type) -> str | None:
     Find the name of the kwarg that is of type kwarg_type.
 
     Includes union types that contain the kwarg_type, as well as Annotated types.
+
+    Components call this on every invocation to find their Context parameter,
+    so results are cached per function, for as long as the function exists.
+    Callables that can't be weakly referenced are analyzed on each call.
     """
     if inspect.ismethod(fn) and hasattr(fn, "__func__"):
         fn = fn.__func__
 
+    try:
+        results = _kwarg_by_type_cache.get(fn)
+    except TypeError:
+        # Unhashable or not weakly referenceable
+        return _find_kwarg_by_type(fn, kwarg_type)
+    if results is None:
+        results = {}
+        try:
+            _kwarg_by_type_cache[fn] = results
+        except TypeError:
+            return _find_kwarg_by_type(fn, kwarg_type)
+    if kwarg_type not in results:
+        results[kwarg_type] = _find_kwarg_by_type(fn, kwarg_type)
+    return results[kwarg_type]
+
+
+def get_cached_signature(fn: Callable) -> inspect.Signature:
+    """
+    Return inspect.signature(fn), cached per function for as long as the
+    function exists. Callables that can't be weakly referenced are inspected
+    on each call.
+    """
+    try:
+        sig = _signature_cache.get(fn)
+    except TypeError:
+        return inspect.signature(fn)
+    if sig is None:
+        sig = inspect.signature(fn)
+        try:
+            _signature_cache[fn] = sig
+        except TypeError:
+            pass
+    return sig
+
+
+# Keyed weakly, so that caching doesn't keep functions (and everything they
+# reference) alive after their components are gone
+_signature_cache: WeakKeyDictionary[Callable, inspect.Signature] = WeakKeyDictionary()
+_kwarg_by_type_cache: WeakKeyDictionary[Callable, dict[type, str | None]] = (
+    WeakKeyDictionary()
+)
+
+
+def _find_kwarg_by_type(fn: Callable, kwarg_type: type) -> str | None:
     # Try to get resolved type hints
     try:
         # Use include_extras=True to preserve Annotated metadata
@@ -0,0 +1,137 @@
+import anyio
+import pytest
+from exceptiongroup import ExceptionGroup
+from mcp.types import TextResourceContents
+
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ToolError
+
+
+@pytest.fixture
+def fastmcp_server():
+    mcp = FastMCP()
+    mcp.running = 0  # type: ignore[attr-defined]
+    mcp.peak = 0  # type: ignore[attr-defined]
+
+    @mcp.tool
+    async def sleep_echo(value: int, seconds: float = 0.02) -> int:
+        mcp.running += 1  # type: ignore[attr-defined]
+        mcp.peak = max(mcp.peak, mcp.running)  # type: ignore[attr-defined]
+        try:
+            await anyio.sleep(seconds)
+        finally:
+            mcp.running -= 1  # type: ignore[attr-defined]
+        return value
+
+    @mcp.tool
+    def fail() -> None:
+        raise ToolError("failed")
+
+    @mcp.resource("data://value")
+    def value() -> str:
+        return "value"
+
+    @mcp.prompt
+    def greet(name: str) -> str:
+        return f"Hello, {name}!"
+
+    return mcp
+
+
+async def test_calls_run_concurrently_and_keep_order(fastmcp_server: FastMCP):
+    async with Client(fastmcp_server) as client:
+        async with client.batch() as batch:
+            for i in range(4):
+                # Earlier calls take longer, so they finish last
+                batch.call_tool("sleep_echo", {"value": i, "seconds": 0.05 - i * 0.01})
+
+    assert fastmcp_server.peak == 4  # type: ignore[attr-defined]
+    assert [result.data for result in batch.results()] == [0, 1, 2, 3]
+
+
+async def test_max_concurrency(fastmcp_server: FastMCP):
+    async with Client(fastmcp_server) as client:
+        async with client.batch(max_concurrency=2) as batch:
+            for i in range(5):
+                batch.call_tool("sleep_echo", {"value": i})
+
+    assert fastmcp_server.peak == 2  # type: ignore[attr-defined]
+    assert [result.data for result in batch.results()] == [0, 1, 2, 3, 4]
+
+
+async def test_mixed_requests(fastmcp_server: FastMCP):
+    async with Client(fastmcp_server) as client:
+        async with client.batch() as batch:
+            tools = batch.list_tools()
+            resource = batch.read_resource("data://value")
+            prompt = batch.get_prompt("greet", {"name": "World"})
+            prompts = batch.list_prompts()
+
+    assert {tool.name for tool in tools.result()} == {"sleep_echo", "fail"}
+    contents = resource.result()
+    assert isinstance(contents[0], TextResourceContents)
+    assert contents[0].text == "value"
+    assert prompt.result().messages[0].content.text == "Hello, World!"  # type: ignore[attr-defined]
+    assert [p.name for p in prompts.result()] == ["greet"]
+
+
+async def test_await_call_inside_batch(fastmcp_server: FastMCP):
+    async with Client(fastmcp_server) as client:
+        async with client.batch() as batch:
+            first = batch.call_tool("sleep_echo", {"value": 1})
+            result = await first
+            second = batch.call_tool("sleep_echo", {"value": result.data + 1})
+
+    assert second.result().data == 2
+
+
+async def test_errors_raised_after_all_calls_finish(fastmcp_server: FastMCP):
+    async with Client(fastmcp_server) as client:
+        with pytest.raises(ExceptionGroup, match="1 of 2") as exc_info:
+            async with client.batch() as batch:
+                ok = batch.call_tool("sleep_echo", {"value": 1})
+                failed = batch.call_tool("fail")
+
+    assert ok.result().data == 1
+    assert isinstance(failed.exception(), ToolError)
+    assert exc_info.value.exceptions == (failed.exception(),)
+
+
+async def test_all_errors_are_raised(fastmcp_server: FastMCP):
+    async with Client(fastmcp_server) as client:
+        with pytest.raises(ExceptionGroup, match="2 of 3") as exc_info:
+            async with client.batch() as batch:
+                first = batch.call_tool("fail")
+                batch.call_tool("sleep_echo", {"value": 1})
+                second = batch.get_prompt("missing")
+
+    assert exc_info.value.exceptions == (first.exception(), second.exception())
+
+
+async def test_per_call_timeout(fastmcp_server: FastMCP):
+    async with Client(fastmcp_server) as client:
+        with pytest.raises(ExceptionGroup) as exc_info:
+            async with client.batch(timeout=5) as batch:
+                slow = batch.call_tool(
+                    "sleep_echo", {"value": 1, "seconds": 5}, timeout=0.05
+                )
+                fast = batch.call_tool("sleep_echo", {"value": 2})
+
+    assert isinstance(slow.exception(), TimeoutError)
+    assert exc_info.value.exceptions == (slow.exception(),)
+    assert fast.result().data == 2
+
+
+async def test_result_before_done(fastmcp_server: FastMCP):
+    async with Client(fastmcp_server) as client:
+        async with client.batch() as batch:
+            call = batch.call_tool("sleep_echo", {"value": 1})
+            with pytest.raises(RuntimeError, match="not finished"):
+                call.result()
+
+
+async def test_requires_connected_client(fastmcp_server: FastMCP):
+    client = Client(fastmcp_server)
+    with pytest.raises(RuntimeError, match="not connected"):
+        async with client.batch():
+            pass
@@ -1,7 +1,7 @@
 import asyncio
 import sys
 from typing import cast
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import mcp
 import pytest
@@ -147,6 +147,40 @@ async def test_call_tool_mcp(fastmcp_server):
         assert "Hello, World!" in content_str
 
 
+async def test_call_tool_mcp_with_known_output_schema(fastmcp_server):
+    """A known output schema validates the result without listing tools."""
+    async with Client(transport=FastMCPTransport(fastmcp_server)) as client:
+        tool = await fastmcp_server.get_tool("add")
+        result = await client.call_tool_mcp(
+            "add", {"a": 1, "b": 2}, output_schema=tool.output_schema
+        )
+        assert result.structuredContent == {"result": 3}
+        assert "add" not in client.session._tool_output_schemas
+
+        with pytest.raises(RuntimeError, match="Invalid structured content"):
+            await client.call_tool_mcp(
+                "add",
+                {"a": 1, "b": 2},
+                output_schema={
+                    "type": "object",
+                    "properties": {"result": {"type": "string"}},
+                },
+            )
+
+
+async def test_call_tool_mcp_without_output_schema(fastmcp_server):
+    """Without a known schema, the session's own call and validation are used."""
+    async with Client(transport=FastMCPTransport(fastmcp_server)) as client:
+        with patch.object(
+            client.session, "call_tool", wraps=client.session.call_tool
+        ) as call_tool:
+            result = await client.call_tool_mcp(
+                "add", {"a": 1, "b": 2}, output_schema=None
+            )
+        assert result.structuredContent == {"result": 3}
+        call_tool.assert_awaited_once()
+
+
 async def test_list_resources(fastmcp_server):
     """Test listing resources with InMemoryClient."""
     client = Client(transport=FastMCPTransport(fastmcp_server))
@@ -0,0 +1,128 @@
+from dataclasses import dataclass
+
+import pytest
+
+from fastmcp import Client, Context, FastMCP
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+@pytest.fixture
+def fastmcp_server():
+    mcp = FastMCP()
+
+    @mcp.tool
+    def point() -> Point:
+        return Point(x=1, y=2)
+
+    @mcp.tool
+    def count() -> int:
+        return 3
+
+    @mcp.tool
+    async def notify(ctx: Context) -> None:
+        await ctx.send_tool_list_changed()
+
+    return mcp
+
+
+class TestOutputTypeCache:
+    async def test_output_type_compiled_once(self, fastmcp_server: FastMCP):
+        async with Client(fastmcp_server) as client:
+            first = await client.call_tool("point")
+            output_type = client._session_state.output_types._types["point"]
+            second = await client.call_tool("point")
+            assert client._session_state.output_types._types["point"] is output_type
+        assert first.data.x == second.data.x == 1
+        assert second.data.y == 2
+
+    async def test_wrapped_result(self, fastmcp_server: FastMCP):
+        async with Client(fastmcp_server) as client:
+            result = await client.call_tool("count")
+            assert client._session_state.output_types._types["count"].wrap_result
+        assert result.data == 3
+
+    async def test_identical_listing_reuses_output_type(self, fastmcp_server: FastMCP):
+        async with Client(fastmcp_server) as client:
+            await client.call_tool("point")
+            output_type = client._session_state.output_types._types["point"]
+            tools = await client.list_tools()
+            assert client._session_state.output_types._types["point"] is output_type
+            # The entry now tracks the schema from the latest listing
+            schema = next(tool for tool in tools if tool.name == "point").outputSchema
+            assert output_type.schema is schema
+
+    async def test_listing_drops_removed_tools(self, fastmcp_server: FastMCP):
+        async with Client(fastmcp_server) as client:
+            await client.call_tool("point")
+            fastmcp_server.remove_tool("point")
+            await client.list_tools()
+            assert "point" not in client._session_state.output_types._types
+
+    async def test_changed_schema_is_recompiled(self, fastmcp_server: FastMCP):
+        async with Client(fastmcp_server) as client:
+            await client.call_tool("point")
+            output_type = client._session_state.output_types._types["point"]
+
+            fastmcp_server.remove_tool("point")
+
+            @fastmcp_server.tool
+            def point() -> dict[str, str]:
+                return {"x": "a"}
+
+            await client.list_tools()
+            result = await client.call_tool("point")
+            assert client._session_state.output_types._types["point"] is not (
+                output_type
+            )
+        assert result.data == {"x": "a"}
+
+    async def test_list_changed_notification_clears_cache(
+        self, fastmcp_server: FastMCP
+    ):
+        messages = []
+
+        async def message_handler(message):
+            messages.append(message)
+
+        async with Client(fastmcp_server, message_handler=message_handler) as client:
+            await client.call_tool("point")
+            assert "point" in client._session_state.output_types._types
+            await client.call_tool("notify")
+            assert client._session_state.output_types._types == {}
+        # The configured message handler still receives the notification
+        assert any(
+            getattr(message, "root", None) is not None
+            and message.root.method == "notifications/tools/list_changed"
+            for message in messages
+        )
+
+    async def test_list_changed_notification_refreshes_schemas(
+        self, fastmcp_server: FastMCP
+    ):
+        @fastmcp_server.tool
+        async def reshape(ctx: Context) -> None:
+            fastmcp_server.remove_tool("point")
+
+            @fastmcp_server.tool
+            def point() -> dict[str, str]:
+                return {"x": "a"}
+
+            await ctx.send_tool_list_changed()
+
+        async with Client(fastmcp_server) as client:
+            await client.call_tool("point")
+            await client.call_tool("reshape")
+            # The new schema is listed before validating the next result
+            result = await client.call_tool("point")
+        assert result.data == {"x": "a"}
+
+    async def test_cache_cleared_on_disconnect(self, fastmcp_server: FastMCP):
+        client = Client(fastmcp_server)
+        async with client:
+            await client.call_tool("point")
+        assert client._session_state.output_types._types == {}
@@ -0,0 +1,144 @@
+import mcp.types
+import pytest
+from mcp import McpError
+
+from fastmcp import Client, FastMCP
+from fastmcp.utilities.tests import temporary_settings
+
+
+@pytest.fixture
+def fastmcp_server():
+    mcp = FastMCP(list_page_size=2)
+
+    for i in range(5):
+
+        @mcp.tool(name=f"tool_{i}")
+        def tool(i: int = i) -> int:
+            return i
+
+        @mcp.resource(f"data://resource_{i}", name=f"resource_{i}")
+        def resource() -> str:
+            return "resource"
+
+        @mcp.resource(f"data://template_{i}/{{id}}", name=f"template_{i}")
+        def template(id: str) -> str:
+            return id
+
+        @mcp.prompt(name=f"prompt_{i}")
+        def prompt(i: int = i) -> str:
+            return str(i)
+
+    return mcp
+
+
+class TestServerPagination:
+    async def test_pages(self, fastmcp_server: FastMCP):
+        first = await fastmcp_server._mcp_list_tools()
+        assert [tool.name for tool in first.tools] == ["tool_0", "tool_1"]
+        assert first.nextCursor is not None
+
+        second = await fastmcp_server._mcp_list_tools(first.nextCursor)
+        assert [tool.name for tool in second.tools] == ["tool_2", "tool_3"]
+
+        last = await fastmcp_server._mcp_list_tools(second.nextCursor)
+        assert [tool.name for tool in last.tools] == ["tool_4"]
+        assert last.nextCursor is None
+
+    async def test_no_page_size_returns_everything(self):
+        mcp = FastMCP()
+
+        @mcp.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        result = await mcp._mcp_list_tools()
+        assert [tool.name for tool in result.tools] == ["add"]
+        assert result.nextCursor is None
+
+    def test_page_size_from_settings(self):
+        with temporary_settings(list_page_size=10):
+            assert FastMCP().list_page_size == 10
+
+    def test_invalid_page_size(self):
+        with pytest.raises(ValueError, match="at least 1"):
+            FastMCP(list_page_size=0)
+
+    async def test_invalid_cursor(self, fastmcp_server: FastMCP):
+        async with Client(fastmcp_server) as client:
+            with pytest.raises(McpError, match="Invalid cursor"):
+                await client.list_tools_mcp(cursor="not a cursor")
+
+    async def test_tool_cache_holds_every_page(self, fastmcp_server: FastMCP):
+        async with Client(fastmcp_server) as client:
+            # Calling a tool makes the low-level server load the tools it
+            # validates calls against
+            result = await client.call_tool("tool_4")
+        assert result.data == 4
+        assert set(fastmcp_server._mcp_server._tool_cache) == {
+            f"tool_{i}" for i in range(5)
+        }
+
+
+class TestClientPagination:
+    async def test_list_methods_fetch_every_page(self, fastmcp_server: FastMCP):
+        async with Client(fastmcp_server) as client:
+            tools = await client.list_tools()
+            resources = await client.list_resources()
+            templates = await client.list_resource_templates()
+            prompts = await client.list_prompts()
+        assert [tool.name for tool in tools] == [f"tool_{i}" for i in range(5)]
+        assert [resource.name for resource in resources] == [
+            f"resource_{i}" for i in range(5)
+        ]
+        assert [template.name for template in templates] == [
+            f"template_{i}" for i in range(5)
+        ]
+        assert [prompt.name for prompt in prompts] == [f"prompt_{i}" for i in range(5)]
+
+    async def test_mcp_methods_return_a_page(self, fastmcp_server: FastMCP):
+        async with Client(fastmcp_server) as client:
+            first = await client.list_prompts_mcp()
+            second = await client.list_prompts_mcp(cursor=first.nextCursor)
+        assert [prompt.name for prompt in first.prompts] == ["prompt_0", "prompt_1"]
+        assert [prompt.name for prompt in second.prompts] == ["prompt_2", "prompt_3"]
+
+    async def test_iter_fetches_pages_lazily(self, fastmcp_server: FastMCP):
+        requests: list[str | None] = []
+
+        async with Client(fastmcp_server) as client:
+            list_tools_mcp = client.list_tools_mcp
+
+            async def record(cursor: str | None = None) -> mcp.types.ListToolsResult:
+                requests.append(cursor)
+                return await list_tools_mcp(cursor)
+
+            client.list_tools_mcp = record  # type: ignore[method-assign]
+
+            names = []
+            async for tool in client.iter_tools():
+                names.append(tool.name)
+                if tool.name == "tool_2":
+                    break
+
+        assert names == ["tool_0", "tool_1", "tool_2"]
+        # The last page was never requested
+        assert len(requests) == 2
+
+    async def test_repeated_cursor(self, fastmcp_server: FastMCP):
+        async with Client(fastmcp_server) as client:
+
+            async def list_tools_mcp(
+                cursor: str | None = None,
+            ) -> mcp.types.ListToolsResult:
+                return mcp.types.ListToolsResult(tools=[], nextCursor="same")
+
+            client.list_tools_mcp = list_tools_mcp  # type: ignore[method-assign]
+
+            with pytest.raises(RuntimeError, match="same list cursor"):
+                await client.list_tools()
+
+    async def test_proxy_lists_every_page(self, fastmcp_server: FastMCP):
+        proxy = FastMCP.as_proxy(fastmcp_server)
+        async with Client(proxy) as client:
+            tools = await client.list_tools()
+        assert len(tools) == 5
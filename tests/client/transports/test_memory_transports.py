@@ -0,0 +1,311 @@
+"""Behavior shared by the in-memory transports for FastMCP servers."""
+
+import anyio
+import pytest
+from mcp import McpError
+from mcp.server.lowlevel.server import Server
+from mcp.types import BlobResourceContents, TextContent, TextResourceContents
+from pydantic import AnyUrl
+
+from fastmcp import Client, Context, FastMCP
+from fastmcp.client import transports
+from fastmcp.client.transports import (
+    DirectFastMCPTransport,
+    FastMCPTransport,
+    MCPConfigTransport,
+)
+from fastmcp.exceptions import ToolError
+from fastmcp.mcp_config import MCPConfig
+
+
+@pytest.fixture
+def server() -> FastMCP:
+    mcp = FastMCP("MemoryServer")
+
+    @mcp.tool
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    @mcp.tool
+    def echo(value: str | list[str]) -> str | list[str]:
+        return value
+
+    @mcp.tool
+    def mutate(items: list[int]) -> list[int]:
+        items.append(0)
+        return items
+
+    @mcp.tool
+    def fail() -> None:
+        raise ToolError("tool failed")
+
+    @mcp.tool
+    async def sleep(seconds: float) -> None:
+        await anyio.sleep(seconds)
+
+    @mcp.tool
+    async def progress(ctx: Context) -> str:
+        for i in range(3):
+            await ctx.report_progress(progress=i + 1, total=3)
+        return "done"
+
+    @mcp.tool
+    async def log(ctx: Context) -> str:
+        await ctx.info("hello")
+        return "logged"
+
+    @mcp.tool
+    async def sample(ctx: Context) -> str:
+        result = await ctx.sample("ping")
+        return result.text  # type: ignore[attr-defined]
+
+    @mcp.tool
+    def request_info(ctx: Context) -> dict[str, str | None]:
+        meta = ctx.request_context.meta
+        return {
+            "request_id": ctx.request_id,
+            "progress_token": str(meta.progressToken) if meta else None,
+        }
+
+    @mcp.resource("data://text")
+    def text() -> str:
+        return "text"
+
+    @mcp.resource("data://blob")
+    def blob() -> bytes:
+        return b"\x00\x01"
+
+    @mcp.resource("data://items/{item_id}")
+    def item(item_id: str) -> str:
+        return f"item {item_id}"
+
+    @mcp.prompt
+    def greet(name: str) -> str:
+        return f"Hello, {name}!"
+
+    return mcp
+
+
+@pytest.fixture(params=[FastMCPTransport, DirectFastMCPTransport])
+def transport_cls(request: pytest.FixtureRequest) -> type[FastMCPTransport]:
+    return request.param
+
+
+@pytest.fixture
+def client(server: FastMCP, transport_cls: type[FastMCPTransport]) -> Client:
+    return Client(transport_cls(server))
+
+
+class TestConformance:
+    async def test_ping(self, client: Client):
+        async with client:
+            assert await client.ping()
+
+    async def test_list_components(self, client: Client):
+        async with client:
+            tools = await client.list_tools()
+            resources = await client.list_resources()
+            templates = await client.list_resource_templates()
+            prompts = await client.list_prompts()
+        assert "add" in {tool.name for tool in tools}
+        assert {str(resource.uri) for resource in resources} == {
+            "data://text",
+            "data://blob",
+        }
+        assert [template.uriTemplate for template in templates] == [
+            "data://items/{item_id}"
+        ]
+        assert [prompt.name for prompt in prompts] == ["greet"]
+
+    async def test_call_tool(self, client: Client):
+        async with client:
+            result = await client.call_tool("add", {"a": 1, "b": 2})
+        assert result.data == 3
+        assert result.structured_content == {"result": 3}
+
+    async def test_arguments_are_json_compatible(self, client: Client):
+        async with client:
+            result = await client.call_tool("echo", {"value": ("a", "b")})
+        assert result.data == ["a", "b"]
+
+    async def test_arguments_are_not_shared(self, client: Client):
+        items = [1, 2]
+        async with client:
+            result = await client.call_tool("mutate", {"items": items})
+        assert result.data == [1, 2, 0]
+        assert items == [1, 2]
+
+    async def test_tool_error(self, client: Client):
+        async with client:
+            with pytest.raises(ToolError, match="tool failed"):
+                await client.call_tool("fail", {})
+
+    async def test_unknown_tool(self, client: Client):
+        async with client:
+            with pytest.raises(ToolError, match="Unknown tool"):
+                await client.call_tool("missing", {})
+
+    async def test_read_resources(self, client: Client):
+        async with client:
+            text = await client.read_resource("data://text")
+            blob = await client.read_resource(AnyUrl("data://blob"))
+            item = await client.read_resource("data://items/42")
+        assert isinstance(text[0], TextResourceContents)
+        assert text[0].text == "text"
+        assert isinstance(blob[0], BlobResourceContents)
+        assert blob[0].blob == "AAE="
+        assert isinstance(item[0], TextResourceContents)
+        assert item[0].text == "item 42"
+
+    async def test_unknown_resource(self, client: Client):
+        async with client:
+            with pytest.raises(McpError, match="Unknown resource"):
+                await client.read_resource("data://missing")
+
+    async def test_get_prompt(self, client: Client):
+        async with client:
+            result = await client.get_prompt("greet", {"name": "World"})
+        assert isinstance(result.messages[0].content, TextContent)
+        assert result.messages[0].content.text == "Hello, World!"
+
+    async def test_progress_arrives_before_result(self, client: Client):
+        updates: list[float] = []
+
+        async def handler(progress: float, total: float | None, message: str | None):
+            updates.append(progress)
+
+        async with client:
+            result = await client.call_tool("progress", {}, progress_handler=handler)
+            # Every update was handled by the time the result is returned
+            assert updates == [1, 2, 3]
+        assert result.data == "done"
+
+    async def test_log_arrives_before_result(
+        self, server: FastMCP, transport_cls: type[FastMCPTransport]
+    ):
+        messages: list[str] = []
+
+        async def log_handler(message):
+            messages.append(message.data["msg"])
+
+        async with Client(transport_cls(server), log_handler=log_handler) as client:
+            await client.call_tool("log", {})
+            assert messages == ["hello"]
+
+    async def test_sampling(
+        self, server: FastMCP, transport_cls: type[FastMCPTransport]
+    ):
+        def sampling_handler(messages, params, ctx) -> str:
+            return "pong"
+
+        async with Client(
+            transport_cls(server), sampling_handler=sampling_handler
+        ) as client:
+            result = await client.call_tool("sample", {})
+        assert result.data == "pong"
+
+    async def test_request_context(self, client: Client):
+        async with client:
+            first = await client.call_tool("request_info", {})
+            second = await client.call_tool("request_info", {})
+        assert first.data["request_id"] != second.data["request_id"]
+        # Progress is reported against the request id
+        assert first.data["progress_token"] == first.data["request_id"]
+
+    async def test_timeout(self, client: Client):
+        async with client:
+            with pytest.raises(McpError, match="Timed out"):
+                await client.call_tool("sleep", {"seconds": 1}, timeout=0.05)
+            # The session is still usable
+            result = await client.call_tool("add", {"a": 1, "b": 1})
+        assert result.data == 2
+
+    async def test_concurrent_requests(self, client: Client):
+        results: dict[int, int] = {}
+
+        async with client:
+
+            async def call(i: int) -> None:
+                result = await client.call_tool("add", {"a": i, "b": i})
+                results[i] = result.data
+
+            async with anyio.create_task_group() as tg:
+                for i in range(10):
+                    tg.start_soon(call, i)
+        assert results == {i: 2 * i for i in range(10)}
+
+
+class TestDirectFastMCPTransport:
+    async def test_timeout_cancels_handler(self):
+        server = FastMCP()
+        cancelled = anyio.Event()
+
+        @server.tool
+        async def wait() -> None:
+            try:
+                await anyio.sleep(5)
+            except anyio.get_cancelled_exc_class():
+                cancelled.set()
+                raise
+
+        async with Client(DirectFastMCPTransport(server)) as client:
+            with pytest.raises(McpError, match="Timed out"):
+                await client.call_tool("wait", {}, timeout=0.05)
+            with anyio.fail_after(1):
+                await cancelled.wait()
+
+    async def test_raise_exceptions(self):
+        server = FastMCP()
+
+        @server.resource("data://broken")
+        def broken() -> str:
+            raise ValueError("broken resource")
+
+        async with Client(
+            DirectFastMCPTransport(server, raise_exceptions=True)
+        ) as client:
+            with pytest.raises(Exception, match="broken resource"):
+                await client.read_resource("data://broken")
+
+    def test_supported_by_the_installed_sdk(self):
+        assert DirectFastMCPTransport.is_supported()
+
+    def test_unsupported_for_untested_sdk_releases(self, monkeypatch):
+        monkeypatch.setattr(transports, "_DIRECT_DISPATCH_MCP_VERSIONS", set())
+        assert not DirectFastMCPTransport.is_supported()
+
+    def test_unsupported_without_sdk_internals(self, monkeypatch):
+        monkeypatch.delattr(Server, "_handle_message")
+        assert not DirectFastMCPTransport.is_supported()
+
+    async def test_used_for_in_process_proxies(self, server: FastMCP):
+        proxy = FastMCP.as_proxy(server)
+        assert isinstance(proxy.client_factory().transport, DirectFastMCPTransport)
+        async with Client(proxy) as client:
+            result = await client.call_tool("add", {"a": 1, "b": 2})
+            assert result.data == 3
+
+    def test_proxies_fall_back_on_unsupported_sdks(self, server: FastMCP, monkeypatch):
+        monkeypatch.setattr(transports, "_DIRECT_DISPATCH_MCP_VERSIONS", set())
+        proxy = FastMCP.as_proxy(server)
+        transport = proxy.client_factory().transport
+        assert type(transport) is FastMCPTransport
+
+    def test_used_for_mcp_config_composites(self):
+        config = MCPConfig.from_dict(
+            {
+                "mcpServers": {
+                    "one": {"url": "http://localhost:1/mcp"},
+                    "two": {"url": "http://localhost:2/mcp"},
+                }
+            }
+        )
+        transport = MCPConfigTransport(config)
+        assert isinstance(transport.transport, DirectFastMCPTransport)
+
+    async def test_proxy_with_explicit_transport(self, server: FastMCP):
+        proxy = FastMCP.as_proxy(DirectFastMCPTransport(server))
+        assert isinstance(proxy.client_factory().transport, DirectFastMCPTransport)
+        async with Client(proxy) as client:
+            result = await client.call_tool("add", {"a": 1, "b": 2})
+            assert result.data == 3
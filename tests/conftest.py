@@ -15,3 +15,14 @@ def import_rich_rule():
     import rich.rule  # noqa: F401
 
     yield
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_http_client():
+    # A test that fails inside a server lifespan can skip its exit, which would
+    # leave the shared HTTP client open and its user count raised for later tests
+    from fastmcp.utilities import http
+
+    yield
+    http._http_clients.clear()
+    http._http_client_users.clear()
@@ -1,14 +1,17 @@
+import asyncio
 from typing import Any
 
+import anyio
 import pytest
 from mcp.types import TextContent
 
-from fastmcp import FastMCP
+from fastmcp import Client, Context, FastMCP
 from fastmcp.contrib.bulk_tool_caller.bulk_tool_caller import (
     BulkToolCaller,
     CallToolRequest,
     CallToolRequestResult,
 )
+from fastmcp.server.middleware import Middleware
 from fastmcp.tools.tool import Tool
 
 
@@ -76,10 +79,12 @@ def live_server_with_tool() -> FastMCP:
     return server
 
 
-@pytest.fixture
-def bulk_caller_live(live_server_with_tool: FastMCP) -> BulkToolCaller:
+@pytest.fixture(params=[False, True], ids=["transport", "in_process"])
+def bulk_caller_live(
+    live_server_with_tool: FastMCP, request: pytest.FixtureRequest
+) -> BulkToolCaller:
     """Fixture to create a BulkToolCaller instance connected to the live server."""
-    bulk_tool_caller = BulkToolCaller()
+    bulk_tool_caller = BulkToolCaller(in_process=request.param)
     bulk_tool_caller.register_tools(live_server_with_tool)
     return bulk_tool_caller
 
@@ -214,3 +219,151 @@ async def test_call_tools_bulk_error_continues(bulk_caller_live: BulkToolCaller)
 
     success_result = results[1]
     assert success_result == expected_success_result
+
+
+class TestConcurrentBulkCalls:
+    @pytest.fixture
+    def server(self) -> FastMCP:
+        server = FastMCP()
+        self.running = 0
+        self.peak = 0
+
+        @server.tool
+        async def slow_echo(arg1: str, delay: float = 0.02) -> str:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            try:
+                await anyio.sleep(delay)
+            finally:
+                self.running -= 1
+            return arg1
+
+        @server.tool
+        async def fail(arg1: str) -> str:
+            raise ToolException(arg1)
+
+        @server.tool
+        def session_id(ctx: Context) -> int:
+            return id(ctx.session)
+
+        return server
+
+    @pytest.fixture
+    def bulk_caller(self, server: FastMCP) -> BulkToolCaller:
+        bulk_tool_caller = BulkToolCaller()
+        bulk_tool_caller.register_tools(server)
+        return bulk_tool_caller
+
+    async def test_calls_share_a_session(self, bulk_caller: BulkToolCaller):
+        results = await bulk_caller.call_tool_bulk("session_id", [{}, {}, {}])
+        assert len({result.content[0].text for result in results}) == 1  # type: ignore[attr-defined]
+
+    async def test_sequential_by_default(self, bulk_caller: BulkToolCaller):
+        await bulk_caller.call_tool_bulk("slow_echo", [{"arg1": "a"}, {"arg1": "b"}])
+        assert self.peak == 1
+
+    def record_call_tasks(self, bulk_caller: BulkToolCaller) -> set[asyncio.Task]:
+        """Record the tasks that `bulk_caller` makes its calls from."""
+        tasks: set[asyncio.Task] = set()
+        call_tool = bulk_caller._call_tool
+
+        async def record_task(*args):
+            tasks.add(asyncio.current_task())  # type: ignore[arg-type]
+            return await call_tool(*args)
+
+        bulk_caller._call_tool = record_task  # type: ignore[method-assign]
+        return tasks
+
+    async def test_sequential_calls_run_in_the_calling_task(
+        self, bulk_caller: BulkToolCaller
+    ):
+        tasks = self.record_call_tasks(bulk_caller)
+        await bulk_caller.call_tool_bulk("slow_echo", [{"arg1": "a"}, {"arg1": "b"}])
+        await bulk_caller.call_tool_bulk(
+            "slow_echo", [{"arg1": "a"}], max_concurrency=5
+        )
+        assert tasks == {asyncio.current_task()}
+
+    async def test_starts_at_most_max_concurrency_workers(
+        self, bulk_caller: BulkToolCaller
+    ):
+        tasks = self.record_call_tasks(bulk_caller)
+        tool_arguments: list[dict[str, str | int | float | bool | None]] = [
+            {"arg1": str(i), "delay": 0} for i in range(20)
+        ]
+        results = await bulk_caller.call_tool_bulk(
+            "slow_echo", tool_arguments, max_concurrency=3
+        )
+        assert [result.content[0].text for result in results] == [  # type: ignore[attr-defined]
+            str(i) for i in range(20)
+        ]
+        assert len(tasks) == 3
+
+    async def test_max_concurrency_preserves_order(self, bulk_caller: BulkToolCaller):
+        # Earlier calls take longer, so they finish last
+        tool_arguments: list[dict[str, str | int | float | bool | None]] = [
+            {"arg1": str(i), "delay": 0.05 - i * 0.01} for i in range(5)
+        ]
+        results = await bulk_caller.call_tool_bulk(
+            "slow_echo", tool_arguments, max_concurrency=3
+        )
+        assert self.peak == 3
+        assert [result.content[0].text for result in results] == [  # type: ignore[attr-defined]
+            "0",
+            "1",
+            "2",
+            "3",
+            "4",
+        ]
+
+    async def test_error_cancels_later_calls(self, bulk_caller: BulkToolCaller):
+        tool_calls = [
+            CallToolRequest(tool="slow_echo", arguments={"arg1": "a", "delay": 0.1}),
+            CallToolRequest(tool="fail", arguments={"arg1": "b"}),
+            CallToolRequest(tool="slow_echo", arguments={"arg1": "c", "delay": 5}),
+            CallToolRequest(tool="slow_echo", arguments={"arg1": "d"}),
+        ]
+        with anyio.fail_after(2):
+            results = await bulk_caller.call_tools_bulk(
+                tool_calls, continue_on_error=False, max_concurrency=3
+            )
+        assert [result.tool for result in results] == ["slow_echo", "fail"]
+        assert not results[0].isError
+        assert results[1].isError
+
+
+class TestInProcessBulkCalls:
+    async def test_applies_middleware_and_filters(self):
+        server = FastMCP(exclude_tags={"hidden"})
+        called: list[str] = []
+
+        class RecordingMiddleware(Middleware):
+            async def on_call_tool(self, context, call_next):
+                called.append(context.message.name)
+                return await call_next(context)
+
+        server.add_middleware(RecordingMiddleware())
+        server.add_tool(Tool.from_function(echo_tool))
+        server.add_tool(Tool.from_function(no_return_tool, tags={"hidden"}))
+        BulkToolCaller(in_process=True).register_tools(server)
+
+        async with Client(server) as client:
+            result = await client.call_tool(
+                "call_tools_bulk",
+                {
+                    "tool_calls": [
+                        {"tool": ECHO_TOOL_NAME, "arguments": {"arg1": "a"}},
+                        {"tool": NO_RETURN_TOOL_NAME, "arguments": {"arg1": "b"}},
+                    ]
+                },
+            )
+
+        assert called == ["call_tools_bulk", ECHO_TOOL_NAME, NO_RETURN_TOOL_NAME]
+        assert result.structured_content is not None
+        results = [
+            CallToolRequestResult.model_validate(item)
+            for item in result.structured_content["result"]
+        ]
+        assert results[0] == echo_tool_result_factory("a")
+        assert results[1].isError
+        assert results[1].content[0].text == "Unknown tool: no_return_tool"  # type: ignore[attr-defined]
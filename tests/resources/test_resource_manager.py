@@ -652,3 +652,138 @@ class TestResourceErrorHandling:
         # The error message should not include the original exception details
         assert "Error reading resource 'buggy://resource'" in str(excinfo.value)
         assert "Internal error details" not in str(excinfo.value)
+
+
+class TestResourceInventoryCache:
+    """Test that resource and template inventories are cached and invalidated."""
+
+    @staticmethod
+    def make_template(uri_template: str) -> ResourceTemplate:
+        def fn(id: str) -> str:
+            return f"data {id}"
+
+        return ResourceTemplate.from_function(fn, uri_template=uri_template)
+
+    async def test_template_index_is_reused(self):
+        manager = ResourceManager()
+        manager.add_template(self.make_template("data://{id}"))
+
+        assert await manager.has_resource("data://1")
+        index = manager._template_index
+        assert await manager.has_resource("data://2")
+        assert manager._template_index is index
+
+    async def test_add_template_invalidates(self):
+        manager = ResourceManager()
+        manager.add_template(self.make_template("data://{id}"))
+        assert not await manager.has_resource("other://1")
+
+        manager.add_template(self.make_template("other://{id}"))
+        assert await manager.has_resource("other://1")
+
+    async def test_direct_registry_edit_invalidates(self):
+        manager = ResourceManager()
+        manager.add_template(self.make_template("data://{id}"))
+        assert await manager.has_resource("data://1")
+
+        manager._templates.pop("data://{id}")
+        assert not await manager.has_resource("data://1")
+
+    async def test_child_changes_propagate_to_parent(self):
+        from fastmcp import FastMCP
+
+        parent = FastMCP("Parent")
+        child = FastMCP("Child")
+        parent.mount(child, prefix="child")
+        assert not await parent._resource_manager.has_resource("data://child/1")
+
+        child.add_template(self.make_template("data://{id}"))
+        assert await parent._resource_manager.has_resource("data://child/1")
+
+    async def test_filtered_grandchild_templates_are_excluded(self):
+        from fastmcp import FastMCP
+
+        parent = FastMCP("Parent")
+        child = FastMCP("Child")
+        grandchild = FastMCP("Grandchild", exclude_tags={"hidden"})
+        child.mount(grandchild, prefix="gc")
+        parent.mount(child, prefix="c")
+
+        @grandchild.resource("data://{x}", tags={"hidden"})
+        def hidden(x: str) -> str:
+            return x
+
+        @grandchild.resource("other://{x}")
+        def visible(x: str) -> str:
+            return x
+
+        templates = await parent.get_resource_templates()
+        assert list(templates) == ["other://c/gc/{x}"]
+        assert not await parent._resource_manager.has_resource("data://c/gc/1")
+
+
+class TestResolveResource:
+    """Test that reads resolve a URI once and skip default template instantiation."""
+
+    async def test_resolve_concrete_resource(self):
+        manager = ResourceManager()
+        resource = FunctionResource(
+            uri=AnyUrl("test://hello"), name="hello", fn=lambda: "hi"
+        )
+        manager.add_resource(resource)
+
+        resolved = await manager.resolve_resource("test://hello")
+        assert resolved.component is resource
+        assert resolved.template is None
+        assert resolved.local
+        assert await manager.read_resource("test://hello", resolved=resolved) == "hi"
+
+    async def test_resolve_template_does_not_create_resource(self, monkeypatch):
+        def fn(id: str) -> str:
+            return f"data {id}"
+
+        template = ResourceTemplate.from_function(fn, uri_template="data://{id}")
+        manager = ResourceManager()
+        manager.add_template(template)
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("create_resource should not be called")
+
+        monkeypatch.setattr(ResourceTemplate, "create_resource", fail)
+
+        resolved = await manager.resolve_resource("data://1")
+        assert resolved.component is template
+        assert resolved.params == {"id": "1"}
+        assert resolved.local
+        assert await manager.read_resource("data://1", resolved=resolved) == "data 1"
+
+    async def test_custom_template_is_created_once(self):
+        calls = []
+
+        class CountingTemplate(ResourceTemplate):
+            async def create_resource(self, uri, params, context=None):
+                calls.append(uri)
+                return FunctionResource(
+                    uri=AnyUrl(uri),
+                    name=self.name,
+                    mime_type="application/json",
+                    fn=lambda: '{"id": 1}',
+                )
+
+        template = CountingTemplate(
+            uri_template="data://{id}",
+            name="counting",
+            parameters={},
+        )
+        manager = ResourceManager()
+        manager.add_template(template)
+
+        resolved = await manager.resolve_resource("data://1")
+        assert resolved.component.mime_type == "application/json"
+        assert await manager.read_resource("data://1", resolved=resolved) == '{"id": 1}'
+        assert calls == ["data://1"]
+
+    async def test_resolve_unknown_uri(self):
+        manager = ResourceManager()
+        with pytest.raises(NotFoundError, match="Unknown resource"):
+            await manager.resolve_resource("data://missing")
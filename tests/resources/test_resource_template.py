@@ -7,7 +7,7 @@ from pydantic import BaseModel
 from fastmcp import Context
 from fastmcp.resources import ResourceTemplate
 from fastmcp.resources.resource import FunctionResource
-from fastmcp.resources.template import match_uri_template
+from fastmcp.resources.template import ResourceTemplateIndex, match_uri_template
 
 
 class TestResourceTemplate:
@@ -395,6 +395,66 @@ class TestResourceTemplate:
         assert content == "X was foo"
 
 
+class TestResourceTemplateIndex:
+    """Test matching URIs through a ResourceTemplateIndex."""
+
+    @staticmethod
+    def make_template(uri_template: str) -> ResourceTemplate:
+        def fn(**kwargs) -> str:
+            return "data"
+
+        return ResourceTemplate.from_function(fn, uri_template=uri_template, name="t")
+
+    def test_matches_like_linear_scan(self):
+        keys = [
+            "test://{x}/{y}",
+            "test://a/b/{x}/c/d/{y}",
+            "prefix+test://{x}/test/{y}",
+            "other://{x}",
+        ]
+        templates = {key: self.make_template(key) for key in keys}
+        index = ResourceTemplateIndex(templates)
+
+        for uri in [
+            "test://foo/123",
+            "test://a/b/foo/c/d/123",
+            "prefix+test://foo/test/123",
+            "other://foo",
+            "missing://foo",
+        ]:
+            expected = next(
+                (
+                    (key, params)
+                    for key in keys
+                    if (params := match_uri_template(uri, key))
+                ),
+                None,
+            )
+            match = index.match(uri)
+            assert (match and (match[0], match[2])) == expected
+
+    def test_first_template_wins(self):
+        # Both templates match, and the shorter literal prefix was added first
+        templates = {
+            "test://{x}/{y}": self.make_template("test://{x}/{y}"),
+            "test://a/{y}": self.make_template("test://a/{y}"),
+        }
+        index = ResourceTemplateIndex(templates)
+
+        match = index.match("test://a/b")
+        assert match is not None
+        assert match[0] == "test://{x}/{y}"
+        assert match[1] is templates["test://{x}/{y}"]
+
+    def test_unquotes_params(self):
+        index = ResourceTemplateIndex(
+            {"user://{name}": self.make_template("user://{name}")}
+        )
+        match = index.match(f"user://{quote('John Doe', safe='')}")
+        assert match is not None
+        assert match[2] == {"name": "John Doe"}
+
+
 class TestMatchUriTemplate:
     """Test match_uri_template function."""
 
@@ -182,10 +182,12 @@ class TestGitHubTokenVerifier:
         """Test token verification when GitHub API returns error."""
         verifier = GitHubTokenVerifier()
 
-        # Mock httpx.AsyncClient to simulate GitHub API failure
-        with patch("httpx.AsyncClient") as mock_client_class:
+        # Mock the shared HTTP client to simulate GitHub API failure
+        with patch(
+            "fastmcp.server.auth.providers.github.get_http_client"
+        ) as get_http_client:
             mock_client = MagicMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            get_http_client.return_value = mock_client
 
             # Simulate 401 response from GitHub
             mock_response = MagicMock()
@@ -203,7 +205,7 @@ class TestGitHubTokenVerifier:
 
         verifier = GitHubTokenVerifier(required_scopes=["user"])
 
-        # Mock the httpx.AsyncClient directly
+        # Mock the shared HTTP client
         mock_client = AsyncMock()
 
         # Mock successful user API response
@@ -224,12 +226,10 @@ class TestGitHubTokenVerifier:
         # Set up the mock client to return our responses
         mock_client.get.side_effect = [user_response, scopes_response]
 
-        # Patch the AsyncClient context manager
         with patch(
-            "fastmcp.server.auth.providers.github.httpx.AsyncClient"
-        ) as mock_client_class:
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-
+            "fastmcp.server.auth.providers.github.get_http_client",
+            return_value=mock_client,
+        ):
             result = await verifier.verify_token("valid_token")
 
             assert result is not None
@@ -1,5 +1,9 @@
+import asyncio
+import copy
+import time
 from collections.abc import Generator
 from typing import Any
+from unittest.mock import patch
 
 import httpx
 import pytest
@@ -579,6 +583,292 @@ class TestBearerTokenJWKS:
         assert access_token is None
 
 
+class TestJWKSCaching:
+    """Tests for JWKS caching and refresh."""
+
+    JWKS_URI = "https://test.example.com/.well-known/jwks.json"
+
+    @pytest.fixture
+    def jwks_provider(self) -> JWTVerifier:
+        return JWTVerifier(jwks_uri=self.JWKS_URI, issuer="https://test.example.com")
+
+    @pytest.fixture
+    def mock_jwks_data(self, rsa_key_pair: RSAKeyPair) -> JWKSData:
+        from authlib.jose import JsonWebKey
+
+        jwk_data: JWKData = JsonWebKey.import_key(rsa_key_pair.public_key).as_dict()  # type: ignore
+        jwk_data["kid"] = "test-key-1"
+        return {"keys": [jwk_data]}
+
+    def age_cache(self, provider: JWTVerifier, seconds: float) -> None:
+        provider._jwks_cache_time -= seconds
+        provider._jwks_fetch_started -= seconds
+
+    def create_token(self, rsa_key_pair: RSAKeyPair, kid: str = "test-key-1") -> str:
+        return rsa_key_pair.create_token(issuer="https://test.example.com", kid=kid)
+
+    async def test_keys_are_cached(
+        self,
+        rsa_key_pair: RSAKeyPair,
+        jwks_provider: JWTVerifier,
+        mock_jwks_data: JWKSData,
+        httpx_mock: HTTPXMock,
+    ):
+        httpx_mock.add_response(url=self.JWKS_URI, json=mock_jwks_data)
+        token = self.create_token(rsa_key_pair)
+
+        assert await jwks_provider.load_access_token(token) is not None
+        assert await jwks_provider.load_access_token(token) is not None
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_concurrent_requests_share_one_fetch(
+        self,
+        rsa_key_pair: RSAKeyPair,
+        jwks_provider: JWTVerifier,
+        mock_jwks_data: JWKSData,
+        httpx_mock: HTTPXMock,
+    ):
+        httpx_mock.add_response(url=self.JWKS_URI, json=mock_jwks_data)
+        token = self.create_token(rsa_key_pair)
+
+        results = await asyncio.gather(
+            *(jwks_provider.load_access_token(token) for _ in range(5))
+        )
+
+        assert all(result is not None for result in results)
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_unknown_kid_refetches_for_rotated_keys(
+        self,
+        rsa_key_pair: RSAKeyPair,
+        jwks_provider: JWTVerifier,
+        mock_jwks_data: JWKSData,
+        httpx_mock: HTTPXMock,
+    ):
+        httpx_mock.add_response(url=self.JWKS_URI, json=mock_jwks_data)
+        assert await jwks_provider.load_access_token(self.create_token(rsa_key_pair))
+
+        # The issuer rotates to a new key id
+        rotated = copy.deepcopy(mock_jwks_data)
+        rotated["keys"][0]["kid"] = "test-key-2"
+        httpx_mock.add_response(url=self.JWKS_URI, json=rotated)
+        self.age_cache(jwks_provider, jwks_provider._jwks_min_refetch_interval)
+
+        token = self.create_token(rsa_key_pair, kid="test-key-2")
+        assert await jwks_provider.load_access_token(token) is not None
+        assert len(httpx_mock.get_requests()) == 2
+
+    async def test_unknown_kid_refetches_are_rate_limited(
+        self,
+        rsa_key_pair: RSAKeyPair,
+        jwks_provider: JWTVerifier,
+        mock_jwks_data: JWKSData,
+        httpx_mock: HTTPXMock,
+    ):
+        httpx_mock.add_response(
+            url=self.JWKS_URI, json=mock_jwks_data, is_reusable=True
+        )
+        assert await jwks_provider.load_access_token(self.create_token(rsa_key_pair))
+
+        for i in range(5):
+            token = self.create_token(rsa_key_pair, kid=f"bogus-{i}")
+            assert await jwks_provider.load_access_token(token) is None
+        assert len(httpx_mock.get_requests()) == 1
+
+        with patch(
+            "time.time",
+            return_value=time.time() + jwks_provider._jwks_min_refetch_interval,
+        ):
+            token = self.create_token(rsa_key_pair, kid="bogus")
+            assert await jwks_provider.load_access_token(token) is None
+        assert len(httpx_mock.get_requests()) == 2
+
+    async def test_keys_are_refreshed_in_background_before_expiry(
+        self,
+        rsa_key_pair: RSAKeyPair,
+        jwks_provider: JWTVerifier,
+        mock_jwks_data: JWKSData,
+        httpx_mock: HTTPXMock,
+    ):
+        httpx_mock.add_response(
+            url=self.JWKS_URI, json=mock_jwks_data, is_reusable=True
+        )
+        token = self.create_token(rsa_key_pair)
+        assert await jwks_provider.load_access_token(token)
+
+        # Close to expiry, the cached key is used while a refresh runs
+        self.age_cache(jwks_provider, jwks_provider._cache_ttl - 60)
+        refreshed_before = jwks_provider._jwks_cache_time
+        assert await jwks_provider.load_access_token(token)
+        assert jwks_provider._jwks_fetch is not None
+        await jwks_provider._jwks_fetch
+
+        assert len(httpx_mock.get_requests()) == 2
+        assert jwks_provider._jwks_cache_time > refreshed_before
+
+    async def test_failed_background_refresh_keeps_cached_keys(
+        self,
+        rsa_key_pair: RSAKeyPair,
+        jwks_provider: JWTVerifier,
+        mock_jwks_data: JWKSData,
+        httpx_mock: HTTPXMock,
+    ):
+        httpx_mock.add_response(url=self.JWKS_URI, json=mock_jwks_data)
+        token = self.create_token(rsa_key_pair)
+        assert await jwks_provider.load_access_token(token)
+
+        httpx_mock.add_response(url=self.JWKS_URI, status_code=503)
+        self.age_cache(jwks_provider, jwks_provider._cache_ttl - 60)
+        assert await jwks_provider.load_access_token(token)
+        assert jwks_provider._jwks_fetch is not None
+        with pytest.raises(ValueError, match="Failed to fetch JWKS"):
+            await jwks_provider._jwks_fetch
+
+        # The cached key is still used, without retrying straight away
+        assert await jwks_provider.load_access_token(token)
+        assert len(httpx_mock.get_requests()) == 2
+
+    async def test_expired_keys_are_used_when_refresh_fails(
+        self,
+        rsa_key_pair: RSAKeyPair,
+        jwks_provider: JWTVerifier,
+        mock_jwks_data: JWKSData,
+        httpx_mock: HTTPXMock,
+    ):
+        httpx_mock.add_response(url=self.JWKS_URI, json=mock_jwks_data)
+        assert await jwks_provider.load_access_token(self.create_token(rsa_key_pair))
+
+        httpx_mock.add_response(url=self.JWKS_URI, status_code=503)
+        self.age_cache(jwks_provider, jwks_provider._cache_ttl)
+        assert await jwks_provider.load_access_token(self.create_token(rsa_key_pair))
+        assert len(httpx_mock.get_requests()) == 2
+
+    async def test_expired_key_refetches_are_rate_limited(
+        self,
+        rsa_key_pair: RSAKeyPair,
+        jwks_provider: JWTVerifier,
+        mock_jwks_data: JWKSData,
+        httpx_mock: HTTPXMock,
+    ):
+        httpx_mock.add_response(url=self.JWKS_URI, json=mock_jwks_data)
+        assert await jwks_provider.load_access_token(self.create_token(rsa_key_pair))
+
+        httpx_mock.add_response(url=self.JWKS_URI, status_code=503, is_reusable=True)
+        self.age_cache(jwks_provider, jwks_provider._cache_ttl)
+        for _ in range(5):
+            token = self.create_token(rsa_key_pair)
+            assert await jwks_provider.load_access_token(token) is not None
+        assert len(httpx_mock.get_requests()) == 2
+
+        with patch(
+            "time.time",
+            return_value=time.time() + jwks_provider._jwks_min_refetch_interval,
+        ):
+            assert await jwks_provider.load_access_token(
+                self.create_token(rsa_key_pair)
+            )
+        assert len(httpx_mock.get_requests()) == 3
+
+    async def test_failed_first_fetch_is_rate_limited(
+        self,
+        rsa_key_pair: RSAKeyPair,
+        jwks_provider: JWTVerifier,
+        httpx_mock: HTTPXMock,
+    ):
+        httpx_mock.add_response(url=self.JWKS_URI, status_code=503, is_reusable=True)
+
+        for _ in range(5):
+            token = self.create_token(rsa_key_pair)
+            assert await jwks_provider.load_access_token(token) is None
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_static_key_is_parsed_once(self, rsa_key_pair: RSAKeyPair):
+        provider = JWTVerifier(public_key=rsa_key_pair.public_key)
+        assert provider._get_public_key() is provider._get_public_key()
+
+
+class TestVerifiedTokenCaching:
+    """Tests for caching verified tokens."""
+
+    @pytest.fixture
+    def provider(self, rsa_key_pair: RSAKeyPair) -> JWTVerifier:
+        return JWTVerifier(
+            public_key=rsa_key_pair.public_key,
+            issuer="https://test.example.com",
+            audience="https://api.example.com",
+            cache_ttl_seconds=60,
+        )
+
+    @pytest.fixture
+    def token(self, rsa_key_pair: RSAKeyPair) -> str:
+        return rsa_key_pair.create_token(
+            issuer="https://test.example.com", audience="https://api.example.com"
+        )
+
+    async def test_disabled_by_default(self, rsa_key_pair: RSAKeyPair, token: str):
+        provider = JWTVerifier(public_key=rsa_key_pair.public_key)
+        first = await provider.load_access_token(token)
+        assert first is not None
+        assert await provider.load_access_token(token) is not first
+        assert provider.token_cache.misses == 0
+
+    async def test_verified_token_is_cached(self, provider: JWTVerifier, token: str):
+        first = await provider.load_access_token(token)
+        assert first is not None
+
+        with patch.object(provider.jwt, "decode") as decode:
+            assert await provider.verify_token(token) is first
+        decode.assert_not_called()
+        assert provider.token_cache.hit_rate == 0.5
+
+    async def test_rejected_token_is_not_cached(
+        self, provider: JWTVerifier, rsa_key_pair: RSAKeyPair
+    ):
+        token = rsa_key_pair.create_token(issuer="https://other.example.com")
+        assert await provider.load_access_token(token) is None
+        assert not provider.token_cache._entries
+
+    async def test_expired_token_is_verified_again(
+        self, provider: JWTVerifier, token: str
+    ):
+        access_token = await provider.load_access_token(token)
+        assert access_token is not None and access_token.expires_at is not None
+
+        with patch("time.time", return_value=access_token.expires_at + 1):
+            assert await provider.load_access_token(token) is None
+
+    async def test_config_change_clears_cache(self, provider: JWTVerifier, token: str):
+        assert await provider.load_access_token(token) is not None
+
+        provider.audience = "https://other-api.example.com"
+        assert await provider.load_access_token(token) is None
+
+    async def test_invalidate_token(self, provider: JWTVerifier, token: str):
+        first = await provider.load_access_token(token)
+        provider.invalidate_token(token)
+        second = await provider.load_access_token(token)
+        assert second is not None and second is not first
+
+    async def test_removed_jwks_key_clears_cache(
+        self, rsa_key_pair: RSAKeyPair, httpx_mock: HTTPXMock
+    ):
+        from authlib.jose import JsonWebKey
+
+        jwks_uri = "https://test.example.com/.well-known/jwks.json"
+        jwk_data = JsonWebKey.import_key(rsa_key_pair.public_key).as_dict()  # type: ignore
+        jwk_data["kid"] = "test-key-1"
+        httpx_mock.add_response(url=jwks_uri, json={"keys": [jwk_data]})
+        httpx_mock.add_response(
+            url=jwks_uri, json={"keys": [{**jwk_data, "kid": "test-key-2"}]}
+        )
+        provider = JWTVerifier(jwks_uri=jwks_uri, cache_ttl_seconds=60)
+        token = rsa_key_pair.create_token(kid="test-key-1")
+        assert await provider.load_access_token(token) is not None
+
+        await provider._refresh_jwks()
+        assert await provider.load_access_token(token) is None
+
+
 class TestBearerToken:
     def test_initialization_with_public_key(self, rsa_key_pair: RSAKeyPair):
         """Test provider initialization with public key."""
@@ -395,7 +395,7 @@ class TestOAuthProxyClientRegistration:
         await oauth_proxy.register_client(client_info)
 
         # Client should be stored with original credentials
-        stored = oauth_proxy._clients.get("original-client")
+        stored = await oauth_proxy._clients.get("original-client")
         assert stored is not None
         assert stored.client_id == "original-client"
         assert stored.client_secret == "original-secret"
@@ -453,8 +453,8 @@ class TestOAuthProxyAuthorization:
 
         # Verify transaction was stored
         txn_id = query_params["state"][0]
-        assert txn_id in oauth_proxy._oauth_transactions
-        transaction = oauth_proxy._oauth_transactions[txn_id]
+        transaction = await oauth_proxy._oauth_transactions.get(txn_id)
+        assert transaction is not None
         assert transaction["client_id"] == "test-client"
         assert transaction["code_challenge"] == "challenge-abc"
 
@@ -512,7 +512,8 @@ class TestOAuthProxyPKCE:
 
         # Transaction should store both challenges
         txn_id = query_params["state"][0]
-        transaction = proxy_with_pkce._oauth_transactions[txn_id]
+        transaction = await proxy_with_pkce._oauth_transactions.get(txn_id)
+        assert transaction is not None
         assert transaction["code_challenge"] == "client_challenge"  # Client's
         assert "proxy_code_verifier" in transaction  # Proxy's verifier
 
@@ -541,7 +542,8 @@ class TestOAuthProxyPKCE:
 
         # Client's challenge still stored
         txn_id = query_params["state"][0]
-        transaction = proxy_without_pkce._oauth_transactions[txn_id]
+        transaction = await proxy_without_pkce._oauth_transactions.get(txn_id)
+        assert transaction is not None
         assert transaction["code_challenge"] == "client_challenge"
         assert "proxy_code_verifier" not in transaction
 
@@ -634,6 +636,19 @@ class TestOAuthProxyTokenEndpointAuth:
             )
 
 
+class TestOAuthProxyRevocation:
+    async def test_revoking_access_token_invalidates_verification(
+        self, oauth_proxy, jwt_verifier
+    ):
+        access_token = AccessToken(token="access-token", client_id="client", scopes=[])
+        await oauth_proxy._access_tokens.set(access_token.token, access_token)
+
+        await oauth_proxy.revoke_token(access_token)
+
+        assert not await oauth_proxy._access_tokens.contains("access-token")
+        jwt_verifier.invalidate_token.assert_called_once_with("access-token")
+
+
 class TestOAuthProxyE2E:
     """End-to-end tests using mock OAuth provider."""
 
@@ -791,5 +806,6 @@ class TestOAuthProxyE2E:
 
         # Transaction should have proxy's verifier
         txn_id = query_params["state"][0]
-        transaction = proxy._oauth_transactions[txn_id]
+        transaction = await proxy._oauth_transactions.get(txn_id)
+        assert transaction is not None
         assert "proxy_code_verifier" in transaction
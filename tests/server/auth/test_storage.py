@@ -0,0 +1,306 @@
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import anyio
+import pytest
+from mcp.server.auth.provider import AccessToken, AuthorizationParams, TokenError
+from mcp.shared.auth import OAuthClientInformationFull
+from pydantic import AnyUrl
+
+from fastmcp.server.auth.oauth_proxy import OAuthProxy
+from fastmcp.server.auth.providers.in_memory import InMemoryOAuthProvider
+from fastmcp.server.auth.providers.jwt import JWTVerifier
+from fastmcp.server.auth.storage import (
+    MemoryOAuthStorage,
+    OAuthStorage,
+    OAuthStorageCollection,
+    SQLiteOAuthStorage,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def storage(request, tmp_path: Path) -> OAuthStorage:
+    if request.param == "memory":
+        return MemoryOAuthStorage()
+    return SQLiteOAuthStorage(tmp_path / "oauth.db")
+
+
+class TestOAuthStorage:
+    async def test_get_set_delete(self, storage: OAuthStorage):
+        assert await storage.get("clients", "a") is None
+
+        await storage.set("clients", "a", {"name": "a"})
+        assert await storage.get("clients", "a") == {"name": "a"}
+        assert await storage.get("tokens", "a") is None
+
+        await storage.delete("clients", "a")
+        assert await storage.get("clients", "a") is None
+        await storage.delete("clients", "a")
+
+    async def test_pop(self, storage: OAuthStorage):
+        await storage.set("codes", "a", "value")
+        assert await storage.pop("codes", "a") == "value"
+        assert await storage.pop("codes", "a") is None
+        assert await storage.get("codes", "a") is None
+
+    async def test_entries_expire(self, storage: OAuthStorage):
+        await storage.set("codes", "a", "value", ttl_seconds=10)
+        await storage.set("codes", "b", "value")
+
+        with patch("time.time", return_value=time.time() + 11):
+            assert await storage.get("codes", "a") is None
+            assert await storage.pop("codes", "a") is None
+            assert await storage.get("codes", "b") == "value"
+
+    async def test_expired_entries_are_swept(self, storage: OAuthStorage):
+        await storage.set("codes", "a", "value", ttl_seconds=10)
+
+        with patch("time.time", return_value=time.time() + 3600):
+            await storage.set("codes", "b", "value")
+
+        if isinstance(storage, MemoryOAuthStorage):
+            assert list(storage._collections["codes"]) == ["b"]
+        else:
+            assert isinstance(storage, SQLiteOAuthStorage)
+            rows = storage._connection.execute(
+                "SELECT key FROM oauth_storage"
+            ).fetchall()
+            assert rows == [("b",)]
+
+
+class TestMemoryOAuthStorage:
+    async def test_least_recently_used_entries_are_dropped(self):
+        storage = MemoryOAuthStorage(max_size=2)
+        await storage.set("clients", "a", 1)
+        await storage.set("clients", "b", 2)
+        await storage.get("clients", "a")
+        await storage.set("clients", "c", 3)
+
+        assert await storage.get("clients", "a") == 1
+        assert await storage.get("clients", "b") is None
+        assert await storage.get("clients", "c") == 3
+
+    async def test_size_is_per_collection(self):
+        storage = MemoryOAuthStorage(max_size=1)
+        await storage.set("clients", "a", 1)
+        await storage.set("tokens", "a", 2)
+        assert await storage.get("clients", "a") == 1
+
+
+class TestSQLiteOAuthStorage:
+    async def test_state_survives_reopening(self, tmp_path: Path):
+        storage = SQLiteOAuthStorage(tmp_path / "oauth.db")
+        await storage.set("clients", "a", {"name": "a"})
+        storage.close()
+
+        storage = SQLiteOAuthStorage(tmp_path / "oauth.db")
+        assert await storage.get("clients", "a") == {"name": "a"}
+
+    async def test_state_is_shared_between_connections(self, tmp_path: Path):
+        first = SQLiteOAuthStorage(tmp_path / "oauth.db")
+        second = SQLiteOAuthStorage(tmp_path / "oauth.db")
+
+        await first.set("tokens", "a", "value")
+        assert await second.get("tokens", "a") == "value"
+        await second.delete("tokens", "a")
+        assert await first.get("tokens", "a") is None
+
+    async def test_pop_is_atomic_between_connections(self, tmp_path: Path):
+        storages = [SQLiteOAuthStorage(tmp_path / "oauth.db") for _ in range(8)]
+        await storages[0].set("codes", "a", "value")
+
+        results: list[Any] = []
+
+        async def pop(storage: SQLiteOAuthStorage) -> None:
+            results.append(await storage.pop("codes", "a"))
+
+        async with anyio.create_task_group() as tg:
+            for storage in storages:
+                tg.start_soon(pop, storage)
+
+        assert results.count("value") == 1
+        assert results.count(None) == 7
+
+    async def test_queries_do_not_block_the_event_loop(self, tmp_path: Path):
+        storage = SQLiteOAuthStorage(tmp_path / "oauth.db")
+        ticks = 0
+
+        def slow_get(collection: str, key: str) -> None:
+            time.sleep(0.2)
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await anyio.sleep(0.01)
+
+        with patch.object(storage, "_get", slow_get):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(tick)
+                await storage.get("codes", "a")
+                tg.cancel_scope.cancel()
+
+        assert ticks > 5
+
+
+class TestOAuthStorageCollection:
+    async def test_values_are_converted(self, storage: OAuthStorage):
+        tokens = OAuthStorageCollection(storage, "access_tokens", AccessToken)
+        token = AccessToken(token="t", client_id="c", scopes=["read"], expires_at=1)
+
+        await tokens.set("t", token)
+        assert await tokens.contains("t")
+        assert await tokens.get("t") == token
+        assert await tokens.get("t") is not token
+
+    async def test_operations(self, storage: OAuthStorage):
+        names = OAuthStorageCollection(storage, "names", str)
+
+        await names.set("a", "alice")
+        assert await names.pop("a") == "alice"
+        assert await names.pop("a") is None
+        assert await names.pop("a", "default") == "default"
+        assert await names.get("a", "default") == "default"
+
+        await names.set("b", "bob")
+        await names.delete("b")
+        assert not await names.contains("b")
+
+
+def client_info(client_id: str = "client") -> OAuthClientInformationFull:
+    return OAuthClientInformationFull(
+        client_id=client_id,
+        redirect_uris=[AnyUrl("http://localhost:12345/callback")],
+    )
+
+
+class TestSharedProviderState:
+    """Providers sharing storage, like the workers of one server."""
+
+    def create_proxy(self, storage: OAuthStorage) -> OAuthProxy:
+        verifier = Mock(spec=JWTVerifier)
+        verifier.required_scopes = []
+        return OAuthProxy(
+            upstream_authorization_endpoint="https://idp.example.com/authorize",
+            upstream_token_endpoint="https://idp.example.com/token",
+            upstream_client_id="upstream-client",
+            upstream_client_secret="upstream-secret",
+            token_verifier=verifier,
+            base_url="https://myserver.com",
+            storage=storage,
+        )
+
+    async def test_oauth_proxy(self, tmp_path: Path):
+        first = self.create_proxy(SQLiteOAuthStorage(tmp_path / "oauth.db"))
+        second = self.create_proxy(SQLiteOAuthStorage(tmp_path / "oauth.db"))
+
+        await first.register_client(client_info())
+        client = await second.get_client("client")
+        assert client is not None
+        # Redirect URI patterns come from the proxy's configuration
+        client.validate_redirect_uri(AnyUrl("http://localhost:54321/callback"))
+
+        url = await second.authorize(
+            client,
+            AuthorizationParams(
+                state="state",
+                scopes=["read"],
+                code_challenge="challenge",
+                redirect_uri=AnyUrl("http://localhost:12345/callback"),
+                redirect_uri_provided_explicitly=True,
+            ),
+        )
+        txn_id = dict(p.split("=") for p in url.split("?")[1].split("&"))["state"]
+        transaction = await first._oauth_transactions.get(txn_id)
+        assert transaction is not None
+        assert transaction["client_state"] == "state"
+
+    async def test_oauth_proxy_transactions_expire(self):
+        proxy = self.create_proxy(MemoryOAuthStorage())
+        await proxy.register_client(client_info())
+        client = await proxy.get_client("client")
+        assert client is not None
+        url = await proxy.authorize(
+            client,
+            AuthorizationParams(
+                state="state",
+                scopes=[],
+                code_challenge="challenge",
+                redirect_uri=AnyUrl("http://localhost:12345/callback"),
+                redirect_uri_provided_explicitly=True,
+            ),
+        )
+        txn_id = dict(p.split("=") for p in url.split("?")[1].split("&"))["state"]
+
+        with patch("time.time", return_value=time.time() + 24 * 60 * 60):
+            assert not await proxy._oauth_transactions.contains(txn_id)
+
+    async def test_in_memory_provider(self, tmp_path: Path):
+        first = InMemoryOAuthProvider(storage=SQLiteOAuthStorage(tmp_path / "oauth.db"))
+        second = InMemoryOAuthProvider(
+            storage=SQLiteOAuthStorage(tmp_path / "oauth.db")
+        )
+        client = client_info()
+        await first.register_client(client)
+
+        url = await first.authorize(
+            client,
+            AuthorizationParams(
+                state="state",
+                scopes=[],
+                code_challenge="challenge",
+                redirect_uri=AnyUrl("http://localhost:12345/callback"),
+                redirect_uri_provided_explicitly=True,
+            ),
+        )
+        code = dict(p.split("=") for p in url.split("?")[1].split("&"))["code"]
+
+        auth_code = await second.load_authorization_code(client, code)
+        assert auth_code is not None
+        token = await second.exchange_authorization_code(client, auth_code)
+
+        access_token = await first.load_access_token(token.access_token)
+        assert access_token is not None
+        await first.revoke_token(access_token)
+        assert await second.load_access_token(token.access_token) is None
+        assert token.refresh_token is not None
+        assert await second.load_refresh_token(client, token.refresh_token) is None
+
+    async def test_codes_are_single_use_across_workers(self, tmp_path: Path):
+        first = InMemoryOAuthProvider(storage=SQLiteOAuthStorage(tmp_path / "oauth.db"))
+        second = InMemoryOAuthProvider(
+            storage=SQLiteOAuthStorage(tmp_path / "oauth.db")
+        )
+        client = client_info()
+        await first.register_client(client)
+        url = await first.authorize(
+            client,
+            AuthorizationParams(
+                state="state",
+                scopes=[],
+                code_challenge="challenge",
+                redirect_uri=AnyUrl("http://localhost:12345/callback"),
+                redirect_uri_provided_explicitly=True,
+            ),
+        )
+        code = dict(p.split("=") for p in url.split("?")[1].split("&"))["code"]
+        auth_code = await first.load_authorization_code(client, code)
+        assert auth_code is not None
+
+        results: list[Any] = []
+
+        async def exchange(provider: InMemoryOAuthProvider) -> None:
+            try:
+                results.append(
+                    await provider.exchange_authorization_code(client, auth_code)
+                )
+            except TokenError as e:
+                results.append(e)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(exchange, first)
+            tg.start_soon(exchange, second)
+
+        assert sum(isinstance(r, TokenError) for r in results) == 1
@@ -0,0 +1,219 @@
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import anyio
+import httpx
+import pytest
+
+from fastmcp.server.auth.auth import AccessToken
+from fastmcp.server.auth.providers.github import GitHubTokenVerifier
+from fastmcp.server.auth.token_cache import VerifiedTokenCache
+
+
+class CountingVerifier:
+    def __init__(self, result: AccessToken | None | Exception, delay: float = 0):
+        self.result = result
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self, token: str) -> AccessToken | None:
+        self.calls += 1
+        await anyio.sleep(self.delay)
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def access_token(token: str = "token", expires_at: int | None = None) -> AccessToken:
+    return AccessToken(
+        token=token, client_id="client", scopes=[], expires_at=expires_at
+    )
+
+
+class TestVerifiedTokenCache:
+    async def test_verified_token_is_cached(self):
+        cache = VerifiedTokenCache()
+        verify = CountingVerifier(access_token())
+
+        first = await cache.verify("token", verify)
+        second = await cache.verify("token", verify)
+
+        assert first is second
+        assert verify.calls == 1
+
+    async def test_tokens_are_stored_by_hash(self):
+        cache = VerifiedTokenCache()
+        await cache.verify("secret-token", CountingVerifier(access_token()))
+        assert "secret-token" not in cache._entries
+
+    async def test_rejected_token_is_cached(self):
+        cache = VerifiedTokenCache()
+        verify = CountingVerifier(None)
+
+        assert await cache.verify("token", verify) is None
+        assert await cache.verify("token", verify) is None
+        assert verify.calls == 1
+
+    async def test_rejections_expire_first(self):
+        cache = VerifiedTokenCache(ttl_seconds=300, negative_ttl_seconds=30)
+        await cache.verify("valid", CountingVerifier(access_token()))
+        await cache.verify("invalid", CountingVerifier(None))
+
+        with patch("time.time", return_value=time.time() + 60):
+            assert cache._get(cache._key("valid"))[0]
+            assert not cache._get(cache._key("invalid"))[0]
+
+    async def test_token_expiry_is_respected(self):
+        cache = VerifiedTokenCache(ttl_seconds=300)
+        expires_at = int(time.time()) + 10
+        verify = CountingVerifier(access_token(expires_at=expires_at))
+        await cache.verify("token", verify)
+
+        with patch("time.time", return_value=expires_at + 1):
+            await cache.verify("token", verify)
+        assert verify.calls == 2
+
+    async def test_expired_token_is_not_cached(self):
+        cache = VerifiedTokenCache()
+        verify = CountingVerifier(access_token(expires_at=int(time.time()) - 1))
+        await cache.verify("token", verify)
+        await cache.verify("token", verify)
+        assert verify.calls == 2
+
+    async def test_errors_are_not_cached(self):
+        cache = VerifiedTokenCache()
+        verify = CountingVerifier(httpx.ConnectError("unreachable"))
+
+        for _ in range(2):
+            with pytest.raises(httpx.ConnectError):
+                await cache.verify("token", verify)
+        assert verify.calls == 2
+
+    async def test_concurrent_verifications_are_coalesced(self):
+        cache = VerifiedTokenCache(ttl_seconds=0)
+        verify = CountingVerifier(access_token(), delay=0.05)
+        results: list[AccessToken | None] = []
+
+        async def verify_token() -> None:
+            results.append(await cache.verify("token", verify))
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(5):
+                tg.start_soon(verify_token)
+
+        assert verify.calls == 1
+        assert len(results) == 5
+        assert all(result is results[0] for result in results)
+
+    async def test_concurrent_requests_share_errors(self):
+        cache = VerifiedTokenCache()
+        verify = CountingVerifier(httpx.ConnectError("unreachable"), delay=0.05)
+        errors: list[Exception] = []
+
+        async def verify_token() -> None:
+            try:
+                await cache.verify("token", verify)
+            except httpx.ConnectError as e:
+                errors.append(e)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(verify_token)
+
+        assert verify.calls == 1
+        assert len(errors) == 3
+
+    async def test_least_recently_used_tokens_are_dropped(self):
+        cache = VerifiedTokenCache(max_size=2)
+        verify = CountingVerifier(access_token())
+
+        await cache.verify("a", verify)
+        await cache.verify("b", verify)
+        await cache.verify("a", verify)
+        await cache.verify("c", verify)
+
+        assert len(cache._entries) == 2
+        await cache.verify("a", verify)
+        assert verify.calls == 3
+        await cache.verify("b", verify)
+        assert verify.calls == 4
+
+    async def test_invalidate(self):
+        cache = VerifiedTokenCache()
+        verify = CountingVerifier(access_token())
+        await cache.verify("token", verify)
+        cache.invalidate("token")
+        await cache.verify("token", verify)
+        assert verify.calls == 2
+
+    async def test_hit_rate(self):
+        cache = VerifiedTokenCache()
+        verify = CountingVerifier(access_token())
+        assert cache.hit_rate == 0
+
+        for _ in range(4):
+            await cache.verify("token", verify)
+
+        assert (cache.hits, cache.misses) == (3, 1)
+        assert cache.hit_rate == 0.75
+
+
+class TestGitHubTokenVerifierCache:
+    def mock_client(self, status_code: int) -> AsyncMock:
+        user_response = MagicMock()
+        user_response.status_code = status_code
+        user_response.json.return_value = {"id": 12345, "login": "testuser"}
+        scopes_response = MagicMock()
+        scopes_response.headers = {"x-oauth-scopes": "user"}
+
+        async def get(url: str, **kwargs):
+            return user_response if url.endswith("/user") else scopes_response
+
+        client = AsyncMock()
+        client.get.side_effect = get
+        return client
+
+    async def test_repeated_requests_call_github_once(self):
+        verifier = GitHubTokenVerifier()
+        client = self.mock_client(200)
+
+        with patch(
+            "fastmcp.server.auth.providers.github.get_http_client",
+            return_value=client,
+        ):
+            first = await verifier.verify_token("valid_token")
+            second = await verifier.verify_token("valid_token")
+
+        assert first is not None
+        assert second is first
+        # /user and /user/repos, once
+        assert client.get.call_count == 2
+
+    async def test_server_errors_are_not_cached(self):
+        verifier = GitHubTokenVerifier()
+        client = self.mock_client(503)
+        client.get.side_effect = None
+        response = httpx.Response(503, request=httpx.Request("GET", "https://x"))
+        client.get.return_value = response
+
+        with patch(
+            "fastmcp.server.auth.providers.github.get_http_client",
+            return_value=client,
+        ):
+            assert await verifier.verify_token("valid_token") is None
+            assert await verifier.verify_token("valid_token") is None
+
+        assert client.get.call_count == 2
+
+    async def test_cache_can_be_disabled(self):
+        verifier = GitHubTokenVerifier(cache_ttl_seconds=0)
+        client = self.mock_client(200)
+
+        with patch(
+            "fastmcp.server.auth.providers.github.get_http_client",
+            return_value=client,
+        ):
+            await verifier.verify_token("valid_token")
+            await verifier.verify_token("valid_token")
+
+        assert client.get.call_count == 4
@@ -892,3 +892,77 @@ class TestToolCallDenial:
 
         # Verify both admin tools were denied
         assert denied_tools == {"admin_delete", "admin_config"}
+
+
+class TestMiddlewareChain:
+    @pytest.fixture
+    def server(self):
+        server = FastMCP("TestServer")
+
+        @server.tool
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        return server
+
+    async def test_chain_is_reused(self, server: FastMCP):
+        server.add_middleware(RecordingMiddleware())
+
+        async with Client(server) as client:
+            await client.call_tool("add", {"a": 1, "b": 2})
+            chain = server._middleware_chains[("tools/call", "request")]
+            await client.call_tool("add", {"a": 1, "b": 2})
+            assert server._middleware_chains[("tools/call", "request")] is chain
+
+    async def test_add_middleware_rebuilds_chain(self, server: FastMCP):
+        first = RecordingMiddleware()
+        second = RecordingMiddleware()
+        server.add_middleware(first)
+
+        async with Client(server) as client:
+            await client.call_tool("add", {"a": 1, "b": 2})
+            server.add_middleware(second)
+            await client.call_tool("add", {"a": 1, "b": 2})
+
+        assert first.assert_called(hook="on_call_tool", times=2)
+        assert second.assert_called(hook="on_call_tool", times=1)
+
+    async def test_direct_list_edit_rebuilds_chain(self, server: FastMCP):
+        recording = RecordingMiddleware()
+        server.add_middleware(recording)
+
+        async with Client(server) as client:
+            await client.call_tool("add", {"a": 1, "b": 2})
+            server.middleware.clear()
+            await client.call_tool("add", {"a": 1, "b": 2})
+
+        assert recording.assert_called(hook="on_call_tool", times=1)
+
+    async def test_only_overridden_hooks_are_called(self, server: FastMCP):
+        class ToolOnlyMiddleware(Middleware):
+            async def on_call_tool(self, context, call_next):
+                return await call_next(context)
+
+        middleware = ToolOnlyMiddleware()
+        server.add_middleware(middleware)
+
+        async with Client(server) as client:
+            await client.call_tool("add", {"a": 1, "b": 2})
+
+        chain = server._middleware_chains[("tools/call", "request")]
+        assert chain._chain.func == middleware.on_call_tool  # type: ignore[attr-defined]
+
+    async def test_custom_call_is_respected(self, server: FastMCP):
+        calls = []
+
+        class CustomCallMiddleware(Middleware):
+            async def __call__(self, context, call_next):
+                calls.append(context.method)
+                return await call_next(context)
+
+        server.add_middleware(CustomCallMiddleware())
+
+        async with Client(server) as client:
+            await client.call_tool("add", {"a": 1, "b": 2})
+
+        assert "tools/call" in calls
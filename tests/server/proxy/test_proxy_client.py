@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import cast
 
 import pytest
-from anyio import create_task_group
+from anyio import create_task_group, sleep
 from mcp.types import LoggingLevel, ModelHint, ModelPreferences, TextContent
 from pydantic import BaseModel, Field
 
@@ -11,7 +11,7 @@ from fastmcp.client.elicitation import ElicitRequestParams, ElicitResult
 from fastmcp.client.logging import LogMessage
 from fastmcp.client.sampling import RequestContext, SamplingMessage, SamplingParams
 from fastmcp.exceptions import ToolError
-from fastmcp.server.proxy import ProxyClient
+from fastmcp.server.proxy import FastMCPProxy, ProxyClient, ProxyClientPool
 
 
 @pytest.fixture
@@ -416,3 +416,202 @@ class TestProxyClient:
             # Verify the proxy is created successfully and uses session reuse
             assert proxy is not None
             assert hasattr(proxy, "_tool_manager")
+
+
+class TestProxyClientPool:
+    @pytest.fixture
+    def counting_factory(self, fastmcp_server: FastMCP):
+        base_client = ProxyClient(fastmcp_server)
+        clients: list[Client] = []
+
+        def factory() -> Client:
+            client = base_client.new()
+            clients.append(client)
+            return client
+
+        factory.clients = clients  # type: ignore[attr-defined]
+        return factory
+
+    async def test_sessions_are_reused(self, counting_factory):
+        pool = ProxyClientPool(counting_factory)
+        proxy = FastMCPProxy(client_pool=pool)
+
+        async with Client(proxy) as client:
+            for message in ["a", "b", "c"]:
+                result = await client.call_tool("echo", {"message": message})
+                assert result.data == f"echo: {message}"
+            await client.list_tools()
+
+            assert len(counting_factory.clients) == 1
+            assert pool.size == pool.idle == 1
+            assert counting_factory.clients[0].is_connected()
+
+    async def test_pool_is_closed_with_server(self, counting_factory):
+        pool = ProxyClientPool(counting_factory)
+        proxy = FastMCPProxy(client_pool=pool)
+
+        async with Client(proxy) as client:
+            await client.call_tool("echo", {"message": "a"})
+            assert pool.size == 1
+
+        assert pool.size == 0
+        assert not counting_factory.clients[0].is_connected()
+
+    async def test_pool_stays_open_while_server_runs(self, counting_factory):
+        pool = ProxyClientPool(counting_factory)
+        proxy = FastMCPProxy(client_pool=pool)
+
+        async with Client(proxy) as client_a:
+            async with Client(proxy) as client_b:
+                await client_b.call_tool("echo", {"message": "b"})
+            await client_a.call_tool("echo", {"message": "a"})
+            assert pool.size == 1
+
+        assert len(counting_factory.clients) == 1
+        assert pool.size == 0
+
+    async def test_idle_sessions_are_swept(self, counting_factory):
+        pool = ProxyClientPool(counting_factory, idle_timeout=0.1)
+        proxy = FastMCPProxy(client_pool=pool)
+
+        async with Client(proxy) as client:
+            await client.call_tool("echo", {"message": "a"})
+            assert pool.size == 1
+            # No further requests, so only the background sweep evicts it
+            await sleep(0.3)
+            assert pool.size == 0
+            assert not counting_factory.clients[0].is_connected()
+
+    async def test_max_size_bounds_sessions(self, counting_factory):
+        pool = ProxyClientPool(counting_factory, max_size=2)
+        proxy = FastMCPProxy(client_pool=pool)
+
+        async with Client(proxy) as client:
+            async with create_task_group() as tg:
+                for i in range(6):
+                    tg.start_soon(client.call_tool, "echo", {"message": str(i)})
+
+        assert len(counting_factory.clients) <= 2
+        await pool.close()
+
+    async def test_idle_sessions_are_evicted(self, counting_factory):
+        pool = ProxyClientPool(counting_factory, idle_timeout=0)
+        proxy = FastMCPProxy(client_pool=pool)
+
+        async with Client(proxy) as client:
+            await client.call_tool("echo", {"message": "a"})
+            assert pool.size == 0
+
+        assert counting_factory.clients
+        assert not any(c.is_connected() for c in counting_factory.clients)
+
+    async def test_min_size_sessions_are_kept(self, counting_factory):
+        pool = ProxyClientPool(counting_factory, min_size=1, idle_timeout=0)
+        proxy = FastMCPProxy(client_pool=pool)
+
+        async with Client(proxy) as client:
+            await client.call_tool("echo", {"message": "a"})
+            assert pool.size == 1
+            await client.call_tool("echo", {"message": "b"})
+
+        assert len(counting_factory.clients) == 1
+        await pool.close()
+
+    async def test_unhealthy_sessions_are_replaced(self, counting_factory):
+        pool = ProxyClientPool(counting_factory, ping_interval=0)
+        proxy = FastMCPProxy(client_pool=pool)
+
+        async with Client(proxy) as client:
+            await client.call_tool("echo", {"message": "a"})
+            await counting_factory.clients[0]._disconnect(force=True)
+            result = await client.call_tool("echo", {"message": "b"})
+            assert result.data == "echo: b"
+
+        assert len(counting_factory.clients) == 2
+        assert not counting_factory.clients[0].is_connected()
+        await pool.close()
+
+    async def test_tool_errors_keep_session(self, counting_factory):
+        pool = ProxyClientPool(counting_factory)
+        proxy = FastMCPProxy(client_pool=pool)
+
+        async with Client(proxy) as client:
+            with pytest.raises(ToolError):
+                await client.call_tool("echo", {})
+            await client.call_tool("echo", {"message": "a"})
+
+        assert len(counting_factory.clients) == 1
+        await pool.close()
+
+    async def test_concurrent_log_requests_no_mixing(self, counting_factory):
+        pool = ProxyClientPool(counting_factory)
+        proxy = FastMCPProxy(client_pool=pool)
+        results: dict[str, list[str | None]] = {"a": [], "b": []}
+
+        async def log_handler_a(message: LogMessage) -> None:
+            results["a"].append(message.logger)
+
+        async def log_handler_b(message: LogMessage) -> None:
+            results["b"].append(message.logger)
+
+        async with (
+            Client(proxy, log_handler=log_handler_a) as client_a,
+            Client(proxy, log_handler=log_handler_b) as client_b,
+        ):
+            for _ in range(3):
+                async with create_task_group() as tg:
+                    tg.start_soon(
+                        client_a.call_tool,
+                        "log",
+                        {"message": "Hello, world!", "level": "info", "logger": "a"},
+                    )
+                    tg.start_soon(
+                        client_b.call_tool,
+                        "log",
+                        {"message": "Hello, world!", "level": "info", "logger": "b"},
+                    )
+
+        assert results == {"a": ["a"] * 3, "b": ["b"] * 3}
+        await pool.close()
+
+    async def test_reused_session_forwards_to_current_request(self, counting_factory):
+        pool = ProxyClientPool(counting_factory, max_size=1)
+        proxy = FastMCPProxy(client_pool=pool)
+        results: dict[str, list[str | None]] = {"a": [], "b": []}
+
+        async def log_handler_a(message: LogMessage) -> None:
+            results["a"].append(message.logger)
+
+        async def log_handler_b(message: LogMessage) -> None:
+            results["b"].append(message.logger)
+
+        async with pool.lifespan():
+            async with Client(proxy, log_handler=log_handler_a) as client_a:
+                await client_a.call_tool(
+                    "log", {"message": "Hello, world!", "level": "info", "logger": "a"}
+                )
+            async with Client(proxy, log_handler=log_handler_b) as client_b:
+                await client_b.call_tool(
+                    "log", {"message": "Hello, world!", "level": "info", "logger": "b"}
+                )
+
+        assert len(counting_factory.clients) == 1
+        assert results == {"a": ["a"], "b": ["b"]}
+        await pool.close()
+
+    async def test_as_proxy_with_pooled_sessions(self, fastmcp_server: FastMCP):
+        proxy = FastMCP.as_proxy(ProxyClient(fastmcp_server), max_pooled_sessions=3)
+        assert isinstance(proxy, FastMCPProxy)
+        assert proxy.client_pool is not None
+        assert proxy.client_pool.max_size == 3
+
+        async with Client(proxy) as client:
+            result = await client.call_tool("echo", {"message": "a"})
+            assert result.data == "echo: a"
+        await proxy.client_pool.close()
+
+    def test_invalid_sizes(self, counting_factory):
+        with pytest.raises(ValueError):
+            ProxyClientPool(counting_factory, max_size=0)
+        with pytest.raises(ValueError):
+            ProxyClientPool(counting_factory, min_size=3, max_size=2)
@@ -2,17 +2,24 @@ import inspect
 import json
 from typing import Any, cast
 
+import anyio
 import pytest
 from anyio import create_task_group
 from dirty_equals import Contains
 from mcp import McpError
 from pydantic import AnyUrl
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 from fastmcp.client import Client
 from fastmcp.client.transports import FastMCPTransport, StreamableHttpTransport
 from fastmcp.exceptions import ToolError
-from fastmcp.server.proxy import FastMCPProxy, ProxyClient
+from fastmcp.server.middleware import Middleware
+from fastmcp.server.proxy import (
+    FastMCPProxy,
+    ProxyClient,
+    ProxyInventoryCache,
+    ProxyToolManager,
+)
 from fastmcp.tools.tool_transform import (
     ToolTransformConfig,
 )
@@ -738,3 +745,110 @@ class TestMirroredComponents:
             tools_list = await client.list_tools()
             tool_names = [tool.name for tool in tools_list]
             assert "greet" not in tool_names
+
+
+class ListCounter(Middleware):
+    def __init__(self):
+        self.counts: dict[str, int] = {}
+
+    async def on_request(self, context, call_next):
+        self.counts[context.method] = self.counts.get(context.method, 0) + 1
+        return await call_next(context)
+
+
+class TestInventoryCache:
+    @pytest.fixture
+    def counter(self, fastmcp_server: FastMCP) -> ListCounter:
+        counter = ListCounter()
+        fastmcp_server.add_middleware(counter)
+        return counter
+
+    async def test_remote_lists_are_cached(self, fastmcp_server, counter):
+        proxy = FastMCP.as_proxy(ProxyClient(fastmcp_server), cache_ttl=60)
+
+        async with Client(proxy) as client:
+            for name in ["Alice", "Bob", "Charlie"]:
+                result = await client.call_tool("greet", {"name": name})
+                assert result.data == f"Hello, {name}!"
+            await client.list_tools()
+            await client.read_resource("data://users")
+            await client.read_resource("data://user/1")
+            await client.get_prompt("welcome", {"name": "Alice"})
+            await client.list_prompts()
+
+        assert counter.counts["tools/list"] == 1
+        assert counter.counts["tools/call"] == 3
+        assert counter.counts["resources/list"] == 1
+        assert counter.counts["resources/templates/list"] == 1
+        assert counter.counts["prompts/list"] == 1
+
+    async def test_components_are_built_once(self, fastmcp_server):
+        proxy = FastMCP.as_proxy(ProxyClient(fastmcp_server), cache_ttl=60)
+
+        first = await proxy.get_tool("greet")
+        second = await proxy.get_tool("greet")
+        assert first is second
+
+    async def test_caching_disabled_by_default(self, fastmcp_server, counter):
+        proxy = FastMCP.as_proxy(ProxyClient(fastmcp_server))
+
+        async with Client(proxy) as client:
+            await client.list_tools()
+            await client.list_tools()
+
+        assert counter.counts["tools/list"] == 2
+
+    async def test_calls_without_cache_do_not_list(self, fastmcp_server):
+        proxy = FastMCP.as_proxy(ProxyClient(fastmcp_server))
+        manager = proxy._tool_manager
+        assert isinstance(manager, ProxyToolManager)
+
+        async def fail(client):
+            raise AssertionError("remote tools were listed")
+
+        manager._fetch_remote_tools = fail  # type: ignore[method-assign]
+        result = await manager.call_tool("greet", {"name": "Alice"})
+        assert result.structured_content == {"result": "Hello, Alice!"}
+
+    @pytest.mark.parametrize("cache_ttl", [0, 60])
+    async def test_unlisted_remote_tools_are_forwarded(self, fastmcp_server, cache_ttl):
+        class HideGreet(Middleware):
+            async def on_list_tools(self, context, call_next):
+                tools = await call_next(context)
+                return [tool for tool in tools if tool.name != "greet"]
+
+        fastmcp_server.add_middleware(HideGreet())
+        proxy = FastMCP.as_proxy(ProxyClient(fastmcp_server), cache_ttl=cache_ttl)
+
+        assert "greet" not in await proxy.get_tools()
+        result = await proxy._tool_manager.call_tool("greet", {"name": "Alice"})
+        assert result.structured_content == {"result": "Hello, Alice!"}
+
+    async def test_list_changed_invalidates_cache(self, fastmcp_server, counter):
+        @fastmcp_server.tool
+        async def add_tool(ctx: Context) -> None:
+            fastmcp_server.tool(lambda: "new", name="new_tool")
+            await ctx.send_tool_list_changed()
+
+        proxy = FastMCP.as_proxy(ProxyClient(fastmcp_server), cache_ttl=float("inf"))
+
+        async with Client(proxy) as client:
+            tools = await client.list_tools()
+            assert "new_tool" not in {tool.name for tool in tools}
+            await client.call_tool("add_tool", {})
+            tools = await client.list_tools()
+            assert "new_tool" in {tool.name for tool in tools}
+
+    async def test_entries_expire(self):
+        cache = ProxyInventoryCache(ttl=0.05)
+        cache.set("tools", {}, cache.generation)
+        assert cache.get("tools") == {}
+        await anyio.sleep(0.1)
+        assert cache.get("tools") is None
+
+    def test_lists_fetched_before_invalidation_are_dropped(self):
+        cache = ProxyInventoryCache(ttl=60)
+        generation = cache.generation
+        cache.invalidate("tools")
+        cache.set("tools", {}, generation)
+        assert cache.get("tools") is None
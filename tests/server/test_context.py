@@ -177,3 +177,40 @@ class TestContextState:
 
             assert context1.get_state("key1") == "key1-context1"
             assert context1.get_state("key-context3-only") is None
+
+    @pytest.mark.asyncio
+    async def test_context_state_mutable_values_are_isolated(self):
+        """Test that changing an inherited value in place doesn't affect the parent."""
+        mock_fastmcp = MagicMock()
+
+        async with Context(fastmcp=mock_fastmcp) as parent:
+            parent.set_state("items", [1])
+            async with Context(fastmcp=mock_fastmcp) as child:
+                child.get_state("items").append(2)
+                assert child.get_state("items") == [1, 2]
+            assert parent.get_state("items") == [1]
+
+    @pytest.mark.asyncio
+    async def test_parent_changes_after_nesting_are_not_inherited(self):
+        """Test that a child context sees the parent's state as of its creation."""
+        mock_fastmcp = MagicMock()
+
+        async with Context(fastmcp=mock_fastmcp) as parent:
+            parent.set_state("key", "before")
+            async with Context(fastmcp=mock_fastmcp) as child:
+                parent.set_state("key", "after")
+                parent.set_state("new-key", "value")
+                assert child.get_state("key") == "before"
+                assert child.get_state("new-key") is None
+
+    @pytest.mark.asyncio
+    async def test_nested_context_does_not_copy_state(self):
+        """Test that entering a nested context doesn't copy the parent's state."""
+        mock_fastmcp = MagicMock()
+
+        async with Context(fastmcp=mock_fastmcp) as parent:
+            parent.set_state("key", {"large": "value"})
+            with patch("fastmcp.server.context.copy.deepcopy") as deepcopy:
+                async with Context(fastmcp=mock_fastmcp):
+                    pass
+                deepcopy.assert_not_called()
@@ -74,7 +74,7 @@ def tools(mcp: FastMCP, test_dir: Path) -> FastMCP:
 
 
 async def test_list_resources(mcp: FastMCP):
-    resources = await mcp._mcp_list_resources()
+    resources = (await mcp._mcp_list_resources()).resources
     assert len(resources) == 4
 
     assert [str(r.uri) for r in resources] == [
@@ -2,15 +2,20 @@ import json
 import sys
 from contextlib import asynccontextmanager
 
+import anyio
 import pytest
 
 from fastmcp import FastMCP
 from fastmcp.client import Client
 from fastmcp.client.transports import FastMCPTransport, SSETransport
+from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware import Middleware
 from fastmcp.server.proxy import FastMCPProxy
+from fastmcp.server.server import MountedServer
 from fastmcp.tools.tool import Tool
 from fastmcp.tools.tool_transform import TransformedTool
-from fastmcp.utilities.tests import caplog_for_fastmcp
+from fastmcp.utilities.mounts import CircuitBreaker
+from fastmcp.utilities.tests import caplog_for_fastmcp, temporary_settings
 
 
 class TestBasicMount:
@@ -1144,3 +1149,235 @@ class TestCustomRouteForwarding:
         route_paths = [route.path for route in routes]  # type: ignore[attr-defined]
         assert "/route1" in route_paths
         assert "/route2" in route_paths
+
+
+class SlowListMiddleware(Middleware):
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+
+    async def on_list_tools(self, context, call_next):
+        await anyio.sleep(self.delay)
+        return await call_next(context)
+
+
+class TestConcurrentMountLoading:
+    async def test_mounts_are_listed_concurrently(self):
+        main_app = FastMCP("MainApp")
+        arrived = 0
+        all_arrived = anyio.Event()
+
+        class BarrierMiddleware(Middleware):
+            async def on_list_tools(self, context, call_next):
+                nonlocal arrived
+                arrived += 1
+                if arrived == 3:
+                    all_arrived.set()
+                # Deadlocks unless all mounts are listed at the same time
+                with anyio.fail_after(5):
+                    await all_arrived.wait()
+                return await call_next(context)
+
+        for i in range(3):
+            sub_app = FastMCP(f"SubApp{i}")
+            sub_app.tool(lambda: i, name="tool")
+            sub_app.add_middleware(BarrierMiddleware())
+            main_app.mount(sub_app, prefix=f"sub{i}")
+
+        tools = await main_app._list_tools()
+        assert {tool.key for tool in tools} == {"sub0_tool", "sub1_tool", "sub2_tool"}
+
+    async def test_later_mounts_take_precedence(self):
+        main_app = FastMCP("MainApp")
+        for i, delay in enumerate([0.05, 0]):
+            sub_app = FastMCP(f"SubApp{i}")
+            sub_app.tool(lambda: None, name="shared", description=f"from {i}")
+            sub_app.add_middleware(SlowListMiddleware(delay))
+            main_app.mount(sub_app)
+
+        tools = await main_app._list_tools()
+        assert [tool.description for tool in tools] == ["from 1"]
+
+    async def test_mount_timeout(self, caplog):
+        main_app = FastMCP("MainApp")
+        slow_app = FastMCP("SlowApp")
+        slow_app.tool(lambda: None, name="slow")
+        slow_app.add_middleware(SlowListMiddleware(5))
+        fast_app = FastMCP("FastApp")
+        fast_app.tool(lambda: None, name="fast")
+        main_app.mount(slow_app, prefix="slow", timeout=0.05)
+        main_app.mount(fast_app, prefix="fast")
+
+        with caplog_for_fastmcp(caplog):
+            tools = await main_app._list_tools()
+
+        assert {tool.key for tool in tools} == {"fast_fast"}
+        assert "Timed out after 0.05 seconds" in caplog.text
+
+    async def test_default_timeout_from_settings(self):
+        main_app = FastMCP("MainApp")
+        slow_app = FastMCP("SlowApp")
+        slow_app.tool(lambda: None, name="slow")
+        slow_app.add_middleware(SlowListMiddleware(5))
+        main_app.mount(slow_app, prefix="slow")
+
+        with temporary_settings(mounted_server_timeout=0.05):
+            assert await main_app._list_tools() == []
+
+    async def test_serve_stale_on_timeout(self):
+        main_app = FastMCP("MainApp")
+        slow_app = FastMCP("SlowApp")
+        slow_app.tool(lambda: None, name="slow")
+        middleware = SlowListMiddleware()
+        slow_app.add_middleware(middleware)
+        main_app.mount(slow_app, prefix="slow", timeout=0.05)
+
+        with temporary_settings(mounted_server_serve_stale=True):
+            tools = await main_app._list_tools()
+            assert [tool.key for tool in tools] == ["slow_slow"]
+
+        middleware.delay = 5
+        assert await main_app._list_tools() == []
+        with temporary_settings(mounted_server_serve_stale=True):
+            tools = await main_app._list_tools()
+            assert [tool.key for tool in tools] == ["slow_slow"]
+
+    async def test_results_are_only_kept_to_serve_stale(self):
+        main_app = FastMCP("MainApp")
+        sub_app = FastMCP("SubApp")
+        sub_app.tool(lambda: None, name="tool")
+        main_app.mount(sub_app, prefix="sub")
+
+        await main_app._list_tools()
+        assert not main_app._tool_manager._mounted_loader._last_results
+        with temporary_settings(mounted_server_serve_stale=True):
+            await main_app._list_tools()
+        assert main_app._tool_manager._mounted_loader._last_results
+
+
+class TestMountHealth:
+    async def test_circuit_opens_after_failures(self):
+        main_app = FastMCP("MainApp")
+        sub_app = FastMCP("SubApp")
+        sub_app.tool(lambda: None, name="tool")
+        attempts = 0
+        failing = True
+
+        class FailingMiddleware(Middleware):
+            async def on_list_tools(self, context, call_next):
+                nonlocal attempts
+                attempts += 1
+                if failing:
+                    raise RuntimeError("backend down")
+                return await call_next(context)
+
+        sub_app.add_middleware(FailingMiddleware())
+        main_app.mount(sub_app, prefix="sub")
+
+        with temporary_settings(
+            mounted_server_failure_threshold=2, mounted_server_backoff=0.05
+        ):
+            for _ in range(4):
+                assert await main_app._list_tools() == []
+            assert attempts == 2
+            assert main_app._mounted_servers[0].health.state == "open"
+
+            # Once the backoff passes, a successful probe closes the circuit
+            await anyio.sleep(0.06)
+            failing = False
+            tools = await main_app._list_tools()
+            assert [tool.key for tool in tools] == ["sub_tool"]
+            assert attempts == 3
+            assert main_app._mounted_servers[0].health.state == "closed"
+
+    async def test_failed_probe_doubles_backoff(self):
+        breaker = CircuitBreaker()
+        with temporary_settings(
+            mounted_server_failure_threshold=1,
+            mounted_server_backoff=0.05,
+            mounted_server_max_backoff=0.15,
+        ):
+            breaker.record_failure()
+            assert breaker.is_open
+            assert not breaker.allow_request()
+
+            await anyio.sleep(0.06)
+            assert breaker.state == "half-open"
+            assert breaker.allow_request()
+            # Only one probe is let through at a time
+            assert not breaker.allow_request()
+            breaker.record_failure()
+            assert breaker._backoff == 0.1
+            breaker.record_failure()
+            assert breaker._backoff == 0.15
+
+            breaker.record_success()
+            assert breaker.state == "closed"
+
+    async def test_circuit_disabled_by_default(self):
+        breaker = CircuitBreaker()
+        for _ in range(10):
+            breaker.record_failure()
+        assert breaker.state == "closed"
+
+    async def test_open_circuit_skipped_when_calling(self):
+        main_app = FastMCP("MainApp")
+        sub_app = FastMCP("SubApp")
+        sub_app.tool(lambda: "ok", name="tool")
+        main_app.mount(FastMCP.as_proxy(sub_app))
+
+        async with Client(main_app) as client:
+            with temporary_settings(mounted_server_failure_threshold=1):
+                main_app._mounted_servers[0].health.record_failure()
+                with pytest.raises(ToolError, match="Unknown tool"):
+                    await client.call_tool("tool", {})
+
+    async def test_negative_cache(self):
+        main_app = FastMCP("MainApp")
+        local_app = FastMCP("LocalApp")
+        local_app.tool(lambda: "local", name="local")
+        remote_app = FastMCP("RemoteApp")
+        requests = 0
+
+        class CountingMiddleware(Middleware):
+            async def on_request(self, context, call_next):
+                nonlocal requests
+                requests += 1
+                return await call_next(context)
+
+        remote_app.add_middleware(CountingMiddleware())
+        main_app.mount(local_app)
+        # Later mounts are asked first, so calling the local tool asks the proxy
+        main_app.mount(FastMCP.as_proxy(remote_app))
+
+        async with Client(main_app) as client:
+
+            async def call_local() -> int:
+                before = requests
+                result = await client.call_tool("local", {})
+                assert result.content[0].text == "local"  # type: ignore[attr-defined]
+                return requests - before
+
+            # The client lists tools once, on its first call
+            await call_local()
+            uncached = await call_local()
+            with temporary_settings(mounted_server_negative_cache_ttl=60):
+                assert await call_local() == uncached
+                assert await call_local() < uncached
+
+    def test_negative_cache_is_invalidated_by_child_changes(self):
+        main_app = FastMCP("MainApp")
+        sub_app = FastMCP("SubApp")
+        main_app.mount(sub_app, prefix="sub")
+        mounted = main_app._mounted_servers[0]
+        not_found = main_app._tool_manager._not_found
+
+        with temporary_settings(mounted_server_negative_cache_ttl=60):
+            not_found.add(mounted, "tool")
+            assert (mounted, "tool") in not_found
+            # An equal mount of the same server is a different mount
+            assert (MountedServer(prefix="sub", server=sub_app), "tool") not in (
+                not_found
+            )
+
+            sub_app.tool(lambda: None, name="tool")
+            assert (mounted, "tool") not in not_found
@@ -67,7 +67,7 @@ class TestTools:
         def fn(x: int) -> int:
             return x + 1
 
-        mcp_tools = await mcp._mcp_list_tools()
+        mcp_tools = (await mcp._mcp_list_tools()).tools
         assert len(mcp_tools) == 1
         assert mcp_tools[0].name == "fn"
 
@@ -80,7 +80,7 @@ class TestTools:
         def fn(x: int) -> int:
             return x + 1
 
-        mcp_tools = await mcp._mcp_list_tools()
+        mcp_tools = (await mcp._mcp_list_tools()).tools
         assert len(mcp_tools) == 1
         assert mcp_tools[0].name == "custom_name"
 
@@ -176,7 +176,7 @@ class TestToolDecorator:
         def add(x: int, y: int) -> int:
             return x + y
 
-        tools = await mcp._mcp_list_tools()
+        tools = (await mcp._mcp_list_tools()).tools
         assert len(tools) == 1
         tool = tools[0]
         assert tool.description == "Add two numbers"
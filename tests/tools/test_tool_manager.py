@@ -8,7 +8,7 @@ import pytest
 from mcp.types import ImageContent
 from pydantic import BaseModel
 
-from fastmcp import Context, FastMCP
+from fastmcp import Client, Context, FastMCP
 from fastmcp.exceptions import NotFoundError, ToolError
 from fastmcp.tools import FunctionTool, ToolManager
 from fastmcp.tools.tool import Tool
@@ -1037,3 +1037,184 @@ class TestMountedComponentsRaiseOnLoadError:
                 AttributeError, match="'str' object has no attribute 'server'"
             ):
                 await parent_mcp._tool_manager.list_tools()
+
+
+class TestToolInventoryCache:
+    """Test that the unfiltered tool inventory is cached and invalidated."""
+
+    async def test_inventory_is_reused_between_lookups(self):
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(lambda: 1, name="one"))
+
+        await manager.get_tool("one")
+        inventory = manager._inventory
+        await manager.get_tool("one")
+        assert manager._inventory is inventory
+
+    async def test_get_tools_returns_copy(self):
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(lambda: 1, name="one"))
+
+        tools = await manager.get_tools()
+        tools.pop("one")
+        assert await manager.has_tool("one")
+
+    async def test_add_and_remove_invalidate(self):
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(lambda: 1, name="one"))
+        assert not await manager.has_tool("two")
+
+        manager.add_tool(Tool.from_function(lambda: 2, name="two"))
+        assert await manager.has_tool("two")
+
+        manager.remove_tool("two")
+        assert not await manager.has_tool("two")
+
+    async def test_transformation_invalidates(self):
+        manager = ToolManager()
+        manager.add_tool(Tool.from_function(lambda: 1, name="one"))
+        assert await manager.has_tool("one")
+
+        manager.add_tool_transformation("one", ToolTransformConfig(name="uno"))
+        assert await manager.has_tool("uno")
+        assert not await manager.has_tool("one")
+
+        manager.remove_tool_transformation("one")
+        assert await manager.has_tool("one")
+
+    async def test_child_changes_propagate_to_parent(self):
+        parent = FastMCP("Parent")
+        child = FastMCP("Child")
+        grandchild = FastMCP("Grandchild")
+        child.mount(grandchild, prefix="gc")
+        parent.mount(child, prefix="child")
+        assert not await parent._tool_manager.has_tool("child_gc_tool")
+
+        @grandchild.tool
+        def tool() -> int:
+            return 1
+
+        assert await parent._tool_manager.has_tool("child_gc_tool")
+
+        grandchild.remove_tool("tool")
+        assert not await parent._tool_manager.has_tool("child_gc_tool")
+
+    async def test_disable_invalidates_prefixed_copies(self):
+        parent = FastMCP("Parent")
+        child = FastMCP("Child")
+        parent.mount(child, prefix="child")
+
+        @child.tool
+        def tool() -> int:
+            return 1
+
+        assert (await parent._tool_manager.get_tool("child_tool")).enabled
+        tool.disable()
+        assert not await parent._tool_manager.has_tool("child_tool")
+        tool.enable()
+        assert (await parent._tool_manager.get_tool("child_tool")).enabled
+
+    async def test_disabling_unrelated_tools_keeps_cache(self):
+        server = FastMCP("Server")
+        other = FastMCP("Other")
+
+        @server.tool
+        def tool() -> int:
+            return 1
+
+        @other.tool
+        def other_tool() -> int:
+            return 2
+
+        inventory = await server._tool_manager._get_inventory()
+        other_tool.disable()
+        assert await server._tool_manager._get_inventory() is inventory
+
+    async def test_filtered_grandchild_tools_are_excluded(self):
+        parent = FastMCP("Parent")
+        child = FastMCP("Child")
+        grandchild = FastMCP("Grandchild", exclude_tags={"internal"})
+        child.mount(grandchild, prefix="grandchild")
+        parent.mount(child, prefix="child")
+
+        @grandchild.tool(tags={"internal"})
+        def hidden() -> int:
+            return 1
+
+        @grandchild.tool
+        def visible() -> int:
+            return 2
+
+        tools = await parent._tool_manager.get_tools()
+        assert "child_grandchild_visible" in tools
+        assert "child_grandchild_hidden" not in tools
+        assert not await parent._tool_manager.has_tool("child_grandchild_hidden")
+        with pytest.raises(NotFoundError):
+            await parent._tool_manager.call_tool("child_grandchild_hidden", {})
+
+        async with Client(parent) as client:
+            names = {tool.name for tool in await client.list_tools()}
+            assert names == {"child_grandchild_visible"}
+
+    async def test_proxy_children_are_not_cached(self):
+        parent = FastMCP("Parent")
+        child = FastMCP("Child")
+        parent.mount(child, prefix="child", as_proxy=True)
+        assert parent._tool_manager._get_version() is None
+
+
+class TestToolRouting:
+    """Test that calls to mounted tools are routed directly to their owner."""
+
+    async def test_call_routes_to_owning_server_only(self):
+        parent = FastMCP("Parent")
+        owner = FastMCP("Owner")
+        other = FastMCP("Other")
+        called: list[str] = []
+
+        @owner.tool
+        def tool() -> str:
+            return "owner"
+
+        parent.mount(owner)
+        parent.mount(other)
+
+        original = other._call_tool
+
+        async def tracking_call_tool(key: str, arguments: dict[str, Any]):
+            called.append(key)
+            return await original(key, arguments)
+
+        other._call_tool = tracking_call_tool  # type: ignore[method-assign]
+
+        async with Client(parent) as client:
+            result = await client.call_tool("tool", {})
+        assert result.data == "owner"
+        assert called == []
+
+    async def test_call_routes_through_nested_mounts(self):
+        parent = FastMCP("Parent")
+        child = FastMCP("Child")
+        grandchild = FastMCP("Grandchild")
+
+        @grandchild.tool
+        def tool() -> str:
+            return "grandchild"
+
+        child.mount(grandchild, prefix="gc")
+        parent.mount(child, prefix="child")
+
+        routes = await parent._tool_manager._get_routes()
+        assert routes is not None
+        assert routes["child_gc_tool"] == (parent._mounted_servers[0], "gc_tool")
+
+        async with Client(parent) as client:
+            result = await client.call_tool("child_gc_tool", {})
+        assert result.data == "grandchild"
+
+    async def test_unknown_tool_not_found(self):
+        parent = FastMCP("Parent")
+        parent.mount(FastMCP("Child"), prefix="child")
+
+        with pytest.raises(NotFoundError):
+            await parent._tool_manager.call_tool("child_missing", {})
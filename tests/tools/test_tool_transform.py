@@ -1,6 +1,7 @@
 import re
 from dataclasses import dataclass
 from typing import Annotated, Any
+from unittest.mock import patch
 
 import pytest
 from dirty_equals import IsList
@@ -16,8 +17,11 @@ from fastmcp.tools import Tool, forward, forward_raw
 from fastmcp.tools.tool import FunctionTool, ToolResult
 from fastmcp.tools.tool_transform import (
     ArgTransform,
+    ArgTransformConfig,
     ToolTransformConfig,
     TransformedTool,
+    TransformedToolCache,
+    apply_transformations_to_tools,
 )
 
 
@@ -1707,3 +1711,120 @@ class TestInputSchema:
                 },
             }
         )
+
+
+class TestTransformedToolCache:
+    def test_reuses_transformed_tool(self, add_tool):
+        cache = TransformedToolCache()
+        config = ToolTransformConfig(name="new_add")
+
+        first = cache.apply(config, add_tool)
+        second = cache.apply(config, add_tool)
+
+        assert first is second
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_copied_parent_tool_hits(self, add_tool):
+        cache = TransformedToolCache()
+        config = ToolTransformConfig(name="new_add")
+
+        first = cache.apply(config, add_tool.model_copy(key="prefix_add"))
+        second = cache.apply(config, add_tool.model_copy(key="prefix_add"))
+
+        assert first is second
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_changed_parent_tool_misses(self, add_tool):
+        cache = TransformedToolCache()
+        config = ToolTransformConfig(name="new_add")
+
+        first = cache.apply(config, add_tool)
+        second = cache.apply(
+            config, add_tool.model_copy(update={"description": "changed"})
+        )
+
+        assert first is not second
+        assert second.description == "changed"
+        assert cache.misses == 2
+
+    def test_config_change_misses(self, add_tool):
+        cache = TransformedToolCache()
+        config = ToolTransformConfig(name="new_add")
+        first = cache.apply(config, add_tool)
+
+        config.arguments = {"old_x": ArgTransformConfig(name="x")}
+        second = cache.apply(config, add_tool)
+
+        assert first is not second
+        assert "x" in second.parameters["properties"]
+        assert cache.misses == 2
+
+    def test_fingerprint_is_computed_once(self):
+        config = ToolTransformConfig(name="new_add")
+        with patch.object(
+            ToolTransformConfig, "model_dump_json", autospec=True, return_value="{}"
+        ) as dump:
+            config.fingerprint()
+            config.fingerprint()
+            assert dump.call_count == 1
+
+            config.description = "changed"
+            config.fingerprint()
+            assert dump.call_count == 2
+
+    def test_copied_config_fingerprint(self):
+        config = ToolTransformConfig(name="new_add")
+        fingerprint = config.fingerprint()
+        copy = config.model_copy(update={"name": "other"})
+        assert copy.fingerprint() != fingerprint
+        assert config.fingerprint() == fingerprint
+
+    def test_parent_enabled_change_misses(self, add_tool):
+        cache = TransformedToolCache()
+        config = ToolTransformConfig(name="new_add")
+        assert cache.apply(config, add_tool).enabled
+
+        add_tool.disable()
+        assert not cache.apply(config, add_tool).enabled
+        assert cache.misses == 2
+
+    def test_maxsize(self, add_tool):
+        cache = TransformedToolCache(maxsize=2)
+        config = ToolTransformConfig(name="new_add")
+        for i in range(3):
+            cache.apply(config, add_tool.model_copy(key=f"add_{i}"))
+        assert len(cache) == 2
+
+    def test_apply_transformations_to_tools_uses_cache(self, add_tool):
+        cache = TransformedToolCache()
+        transformations = {"add": ToolTransformConfig(name="new_add")}
+
+        first = apply_transformations_to_tools(
+            {"add": add_tool}, transformations, cache=cache
+        )
+        second = apply_transformations_to_tools(
+            {"add": add_tool}, transformations, cache=cache
+        )
+
+        assert first["new_add"] is second["new_add"]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    async def test_mounted_prefixed_tool_hits(self):
+        parent = FastMCP("Parent")
+        child = FastMCP("Child")
+
+        @child.tool
+        def add(x: int, y: int) -> int:
+            return x + y
+
+        parent.mount(child, prefix="child")
+        parent.add_tool_transformation("child_add", ToolTransformConfig(name="plus"))
+        cache = parent._tool_manager.transform_cache
+
+        assert "plus" in await parent.get_tools()
+        # Any change to the parent rebuilds its inventory, copying the
+        # mounted tool again
+        parent.tool(lambda: None, name="other")
+        assert "plus" in await parent.get_tools()
+
+        assert (cache.hits, cache.misses) == (1, 1)
@@ -7,6 +7,7 @@ from fastmcp.utilities.components import (
     FastMCPComponent,
     FastMCPMeta,
     MirroredComponent,
+    VersionedDict,
     _convert_set_default_none,
 )
 
@@ -201,6 +202,78 @@ class TestFastMCPComponent:
         assert "Extra inputs are not permitted" in str(exc_info.value)
 
 
+class TestVersionedDict:
+    """Tests for the VersionedDict registry."""
+
+    def test_mutations_bump_version(self):
+        d: VersionedDict[int] = VersionedDict()
+        versions = [d.version]
+        d["a"] = 1
+        versions.append(d.version)
+        d.update(b=2)
+        versions.append(d.version)
+        d.pop("a")
+        versions.append(d.version)
+        del d["b"]
+        versions.append(d.version)
+        assert len(set(versions)) == len(versions)
+
+    def test_reads_do_not_bump_version(self):
+        d: VersionedDict[int] = VersionedDict()
+        d["a"] = 1
+        version = d.version
+        assert d["a"] == 1
+        assert "a" in d
+        assert d.get("b") is None
+        assert d.version == version
+
+
+class TestEnabledTracking:
+    """Tests that enabling or disabling a component bumps its registries."""
+
+    def test_enable_disable_bump_registry_version(self):
+        component = FastMCPComponent(name="test")
+        registry: VersionedDict[FastMCPComponent] = VersionedDict()
+        registry["test"] = component
+
+        version = registry.version
+        component.disable()
+        assert registry.version > version
+
+        version = registry.version
+        component.enable()
+        assert registry.version > version
+
+    def test_other_registries_are_not_bumped(self):
+        component = FastMCPComponent(name="test")
+        registry: VersionedDict[FastMCPComponent] = VersionedDict()
+        registry["test"] = component
+        other: VersionedDict[FastMCPComponent] = VersionedDict()
+        other["other"] = FastMCPComponent(name="other")
+
+        version = other.version
+        component.disable()
+        assert other.version == version
+
+    def test_copies_are_not_tracked_by_the_original_registry(self):
+        component = FastMCPComponent(name="test")
+        registry: VersionedDict[FastMCPComponent] = VersionedDict()
+        registry["test"] = component
+
+        version = registry.version
+        component.copy().disable()
+        assert registry.version == version
+
+    def test_update_tracks_components(self):
+        component = FastMCPComponent(name="test")
+        registry: VersionedDict[FastMCPComponent] = VersionedDict()
+        registry.update(test=component)
+
+        version = registry.version
+        component.disable()
+        assert registry.version > version
+
+
 class TestMirroredComponent:
     """Tests for the MirroredComponent class."""
 
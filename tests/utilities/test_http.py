@@ -0,0 +1,80 @@
+from unittest.mock import patch
+
+import httpx
+
+from fastmcp import Client, FastMCP
+from fastmcp.resources import HttpResource
+from fastmcp.utilities.http import get_http_client, http_client_lifespan
+from fastmcp.utilities.tests import temporary_settings
+
+
+class TestSharedHttpClient:
+    async def test_client_is_shared(self):
+        async with http_client_lifespan():
+            assert get_http_client() is get_http_client()
+
+    async def test_client_uses_settings(self):
+        with temporary_settings(http_timeout=7, http_max_connections=3):
+            async with http_client_lifespan():
+                client = get_http_client()
+                assert client.timeout == httpx.Timeout(7)
+                pool = client._transport._pool  # type: ignore[attr-defined]
+                assert pool._max_connections == 3
+
+    async def test_closed_when_last_lifespan_ends(self):
+        async with http_client_lifespan():
+            async with http_client_lifespan():
+                client = get_http_client()
+            assert not client.is_closed
+        assert client.is_closed
+        # A new client is created on next use
+        async with http_client_lifespan():
+            assert get_http_client() is not client
+
+    async def test_closed_with_server(self):
+        server = FastMCP()
+
+        @server.tool
+        def is_open() -> bool:
+            return not get_http_client().is_closed
+
+        async with Client(server) as client:
+            result = await client.call_tool("is_open")
+            shared = get_http_client()
+        assert result.data is True
+        assert shared.is_closed
+
+    async def test_cookies_are_not_persisted(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                headers={"set-cookie": "session=secret; Path=/"},
+                json={"cookie": request.headers.get("cookie")},
+            )
+
+        with patch(
+            "httpx.AsyncClient._transport_for_url",
+            return_value=httpx.MockTransport(handler),
+        ):
+            async with http_client_lifespan():
+                client = get_http_client()
+                first = await client.get("https://example.com/login")
+                second = await client.get("https://example.com/data")
+
+        assert first.cookies["session"] == "secret"
+        assert second.json() == {"cookie": None}
+        assert not client.cookies
+
+
+async def test_http_resource_uses_shared_client():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=f"fetched {request.url}")
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    resource = HttpResource(uri="data://page", url="https://example.com/page")  # type: ignore[arg-type]
+
+    with patch("fastmcp.resources.types.get_http_client", return_value=client):
+        assert await resource.read() == "fetched https://example.com/page"
+        assert await resource.read() == "fetched https://example.com/page"
+    assert not client.is_closed
+    await client.aclose()
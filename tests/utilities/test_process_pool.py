@@ -0,0 +1,167 @@
+import importlib.util
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import anyio
+import pytest
+
+from fastmcp import Client, Context, FastMCP
+from fastmcp.exceptions import ToolError
+from fastmcp.tools.tool import Tool
+from fastmcp.utilities.process_pool import FunctionRef, ProcessPool, get_process_pool
+
+mcp = FastMCP()
+
+
+def get_pid() -> int:
+    return os.getpid()
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+def fail() -> None:
+    raise ValueError("secret internal detail")
+
+
+def crash() -> None:
+    os._exit(1)
+
+
+def sleep(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+@mcp.tool(run_in_process=True)
+def decorated_pid() -> int:
+    return os.getpid()
+
+
+@pytest.fixture
+def pool():
+    pool = ProcessPool(max_workers=2)
+    yield pool
+    pool.shutdown()
+
+
+class TestFunctionRef:
+    def test_resolves_module_function(self):
+        assert FunctionRef.from_function(add).resolve() is add
+
+    def test_resolves_decorated_function(self):
+        ref = FunctionRef.from_function(decorated_pid.fn)
+        assert ref.resolve() is decorated_pid.fn
+
+    def test_rejects_local_function(self):
+        def local() -> None:
+            pass
+
+        with pytest.raises(ValueError, match="worker process"):
+            FunctionRef.from_function(local)
+
+    def test_rejects_main_module_function(self):
+        def fn() -> None:
+            pass
+
+        fn.__module__ = "__main__"
+        fn.__qualname__ = "fn"
+        with pytest.raises(ValueError, match="can't be imported by name"):
+            FunctionRef.from_function(fn)
+
+    def test_rejects_function_loaded_from_file(self, tmp_path: Path, monkeypatch):
+        # Like `fastmcp run server.py`, which loads the file as `server_module`
+        path = tmp_path / "server.py"
+        path.write_text("def fn() -> None:\n    pass\n")
+        spec = importlib.util.spec_from_file_location("server_module", path)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        monkeypatch.setitem(sys.modules, "server_module", module)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        spec.loader.exec_module(module)
+
+        with pytest.raises(ValueError, match="can't be imported by name"):
+            FunctionRef.from_function(module.fn)
+
+
+class TestProcessPool:
+    async def test_runs_in_other_process(self, pool: ProcessPool):
+        assert await pool.call(get_pid, {}) != os.getpid()
+
+    async def test_validates_arguments(self, pool: ProcessPool):
+        assert await pool.call(add, {"a": "1", "b": 2}) == 3
+
+    async def test_exceptions_propagate(self, pool: ProcessPool):
+        with pytest.raises(ValueError, match="secret internal detail"):
+            await pool.call(fail, {})
+
+    async def test_timeout(self, pool: ProcessPool):
+        with pytest.raises(ToolError, match="timed out"):
+            await pool.call(sleep, {"seconds": 2}, timeout=0.1)
+
+    async def test_waiting_calls_do_not_use_threads(self, pool: ProcessPool):
+        await pool.call(add, {"a": 1, "b": 2})
+        threads = threading.active_count()
+        max_threads = threads
+
+        async def call() -> None:
+            await pool.call(sleep, {"seconds": 0.2})
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(20):
+                tg.start_soon(call)
+            for _ in range(10):
+                await anyio.sleep(0.02)
+                max_threads = max(max_threads, threading.active_count())
+
+        assert max_threads <= threads + 1
+
+    async def test_recovers_from_crash(self, pool: ProcessPool):
+        with pytest.raises(ToolError, match="crashed"):
+            await pool.call(crash, {})
+        assert await pool.call(add, {"a": 1, "b": 2}) == 3
+
+
+class TestProcessTools:
+    async def test_tool_runs_in_process(self):
+        tool = Tool.from_function(get_pid, run_in_process=True)
+        result = await tool.run({})
+        assert result.structured_content is not None
+        assert result.structured_content["result"] != os.getpid()
+
+    async def test_decorated_tool(self):
+        async with Client(mcp) as client:
+            result = await client.call_tool("decorated_pid", {})
+            assert result.data != os.getpid()
+
+    async def test_workers_stop_with_server(self):
+        async with Client(mcp) as client:
+            await client.call_tool("decorated_pid", {})
+            assert get_process_pool()._executor is not None
+        assert get_process_pool()._executor is None
+
+    async def test_errors_are_masked(self):
+        server = FastMCP(mask_error_details=True)
+        server.tool(fail, run_in_process=True)
+
+        async with Client(server) as client:
+            with pytest.raises(ToolError) as exc_info:
+                await client.call_tool("fail", {})
+            assert "secret internal detail" not in str(exc_info.value)
+
+    def test_rejects_async_function(self):
+        async def fn() -> None:
+            pass
+
+        with pytest.raises(ValueError, match="Only sync functions"):
+            Tool.from_function(fn, run_in_process=True)
+
+    def test_rejects_context(self):
+        def fn(ctx: Context) -> None:
+            pass
+
+        with pytest.raises(ValueError, match="Context"):
+            Tool.from_function(fn, run_in_process=True)
@@ -0,0 +1,184 @@
+import functools
+import threading
+
+import anyio
+import pytest
+
+from fastmcp import Client, Context, FastMCP
+from fastmcp.tools.tool import Tool
+from fastmcp.utilities.sync_executor import (
+    SyncExecutor,
+    get_sync_executor,
+    is_coroutine_callable,
+    use_sync_executor,
+)
+from fastmcp.utilities.tests import temporary_settings
+
+
+class TestSyncExecutor:
+    async def test_runs_on_event_loop_by_default(self):
+        executor = SyncExecutor()
+        assert await executor.call(threading.get_ident) == threading.get_ident()
+
+    async def test_runs_in_thread_when_enabled(self):
+        executor = SyncExecutor(run_sync_in_thread=True)
+        assert await executor.call(threading.get_ident) != threading.get_ident()
+
+    async def test_call_overrides_default(self):
+        executor = SyncExecutor(run_sync_in_thread=True)
+        ident = await executor.call(threading.get_ident, run_in_thread=False)
+        assert ident == threading.get_ident()
+
+    async def test_defaults_follow_settings(self):
+        executor = SyncExecutor()
+        with temporary_settings(run_sync_in_thread=True, sync_worker_threads=3):
+            assert executor.run_sync_in_thread
+            assert executor.max_workers == 3
+
+    async def test_coroutine_functions_stay_on_event_loop(self):
+        executor = SyncExecutor(run_sync_in_thread=True)
+
+        async def fn():
+            return threading.get_ident()
+
+        assert await (await executor.call(fn)) == threading.get_ident()
+
+    def test_partials_of_coroutine_callables(self):
+        class AsyncCallable:
+            async def __call__(self, x: int) -> int:
+                return x
+
+        async def fn(x: int) -> int:
+            return x
+
+        assert is_coroutine_callable(functools.partial(fn, 1))
+        assert is_coroutine_callable(functools.partial(AsyncCallable(), 1))
+        assert is_coroutine_callable(
+            functools.partial(functools.partial(AsyncCallable(), 1))
+        )
+        assert not is_coroutine_callable(functools.partial(int, "1"))
+
+    async def test_max_workers_bounds_threads(self):
+        executor = SyncExecutor(run_sync_in_thread=True, max_workers=2)
+        release = threading.Event()
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            release.wait(5)
+            with lock:
+                running -= 1
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(5):
+                tg.start_soon(executor.call, work)
+            while executor.active < 2 or executor.queue_depth < 3:
+                await anyio.sleep(0.01)
+            assert executor.queue_depth == 3
+            release.set()
+
+        assert peak == 2
+        assert executor.active == 0
+        assert executor.queue_depth == 0
+
+    def test_invalid_max_workers(self):
+        with pytest.raises(ValueError):
+            SyncExecutor(max_workers=0)
+
+    async def test_use_sync_executor(self):
+        executor = SyncExecutor()
+        default = get_sync_executor()
+        with use_sync_executor(executor):
+            assert get_sync_executor() is executor
+            with use_sync_executor(None):
+                assert get_sync_executor() is executor
+        assert get_sync_executor() is default
+
+
+class TestToolThreadExecution:
+    async def test_tool_runs_in_thread(self):
+        def fn() -> int:
+            return threading.get_ident()
+
+        tool = Tool.from_function(fn, run_in_thread=True)
+        result = await tool.run({})
+        assert result.structured_content is not None
+        assert result.structured_content["result"] != threading.get_ident()
+
+    async def test_server_setting_applies_to_components(self):
+        mcp = FastMCP(run_sync_in_thread=True)
+
+        @mcp.tool
+        def tool_thread() -> int:
+            return threading.get_ident()
+
+        @mcp.tool(run_in_thread=False)
+        def loop_thread() -> int:
+            return threading.get_ident()
+
+        @mcp.resource("data://thread")
+        def resource_thread() -> str:
+            return str(threading.get_ident())
+
+        @mcp.prompt
+        def prompt_thread() -> str:
+            return str(threading.get_ident())
+
+        loop_ident = threading.get_ident()
+        async with Client(mcp) as client:
+            result = await client.call_tool("tool_thread", {})
+            assert result.data != loop_ident
+            result = await client.call_tool("loop_thread", {})
+            assert result.data == loop_ident
+            contents = await client.read_resource("data://thread")
+            assert int(contents[0].text) != loop_ident  # type: ignore[attr-defined]
+            prompt = await client.get_prompt("prompt_thread")
+            assert int(prompt.messages[0].content.text) != loop_ident  # type: ignore[attr-defined]
+
+    async def test_context_available_in_thread(self):
+        mcp = FastMCP(run_sync_in_thread=True)
+
+        @mcp.tool
+        def get_server_name(ctx: Context) -> str:
+            return ctx.fastmcp.name
+
+        async with Client(mcp) as client:
+            result = await client.call_tool("get_server_name", {})
+            assert result.data == mcp.name
+
+    async def test_mounted_server_inherits_executor(self):
+        parent = FastMCP("Parent", run_sync_in_thread=True)
+        child = FastMCP("Child")
+
+        @child.tool
+        def ident() -> int:
+            return threading.get_ident()
+
+        parent.mount(child, prefix="child")
+
+        async with Client(parent) as client:
+            result = await client.call_tool("child_ident", {})
+            assert result.data != threading.get_ident()
+
+    async def test_max_concurrency(self):
+        running = 0
+        peak = 0
+
+        async def fn() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await anyio.sleep(0.05)
+            running -= 1
+
+        tool = Tool.from_function(fn, max_concurrency=2)
+        async with anyio.create_task_group() as tg:
+            for _ in range(5):
+                tg.start_soon(tool.run, {})
+
+        assert peak == 2
@@ -1,9 +1,12 @@
 import base64
+import gc
 import os
 import tempfile
+import weakref
 from pathlib import Path
 from types import EllipsisType
 from typing import Annotated, Any
+from unittest.mock import patch
 
 import pytest
 from mcp.types import BlobResourceContents, TextResourceContents
@@ -594,6 +597,40 @@ class TestFindKwargByType:
 
         assert find_kwarg_by_type(func, str) == "c"
 
+    def test_results_are_cached(self):
+        """Test that repeated lookups don't re-inspect the function."""
+
+        def func(a: int, b: BaseClass):
+            pass
+
+        assert find_kwarg_by_type(func, BaseClass) == "b"
+        with patch("fastmcp.utilities.types.get_type_hints") as get_type_hints:
+            assert find_kwarg_by_type(func, BaseClass) == "b"
+            get_type_hints.assert_not_called()
+
+    def test_unhashable_callable(self):
+        """Test that unhashable callables are still supported."""
+
+        class Handler:
+            __hash__ = None  # type: ignore[assignment]
+
+            def __call__(self, a: int, b: BaseClass):
+                pass
+
+        assert find_kwarg_by_type(Handler(), BaseClass) == "b"
+
+    def test_cache_does_not_keep_functions_alive(self):
+        """Test that cached functions can still be garbage collected."""
+
+        def func(a: int, b: BaseClass):
+            pass
+
+        assert find_kwarg_by_type(func, BaseClass) == "b"
+        func_ref = weakref.ref(func)
+        del func
+        gc.collect()
+        assert func_ref() is None
+
 
 class TestReplaceType:
     @pytest.mark.parametrize(